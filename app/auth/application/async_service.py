@@ -0,0 +1,18 @@
+from typing import Union
+
+from auth.application.dtos import GetTokenDataInputDto, GetTokenDataOutputDto
+from shared_kernel.application.async_service import AsyncApplicationService
+from shared_kernel.application.dtos import FailedOutputDto
+
+
+class AsyncAuthApplicationService(AsyncApplicationService):
+    """
+    인증이 필요한 라우트는 요청마다 access token 을 확인하므로, 캐시된 토큰은 executor 를 거치지 않고 바로 확인한다.
+    이렇게 하면 요청 하나가 executor 를 한 번만 오가고, 토큰 확인이 DB 를 쓰는 use case 뒤에 줄 서지 않는다.
+    """
+
+    async def get_token_data(self, input_dto: GetTokenDataInputDto) -> Union[GetTokenDataOutputDto, FailedOutputDto]:
+        output_dto = self._application_service.find_cached_token_data(input_dto)
+        if output_dto is not None:
+            return output_dto
+        return await self._run_in_executor(self._application_service.get_token_data, input_dto)
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Callable, Optional, Union
 
 from jose import JWTError, jwt
 
@@ -11,6 +11,7 @@ from auth.application.dtos import (
     VerifyTokenOutputDto,
 )
 from auth.domain.value_objects import TokenPayload
+from auth.infra_structure.token_cache import VerifiedTokenCache
 from shared_kernel.application.dtos import FailedOutputDto
 from users.application.dtos import LoginInputDto
 from users.application.service import UserApplicationService
@@ -18,11 +19,22 @@ from users.application.service import UserApplicationService
 
 class AuthApplicationService:
     def __init__(
-        self, user_application_service: UserApplicationService, jwt_secret_key: str, jwt_algorithm: str
+        self,
+        user_application_service: UserApplicationService,
+        jwt_secret_key: str,
+        jwt_algorithm: str,
+        token_cache: Optional[VerifiedTokenCache] = None,
+        is_token_revoked: Optional[Callable[[str, TokenPayload], bool]] = None,
     ) -> None:
+        """
+        is_token_revoked(token_digest, token_payload) 가 True 를 돌려주면 캐시 여부와 관계없이 토큰을 거부한다.
+        token_digest 는 VerifiedTokenCache.digest(access_token) 이다.
+        """
         self._user_application_service = user_application_service
         self._JWT_SECRET_KEY = jwt_secret_key
         self._JWT_ALGORITHM = jwt_algorithm
+        self._token_cache = token_cache
+        self._is_token_revoked = is_token_revoked
 
     def get_token(self, input_dto: GetTokenInputDto) -> Union[GetTokenOutputDto, FailedOutputDto]:
         try:
@@ -32,22 +44,31 @@ class AuthApplicationService:
             if login_output_dto.status is True:
                 access_token = self._create_access_token(data=TokenPayload(user_id=input_dto.user_id).dict())
                 return GetTokenOutputDto(access_token=access_token)
+            if login_output_dto.type == FailedOutputDto.SERVICE_UNAVAILABLE_ERROR:
+                return login_output_dto
             return FailedOutputDto.build_resource_error(message=login_output_dto.message)
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
 
     def get_token_data(self, input_dto: GetTokenDataInputDto) -> Union[GetTokenDataOutputDto, FailedOutputDto]:
         try:
-            decoded_jwt = jwt.decode(
-                token=input_dto.access_token,
-                key=self._JWT_SECRET_KEY,
-                algorithms=self._JWT_ALGORITHM,
-            )
-            token_payload = TokenPayload(**decoded_jwt)
+            token_payload = self._decode_access_token(input_dto.access_token)
             return GetTokenDataOutputDto(user_id=token_payload.user_id)
         except JWTError:
             return FailedOutputDto.build_unauthorized_error(message="올바른 access-token이 아닙니다.")
 
+    def find_cached_token_data(self, input_dto: GetTokenDataInputDto) -> Optional[GetTokenDataOutputDto]:
+        """
+        서명 검증을 마친 토큰 캐시에 있을 때만 돌려주고, 아니면 None 이다. 메모리만 읽으므로 이벤트 루프에서 불러도 된다.
+        is_token_revoked 는 I/O 를 할 수 있으므로, 이를 쓰면 항상 None 을 돌려 get_token_data 로 확인하게 한다.
+        """
+        if self._token_cache is None or self._is_token_revoked is not None:
+            return None
+        token_payload = self._token_cache.get(VerifiedTokenCache.digest(input_dto.access_token))
+        if token_payload is None:
+            return None
+        return GetTokenDataOutputDto(user_id=token_payload.user_id)
+
     def verify_token(self, input_dto: VerifyTokenInputDto) -> Union[VerifyTokenOutputDto, FailedOutputDto]:
         """
         현재 사용하지 않음.
@@ -66,6 +87,21 @@ class AuthApplicationService:
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
 
+    def _decode_access_token(self, access_token: str) -> TokenPayload:
+        token_digest = VerifiedTokenCache.digest(access_token)
+        token_payload = self._token_cache.get(token_digest) if self._token_cache is not None else None
+        if token_payload is None:
+            decoded_jwt = jwt.decode(token=access_token, key=self._JWT_SECRET_KEY, algorithms=self._JWT_ALGORITHM)
+            token_payload = TokenPayload(**decoded_jwt)
+            if self._token_cache is not None:
+                self._token_cache.put(token_digest, token_payload, expires_at=decoded_jwt.get("exp"))
+
+        if self._is_token_revoked is not None and self._is_token_revoked(token_digest, token_payload):
+            if self._token_cache is not None:
+                self._token_cache.revoke(token_digest)
+            raise JWTError("revoked token")
+        return token_payload
+
     def _create_access_token(self, data: dict) -> str:
         try:
             encoded_jwt = jwt.encode(data, self._JWT_SECRET_KEY, algorithm=self._JWT_ALGORITHM)
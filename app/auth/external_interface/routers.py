@@ -5,6 +5,7 @@ from starlette import status
 from auth.application.dtos import GetTokenInputDto
 from auth.external_interface.json_dto import GetTokenJsonRequest, GetTokenJsonResponse
 from container import Container
+from shared_kernel.application.async_service import AsyncApplicationService
 from shared_kernel.external_interface.json_dtos import FailedJsonResponse
 
 router = APIRouter(
@@ -15,14 +16,15 @@ router = APIRouter(
 
 @router.post("/token", status_code=status.HTTP_200_OK, response_model=GetTokenJsonResponse)
 @inject
-def get_token(
-    request: GetTokenJsonRequest, auth_application_service=Depends(Provide[Container.auth_application_service])
+async def get_token(
+    request: GetTokenJsonRequest,
+    auth_application_service: AsyncApplicationService = Depends(Provide[Container.async_auth_application_service]),
 ):
     input_dto = GetTokenInputDto(
         user_id=request.user_id,
         password=request.password,
     )
-    output_dto = auth_application_service.get_token(input_dto=input_dto)
+    output_dto = await auth_application_service.get_token(input_dto=input_dto)
     if output_dto.status:
         return GetTokenJsonResponse(access_token=output_dto.access_token)
     return FailedJsonResponse.build_by_output_dto(output_dto)
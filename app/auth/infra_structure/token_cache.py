@@ -0,0 +1,45 @@
+import hashlib
+import time
+from typing import Callable, Dict, Optional
+
+from auth.domain.value_objects import TokenPayload
+from shared_kernel.infra_structure.cache import LruTtlCache
+
+
+class VerifiedTokenCache:
+    """
+    서명 검증까지 끝난 access token 의 payload 를 담아 두는 캐시.
+    토큰 원문 대신 sha256 digest 를 키로 쓰고, 토큰의 exp 와 ttl_seconds 중 먼저 오는 시각에 만료된다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl_seconds: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._cache = LruTtlCache(max_size=max_size, ttl_seconds=ttl_seconds, clock=clock)
+        self._ttl_seconds = ttl_seconds
+        self._wall_clock = wall_clock
+
+    @staticmethod
+    def digest(access_token: str) -> str:
+        return hashlib.sha256(access_token.encode()).hexdigest()
+
+    def get(self, token_digest: str) -> Optional[TokenPayload]:
+        return self._cache.get(token_digest)
+
+    def put(self, token_digest: str, token_payload: TokenPayload, expires_at: Optional[float] = None) -> None:
+        ttl_seconds = self._ttl_seconds
+        if expires_at is not None:
+            ttl_seconds = min(ttl_seconds, expires_at - self._wall_clock())
+        if ttl_seconds <= 0:
+            return
+        self._cache.set(token_digest, token_payload, ttl_seconds=ttl_seconds)
+
+    def revoke(self, token_digest: str) -> None:
+        self._cache.delete(token_digest)
+
+    def stats(self) -> Dict:
+        return self._cache.stats()
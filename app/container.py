@@ -1,14 +1,31 @@
 from dependency_injector import containers, providers
 
+from auth.application.async_service import AsyncAuthApplicationService
 from auth.application.service import AuthApplicationService
+from auth.infra_structure.token_cache import VerifiedTokenCache
 from drinks.application.service import DrinkApplicationService
+from drinks.infra_structure.cached_repository import CachedDrinkRepository
+from drinks.infra_structure.columnar_catalog import ColumnarDrinkCatalog
+from drinks.infra_structure.leaderboard import DrinkLeaderboard
+from drinks.infra_structure.leaderboard_repository import LeaderboardDrinkRepository
+from drinks.infra_structure.orm_query_service import OrmDrinkQueryService
 from drinks.infra_structure.orm_repository import OrmDrinkRepository
 from reviews.application.service import ReviewApplicationService
+from reviews.infra_structure.cached_repository import CachedReviewRepository
+from reviews.infra_structure.orm_query_service import OrmReviewQueryService
 from reviews.infra_structure.orm_repository import OrmReviewRepository
+from shared_kernel.application.async_service import AsyncApplicationService, build_service_executor
+from shared_kernel.infra_structure.cache_backend import InProcessCacheBackend, RespCacheBackend
 from shared_kernel.infra_structure.database import Database
+from shared_kernel.infra_structure.read_coalescer import ReadCoalescer
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
+from shared_kernel.infra_structure.warm_up import WarmUp
 from users.application.service import UserApplicationService
+from users.infra_structure.cached_repository import CachedUserRepository
 from users.infra_structure.orm_repository import OrmUserRepository
+from users.infra_structure.password_hasher import BcryptPasswordHasher, ProcessPoolPasswordHasher
 from wishes.application.service import WishApplicationService
+from wishes.infra_structure.orm_query_service import OrmWishQueryService
 from wishes.infra_structure.orm_repository import OrmWishRepository
 
 
@@ -17,22 +34,226 @@ class Container(containers.DeclarativeContainer):
     settings = providers.Configuration()
 
     # database
-    db = providers.Singleton(Database, db_url=settings.DB_URL)
+    db = providers.Singleton(
+        Database,
+        db_url=settings.DB_URL,
+        replica_urls=settings.DB_REPLICA_URLS,
+        replica_routing=settings.DB_REPLICA_ROUTING,
+        pin_primary_after_write=settings.DB_PIN_PRIMARY_AFTER_WRITE,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        echo=settings.DB_ECHO,
+        slow_query_threshold_ms=settings.DB_SLOW_QUERY_THRESHOLD_MS,
+        query_log_sample_rate=settings.DB_QUERY_LOG_SAMPLE_RATE,
+    )
+
+    # cache
+    cache_backend = providers.Selector(
+        settings.CACHE_BACKEND,
+        memory=providers.Singleton(InProcessCacheBackend, max_size=settings.CACHE_MAX_SIZE),
+        resp=providers.Singleton(
+            RespCacheBackend,
+            url=settings.CACHE_URL,
+            key_prefix=settings.CACHE_KEY_PREFIX,
+            pool_size=settings.CACHE_POOL_SIZE,
+            socket_timeout_seconds=settings.CACHE_SOCKET_TIMEOUT_SECONDS,
+        ),
+    )
 
     # repository
-    user_repository = providers.Singleton(OrmUserRepository, session_factory=db.provided.session)
-    review_repository = providers.Singleton(OrmReviewRepository, session_factory=db.provided.session)
-    wish_repository = providers.Singleton(OrmWishRepository, session_factory=db.provided.session)
-    drink_repository = providers.Singleton(OrmDrinkRepository, session_factory=db.provided.session)
+    orm_user_repository = providers.Singleton(
+        OrmUserRepository, session_factory=db.provided.session, read_session_factory=db.provided.read_session
+    )
+    user_repository = providers.Selector(
+        settings.USER_CACHE,
+        none=orm_user_repository,
+        backend=providers.Singleton(
+            CachedUserRepository,
+            user_repository=orm_user_repository,
+            cache_backend=cache_backend,
+            ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+            negative_ttl_seconds=settings.CACHE_NEGATIVE_TTL_SECONDS,
+            tombstone_ttl_seconds=settings.CACHE_TOMBSTONE_TTL_SECONDS,
+        ),
+    )
+    orm_review_repository = providers.Singleton(
+        OrmReviewRepository, session_factory=db.provided.session, read_session_factory=db.provided.read_session
+    )
+    review_repository = providers.Selector(
+        settings.REVIEW_CACHE,
+        none=orm_review_repository,
+        backend=providers.Singleton(
+            CachedReviewRepository,
+            review_repository=orm_review_repository,
+            cache_backend=cache_backend,
+            ttl_seconds=settings.REVIEW_CACHE_TTL_SECONDS,
+            negative_ttl_seconds=settings.CACHE_NEGATIVE_TTL_SECONDS,
+            tombstone_ttl_seconds=settings.CACHE_TOMBSTONE_TTL_SECONDS,
+        ),
+    )
+    wish_repository = providers.Singleton(
+        OrmWishRepository,
+        session_factory=db.provided.session,
+        read_session_factory=db.provided.read_session,
+        allow_unfiltered_scan=settings.WISH_ALLOW_UNFILTERED_SCAN,
+    )
+    orm_drink_repository = providers.Singleton(
+        OrmDrinkRepository, session_factory=db.provided.session, read_session_factory=db.provided.read_session
+    )
+
+    # leaderboard
+    drink_leaderboard = providers.Singleton(DrinkLeaderboard)
+    memory_leaderboard_drink_repository = providers.Singleton(
+        LeaderboardDrinkRepository,
+        drink_repository=orm_drink_repository,
+        leaderboard=drink_leaderboard,
+        refresh_interval_seconds=settings.DRINK_LEADERBOARD_REFRESH_SECONDS,
+    )
+    # numpy 가 있어야 한다. DRINK_LEADERBOARD=columnar 일 때만 만들어진다.
+    columnar_leaderboard_drink_repository = providers.Singleton(
+        LeaderboardDrinkRepository,
+        drink_repository=orm_drink_repository,
+        leaderboard=providers.Singleton(ColumnarDrinkCatalog),
+        refresh_interval_seconds=settings.DRINK_LEADERBOARD_REFRESH_SECONDS,
+    )
+    leaderboard_drink_repository = providers.Selector(
+        settings.DRINK_LEADERBOARD,
+        none=orm_drink_repository,
+        memory=memory_leaderboard_drink_repository,
+        columnar=columnar_leaderboard_drink_repository,
+    )
+
+    drink_repository = providers.Selector(
+        settings.DRINK_CACHE,
+        none=leaderboard_drink_repository,
+        backend=providers.Singleton(
+            CachedDrinkRepository,
+            drink_repository=leaderboard_drink_repository,
+            cache_backend=cache_backend,
+            ttl_seconds=settings.DRINK_CACHE_TTL_SECONDS,
+            negative_ttl_seconds=settings.CACHE_NEGATIVE_TTL_SECONDS,
+            tombstone_ttl_seconds=settings.CACHE_TOMBSTONE_TTL_SECONDS,
+        ),
+    )
+
+    # query service: 목록 조회를 entity / DTO 없이 응답 모양의 행으로 읽는다.
+    drink_query_service = providers.Selector(
+        settings.DRINK_LEADERBOARD,
+        none=providers.Singleton(OrmDrinkQueryService, read_session_factory=db.provided.read_session),
+        memory=memory_leaderboard_drink_repository,
+        columnar=columnar_leaderboard_drink_repository,
+    )
+    review_query_service = providers.Singleton(OrmReviewQueryService, read_session_factory=db.provided.read_session)
+    wish_query_service = providers.Singleton(
+        OrmWishQueryService,
+        read_session_factory=db.provided.read_session,
+        allow_unfiltered_scan=settings.WISH_ALLOW_UNFILTERED_SCAN,
+    )
+
+    token_cache = providers.Selector(
+        settings.AUTH_TOKEN_CACHE,
+        none=providers.Object(None),
+        lru=providers.Singleton(
+            VerifiedTokenCache,
+            max_size=settings.AUTH_TOKEN_CACHE_MAX_SIZE,
+            ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+        ),
+    )
+
+    password_hasher = providers.Selector(
+        settings.PASSWORD_HASHER,
+        inline=providers.Singleton(BcryptPasswordHasher),
+        process_pool=providers.Singleton(
+            ProcessPoolPasswordHasher,
+            max_workers=settings.PASSWORD_HASHER_WORKERS,
+            max_pending=settings.PASSWORD_HASHER_MAX_PENDING,
+            timeout_seconds=settings.PASSWORD_HASHER_TIMEOUT_SECONDS,
+        ),
+    )
+
+    # ETag
+    resource_versions = providers.Singleton(
+        ResourceVersions,
+        cache_backend=cache_backend,
+        validity_seconds=settings.ETAG_VALIDITY_SECONDS,
+        recent_bump_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    )
+
+    # single-flight
+    drink_read_coalescer = providers.Singleton(
+        ReadCoalescer,
+        ttl_seconds=settings.READ_COALESCING_TTL_SECONDS,
+        max_size=settings.READ_COALESCING_MAX_SIZE,
+        beta=settings.READ_COALESCING_BETA,
+        stale_while_revalidate_seconds=settings.DRINK_STALE_WHILE_REVALIDATE_SECONDS,
+        stale_if_error_seconds=settings.DRINK_STALE_IF_ERROR_SECONDS,
+    )
+    review_read_coalescer = providers.Singleton(
+        ReadCoalescer,
+        ttl_seconds=settings.READ_COALESCING_TTL_SECONDS,
+        max_size=settings.READ_COALESCING_MAX_SIZE,
+        beta=settings.READ_COALESCING_BETA,
+    )
+
+    # warm-up
+    warm_up = providers.Singleton(WarmUp)
 
     # application service
-    user_application_service = providers.Singleton(UserApplicationService, user_repository=user_repository)
+    user_application_service = providers.Singleton(
+        UserApplicationService, user_repository=user_repository, password_hasher=password_hasher
+    )
     auth_application_service = providers.Singleton(
         AuthApplicationService,
         user_application_service=user_application_service,
         jwt_secret_key=settings.JWT_SECRET_KEY,
         jwt_algorithm=settings.JWT_ALGORITHM,
+        token_cache=token_cache,
+    )
+    review_application_service = providers.Singleton(
+        ReviewApplicationService,
+        review_repository=review_repository,
+        unit_of_work_factory=db.provided.unit_of_work,
+        resource_versions=resource_versions,
+        read_coalescer=review_read_coalescer,
+        review_query_service=review_query_service,
+    )
+    wish_application_service = providers.Singleton(
+        WishApplicationService,
+        wish_repository=wish_repository,
+        unit_of_work_factory=db.provided.unit_of_work,
+        resource_versions=resource_versions,
+        wish_query_service=wish_query_service,
+    )
+    drink_application_service = providers.Singleton(
+        DrinkApplicationService,
+        drink_repository=drink_repository,
+        unit_of_work_factory=db.provided.unit_of_work,
+        resource_versions=resource_versions,
+        read_coalescer=drink_read_coalescer,
+        drink_query_service=drink_query_service,
+    )
+
+    # async application service
+    service_executor = providers.Selector(
+        settings.SERVICE_EXECUTOR,
+        shared=providers.Object(None),
+        dedicated=providers.Singleton(build_service_executor, max_workers=settings.SERVICE_EXECUTOR_WORKERS),
+    )
+    async_user_application_service = providers.Factory(
+        AsyncApplicationService, application_service=user_application_service, executor=service_executor
+    )
+    async_auth_application_service = providers.Factory(
+        AsyncAuthApplicationService, application_service=auth_application_service, executor=service_executor
+    )
+    async_review_application_service = providers.Factory(
+        AsyncApplicationService, application_service=review_application_service, executor=service_executor
+    )
+    async_wish_application_service = providers.Factory(
+        AsyncApplicationService, application_service=wish_application_service, executor=service_executor
+    )
+    async_drink_application_service = providers.Factory(
+        AsyncApplicationService, application_service=drink_application_service, executor=service_executor
     )
-    review_application_service = providers.Singleton(ReviewApplicationService, review_repository=review_repository)
-    wish_application_service = providers.Singleton(WishApplicationService, wish_repository=wish_repository)
-    drink_application_service = providers.Singleton(DrinkApplicationService, drink_repository=drink_repository)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -18,25 +18,14 @@ class FindDrinkOutputDto(SuccessOutputDto):
     avg_rating: float
     num_of_reviews: int
     num_of_wish: int
+    # DB 를 읽지 못해 예전에 읽은 값으로 응답했다면, 그 값을 읽은 뒤 지난 시간(초)
+    stale_seconds: Optional[float] = None
 
 
 class FindDrinksInputDto(BaseModel):
     query_param: QueryParam
 
 
-class FindDrinksOutputDto(SuccessOutputDto):
-    class Item(BaseModel):
-        drink_id: str
-        drink_name: str
-        drink_image_url: str
-        drink_type: str
-        avg_rating: float
-        num_of_reviews: int
-        num_of_wish: int
-
-    items: List[Item]
-
-
 class CreateDrinkInputDto(BaseModel):
     drink_name: str
     drink_image_url: str
@@ -52,7 +41,7 @@ class UpdateDrinkInputDto(BaseModel):
     drink_name: str
     drink_image_url: str
     drink_type: str
-    avg_rating: float
+    rating_sum: int
     num_of_reviews: int
     num_of_wish: int
 
@@ -0,0 +1,42 @@
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict
+
+from drinks.domain.entities import Drink
+from drinks.domain.repository import DrinkRepository, QueryParam
+from shared_kernel.domain.pagination import RowPage
+
+
+def drink_row(drink: Drink) -> Dict[str, Any]:
+    return {
+        "drink_id": str(drink.id),
+        "name": drink.name,
+        "image_url": drink.image_url,
+        "type": drink.type.value,
+        "avg_rating": drink.avg_rating,
+        "num_of_reviews": drink.num_of_reviews,
+        "num_of_wish": drink.num_of_wish,
+    }
+
+
+class DrinkQueryService(metaclass=ABCMeta):
+    """
+    GET /drinks 의 항목 모양(GetDrinkJsonResponse) 그대로 술 목록을 읽는다.
+    cursor 는 DrinkRepository.find_all 과 같으므로 두 경로의 페이지를 섞어 써도 된다.
+    """
+
+    @abstractmethod
+    def find_rows(self, query_param: QueryParam) -> RowPage:
+        pass
+
+
+class RepositoryDrinkQueryService(DrinkQueryService):
+    """
+    repository 로 읽은 entity 를 행으로 바꾼다. 행을 바로 읽는 query service 가 없을 때 쓴다.
+    """
+
+    def __init__(self, drink_repository: DrinkRepository) -> None:
+        self._drink_repository = drink_repository
+
+    def find_rows(self, query_param: QueryParam) -> RowPage:
+        page = self._drink_repository.find_all(query_param)
+        return RowPage(items=[drink_row(drink) for drink in page.items], next_cursor=page.next_cursor)
@@ -1,5 +1,5 @@
 import time
-from typing import Union
+from typing import Callable, List, Optional, Tuple, Union
 
 from drinks.application.dtos import (
     AddDrinkReviewInputDto,
@@ -17,27 +17,42 @@ from drinks.application.dtos import (
     FindDrinkInputDto,
     FindDrinkOutputDto,
     FindDrinksInputDto,
-    FindDrinksOutputDto,
     UpdateDrinkInputDto,
     UpdateDrinkOutputDto,
     UpdateDrinkReviewInputDto,
     UpdateDrinkReviewOutputDto,
 )
+from drinks.application.query_service import DrinkQueryService, RepositoryDrinkQueryService
 from drinks.domain.entities import Drink
-from drinks.domain.repository import DrinkRepository
-from drinks.domain.value_objects import DrinkRating, DrinkType
-from shared_kernel.application.dtos import FailedOutputDto
-from shared_kernel.domain.exceptions import ResourceNotFoundError, ResourceAlreadyExistError
+from drinks.domain.repository import DrinkRepository, QueryParam
+from drinks.domain.value_objects import DrinkType, FilterType
+from shared_kernel.application.dtos import FailedOutputDto, RowsOutputDto
+from shared_kernel.application.unit_of_work import NullUnitOfWork, UnitOfWork
+from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceNotFoundError, ResourceAlreadyExistError
+from shared_kernel.domain.pagination import RowPage
 from shared_kernel.domain.value_objects import DrinkId
+from shared_kernel.infra_structure.read_coalescer import ReadCoalescer
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
 
 
 class DrinkApplicationService:
-    def __init__(self, drink_repository: DrinkRepository) -> None:
+    def __init__(
+        self,
+        drink_repository: DrinkRepository,
+        unit_of_work_factory: Callable[[], UnitOfWork] = NullUnitOfWork,
+        resource_versions: Optional[ResourceVersions] = None,
+        read_coalescer: Optional[ReadCoalescer] = None,
+        drink_query_service: Optional[DrinkQueryService] = None,
+    ) -> None:
         self._drink_repository = drink_repository
+        self._drink_query_service = drink_query_service or RepositoryDrinkQueryService(drink_repository)
+        self._unit_of_work_factory = unit_of_work_factory
+        self._resource_versions = resource_versions
+        self._read_coalescer = read_coalescer
 
     def find_drink(self, input_dto: FindDrinkInputDto) -> Union[FindDrinkOutputDto, FailedOutputDto]:
         try:
-            drink = self._drink_repository.find_by_drink_id(drink_id=DrinkId.from_str(input_dto.drink_id))
+            drink, stale_seconds = self._find_drink(DrinkId.from_str(input_dto.drink_id))
             if drink is None:
                 return FailedOutputDto.build_resource_not_found_error(
                     message=f"{str(input_dto.drink_id)}의 술을 찾을 수 없습니다."
@@ -48,9 +63,10 @@ class DrinkApplicationService:
                 drink_name=drink.name,
                 drink_image_url=drink.image_url,
                 drink_type=drink.type.value,
-                avg_rating=float(drink.avg_rating),
+                avg_rating=drink.avg_rating,
                 num_of_reviews=drink.num_of_reviews,
                 num_of_wish=drink.num_of_wish,
+                stale_seconds=stale_seconds,
             )
 
         except ResourceNotFoundError as e:
@@ -58,40 +74,34 @@ class DrinkApplicationService:
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
 
-    def find_drinks(self, input_dto: FindDrinksInputDto) -> Union[FindDrinksOutputDto, FailedOutputDto]:
+    def find_drink_rows(self, input_dto: FindDrinksInputDto) -> Union[RowsOutputDto, FailedOutputDto]:
+        """
+        술 목록을 entity, DTO 없이 GET /drinks 의 항목 모양 그대로 돌려준다.
+        """
         try:
-            drinks = self._drink_repository.find_all(input_dto.query_param)
-
-            return FindDrinksOutputDto(
-                items=[
-                    FindDrinksOutputDto.Item(
-                        drink_id=str(drink.id),
-                        drink_name=drink.name,
-                        drink_image_url=drink.image_url,
-                        drink_type=drink.type.value,
-                        avg_rating=float(drink.avg_rating),
-                        num_of_reviews=drink.num_of_reviews,
-                        num_of_wish=drink.num_of_wish,
-                    )
-                    for drink in drinks
-                ]
-            )
+            row_page, stale_seconds = self._find_rows(input_dto.query_param)
+            return RowsOutputDto.build(row_page, stale_seconds=stale_seconds)
 
+        except InvalidParamInputError as e:
+            return FailedOutputDto.build_parameters_error(message=str(e))
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
 
     def create_drink(self, input_dto: CreateDrinkInputDto) -> Union[CreateDrinkOutputDto, FailedOutputDto]:
         try:
-            drink = Drink(
-                id=DrinkId.build(drink_name=input_dto.drink_name, created_at=time.time()),
-                name=input_dto.drink_name,
-                image_url=input_dto.drink_image_url,
-                type=DrinkType.from_str(input_dto.drink_type),
-            )
+            with self._unit_of_work_factory():
+                drink = Drink(
+                    id=DrinkId.build(drink_name=input_dto.drink_name, created_at=time.time()),
+                    name=input_dto.drink_name,
+                    image_url=input_dto.drink_image_url,
+                    type=DrinkType.from_str(input_dto.drink_type),
+                )
 
-            self._drink_repository.add(drink)
+                self._drink_repository.add(drink)
+                self._invalidate_reads()
+                self._bump_versions()
 
-            return CreateDrinkOutputDto()
+                return CreateDrinkOutputDto()
 
         except ResourceAlreadyExistError as e:
             return FailedOutputDto.build_resource_conflict_error(message=str(e))
@@ -100,22 +110,25 @@ class DrinkApplicationService:
 
     def update_drink(self, input_dto: UpdateDrinkInputDto) -> Union[UpdateDrinkOutputDto, FailedOutputDto]:
         try:
-            drink_id = DrinkId.from_str(input_dto.drink_id)
-            if self._drink_repository.find_by_drink_id(drink_id) is None:
-                return FailedOutputDto.build_resource_not_found_error(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
-
-            drink = Drink(
-                id=drink_id,
-                name=input_dto.drink_name,
-                image_url=input_dto.drink_image_url,
-                type=input_dto.drink_type,
-                avg_rating=DrinkRating(value=input_dto.avg_rating),
-                num_of_reviews=input_dto.num_of_reviews,
-                num_of_wish=input_dto.num_of_wish,
-            )
-            self._drink_repository.update(drink)
+            with self._unit_of_work_factory():
+                drink_id = DrinkId.from_str(input_dto.drink_id)
+                if self._drink_repository.find_by_drink_id(drink_id) is None:
+                    return FailedOutputDto.build_resource_not_found_error(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
+
+                drink = Drink(
+                    id=drink_id,
+                    name=input_dto.drink_name,
+                    image_url=input_dto.drink_image_url,
+                    type=input_dto.drink_type,
+                    rating_sum=input_dto.rating_sum,
+                    num_of_reviews=input_dto.num_of_reviews,
+                    num_of_wish=input_dto.num_of_wish,
+                )
+                self._drink_repository.update(drink)
+                self._invalidate_reads()
+                self._bump_versions()
 
-            return UpdateDrinkOutputDto()
+                return UpdateDrinkOutputDto()
 
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
@@ -124,13 +137,16 @@ class DrinkApplicationService:
 
     def delete_drink(self, input_dto: DeleteDrinkInputDto) -> Union[DeleteDrinkOutputDto, FailedOutputDto]:
         try:
-            drink_id = DrinkId.from_str(input_dto.drink_id)
-            if self._drink_repository.find_by_drink_id(drink_id) is None:
-                return FailedOutputDto.build_resource_not_found_error(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
+            with self._unit_of_work_factory():
+                drink_id = DrinkId.from_str(input_dto.drink_id)
+                if self._drink_repository.find_by_drink_id(drink_id) is None:
+                    return FailedOutputDto.build_resource_not_found_error(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
 
-            self._drink_repository.delete_by_drink_id(drink_id)
+                self._drink_repository.delete_by_drink_id(drink_id)
+                self._invalidate_reads()
+                self._bump_versions()
 
-            return DeleteDrinkOutputDto()
+                return DeleteDrinkOutputDto()
 
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
@@ -139,12 +155,11 @@ class DrinkApplicationService:
 
     def add_drink_review(self, input_dto: AddDrinkReviewInputDto) -> Union[AddDrinkReviewOutputDto, FailedOutputDto]:
         try:
-            drink = self._drink_repository.find_by_drink_id(DrinkId.from_str(input_dto.drink_id))
-
-            drink.add_rating(input_dto.drink_rating)
-            self._drink_repository.update(drink)
+            with self._unit_of_work_factory():
+                self._drink_repository.add_rating(DrinkId.from_str(input_dto.drink_id), rating=input_dto.drink_rating)
+                self._invalidate_reads()
 
-            return AddDrinkReviewOutputDto()
+                return AddDrinkReviewOutputDto()
 
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
@@ -155,19 +170,15 @@ class DrinkApplicationService:
         self, input_dto: UpdateDrinkReviewInputDto
     ) -> Union[UpdateDrinkReviewOutputDto, FailedOutputDto]:
         try:
-            drink = self._drink_repository.find_by_drink_id(DrinkId.from_str(input_dto.drink_id))
-            if drink is None:
-                return FailedOutputDto.build_resource_not_found_error(
-                    message=f"{str(input_dto.drink_id)}의 술을 찾을 수 없습니다."
+            with self._unit_of_work_factory():
+                self._drink_repository.update_rating(
+                    DrinkId.from_str(input_dto.drink_id),
+                    old_rating=input_dto.old_drink_rating,
+                    new_rating=input_dto.new_drink_rating,
                 )
+                self._invalidate_reads()
 
-            drink.update_rating(
-                old_rating=input_dto.old_drink_rating,
-                new_rating=input_dto.new_drink_rating,
-            )
-            self._drink_repository.update(drink)
-
-            return UpdateDrinkReviewOutputDto()
+                return UpdateDrinkReviewOutputDto()
 
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
@@ -178,12 +189,13 @@ class DrinkApplicationService:
         self, input_dto: DeleteDrinkReviewInputDto
     ) -> Union[DeleteDrinkReviewOutputDto, FailedOutputDto]:
         try:
-            drink = self._drink_repository.find_by_drink_id(DrinkId.from_str(input_dto.drink_id))
-
-            drink.delete_rating(input_dto.drink_rating)
-            self._drink_repository.update(drink)
+            with self._unit_of_work_factory():
+                self._drink_repository.delete_rating(
+                    DrinkId.from_str(input_dto.drink_id), rating=input_dto.drink_rating
+                )
+                self._invalidate_reads()
 
-            return DeleteDrinkReviewOutputDto()
+                return DeleteDrinkReviewOutputDto()
 
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
@@ -192,30 +204,69 @@ class DrinkApplicationService:
 
     def add_drink_wish(self, input_dto: AddDrinkWishInputDto) -> Union[AddDrinkWishOutputDto, FailedOutputDto]:
         try:
-            drink = self._drink_repository.find_by_drink_id(DrinkId.from_str(input_dto.drink_id))
-
-            drink.add_wish()
-            self._drink_repository.update(drink)
+            with self._unit_of_work_factory():
+                self._drink_repository.add_wish(DrinkId.from_str(input_dto.drink_id))
+                self._invalidate_reads()
 
-            return AddDrinkWishOutputDto()
+                return AddDrinkWishOutputDto()
 
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
 
-    def delete_drink_wish(
-        self, input_dto: DeleteDrinkWishInputDto
-    ) -> Union[DeleteDrinkWishOutputDto, FailedOutputDto]:
+    def delete_drink_wish(self, input_dto: DeleteDrinkWishInputDto) -> Union[DeleteDrinkWishOutputDto, FailedOutputDto]:
         try:
-            drink = self._drink_repository.find_by_drink_id(DrinkId.from_str(input_dto.drink_id))
+            with self._unit_of_work_factory():
+                self._drink_repository.delete_wish(DrinkId.from_str(input_dto.drink_id))
+                self._invalidate_reads()
 
-            drink.delete_wish()
-            self._drink_repository.update(drink)
-
-            return DeleteDrinkWishOutputDto()
+                return DeleteDrinkWishOutputDto()
 
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
+
+    def warm_up(self, num_of_pages: int = 1) -> List[str]:
+        """
+        정렬 조건마다 앞쪽 num_of_pages 페이지를 읽어 술 랭킹을 올리고, 그 페이지의 술들을 단건 캐시에 채운다.
+        리뷰가 많은 순서로 읽은 술 id 를 돌려준다.
+        """
+        most_reviewed_drink_ids = []
+        for filter_type in FilterType:
+            query_param = QueryParam(filter=filter_type.value).to_enum()
+            for _ in range(num_of_pages):
+                page, _ = self._find_rows(query_param)
+                drink_ids = [row["drink_id"] for row in page.items]
+                for drink_id in drink_ids:
+                    self._drink_repository.find_by_drink_id(DrinkId.from_str(drink_id))
+                if filter_type == FilterType.REVIEW:
+                    most_reviewed_drink_ids += drink_ids
+                if page.next_cursor is None:
+                    break
+                query_param = query_param.copy(update={"cursor": page.next_cursor})
+        return most_reviewed_drink_ids
+
+    def _find_drink(self, drink_id: DrinkId) -> Tuple[Optional[Drink], Optional[float]]:
+        if self._read_coalescer is None:
+            return self._drink_repository.find_by_drink_id(drink_id=drink_id), None
+        return self._read_coalescer.get_with_staleness(
+            f"drink:{drink_id}", lambda: self._drink_repository.find_by_drink_id(drink_id=drink_id)
+        )
+
+    def _find_rows(self, query_param: QueryParam) -> Tuple[RowPage, Optional[float]]:
+        if self._read_coalescer is None:
+            return self._drink_query_service.find_rows(query_param), None
+        return self._read_coalescer.get_with_staleness(
+            f"rows:{query_param.json()}", lambda: self._drink_query_service.find_rows(query_param)
+        )
+
+    def _invalidate_reads(self) -> None:
+        if self._read_coalescer is not None:
+            self._read_coalescer.invalidate()
+
+    def _bump_versions(self) -> None:
+        # 평점/위시 수 변경은 이 메서드들을 부르는 리뷰/위시 서비스가 올린다.
+        if self._resource_versions is not None:
+            self._resource_versions.bump(ResourceVersions.DRINKS)
@@ -1,46 +1,61 @@
-from typing import ClassVar
+from typing import ClassVar, Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, root_validator
 
 from drinks.domain.value_objects import DrinkRating, DrinkType
-from shared_kernel.domain.value_objects import DrinkId
+from shared_kernel.domain.value_objects import VALUE_OBJECT_JSON_ENCODERS, DrinkId
 
 
 class Drink(BaseModel):
     MIN_NUM_OF_REVIEWS: ClassVar[int] = 0
     MIN_NUM_OF_WISH: ClassVar[int] = 0
+    MIN_RATING_SUM: ClassVar[int] = 0
 
     id: DrinkId
     name: str
     image_url: str
     type: DrinkType
-    avg_rating: DrinkRating = Field(default=DrinkRating())
+    # 평점은 리뷰 평점의 정수 합계로 들고 평균은 읽을 때 나눈다. 쓰기마다 평균을 다시 곱하고 나누며 오차가 쌓이지 않는다.
+    rating_sum: int = Field(default=0, ge=MIN_RATING_SUM)
     num_of_reviews: int = Field(default=0, ge=MIN_NUM_OF_REVIEWS)
     num_of_wish: int = Field(default=0, ge=MIN_NUM_OF_WISH)
 
+    class Config:
+        json_encoders = VALUE_OBJECT_JSON_ENCODERS
+
+    @root_validator(skip_on_failure=True)
+    def check_rating_sum(cls, values: Dict) -> Dict:
+        if values["rating_sum"] > DrinkRating.MAX_VALUE * values["num_of_reviews"]:
+            raise ValueError(
+                f"rating_sum: {values['rating_sum']}가 리뷰 {values['num_of_reviews']}개의 평점 합계보다 큽니다."
+            )
+        return values
+
+    @property
+    def avg_rating(self) -> float:
+        if self.num_of_reviews <= 0:
+            return 0.0
+        return self.rating_sum / self.num_of_reviews
+
     def add_rating(self, input_rating: int) -> None:
-        sum_rating_value = (float(self.avg_rating) * self.num_of_reviews) + input_rating
+        self.rating_sum += input_rating
         self.num_of_reviews += 1
-        self.avg_rating = DrinkRating(value=(sum_rating_value / self.num_of_reviews))
 
     def update_rating(self, old_rating: int, new_rating: int) -> None:
         if self.num_of_reviews <= 0:
             return
 
-        sum_rating_value = (float(self.avg_rating) * self.num_of_reviews) - old_rating + new_rating
-        self.avg_rating = DrinkRating(value=(sum_rating_value / self.num_of_reviews))
+        self.rating_sum += new_rating - old_rating
 
     def delete_rating(self, input_rating: int) -> None:
         if self.num_of_reviews <= 0:
             return
 
-        total_rating_value = (float(self.avg_rating) * self.num_of_reviews) - input_rating
         self.num_of_reviews -= 1
-
         if self.num_of_reviews == 0:
-            self.avg_rating = DrinkRating(value=0)
+            self.rating_sum = 0
         else:
-            self.avg_rating = DrinkRating(value=(total_rating_value / self.num_of_reviews))
+            self.rating_sum -= input_rating
 
     def add_wish(self) -> None:
         self.num_of_wish += 1
@@ -1,10 +1,12 @@
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
 from drinks.domain.entities import Drink
 from drinks.domain.value_objects import DrinkType, FilterType, OrderType
+from shared_kernel.domain.exceptions import InvalidParamInputError
+from shared_kernel.domain.pagination import Cursor, Page, PageSize
 from shared_kernel.domain.value_objects import DrinkId
 
 
@@ -12,17 +14,56 @@ class QueryParam(BaseModel):
     type: Union[str, DrinkType] = "all"
     filter: Union[str, FilterType] = "review"
     order: Union[str, OrderType] = "descending"
+    limit: int = PageSize.DEFAULT
+    cursor: Optional[str] = None
 
     def to_enum(self) -> "QueryParam":
         self.type = DrinkType.from_str(self.type)
         self.filter = FilterType.from_str(self.filter)
         self.order = OrderType.from_str(self.order)
-        return QueryParam(type=self.type, filter=self.filter, order=self.order)
+        return QueryParam(type=self.type, filter=self.filter, order=self.order, limit=self.limit, cursor=self.cursor)
+
+    def sort_key(self, drink: Drink) -> Tuple[Union[int, float], str]:
+        if self.filter == FilterType.RATING:
+            return drink.avg_rating, str(drink.id)
+        if self.filter == FilterType.WISH:
+            return drink.num_of_wish, str(drink.id)
+        return drink.num_of_reviews, str(drink.id)
+
+    def encode_cursor(self, drink: Drink) -> str:
+        return self.encode_sort_key(self.sort_key(drink))
+
+    def encode_sort_key(self, sort_key: Tuple[Union[int, float], str]) -> str:
+        # 다른 정렬 조건으로 만든 cursor 를 잘못 쓰지 않도록 정렬 조건도 함께 담는다.
+        return Cursor(values=[self.filter.value, self.order.value, *sort_key]).encode()
+
+    def decode_cursor(self) -> Optional[Tuple[Union[int, float], str]]:
+        if self.cursor is None:
+            return None
+        filter_value, order_value, sort_value, drink_id = Cursor.decode(self.cursor, num_of_values=4).values
+        if filter_value != self.filter.value or order_value != self.order.value:
+            raise InvalidParamInputError(f"cursor: {self.cursor}는 다른 정렬 조건으로 만들어진 cursor 입니다.")
+        # 값을 바꾸지 않고 타입만 확인한다. 3.7 을 int 로 자르면 오류 없이 엉뚱한 페이지를 돌려주게 된다.
+        sort_value_types = (int, float) if self.filter == FilterType.RATING else (int,)
+        if not isinstance(sort_value, sort_value_types) or isinstance(sort_value, bool):
+            raise InvalidParamInputError(f"cursor: {self.cursor}는 올바르지 않은 cursor 입니다.")
+        try:
+            sort_value = float(sort_value) if self.filter == FilterType.RATING else sort_value
+            return sort_value, str(DrinkId.from_str(drink_id))
+        except (AttributeError, TypeError, ValueError):
+            raise InvalidParamInputError(f"cursor: {self.cursor}는 올바르지 않은 cursor 입니다.")
 
 
 class DrinkRepository(metaclass=ABCMeta):
     @abstractmethod
-    def find_all(self, query_param: QueryParam) -> List[Drink]:
+    def find_all(self, query_param: QueryParam) -> Page[Drink]:
+        pass
+
+    @abstractmethod
+    def find_catalog(self) -> List[Drink]:
+        """
+        정렬, 페이지 없이 모든 술을 읽는다. 술 목록 전체를 메모리에 올려 둘 때만 쓴다.
+        """
         pass
 
     @abstractmethod
@@ -40,3 +81,25 @@ class DrinkRepository(metaclass=ABCMeta):
     @abstractmethod
     def delete_by_drink_id(self, drink_id: DrinkId) -> None:
         pass
+
+    # 아래 메서드들은 동시에 들어오는 리뷰 / 위시에도 값을 잃지 않도록 저장소에서 원자적으로 값을 바꾸고,
+    # 바뀐 뒤의 Drink 를 돌려준다.
+    @abstractmethod
+    def add_rating(self, drink_id: DrinkId, rating: int) -> Drink:
+        pass
+
+    @abstractmethod
+    def update_rating(self, drink_id: DrinkId, old_rating: int, new_rating: int) -> Drink:
+        pass
+
+    @abstractmethod
+    def delete_rating(self, drink_id: DrinkId, rating: int) -> Drink:
+        pass
+
+    @abstractmethod
+    def add_wish(self, drink_id: DrinkId) -> Drink:
+        pass
+
+    @abstractmethod
+    def delete_wish(self, drink_id: DrinkId) -> Drink:
+        pass
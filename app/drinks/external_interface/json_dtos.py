@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pydantic import BaseModel
 
 from drinks.application.dtos import FindDrinkOutputDto
@@ -35,3 +37,8 @@ class GetDrinkJsonResponse(BaseModel):
             num_of_reviews=output_dto.num_of_reviews,
             num_of_wish=output_dto.num_of_wish,
         )
+
+
+class GetDrinksJsonResponse(BaseModel):
+    items: List[GetDrinkJsonResponse]
+    next_cursor: Optional[str] = None
@@ -1,19 +1,27 @@
-from typing import Optional, Union, List
+from typing import Optional, Union
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from container import Container
 from drinks.application.dtos import CreateDrinkInputDto, FindDrinksInputDto
-from drinks.application.service import DrinkApplicationService
 from drinks.domain.repository import QueryParam
 from drinks.external_interface.json_dtos import (
     CreateDrinkJsonRequest,
-    GetDrinkJsonResponse,
+    GetDrinksJsonResponse,
 )
-from shared_kernel.external_interface.json_dtos import FailedJsonResponse
+from shared_kernel.application.async_service import AsyncApplicationService
+from shared_kernel.external_interface.conditional_get import (
+    build_not_modified_response,
+    is_not_modified,
+    set_cache_headers,
+    set_stale_headers,
+)
+from shared_kernel.external_interface.json_dtos import FailedJsonResponse, RowsJsonResponse
+from shared_kernel.infra_structure.database import pin_request_to_primary
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
 
 router = APIRouter(
     prefix="/drinks",
@@ -23,29 +31,43 @@ router = APIRouter(
 
 @router.post("", status_code=status.HTTP_201_CREATED)
 @inject
-def create_drink(
+async def create_drink(
     request: CreateDrinkJsonRequest,
-    drink_application_service: DrinkApplicationService = Depends(Provide[Container.drink_application_service]),
+    drink_application_service: AsyncApplicationService = Depends(Provide[Container.async_drink_application_service]),
 ) -> Optional[JSONResponse]:
     input_dto = CreateDrinkInputDto(
         drink_name=request.drink_name,
         drink_image_url=request.drink_image_url,
         drink_type=request.drink_type,
     )
-    output_dto = drink_application_service.create_drink(input_dto=input_dto)
+    output_dto = await drink_application_service.create_drink(input_dto=input_dto)
     if not output_dto.status:
         return FailedJsonResponse.build_by_output_dto(output_dto)
 
 
-@router.get("", status_code=status.HTTP_200_OK, response_model=List[GetDrinkJsonResponse])
+@router.get("", status_code=status.HTTP_200_OK, response_model=GetDrinksJsonResponse)
 @inject
-def get_drinks(
+async def get_drinks(
     query_param: QueryParam = Depends(),
-    drink_application_service: DrinkApplicationService = Depends(Provide[Container.drink_application_service]),
-) -> Union[List[GetDrinkJsonResponse], JSONResponse]:
+    if_none_match: Optional[str] = Header(None),
+    drink_application_service: AsyncApplicationService = Depends(Provide[Container.async_drink_application_service]),
+    resource_versions: ResourceVersions = Depends(Provide[Container.resource_versions]),
+) -> Union[JSONResponse, Response]:
+    # 버전을 먼저 읽어야, 조회 도중 쓰기가 일어나도 더 새 응답에 예전 ETag 가 붙을 뿐 그 반대가 되지 않는다.
+    etag, recently_bumped = await resource_versions.lookup(ResourceVersions.DRINKS, variant=query_param.json())
+    if is_not_modified(if_none_match, etag):
+        return build_not_modified_response(etag)
+    if recently_bumped:
+        # 방금 쓰인 목록은 replica 가 아직 따라오지 못했을 수 있으므로, 새 ETag 에 맞게 primary 에서 읽는다.
+        pin_request_to_primary()
+
     input_dto = FindDrinksInputDto(query_param=query_param.to_enum())
-    output_dto = drink_application_service.find_drinks(input_dto=input_dto)
+    output_dto = await drink_application_service.find_drink_rows(input_dto=input_dto)
     if not output_dto.status:
         return FailedJsonResponse.build_by_output_dto(output_dto)
-    get_drinks_json_response = [GetDrinkJsonResponse.build_by_output_dto(review) for review in output_dto.items]
-    return get_drinks_json_response
+    json_response = RowsJsonResponse.build_by_output_dto(output_dto)
+    if output_dto.stale_seconds is not None:
+        set_stale_headers(json_response, output_dto.stale_seconds)
+    else:
+        set_cache_headers(json_response, etag)
+    return json_response
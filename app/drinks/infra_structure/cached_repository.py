@@ -0,0 +1,87 @@
+from typing import Callable, List, Optional
+
+from drinks.domain.entities import Drink
+from drinks.domain.repository import DrinkRepository, QueryParam
+from shared_kernel.domain.pagination import Page
+from shared_kernel.domain.value_objects import DrinkId
+from shared_kernel.infra_structure.cache_backend import CacheBackend
+from shared_kernel.infra_structure.read_through_cache import ReadThroughCache
+from shared_kernel.infra_structure.unit_of_work import call_after_transaction
+
+
+class CachedDrinkRepository(DrinkRepository):
+    """
+    find_by_drink_id 결과를 CacheBackend 에 담아 두는 read-through 캐시.
+    negative_ttl_seconds 동안은 없는 id 도 기억해 둔다.
+    쓰기 메서드는 원래 repository 에 위임한 뒤 해당 술을 캐시에서 지운다.
+    """
+
+    def __init__(
+        self,
+        drink_repository: DrinkRepository,
+        cache_backend: CacheBackend,
+        ttl_seconds: float = 60,
+        negative_ttl_seconds: float = 0,
+        tombstone_ttl_seconds: float = 5,
+        after_transaction: Callable[[Callable[[], None]], bool] = call_after_transaction,
+    ) -> None:
+        self._drink_repository = drink_repository
+        self._cache = ReadThroughCache(
+            backend=cache_backend,
+            # Drink 가 avg_rating 대신 rating_sum 을 담게 되면서, 예전 형식으로 담긴 값을 읽지 않도록 이름을 바꿨다.
+            namespace="drink.v2",
+            model=Drink,
+            ttl_seconds=ttl_seconds,
+            negative_ttl_seconds=negative_ttl_seconds,
+            tombstone_ttl_seconds=tombstone_ttl_seconds,
+            after_transaction=after_transaction,
+        )
+
+    def find_by_drink_id(self, drink_id: DrinkId) -> Optional[Drink]:
+        return self._cache.get(str(drink_id), lambda: self._drink_repository.find_by_drink_id(drink_id))
+
+    def find_all(self, query_param: QueryParam) -> Page[Drink]:
+        return self._drink_repository.find_all(query_param)
+
+    def find_catalog(self) -> List[Drink]:
+        return self._drink_repository.find_catalog()
+
+    def add(self, drink: Drink) -> None:
+        self._drink_repository.add(drink)
+        self._invalidate(drink.id)
+
+    def update(self, drink: Drink) -> None:
+        self._drink_repository.update(drink)
+        self._invalidate(drink.id)
+
+    def delete_by_drink_id(self, drink_id: DrinkId) -> None:
+        self._drink_repository.delete_by_drink_id(drink_id)
+        self._invalidate(drink_id)
+
+    def add_rating(self, drink_id: DrinkId, rating: int) -> Drink:
+        drink = self._drink_repository.add_rating(drink_id, rating)
+        self._invalidate(drink_id)
+        return drink
+
+    def update_rating(self, drink_id: DrinkId, old_rating: int, new_rating: int) -> Drink:
+        drink = self._drink_repository.update_rating(drink_id, old_rating, new_rating)
+        self._invalidate(drink_id)
+        return drink
+
+    def delete_rating(self, drink_id: DrinkId, rating: int) -> Drink:
+        drink = self._drink_repository.delete_rating(drink_id, rating)
+        self._invalidate(drink_id)
+        return drink
+
+    def add_wish(self, drink_id: DrinkId) -> Drink:
+        drink = self._drink_repository.add_wish(drink_id)
+        self._invalidate(drink_id)
+        return drink
+
+    def delete_wish(self, drink_id: DrinkId) -> Drink:
+        drink = self._drink_repository.delete_wish(drink_id)
+        self._invalidate(drink_id)
+        return drink
+
+    def _invalidate(self, drink_id: DrinkId) -> None:
+        self._cache.invalidate(str(drink_id))
@@ -0,0 +1,223 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # DRINK_LEADERBOARD=columnar 일 때만 필요하다.
+    np = None
+
+from drinks.application.query_service import drink_row
+from drinks.domain.entities import Drink
+from drinks.domain.repository import QueryParam
+from drinks.domain.value_objects import DrinkType, FilterType, OrderType
+from shared_kernel.domain.pagination import Page, PageSize, RowPage
+from shared_kernel.domain.value_objects import DrinkId
+
+# QueryParam.sort_key 를 그대로 써서, SQL 로 읽은 페이지와 같은 순서 / 같은 cursor 를 만든다.
+_SORT_KEYS = {filter_type: QueryParam(filter=filter_type).sort_key for filter_type in FilterType}
+_VALUE_DTYPES = {FilterType.REVIEW: "int64", FilterType.RATING: "float64", FilterType.WISH: "int64"}
+_TYPE_CODES = {drink_type: code for code, drink_type in enumerate(DrinkType)}
+# DrinkId 를 문자열로 바꾼 길이
+_ID_LENGTH = 36
+
+
+class ColumnarDrinkCatalog:
+    """
+    DrinkLeaderboard 와 같은 페이지를, 술 전체를 컬럼 배열(numpy)로 들고 만든다.
+    술마다 slot 하나를 주고 slot 위치에 종류 코드, 리뷰 수, 평균 평점, 위시 수, id 를 담는다.
+    술 종류(전체 포함) x 정렬 기준마다 (정렬 값, id) 순서의 slot 순열과 그 순서의 정렬 값을 미리 만들어 두고,
+    페이지는 cursor 위치를 정렬 값에서 이진 탐색해 순열을 잘라 읽는다. 오름차순 / 내림차순은 같은 순열을 양쪽에서 읽는다.
+
+    술 하나가 바뀌면 그 slot 의 값만 바꾸고, 값이 바뀐 순열에서만 그 slot 을 제자리에서 새 위치로 옮긴다.
+    술이 추가되거나 빠지거나 종류가 바뀔 때만 순열을 새로 만든다.
+    빠진 술의 slot 은 다음에 추가되는 술이 다시 쓴다.
+    """
+
+    INITIAL_CAPACITY = 64
+
+    def __init__(self) -> None:
+        if np is None:
+            raise ImportError("ColumnarDrinkCatalog(DRINK_LEADERBOARD=columnar) 를 쓰려면 numpy 를 설치해야 합니다.")
+        self._lock = threading.Lock()
+        self.replace_all([])
+
+    def replace_all(self, drinks: Iterable[Drink]) -> None:
+        drinks = list({str(drink.id): drink.copy() for drink in drinks}.values())
+        size = len(drinks)
+        capacity = max(self.INITIAL_CAPACITY, size)
+
+        ids = np.zeros(capacity, dtype=f"U{_ID_LENGTH}")
+        ids[:size] = [str(drink.id) for drink in drinks]
+        type_codes = np.zeros(capacity, dtype="int8")
+        type_codes[:size] = [_TYPE_CODES[drink.type] for drink in drinks]
+        values = {}
+        for filter_type, sort_key in _SORT_KEYS.items():
+            values[filter_type] = np.zeros(capacity, dtype=_VALUE_DTYPES[filter_type])
+            values[filter_type][:size] = [sort_key(drink)[0] for drink in drinks]
+
+        orders, sorted_values = {}, {}
+        for drink_type in DrinkType:
+            slots = np.arange(size)
+            if drink_type != DrinkType.ALL:
+                slots = np.flatnonzero(type_codes[:size] == _TYPE_CODES[drink_type])
+            for filter_type in FilterType:
+                order = slots[np.lexsort((ids[slots], values[filter_type][slots]))]
+                orders[(drink_type, filter_type)] = order
+                sorted_values[(drink_type, filter_type)] = values[filter_type][order]
+
+        with self._lock:
+            self._slots: Dict[str, int] = {str(drink.id): slot for slot, drink in enumerate(drinks)}
+            self._free_slots: List[int] = []
+            self._drinks: List[Optional[Drink]] = drinks
+            self._rows: List[Optional[Dict[str, Any]]] = [drink_row(drink) for drink in drinks]
+            self._ids, self._type_codes, self._values = ids, type_codes, values
+            self._orders, self._sorted_values = orders, sorted_values
+
+    def upsert(self, drink: Drink) -> None:
+        drink = drink.copy()
+        drink_id = str(drink.id)
+        with self._lock:
+            slot = self._slots.get(drink_id)
+            old_drink = None
+            if slot is None:
+                slot = self._allocate_slot()
+                self._slots[drink_id] = slot
+                self._ids[slot] = drink_id
+            else:
+                old_drink = self._drinks[slot]
+
+            for filter_type, sort_key in _SORT_KEYS.items():
+                value = sort_key(drink)[0]
+                if old_drink is not None and old_drink.type == drink.type:
+                    # 평점 / 위시가 바뀐 흔한 경우: 순열 안에서 그 slot 만 제자리에서 옮긴다.
+                    if self._values[filter_type][slot] != value:
+                        for drink_type in {DrinkType.ALL, drink.type}:
+                            self._move((drink_type, filter_type), slot, value)
+                        self._values[filter_type][slot] = value
+                    continue
+                if old_drink is not None:
+                    for drink_type in {DrinkType.ALL, old_drink.type}:
+                        self._discard((drink_type, filter_type), slot)
+                self._values[filter_type][slot] = value
+                for drink_type in {DrinkType.ALL, drink.type}:
+                    self._insert((drink_type, filter_type), slot)
+
+            self._type_codes[slot] = _TYPE_CODES[drink.type]
+            self._drinks[slot] = drink
+            # 이미 내준 행은 바꾸지 않고 새 행으로 갈아 끼운다.
+            self._rows[slot] = drink_row(drink)
+
+    def remove(self, drink_id: DrinkId) -> None:
+        with self._lock:
+            slot = self._slots.pop(str(drink_id), None)
+            if slot is None:
+                return
+            for drink_type in {DrinkType.ALL, self._drinks[slot].type}:
+                for filter_type in FilterType:
+                    self._discard((drink_type, filter_type), slot)
+            self._drinks[slot] = None
+            self._rows[slot] = None
+            self._free_slots.append(slot)
+
+    def page(self, query_param: QueryParam) -> Page[Drink]:
+        PageSize.check(query_param.limit)
+        cursor = query_param.decode_cursor()
+
+        with self._lock:
+            slots = self._page_slots(query_param, cursor)
+            drinks = [self._drinks[slot].copy() for slot in slots[: query_param.limit]]
+
+        next_cursor = None
+        if len(slots) > query_param.limit:
+            next_cursor = query_param.encode_cursor(drinks[-1])
+        return Page[Drink](items=drinks, next_cursor=next_cursor)
+
+    def row_page(self, query_param: QueryParam) -> RowPage:
+        """
+        page 와 같은 페이지를 미리 만들어 둔 행으로 돌려준다. 행은 여러 요청이 함께 쓰므로 바꾸면 안 된다.
+        """
+        PageSize.check(query_param.limit)
+        cursor = query_param.decode_cursor()
+
+        with self._lock:
+            slots = self._page_slots(query_param, cursor)
+            items = [self._rows[slot] for slot in slots[: query_param.limit]]
+            last_drink = self._drinks[slots[query_param.limit - 1]] if len(slots) > query_param.limit else None
+
+        next_cursor = None
+        if last_drink is not None:
+            next_cursor = query_param.encode_cursor(last_drink)
+        return RowPage(items=items, next_cursor=next_cursor)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._slots)
+
+    def _page_slots(self, query_param: QueryParam, cursor: Optional[Tuple]) -> List[int]:
+        # lock 을 잡은 채로 부른다. cursor 의 술은 이전 페이지에 있었으므로 빼고 그 다음부터 읽는다.
+        key = (query_param.type, query_param.filter)
+        order = self._orders[key]
+        if query_param.order == OrderType.ASC:
+            start = 0 if cursor is None else self._position(key, cursor, side="right")
+            return order[start : start + query_param.limit + 1].tolist()
+
+        end = len(order) if cursor is None else self._position(key, cursor, side="left")
+        return order[max(end - query_param.limit - 1, 0) : end][::-1].tolist()
+
+    def _position(self, key: Tuple[DrinkType, FilterType], sort_key: Tuple, side: str) -> int:
+        """
+        key 의 순열에서 (정렬 값, id) 가 들어갈 위치. 정렬 값이 같은 구간 안에서는 id 로 다시 찾는다.
+        """
+        value, drink_id = sort_key
+        values = self._sorted_values[key]
+        low = np.searchsorted(values, value, side="left")
+        high = np.searchsorted(values, value, side="right")
+        return int(low + np.searchsorted(self._ids[self._orders[key][low:high]], drink_id, side=side))
+
+    def _insert(self, key: Tuple[DrinkType, FilterType], slot: int) -> None:
+        value = self._values[key[1]][slot]
+        position = self._position(key, (value, self._ids[slot]), side="left")
+        self._orders[key] = np.insert(self._orders[key], position, slot)
+        self._sorted_values[key] = np.insert(self._sorted_values[key], position, value)
+
+    def _discard(self, key: Tuple[DrinkType, FilterType], slot: int) -> None:
+        # slot 의 값이 순열에 넣을 때의 값 그대로일 때 부른다.
+        position = self._position(key, (self._values[key[1]][slot], self._ids[slot]), side="left")
+        self._orders[key] = np.delete(self._orders[key], position)
+        self._sorted_values[key] = np.delete(self._sorted_values[key], position)
+
+    def _move(self, key: Tuple[DrinkType, FilterType], slot: int, value: Any) -> None:
+        # slot 의 값을 value 로 바꾸기 전에 부른다. 두 위치 사이만 한 칸씩 밀어 배열을 새로 만들지 않는다.
+        order, values = self._orders[key], self._sorted_values[key]
+        old_position = self._position(key, (self._values[key[1]][slot], self._ids[slot]), side="left")
+        new_position = self._position(key, (value, self._ids[slot]), side="left")
+        if new_position > old_position:
+            # 예전 위치가 빠지면 그 뒤는 한 칸씩 앞으로 온다.
+            new_position -= 1
+            order[old_position:new_position] = order[old_position + 1 : new_position + 1]
+            values[old_position:new_position] = values[old_position + 1 : new_position + 1]
+        else:
+            order[new_position + 1 : old_position + 1] = order[new_position:old_position]
+            values[new_position + 1 : old_position + 1] = values[new_position:old_position]
+        order[new_position] = slot
+        values[new_position] = value
+
+    def _allocate_slot(self) -> int:
+        if self._free_slots:
+            return self._free_slots.pop()
+
+        slot = len(self._drinks)
+        if slot == len(self._ids):
+            capacity = len(self._ids) * 2
+            self._ids = self._grow(self._ids, capacity)
+            self._type_codes = self._grow(self._type_codes, capacity)
+            self._values = {filter_type: self._grow(values, capacity) for filter_type, values in self._values.items()}
+        self._drinks.append(None)
+        self._rows.append(None)
+        return slot
+
+    @staticmethod
+    def _grow(array: "np.ndarray", capacity: int) -> "np.ndarray":
+        grown = np.zeros(capacity, dtype=array.dtype)
+        grown[: len(array)] = array
+        return grown
@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from drinks.domain.entities import Drink
 from drinks.domain.repository import DrinkRepository, QueryParam
-from drinks.domain.value_objects import FilterType, OrderType
+from drinks.domain.value_objects import DrinkType, OrderType
+from shared_kernel.domain.exceptions import ResourceNotFoundError
+from shared_kernel.domain.pagination import Page, PageSize
 from shared_kernel.domain.value_objects import DrinkId
 
 
@@ -10,29 +12,29 @@ class InMemoryDrinkRepository(DrinkRepository):
     def __init__(self) -> None:
         self.drink_id_to_drink = {}
 
-    def find_all(self, query_param: QueryParam) -> List[Drink]:
-        drinks = list(self.drink_id_to_drink.values())
-        drinks_typed = [drink for drink in drinks if drink.type == query_param.drink]
-
-        drinks_filtered_in_order = []
-        filter_type = FilterType.from_str(query_param.filter)
-        is_order_type = query_param.order != OrderType.DESC
-        if filter_type == FilterType.REVIEW:
-            drinks_filtered_in_order = sorted(
-                drinks_typed,
-                key=lambda drink: drink.num_of_reviews,
-                reverse=is_order_type,
-            )
-        elif filter_type == FilterType.RATING:
-            drinks_filtered_in_order = sorted(
-                drinks_typed,
-                key=lambda drink: float(drink.avg_rating),
-                reverse=is_order_type,
-            )
-        elif filter_type == FilterType.WISH:
-            drinks_filtered_in_order = sorted(drinks_typed, key=lambda drink: drink.num_of_wish, reverse=is_order_type)
-
-        return drinks_filtered_in_order
+    def find_all(self, query_param: QueryParam) -> Page[Drink]:
+        PageSize.check(query_param.limit)
+        cursor = query_param.decode_cursor()
+        is_descending = query_param.order != OrderType.ASC
+
+        drinks = [
+            drink
+            for drink in self.drink_id_to_drink.values()
+            if query_param.type == DrinkType.ALL or drink.type == query_param.type
+        ]
+        drinks = sorted(drinks, key=query_param.sort_key, reverse=is_descending)
+        if cursor is not None:
+            if is_descending:
+                drinks = [drink for drink in drinks if query_param.sort_key(drink) < cursor]
+            else:
+                drinks = [drink for drink in drinks if query_param.sort_key(drink) > cursor]
+
+        items = drinks[: query_param.limit]
+        next_cursor = query_param.encode_cursor(items[-1]) if len(drinks) > query_param.limit else None
+        return Page[Drink](items=items, next_cursor=next_cursor)
+
+    def find_catalog(self) -> List[Drink]:
+        return list(self.drink_id_to_drink.values())
 
     def find_by_drink_id(self, drink_id: DrinkId) -> Optional[Drink]:
         return self.drink_id_to_drink.get(str(drink_id), None)
@@ -45,3 +47,25 @@ class InMemoryDrinkRepository(DrinkRepository):
 
     def delete_by_drink_id(self, drink_id: DrinkId) -> None:
         self.drink_id_to_drink.pop(str(drink_id), None)
+
+    def add_rating(self, drink_id: DrinkId, rating: int) -> Drink:
+        return self._apply(drink_id, lambda drink: drink.add_rating(rating))
+
+    def update_rating(self, drink_id: DrinkId, old_rating: int, new_rating: int) -> Drink:
+        return self._apply(drink_id, lambda drink: drink.update_rating(old_rating=old_rating, new_rating=new_rating))
+
+    def delete_rating(self, drink_id: DrinkId, rating: int) -> Drink:
+        return self._apply(drink_id, lambda drink: drink.delete_rating(rating))
+
+    def add_wish(self, drink_id: DrinkId) -> Drink:
+        return self._apply(drink_id, lambda drink: drink.add_wish())
+
+    def delete_wish(self, drink_id: DrinkId) -> Drink:
+        return self._apply(drink_id, lambda drink: drink.delete_wish())
+
+    def _apply(self, drink_id: DrinkId, change: Callable[[Drink], None]) -> Drink:
+        drink = self.drink_id_to_drink.get(str(drink_id), None)
+        if drink is None:
+            raise ResourceNotFoundError(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
+        change(drink)
+        return drink
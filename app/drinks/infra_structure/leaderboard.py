@@ -0,0 +1,114 @@
+import threading
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sortedcontainers import SortedList
+
+from drinks.application.query_service import drink_row
+from drinks.domain.entities import Drink
+from drinks.domain.repository import QueryParam
+from drinks.domain.value_objects import DrinkType, FilterType, OrderType
+from shared_kernel.domain.pagination import Page, PageSize, RowPage
+from shared_kernel.domain.value_objects import DrinkId
+
+# QueryParam.sort_key 를 그대로 써서, SQL 로 읽은 페이지와 같은 순서 / 같은 cursor 를 만든다.
+_SORT_KEYS = {filter_type: QueryParam(filter=filter_type).sort_key for filter_type in FilterType}
+
+
+class DrinkLeaderboard:
+    """
+    술 종류(전체 포함) x 정렬 기준마다 (정렬 값, id) 를 정렬된 상태로 들고 있는 메모리 랭킹.
+    술 하나가 바뀌면 해당 랭킹들에서 그 술의 키만 O(log n) 으로 빼고 다시 넣는다.
+    오름차순 / 내림차순은 같은 랭킹을 양쪽에서 읽는다.
+    술마다 응답 모양의 행(drink_row)도 미리 만들어 두어, row_page 는 페이지의 행을 찾아 담기만 한다.
+    """
+
+    def __init__(self) -> None:
+        self._drinks: Dict[str, Drink] = {}
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._rankings: Dict[Tuple[DrinkType, FilterType], SortedList] = {
+            (drink_type, filter_type): SortedList() for drink_type in DrinkType for filter_type in FilterType
+        }
+        self._lock = threading.Lock()
+
+    def replace_all(self, drinks: Iterable[Drink]) -> None:
+        drinks = {str(drink.id): drink.copy() for drink in drinks}
+        rankings = {
+            (drink_type, filter_type): SortedList(
+                sort_key(drink) for drink in drinks.values() if drink_type == DrinkType.ALL or drink.type == drink_type
+            )
+            for drink_type in DrinkType
+            for filter_type, sort_key in _SORT_KEYS.items()
+        }
+        rows = {drink_id: drink_row(drink) for drink_id, drink in drinks.items()}
+        with self._lock:
+            self._drinks, self._rows, self._rankings = drinks, rows, rankings
+
+    def upsert(self, drink: Drink) -> None:
+        with self._lock:
+            self._discard(str(drink.id))
+            drink = drink.copy()
+            self._drinks[str(drink.id)] = drink
+            # 이미 내준 행은 바꾸지 않고 새 행으로 갈아 끼운다.
+            self._rows[str(drink.id)] = drink_row(drink)
+            for ranking, sort_key in self._rankings_of(drink):
+                ranking.add(sort_key(drink))
+
+    def remove(self, drink_id: DrinkId) -> None:
+        with self._lock:
+            self._discard(str(drink_id))
+
+    def page(self, query_param: QueryParam) -> Page[Drink]:
+        PageSize.check(query_param.limit)
+        cursor = query_param.decode_cursor()
+
+        with self._lock:
+            keys = self._page_keys(query_param, cursor)
+            drinks = [self._drinks[drink_id].copy() for _, drink_id in keys[: query_param.limit]]
+
+        next_cursor = None
+        if len(keys) > query_param.limit:
+            next_cursor = query_param.encode_cursor(drinks[-1])
+        return Page[Drink](items=drinks, next_cursor=next_cursor)
+
+    def row_page(self, query_param: QueryParam) -> RowPage:
+        """
+        page 와 같은 페이지를 미리 만들어 둔 행으로 돌려준다. 행은 여러 요청이 함께 쓰므로 바꾸면 안 된다.
+        """
+        PageSize.check(query_param.limit)
+        cursor = query_param.decode_cursor()
+
+        with self._lock:
+            keys = self._page_keys(query_param, cursor)
+            items = [self._rows[drink_id] for _, drink_id in keys[: query_param.limit]]
+
+        next_cursor = None
+        if len(keys) > query_param.limit:
+            next_cursor = query_param.encode_sort_key(keys[query_param.limit - 1])
+        return RowPage(items=items, next_cursor=next_cursor)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._drinks)
+
+    def _page_keys(self, query_param: QueryParam, cursor: Optional[Tuple]) -> List[Tuple]:
+        # lock 을 잡은 채로 부른다.
+        ranking = self._rankings[(query_param.type, query_param.filter)]
+        if query_param.order == OrderType.ASC:
+            keys = ranking.irange(minimum=cursor, inclusive=(False, True))
+        else:
+            keys = ranking.irange(maximum=cursor, inclusive=(True, False), reverse=True)
+        return list(islice(keys, query_param.limit + 1))
+
+    def _discard(self, drink_id: str) -> None:
+        self._rows.pop(drink_id, None)
+        drink = self._drinks.pop(drink_id, None)
+        if drink is None:
+            return
+        for ranking, sort_key in self._rankings_of(drink):
+            ranking.discard(sort_key(drink))
+
+    def _rankings_of(self, drink: Drink) -> Iterator[Tuple[SortedList, Callable[[Drink], Tuple]]]:
+        for drink_type in {DrinkType.ALL, drink.type}:
+            for filter_type, sort_key in _SORT_KEYS.items():
+                yield self._rankings[(drink_type, filter_type)], sort_key
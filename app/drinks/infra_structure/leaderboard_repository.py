@@ -0,0 +1,163 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Union
+
+from drinks.application.query_service import DrinkQueryService
+from drinks.domain.entities import Drink
+from drinks.domain.repository import DrinkRepository, QueryParam
+from drinks.infra_structure.columnar_catalog import ColumnarDrinkCatalog
+from drinks.infra_structure.leaderboard import DrinkLeaderboard
+from shared_kernel.domain.exceptions import ResourceNotFoundError
+from shared_kernel.domain.pagination import Page, RowPage
+from shared_kernel.domain.value_objects import DrinkId
+from shared_kernel.infra_structure.unit_of_work import call_after_commit
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderboardDrinkRepository(DrinkRepository, DrinkQueryService):
+    """
+    find_all, find_rows 를 SQL 대신 DrinkLeaderboard(또는 같은 메서드를 가진 ColumnarDrinkCatalog)에서 바로 페이지로 잘라 돌려준다.
+    이 repository 를 거친 쓰기는 commit 된 뒤 leaderboard 에 바로 반영하고,
+    다른 워커/호스트에서 일어난 쓰기는 refresh_interval_seconds 마다 전체를 다시 읽어 맞춘다.
+    """
+
+    def __init__(
+        self,
+        drink_repository: DrinkRepository,
+        leaderboard: Union[DrinkLeaderboard, ColumnarDrinkCatalog],
+        refresh_interval_seconds: float = 30,
+        clock: Callable[[], float] = time.monotonic,
+        after_commit: Callable[[Callable[[], None]], bool] = call_after_commit,
+    ) -> None:
+        self._drink_repository = drink_repository
+        self._leaderboard = leaderboard
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._clock = clock
+        self._after_commit = after_commit
+
+        self._refreshed_at: Optional[float] = None
+        self._refresh_lock = threading.Lock()
+        # 전체를 다시 읽는 동안 반영된 변경은, 읽어 온 목록으로 덮어쓴 뒤에 다시 반영한다.
+        self._changes_during_refresh: Optional[Dict[str, Optional[Drink]]] = None
+        self._changes_lock = threading.Lock()
+
+    def refresh(self) -> None:
+        with self._changes_lock:
+            self._changes_during_refresh = {}
+        try:
+            drinks = self._drink_repository.find_catalog()
+        finally:
+            with self._changes_lock:
+                changes, self._changes_during_refresh = self._changes_during_refresh, None
+
+        with self._changes_lock:
+            self._leaderboard.replace_all(drinks)
+            for drink_id, drink in changes.items():
+                if drink is None:
+                    self._leaderboard.remove(DrinkId.from_str(drink_id))
+                else:
+                    self._leaderboard.upsert(drink)
+        self._refreshed_at = self._clock()
+
+    def find_all(self, query_param: QueryParam) -> Page[Drink]:
+        self._refresh_if_stale()
+        return self._leaderboard.page(query_param)
+
+    def find_rows(self, query_param: QueryParam) -> RowPage:
+        self._refresh_if_stale()
+        return self._leaderboard.row_page(query_param)
+
+    def find_catalog(self) -> List[Drink]:
+        return self._drink_repository.find_catalog()
+
+    def find_by_drink_id(self, drink_id: DrinkId) -> Optional[Drink]:
+        return self._drink_repository.find_by_drink_id(drink_id)
+
+    def add(self, drink: Drink) -> None:
+        self._drink_repository.add(drink)
+        self._apply_on_commit(str(drink.id), drink)
+
+    def update(self, drink: Drink) -> None:
+        self._drink_repository.update(drink)
+        self._apply_on_commit(str(drink.id), drink)
+
+    def delete_by_drink_id(self, drink_id: DrinkId) -> None:
+        self._drink_repository.delete_by_drink_id(drink_id)
+        self._apply_on_commit(str(drink_id), None)
+
+    def add_rating(self, drink_id: DrinkId, rating: int) -> Drink:
+        drink = self._drink_repository.add_rating(drink_id, rating)
+        self._apply_on_commit(str(drink_id), drink)
+        return drink
+
+    def update_rating(self, drink_id: DrinkId, old_rating: int, new_rating: int) -> Drink:
+        drink = self._drink_repository.update_rating(drink_id, old_rating, new_rating)
+        self._apply_on_commit(str(drink_id), drink)
+        return drink
+
+    def delete_rating(self, drink_id: DrinkId, rating: int) -> Drink:
+        drink = self._drink_repository.delete_rating(drink_id, rating)
+        self._apply_on_commit(str(drink_id), drink)
+        return drink
+
+    def add_wish(self, drink_id: DrinkId) -> Drink:
+        drink = self._drink_repository.add_wish(drink_id)
+        self._apply_on_commit(str(drink_id), drink)
+        return drink
+
+    def delete_wish(self, drink_id: DrinkId) -> Drink:
+        drink = self._drink_repository.delete_wish(drink_id)
+        self._apply_on_commit(str(drink_id), drink)
+        return drink
+
+    def _refresh_if_stale(self) -> None:
+        if self._refreshed_at is not None and self._clock() - self._refreshed_at < self._refresh_interval_seconds:
+            return
+
+        # 처음 읽을 때만 기다리고, 이후에는 다른 스레드가 다시 읽는 동안 기존 랭킹으로 응답한다.
+        if not self._refresh_lock.acquire(blocking=self._refreshed_at is None):
+            return
+        try:
+            if self._refreshed_at is None or self._clock() - self._refreshed_at >= self._refresh_interval_seconds:
+                self.refresh()
+        except Exception:
+            if self._refreshed_at is None:
+                raise
+            logger.exception("drink leaderboard 를 다시 읽지 못해 이전 랭킹으로 응답합니다.")
+        finally:
+            self._refresh_lock.release()
+
+    def _apply_on_commit(self, drink_id: str, drink: Optional[Drink]) -> None:
+        """
+        commit 된 뒤 drink_id 의 술을 다시 읽어 leaderboard 에 반영한다. 없으면 leaderboard 에서 뺀다.
+        rollback 된 쓰기는 반영하지 않는다.
+
+        같은 술을 고친 두 트랜잭션의 콜백은 commit 과 반대 순서로 불릴 수 있으므로, 쓴 쪽이 들고 있던 drink 대신
+        lock 안에서 다시 읽은 값을 쓴다. 나중에 lock 을 잡은 콜백이 나중에 읽으므로 마지막에 반영되는 값이 가장 새롭다.
+        쓰기가 일어난 요청의 읽기는 primary 로 고정되므로 replica 지연도 끼어들지 않는다.
+        """
+
+        def apply() -> None:
+            with self._changes_lock:
+                latest = self._reload(drink_id, drink)
+                if self._changes_during_refresh is not None:
+                    self._changes_during_refresh[drink_id] = latest
+                if latest is None:
+                    self._leaderboard.remove(DrinkId.from_str(drink_id))
+                else:
+                    self._leaderboard.upsert(latest)
+
+        if not self._after_commit(apply):
+            apply()
+
+    def _reload(self, drink_id: str, drink: Optional[Drink]) -> Optional[Drink]:
+        try:
+            return self._drink_repository.find_by_drink_id(DrinkId.from_str(drink_id))
+        except ResourceNotFoundError:
+            return None
+        except Exception:
+            # 다시 읽지 못하면 쓴 쪽의 값으로 반영하고, 순서가 뒤바뀌었다면 다음 refresh 에서 맞춘다.
+            logger.warning("commit 된 술 %s 를 다시 읽지 못해 쓴 값으로 반영합니다.", drink_id, exc_info=True)
+            return drink
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Float, Integer, Text
+from sqlalchemy import Column, Computed, String, Float, Index, Integer, Text
 from sqlalchemy.dialects.postgresql import UUID
 
 from drinks.domain.entities import Drink
-from drinks.domain.value_objects import DrinkRating, DrinkType
+from drinks.domain.value_objects import DrinkType
 from shared_kernel.domain.value_objects import DrinkId
 from shared_kernel.infra_structure.database import Base
 
@@ -14,9 +14,15 @@ class DrinkOrm(Base):
     name = Column(String(30), nullable=False)
     image_url = Column(Text, default="", nullable=False)
     type = Column(String(30), nullable=False)
-    avg_rating = Column(Float, default=0, nullable=False)
+    rating_sum = Column(Integer, default=0, nullable=False)
     num_of_reviews = Column(Integer, default=0, nullable=False)
     num_of_wish = Column(Integer, default=0, nullable=False)
+    # migrations/v0006_drink_rating_sum.py 에서 만드는 generated column. 읽기와 평점 순 정렬(인덱스)에만 쓰고 직접 쓰지 않는다.
+    avg_rating = Column(
+        Float,
+        Computed("CASE WHEN num_of_reviews > 0 THEN rating_sum::float / num_of_reviews ELSE 0 END", persisted=True),
+        nullable=False,
+    )
 
     @classmethod
     def from_drink(cls, drink: Drink) -> "DrinkOrm":
@@ -25,7 +31,7 @@ class DrinkOrm(Base):
             name=drink.name,
             image_url=drink.image_url,
             type=drink.type.value,
-            avg_rating=float(drink.avg_rating),
+            rating_sum=drink.rating_sum,
             num_of_reviews=drink.num_of_reviews,
             num_of_wish=drink.num_of_wish,
         )
@@ -35,7 +41,7 @@ class DrinkOrm(Base):
         self.name = drink.name
         self.image_url = drink.image_url
         self.type = drink.type.value
-        self.avg_rating = float(drink.avg_rating)
+        self.rating_sum = drink.rating_sum
         self.num_of_reviews = drink.num_of_reviews
         self.num_of_wish = drink.num_of_wish
 
@@ -45,7 +51,16 @@ class DrinkOrm(Base):
             name=self.name,
             image_url=self.image_url,
             type=DrinkType.from_str(self.type),
-            avg_rating=DrinkRating(value=self.avg_rating),
+            rating_sum=self.rating_sum,
             num_of_reviews=self.num_of_reviews,
             num_of_wish=self.num_of_wish,
         )
+
+
+# 인덱스는 migrations/v0003_drink_keyset_indexes.py 에서 생성된다. (avg_rating 인덱스는 v0006 에서 다시 만든다.)
+Index("ix_drink_type_num_of_reviews_id", DrinkOrm.type, DrinkOrm.num_of_reviews, DrinkOrm.id)
+Index("ix_drink_type_avg_rating_id", DrinkOrm.type, DrinkOrm.avg_rating, DrinkOrm.id)
+Index("ix_drink_type_num_of_wish_id", DrinkOrm.type, DrinkOrm.num_of_wish, DrinkOrm.id)
+Index("ix_drink_num_of_reviews_id", DrinkOrm.num_of_reviews, DrinkOrm.id)
+Index("ix_drink_avg_rating_id", DrinkOrm.avg_rating, DrinkOrm.id)
+Index("ix_drink_num_of_wish_id", DrinkOrm.num_of_wish, DrinkOrm.id)
@@ -0,0 +1,62 @@
+from contextlib import AbstractContextManager
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from drinks.application.query_service import DrinkQueryService
+from drinks.domain.repository import QueryParam
+from drinks.domain.value_objects import FilterType
+from drinks.infra_structure.orm_models import DrinkOrm
+from drinks.infra_structure.orm_repository import build_page_query
+from shared_kernel.domain.pagination import RowPage
+
+_COLUMNS = (
+    DrinkOrm.id,
+    DrinkOrm.name,
+    DrinkOrm.image_url,
+    DrinkOrm.type,
+    DrinkOrm.avg_rating,
+    DrinkOrm.num_of_reviews,
+    DrinkOrm.num_of_wish,
+)
+
+# cursor 에 담는 정렬 값. QueryParam.sort_key 와 같아야 한다.
+_SORT_FIELDS = {
+    FilterType.REVIEW: "num_of_reviews",
+    FilterType.RATING: "avg_rating",
+    FilterType.WISH: "num_of_wish",
+}
+
+
+class OrmDrinkQueryService(DrinkQueryService):
+    """
+    응답에 필요한 컬럼만 tuple 로 읽어 바로 행을 만든다. DrinkOrm, Drink, DTO 를 만들지 않는다.
+    """
+
+    def __init__(self, read_session_factory: Callable[..., AbstractContextManager[Session]]) -> None:
+        self._read_session_factory = read_session_factory
+
+    def find_rows(self, query_param: QueryParam) -> RowPage:
+        with self._read_session_factory() as session:
+            rows = build_page_query(session, query_param, *_COLUMNS).all()
+
+        items = [
+            {
+                "drink_id": str(drink_id),
+                "name": name,
+                "image_url": image_url,
+                "type": drink_type,
+                "avg_rating": avg_rating,
+                "num_of_reviews": num_of_reviews,
+                "num_of_wish": num_of_wish,
+            }
+            for drink_id, name, image_url, drink_type, avg_rating, num_of_reviews, num_of_wish in rows[
+                : query_param.limit
+            ]
+        ]
+
+        next_cursor = None
+        if len(rows) > query_param.limit:
+            last = items[-1]
+            next_cursor = query_param.encode_sort_key((last[_SORT_FIELDS[query_param.filter]], last["drink_id"]))
+        return RowPage(items=items, next_cursor=next_cursor)
@@ -1,72 +1,157 @@
+import uuid
 from contextlib import AbstractContextManager
-from typing import Optional, List, Callable
+from typing import Callable, List, Optional
 
-from sqlalchemy import desc, asc
-from sqlalchemy.orm import Session
+from sqlalchemy import asc, case, desc, tuple_, update
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm.util import identity_key
 
 from drinks.domain.entities import Drink
 from drinks.domain.repository import DrinkRepository, QueryParam
 from drinks.domain.value_objects import OrderType, FilterType, DrinkType
 from drinks.infra_structure.orm_models import DrinkOrm
 from shared_kernel.domain.exceptions import ResourceNotFoundError, ResourceAlreadyExistError
+from shared_kernel.domain.pagination import Page, PageSize
 from shared_kernel.domain.value_objects import DrinkId
 
 
+def build_page_query(session: Session, query_param: QueryParam, *entities) -> Query:
+    """
+    query_param 의 한 페이지를 읽는 쿼리. 다음 페이지가 있는지 알 수 있도록 limit + 1 개까지 읽는다.
+    entities 로 DrinkOrm 대신 컬럼들을 넘기면 그 컬럼들만 tuple 로 읽는다.
+    """
+    PageSize.check(query_param.limit)
+    cursor = query_param.decode_cursor()
+
+    sort_column = DrinkOrm.num_of_reviews
+    if query_param.filter == FilterType.RATING:
+        sort_column = DrinkOrm.avg_rating
+    elif query_param.filter == FilterType.WISH:
+        sort_column = DrinkOrm.num_of_wish
+
+    # (정렬 키, id) 로 순서를 고정하고, cursor 이후의 구간만 인덱스에서 읽는다.
+    query = session.query(*entities)
+    if query_param.type != DrinkType.ALL:
+        query = query.filter(DrinkOrm.type == query_param.type.value)
+
+    if query_param.order == OrderType.ASC:
+        if cursor is not None:
+            query = query.filter(tuple_(sort_column, DrinkOrm.id) > tuple_(cursor[0], uuid.UUID(cursor[1])))
+        query = query.order_by(asc(sort_column), asc(DrinkOrm.id))
+    else:
+        if cursor is not None:
+            query = query.filter(tuple_(sort_column, DrinkOrm.id) < tuple_(cursor[0], uuid.UUID(cursor[1])))
+        query = query.order_by(desc(sort_column), desc(DrinkOrm.id))
+    return query.limit(query_param.limit + 1)
+
+
 class OrmDrinkRepository(DrinkRepository):
-    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[..., AbstractContextManager[Session]],
+        read_session_factory: Optional[Callable[..., AbstractContextManager[Session]]] = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._read_session_factory = read_session_factory or session_factory
 
     def find_by_drink_id(self, drink_id: DrinkId) -> Optional[Drink]:
-        with self._session_factory() as session:
-            drink_orm = session.query(DrinkOrm).filter(DrinkOrm.id == str(drink_id)).first()
+        with self._read_session_factory() as session:
+            drink_orm = session.query(DrinkOrm).get(drink_id.uuid)
             if drink_orm is None:
                 raise ResourceNotFoundError(f"{str(drink_id)}의 리뷰를 찾지 못했습니다.")
             return drink_orm.to_drink()
 
-    def find_all(self, query_param: QueryParam) -> List[Drink]:
-        with self._session_factory() as session:
-            order_filter = DrinkOrm.num_of_reviews
-            if query_param.filter == FilterType.RATING:
-                order_filter = DrinkOrm.avg_rating
-            elif query_param.filter == FilterType.WISH:
-                order_filter = DrinkOrm.num_of_wish
-
-            order_type = desc(order_filter)
-            if order_type == OrderType.ASC:
-                order_type = asc(order_filter)
+    def find_all(self, query_param: QueryParam) -> Page[Drink]:
+        with self._read_session_factory() as session:
+            drink_orms = build_page_query(session, query_param, DrinkOrm).all()
+            drinks = [drink_orm.to_drink() for drink_orm in drink_orms[: query_param.limit]]
 
-            query = session.query(DrinkOrm)
-            if query_param.type == DrinkType.ALL:
-                drink_orms = query.order_by(order_type).all()
-            else:
-                drink_orms = query.filter(DrinkOrm.type == query_param.type.value).order_by(order_type).all()
+        next_cursor = None
+        if len(drink_orms) > query_param.limit:
+            next_cursor = query_param.encode_cursor(drinks[-1])
+        return Page[Drink](items=drinks, next_cursor=next_cursor)
 
-            return [drink_orm.to_drink() for drink_orm in drink_orms]
+    def find_catalog(self) -> List[Drink]:
+        with self._read_session_factory() as session:
+            return [drink_orm.to_drink() for drink_orm in session.query(DrinkOrm).all()]
 
     def add(self, drink: Drink) -> None:
         with self._session_factory() as session:
-            drink_orm = session.query(DrinkOrm).filter(DrinkOrm.id == str(drink.id)).first()
+            drink_orm = session.query(DrinkOrm).get(drink.id.uuid)
             if drink_orm is not None:
                 raise ResourceAlreadyExistError(f"{str(drink.id)}는 이미 존재하는 리뷰입니다.")
 
             drink_orm = DrinkOrm.from_drink(drink)
             session.add(drink_orm)
-            session.commit()
+            session.flush()
 
     def update(self, drink: Drink) -> None:
         with self._session_factory() as session:
-            drink_orm = session.query(DrinkOrm).filter(DrinkOrm.id == str(drink.id)).first()
+            drink_orm = session.query(DrinkOrm).get(drink.id.uuid)
 
             if drink_orm is None:
                 raise ResourceNotFoundError(f"{str(drink.id)}의 리뷰를 찾지 못했습니다.")
 
             drink_orm.fetch_drink(drink)
-            session.commit()
+            session.flush()
 
     def delete_by_drink_id(self, drink_id: DrinkId) -> None:
         with self._session_factory() as session:
-            drink_orm = session.query(DrinkOrm).filter(DrinkOrm.id == str(drink_id)).first()
+            drink_orm = session.query(DrinkOrm).get(drink_id.uuid)
             if drink_orm is None:
                 raise ResourceNotFoundError(f"{str(drink_id)}의 리뷰를 찾지 못했습니다.")
             session.delete(drink_orm)
-            session.commit()
+            session.flush()
+
+    def add_rating(self, drink_id: DrinkId, rating: int) -> Drink:
+        return self._update_returning(
+            drink_id, num_of_reviews=DrinkOrm.num_of_reviews + 1, rating_sum=DrinkOrm.rating_sum + rating
+        )
+
+    def update_rating(self, drink_id: DrinkId, old_rating: int, new_rating: int) -> Drink:
+        return self._update_returning(
+            drink_id,
+            rating_sum=case(
+                [(DrinkOrm.num_of_reviews > 0, DrinkOrm.rating_sum - old_rating + new_rating)],
+                else_=DrinkOrm.rating_sum,
+            ),
+        )
+
+    def delete_rating(self, drink_id: DrinkId, rating: int) -> Drink:
+        return self._update_returning(
+            drink_id,
+            num_of_reviews=case([(DrinkOrm.num_of_reviews > 0, DrinkOrm.num_of_reviews - 1)], else_=0),
+            rating_sum=case([(DrinkOrm.num_of_reviews > 1, DrinkOrm.rating_sum - rating)], else_=0),
+        )
+
+    def add_wish(self, drink_id: DrinkId) -> Drink:
+        return self._update_returning(drink_id, num_of_wish=DrinkOrm.num_of_wish + 1)
+
+    def delete_wish(self, drink_id: DrinkId) -> Drink:
+        return self._update_returning(
+            drink_id, num_of_wish=case([(DrinkOrm.num_of_wish > 0, DrinkOrm.num_of_wish - 1)], else_=0)
+        )
+
+    def _update_returning(self, drink_id: DrinkId, **values) -> Drink:
+        """
+        SET 절의 우변은 UPDATE 직전 행의 값으로 계산되므로, 읽고 쓰는 사이에 다른 요청이 끼어들 틈이 없다.
+        avg_rating 은 generated column 이므로 DB 가 새 rating_sum, num_of_reviews 로 다시 계산한다.
+        """
+        with self._session_factory() as session:
+            drink_table = DrinkOrm.__table__
+            row = session.execute(
+                update(drink_table)
+                .where(drink_table.c.id == drink_id.uuid)
+                .values(**values)
+                .returning(*drink_table.columns)
+            ).first()
+            if row is None:
+                raise ResourceNotFoundError(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
+
+            # 같은 세션에 이미 올라온 DrinkOrm 이 있다면 다음 조회 때 새 값을 읽도록 만료시킨다.
+            drink_orm = session.identity_map.get(identity_key(DrinkOrm, drink_id.uuid))
+            if drink_orm is not None:
+                session.expire(drink_orm)
+
+            # 반환한 값으로 Drink 를 만들면서 도메인의 불변식(평점 범위, 음수가 아닌 개수)을 다시 검증한다.
+            return DrinkOrm(**dict(row)).to_drink()
@@ -1,4 +1,16 @@
-from fastapi import APIRouter
+from typing import Optional
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+from starlette import status
+from starlette.responses import Response
+
+from auth.infra_structure.token_cache import VerifiedTokenCache
+from container import Container
+from shared_kernel.infra_structure.cache_backend import CacheBackend
+from shared_kernel.infra_structure.database import Database
+from shared_kernel.infra_structure.read_coalescer import ReadCoalescer
+from shared_kernel.infra_structure.warm_up import WarmUp
 
 router = APIRouter(
     prefix="/health",
@@ -9,3 +21,33 @@ router = APIRouter(
 @router.get("")
 async def health_check():
     return {"msg": "I'm healthy!"}
+
+
+@router.get("/ready")
+@inject
+async def readiness_check(response: Response, warm_up: WarmUp = Depends(Provide[Container.warm_up])):
+    """
+    warm-up 이 끝나기 전에는 503 을 돌려주어 load balancer 가 트래픽을 보내지 않게 한다.
+    """
+    warm_up_status = warm_up.status()
+    if not warm_up_status["ready"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return warm_up_status
+
+
+@router.get("/metrics")
+@inject
+async def get_metrics(
+    db: Database = Depends(Provide[Container.db]),
+    cache_backend: CacheBackend = Depends(Provide[Container.cache_backend]),
+    token_cache: Optional[VerifiedTokenCache] = Depends(Provide[Container.token_cache]),
+    drink_read_coalescer: ReadCoalescer = Depends(Provide[Container.drink_read_coalescer]),
+    review_read_coalescer: ReadCoalescer = Depends(Provide[Container.review_read_coalescer]),
+):
+    return {
+        "db_pool": db.pool_status(),
+        "db_queries": db.query_telemetry.snapshot(),
+        "cache": cache_backend.stats(),
+        "token_cache": token_cache.stats() if token_cache is not None else None,
+        "read_coalescing": {"drinks": drink_read_coalescer.stats(), "reviews": review_read_coalescer.stats()},
+    }
@@ -1,5 +1,8 @@
 import uvicorn
 from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from starlette.exceptions import HTTPException
 
 import auth.external_interface.routers
 import drinks.external_interface.routers
@@ -8,9 +11,35 @@ import reviews.external_interface.routers
 import users.external_interface.routers
 import wishes.external_interface.routers
 from container import Container
+from shared_kernel.external_interface.exception_handlers import (
+    http_exception_handler,
+    request_validation_exception_handler,
+)
+from shared_kernel.external_interface.middlewares import DatabaseRequestMiddleware
 from settings import Settings
 
 
+def add_warm_up_steps(container: Container) -> None:
+    warm_up = container.warm_up()
+    drink_application_service = container.drink_application_service()
+    review_application_service = container.review_application_service()
+    warm_up.add_step("db_pool", container.db().warm_up)
+    most_reviewed_drink_ids = []
+    warm_up.add_step(
+        "drinks",
+        lambda: most_reviewed_drink_ids.extend(
+            drink_application_service.warm_up(num_of_pages=container.settings.WARM_UP_DRINK_PAGES())
+        ),
+    )
+    # 리뷰 목록은 술/유저로만 조회하므로, 리뷰가 많은 술들의 리뷰 목록을 읽어 둔다.
+    warm_up.add_step(
+        "reviews",
+        lambda: review_application_service.warm_up(
+            drink_ids=most_reviewed_drink_ids, num_of_pages=container.settings.WARM_UP_REVIEW_PAGES()
+        ),
+    )
+
+
 def create_app() -> FastAPI:
     router_modules = [
         auth.external_interface.routers,
@@ -25,11 +54,22 @@ def create_app() -> FastAPI:
     container.wire(modules=router_modules)
     container.settings.from_pydantic(Settings())
 
-    db = container.db()
-    db.create_database()
+    if container.settings.DB_AUTO_MIGRATE():
+        container.db().migrate()
 
-    app = FastAPI()
+    # 라우터가 돌려준 값과 에러 응답을 모두 orjson 으로 쓴다.
+    app = FastAPI(default_response_class=ORJSONResponse)
     app.container = container
+    app.add_exception_handler(HTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, request_validation_exception_handler)
+    if container.settings.PASSWORD_HASHER() == "process_pool":
+        app.add_event_handler("shutdown", container.password_hasher().shutdown)
+    if container.settings.CACHE_BACKEND() == "resp":
+        app.add_event_handler("shutdown", container.cache_backend().close)
+    if container.settings.WARM_UP():
+        add_warm_up_steps(container)
+        app.add_event_handler("startup", container.warm_up().start)
+    app.add_middleware(DatabaseRequestMiddleware)
     for router_module in router_modules:
         app.include_router(router_module.router)
     return app
@@ -0,0 +1,32 @@
+import argparse
+
+from sqlalchemy import create_engine
+
+from shared_kernel.infra_structure.migrator import Migrator
+
+"""
+usage: python -m migrations [--db-url DB_URL]
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="스키마 migration 을 적용합니다.")
+    parser.add_argument("--db-url", help="migration 을 적용할 DB 의 SQLALCHEMY 커넥션 URL (기본값: DB_URL)")
+    args = parser.parse_args()
+
+    db_url = args.db_url
+    if db_url is None:
+        from settings import Settings
+
+        db_url = Settings().DB_URL
+
+    engine = create_engine(db_url)
+    applied = Migrator(engine).upgrade()
+    for migration in applied:
+        print(f"applied v{migration.version:04d}_{migration.name}")
+    if not applied:
+        print("already up to date")
+
+
+if __name__ == "__main__":
+    main()
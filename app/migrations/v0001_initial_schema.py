@@ -0,0 +1,51 @@
+from sqlalchemy.engine import Connection
+
+"""
+create_all 로 만들어지던 기존 스키마. 이미 테이블이 있는 DB 에서도 그대로 적용될 수 있도록 IF NOT EXISTS 를 사용한다.
+"""
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS "user" (
+            id VARCHAR(30) NOT NULL,
+            name VARCHAR(30) NOT NULL,
+            description VARCHAR(100) NOT NULL,
+            password TEXT NOT NULL,
+            image_url TEXT NOT NULL,
+            PRIMARY KEY (id)
+        )
+        """)
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS drink (
+            id UUID NOT NULL,
+            name VARCHAR(30) NOT NULL,
+            image_url TEXT NOT NULL,
+            type VARCHAR(30) NOT NULL,
+            avg_rating FLOAT NOT NULL,
+            num_of_reviews INTEGER NOT NULL,
+            num_of_wish INTEGER NOT NULL,
+            PRIMARY KEY (id)
+        )
+        """)
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS review (
+            id UUID NOT NULL,
+            user_id VARCHAR(30) NOT NULL,
+            drink_id UUID NOT NULL,
+            rating INTEGER NOT NULL,
+            comment VARCHAR(300) NOT NULL,
+            created_at FLOAT NOT NULL,
+            updated_at FLOAT NOT NULL,
+            PRIMARY KEY (id)
+        )
+        """)
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS wish (
+            id UUID NOT NULL,
+            user_id VARCHAR(30) NOT NULL,
+            drink_id UUID NOT NULL,
+            created_at FLOAT NOT NULL,
+            PRIMARY KEY (id)
+        )
+        """)
@@ -0,0 +1,26 @@
+from sqlalchemy.engine import Connection
+
+"""
+repository 의 조회 형태에 맞춘 인덱스.
+- review: user_id 또는 drink_id 로 거르고 updated_at 내림차순 정렬
+- wish: user_id 와 drink_id 로 한 건 조회, user_id 또는 drink_id 로 목록 조회
+- drink: type 으로 거르거나(ALL 이면 거르지 않음) num_of_reviews / avg_rating / num_of_wish 로 정렬
+"""
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_review_user_id_updated_at ON review (user_id, updated_at DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_review_drink_id_updated_at ON review (drink_id, updated_at DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_wish_user_id_drink_id ON wish (user_id, drink_id)",
+    "CREATE INDEX IF NOT EXISTS ix_wish_drink_id ON wish (drink_id)",
+    "CREATE INDEX IF NOT EXISTS ix_drink_type_num_of_reviews ON drink (type, num_of_reviews)",
+    "CREATE INDEX IF NOT EXISTS ix_drink_type_avg_rating ON drink (type, avg_rating)",
+    "CREATE INDEX IF NOT EXISTS ix_drink_type_num_of_wish ON drink (type, num_of_wish)",
+    "CREATE INDEX IF NOT EXISTS ix_drink_num_of_reviews ON drink (num_of_reviews)",
+    "CREATE INDEX IF NOT EXISTS ix_drink_avg_rating ON drink (avg_rating)",
+    "CREATE INDEX IF NOT EXISTS ix_drink_num_of_wish ON drink (num_of_wish)",
+]
+
+
+def upgrade(connection: Connection) -> None:
+    for index in INDEXES:
+        connection.execute(index)
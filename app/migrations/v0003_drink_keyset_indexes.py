@@ -0,0 +1,18 @@
+from sqlalchemy.engine import Connection
+
+"""
+GET /drinks 의 keyset pagination 을 위해 drink 정렬 인덱스 끝에 id 를 붙인다.
+(정렬 키, id) 순서가 인덱스 순서와 같아야 cursor 이후 구간을 정렬 없이 읽을 수 있다.
+"""
+
+SORT_COLUMNS = ["num_of_reviews", "avg_rating", "num_of_wish"]
+
+
+def upgrade(connection: Connection) -> None:
+    for sort_column in SORT_COLUMNS:
+        connection.execute(f"DROP INDEX IF EXISTS ix_drink_type_{sort_column}")
+        connection.execute(f"DROP INDEX IF EXISTS ix_drink_{sort_column}")
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_drink_type_{sort_column}_id ON drink (type, {sort_column}, id)"
+        )
+        connection.execute(f"CREATE INDEX IF NOT EXISTS ix_drink_{sort_column}_id ON drink ({sort_column}, id)")
@@ -0,0 +1,14 @@
+from sqlalchemy.engine import Connection
+
+"""
+GET /reviews 의 keyset pagination 을 위해 review 인덱스 끝에 id 를 붙인다.
+"""
+
+
+def upgrade(connection: Connection) -> None:
+    for filter_column in ["user_id", "drink_id"]:
+        connection.execute(f"DROP INDEX IF EXISTS ix_review_{filter_column}_updated_at")
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_review_{filter_column}_updated_at_id "
+            f"ON review ({filter_column}, updated_at DESC, id DESC)"
+        )
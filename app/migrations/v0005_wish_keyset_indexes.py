@@ -0,0 +1,15 @@
+from sqlalchemy.engine import Connection
+
+"""
+GET /wishes 의 keyset pagination 을 위해 user_id, drink_id 별로 (created_at, id) 순서의 인덱스를 만든다.
+(user_id, drink_id) 인덱스는 단건 조회에 계속 사용한다.
+"""
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute("DROP INDEX IF EXISTS ix_wish_drink_id")
+    for filter_column in ["user_id", "drink_id"]:
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_wish_{filter_column}_created_at_id "
+            f"ON wish ({filter_column}, created_at DESC, id DESC)"
+        )
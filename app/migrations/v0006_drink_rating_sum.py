@@ -0,0 +1,20 @@
+from sqlalchemy.engine import Connection
+
+"""
+drink 의 평점을 정수 합계(rating_sum)로 저장하고, avg_rating 은 rating_sum / num_of_reviews 의 generated column 으로 바꾼다.
+기존 행의 rating_sum 은 avg_rating * num_of_reviews 를 반올림해 채운다. 리뷰 평점은 정수이므로 그동안 쌓인 float 오차가 사라진다.
+avg_rating 을 지우면 그 컬럼의 인덱스도 함께 지워지므로 술 랭킹의 keyset pagination 인덱스를 다시 만든다.
+"""
+
+
+def upgrade(connection: Connection) -> None:
+    connection.execute("ALTER TABLE drink ADD COLUMN rating_sum INTEGER NOT NULL DEFAULT 0")
+    connection.execute("UPDATE drink SET rating_sum = ROUND(avg_rating * num_of_reviews)")
+    connection.execute("ALTER TABLE drink DROP COLUMN avg_rating")
+    connection.execute("""
+        ALTER TABLE drink ADD COLUMN avg_rating FLOAT NOT NULL GENERATED ALWAYS AS (
+            CASE WHEN num_of_reviews > 0 THEN rating_sum::float / num_of_reviews ELSE 0 END
+        ) STORED
+        """)
+    connection.execute("CREATE INDEX IF NOT EXISTS ix_drink_type_avg_rating_id ON drink (type, avg_rating, id)")
+    connection.execute("CREATE INDEX IF NOT EXISTS ix_drink_avg_rating_id ON drink (avg_rating, id)")
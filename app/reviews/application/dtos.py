@@ -1,5 +1,3 @@
-from typing import List
-
 from pydantic import BaseModel
 
 from reviews.domain.repository import QueryParam
@@ -24,19 +22,6 @@ class FindReviewsInputDto(BaseModel):
     query_param: QueryParam
 
 
-class FindReviewsOutputDto(SuccessOutputDto):
-    class Item(BaseModel):
-        review_id: str
-        drink_id: str
-        user_id: str
-        rating: int
-        comment: str
-        created_at: float
-        updated_at: float
-
-    items: List[Item]
-
-
 class CreateReviewInputDto(BaseModel):
     drink_id: str
     user_id: str
@@ -0,0 +1,42 @@
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict
+
+from reviews.domain.entities import Review
+from reviews.domain.repository import QueryParam, ReviewRepository
+from shared_kernel.domain.pagination import RowPage
+
+
+def review_row(review: Review) -> Dict[str, Any]:
+    return {
+        "review_id": str(review.id),
+        "user_id": str(review.user_id),
+        "drink_id": str(review.drink_id),
+        "rating": int(review.rating),
+        "comment": review.comment,
+        "created_at": review.created_at,
+        "updated_at": review.updated_at,
+    }
+
+
+class ReviewQueryService(metaclass=ABCMeta):
+    """
+    GET /reviews 의 항목 모양(GetReviewsJsonResponse.Item) 그대로 리뷰 목록을 읽는다.
+    cursor 는 ReviewRepository.find_all 과 같으므로 두 경로의 페이지를 섞어 써도 된다.
+    """
+
+    @abstractmethod
+    def find_rows(self, query_param: QueryParam) -> RowPage:
+        pass
+
+
+class RepositoryReviewQueryService(ReviewQueryService):
+    """
+    repository 로 읽은 entity 를 행으로 바꾼다. 컬럼만 읽는 query service 가 없을 때 쓴다.
+    """
+
+    def __init__(self, review_repository: ReviewRepository) -> None:
+        self._review_repository = review_repository
+
+    def find_rows(self, query_param: QueryParam) -> RowPage:
+        page = self._review_repository.find_all(query_param=query_param)
+        return RowPage(items=[review_row(review) for review in page.items], next_cursor=page.next_cursor)
@@ -1,5 +1,5 @@
 import time
-from typing import Union
+from typing import Callable, List, Optional, Union
 
 from drinks.application.dtos import AddDrinkReviewInputDto, DeleteDrinkReviewInputDto, UpdateDrinkReviewInputDto
 from drinks.application.service import DrinkApplicationService
@@ -11,21 +11,36 @@ from reviews.application.dtos import (
     FindReviewInputDto,
     FindReviewOutputDto,
     FindReviewsInputDto,
-    FindReviewsOutputDto,
     UpdateReviewInputDto,
     UpdateReviewOutputDto,
 )
+from reviews.application.query_service import RepositoryReviewQueryService, ReviewQueryService
 from reviews.domain.entities import Review
-from reviews.domain.repository import ReviewRepository
+from reviews.domain.repository import QueryParam, ReviewRepository
 from reviews.domain.value_objects import ReviewRating
-from shared_kernel.application.dtos import FailedOutputDto
+from shared_kernel.application.dtos import FailedOutputDto, RowsOutputDto
+from shared_kernel.application.unit_of_work import NullUnitOfWork, UnitOfWork
 from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceAlreadyExistError, ResourceNotFoundError
+from shared_kernel.domain.pagination import RowPage
 from shared_kernel.domain.value_objects import ReviewId, DrinkId, UserId
+from shared_kernel.infra_structure.read_coalescer import ReadCoalescer
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
 
 
 class ReviewApplicationService:
-    def __init__(self, review_repository: ReviewRepository) -> None:
+    def __init__(
+        self,
+        review_repository: ReviewRepository,
+        unit_of_work_factory: Callable[[], UnitOfWork] = NullUnitOfWork,
+        resource_versions: Optional[ResourceVersions] = None,
+        read_coalescer: Optional[ReadCoalescer] = None,
+        review_query_service: Optional[ReviewQueryService] = None,
+    ) -> None:
         self._review_repository = review_repository
+        self._review_query_service = review_query_service or RepositoryReviewQueryService(review_repository)
+        self._unit_of_work_factory = unit_of_work_factory
+        self._resource_versions = resource_versions
+        self._read_coalescer = read_coalescer
 
     def find_review(self, input_dto: FindReviewInputDto) -> Union[FindReviewOutputDto, FailedOutputDto]:
         try:
@@ -45,23 +60,12 @@ class ReviewApplicationService:
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
 
-    def find_reviews(self, input_dto: FindReviewsInputDto) -> Union[FailedOutputDto, FindReviewsOutputDto]:
+    def find_review_rows(self, input_dto: FindReviewsInputDto) -> Union[FailedOutputDto, RowsOutputDto]:
+        """
+        리뷰 목록을 entity, DTO 없이 GET /reviews 의 항목 모양 그대로 돌려준다.
+        """
         try:
-            reviews = self._review_repository.find_all(query_param=input_dto.query_param)
-            return FindReviewsOutputDto(
-                items=[
-                    FindReviewsOutputDto.Item(
-                        review_id=str(review.id),
-                        drink_id=str(review.drink_id),
-                        user_id=str(review.user_id),
-                        rating=int(review.rating),
-                        comment=review.comment,
-                        created_at=review.created_at,
-                        updated_at=review.updated_at,
-                    )
-                    for review in reviews
-                ]
-            )
+            return RowsOutputDto.build(self._find_rows(input_dto.query_param))
         except InvalidParamInputError as e:
             return FailedOutputDto.build_parameters_error(message=str(e))
         except Exception as e:
@@ -73,21 +77,25 @@ class ReviewApplicationService:
         drink_application_service: DrinkApplicationService,
     ) -> Union[CreateReviewOutputDto, FailedOutputDto]:
         try:
-            review = Review(
-                id=ReviewId.build(user_id=input_dto.user_id, drink_id=input_dto.drink_id),
-                drink_id=DrinkId(value=input_dto.drink_id),
-                user_id=UserId(value=input_dto.user_id),
-                rating=ReviewRating(value=input_dto.rating),
-                comment=input_dto.comment,
-                created_at=time.time(),
-                updated_at=time.time(),
-            )
-            self._review_repository.add(review)
-            input_dto = AddDrinkReviewInputDto(drink_id=input_dto.drink_id, drink_rating=input_dto.rating)
-            drink_add_review_output_dto = drink_application_service.add_drink_review(input_dto=input_dto)
-
-            if not drink_add_review_output_dto.status:
-                return drink_add_review_output_dto
+            with self._unit_of_work_factory() as unit_of_work:
+                review = Review(
+                    id=ReviewId.build(user_id=input_dto.user_id, drink_id=input_dto.drink_id),
+                    drink_id=DrinkId(value=input_dto.drink_id),
+                    user_id=UserId(value=input_dto.user_id),
+                    rating=ReviewRating(value=input_dto.rating),
+                    comment=input_dto.comment,
+                    created_at=time.time(),
+                    updated_at=time.time(),
+                )
+                self._review_repository.add(review)
+                input_dto = AddDrinkReviewInputDto(drink_id=input_dto.drink_id, drink_rating=input_dto.rating)
+                drink_add_review_output_dto = drink_application_service.add_drink_review(input_dto=input_dto)
+
+                if not drink_add_review_output_dto.status:
+                    unit_of_work.rollback()
+                    return drink_add_review_output_dto
+                self._invalidate_reads()
+                self._bump_versions(review)
             return CreateReviewOutputDto(
                 review_id=str(review.id),
                 drink_id=str(review.drink_id),
@@ -108,31 +116,37 @@ class ReviewApplicationService:
         drink_application_service: DrinkApplicationService,
     ) -> Union[UpdateReviewOutputDto, FailedOutputDto]:
         try:
-            review_id = ReviewId.from_str(input_dto.review_id)
-            old_review = self._review_repository.find_by_review_id(review_id)
-
-            old_rating = int(old_review.rating)
-
-            new_review = Review(
-                id=old_review.id,
-                drink_id=old_review.drink_id,
-                user_id=old_review.user_id,
-                rating=ReviewRating(value=input_dto.rating),
-                comment=input_dto.comment,
-                created_at=old_review.created_at,
-                updated_at=time.time(),
-            )
-            self._review_repository.update(new_review)
-
-            drinks_input_dto = UpdateDrinkReviewInputDto(
-                drink_id=str(new_review.drink_id),
-                old_drink_rating=old_rating,
-                new_drink_rating=input_dto.rating,
-            )
-            drink_update_review_output_dto = drink_application_service.update_drink_review(input_dto=drinks_input_dto)
-
-            if not drink_update_review_output_dto.status:
-                return drink_update_review_output_dto
+            with self._unit_of_work_factory() as unit_of_work:
+                review_id = ReviewId.from_str(input_dto.review_id)
+                old_review = self._review_repository.find_by_review_id(review_id)
+
+                old_rating = int(old_review.rating)
+
+                new_review = Review(
+                    id=old_review.id,
+                    drink_id=old_review.drink_id,
+                    user_id=old_review.user_id,
+                    rating=ReviewRating(value=input_dto.rating),
+                    comment=input_dto.comment,
+                    created_at=old_review.created_at,
+                    updated_at=time.time(),
+                )
+                self._review_repository.update(new_review)
+
+                drinks_input_dto = UpdateDrinkReviewInputDto(
+                    drink_id=str(new_review.drink_id),
+                    old_drink_rating=old_rating,
+                    new_drink_rating=input_dto.rating,
+                )
+                drink_update_review_output_dto = drink_application_service.update_drink_review(
+                    input_dto=drinks_input_dto
+                )
+
+                if not drink_update_review_output_dto.status:
+                    unit_of_work.rollback()
+                    return drink_update_review_output_dto
+                self._invalidate_reads()
+                self._bump_versions(new_review)
             return UpdateReviewOutputDto()
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
@@ -145,22 +159,67 @@ class ReviewApplicationService:
         drink_application_service: DrinkApplicationService,
     ) -> Union[DeleteReviewOutputDto, FailedOutputDto]:
         try:
-            review_id = ReviewId.from_str(input_dto.review_id)
-            review = self._review_repository.find_by_review_id(review_id)
-            if review is None:
-                return FailedOutputDto.build_resource_not_found_error(f"{str(input_dto.review_id)}의 리뷰를 찾을 수 없습니다.")
-
-            self._review_repository.delete_by_review_id(review_id)
-            drinks_input_dto = DeleteDrinkReviewInputDto(
-                drink_id=str(review.drink_id), drink_rating=int(review.rating)
-            )
-            drink_delete_review_output_dto = drink_application_service.delete_drink_review(input_dto=drinks_input_dto)
+            with self._unit_of_work_factory() as unit_of_work:
+                review_id = ReviewId.from_str(input_dto.review_id)
+                review = self._review_repository.find_by_review_id(review_id)
+                if review is None:
+                    return FailedOutputDto.build_resource_not_found_error(
+                        f"{str(input_dto.review_id)}의 리뷰를 찾을 수 없습니다."
+                    )
 
-            if not drink_delete_review_output_dto.status:
-                return drink_delete_review_output_dto
+                self._review_repository.delete_by_review_id(review_id)
+                drinks_input_dto = DeleteDrinkReviewInputDto(
+                    drink_id=str(review.drink_id), drink_rating=int(review.rating)
+                )
+                drink_delete_review_output_dto = drink_application_service.delete_drink_review(
+                    input_dto=drinks_input_dto
+                )
+
+                if not drink_delete_review_output_dto.status:
+                    unit_of_work.rollback()
+                    return drink_delete_review_output_dto
+                self._invalidate_reads()
+                self._bump_versions(review)
             return DeleteReviewOutputDto()
 
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
+
+    def warm_up(self, drink_ids: List[str], num_of_pages: int = 1) -> None:
+        """
+        술마다 최신 리뷰 목록의 앞쪽 num_of_pages 페이지를 미리 읽어 둔다.
+        """
+        for drink_id in drink_ids:
+            query_param = QueryParam(drink_id=drink_id).to_enum()
+            for _ in range(num_of_pages):
+                page = self._find_rows(query_param)
+                if page.next_cursor is None:
+                    break
+                query_param = query_param.copy(update={"cursor": page.next_cursor})
+
+    def _find_rows(self, query_param: QueryParam) -> RowPage:
+        if self._read_coalescer is None:
+            return self._review_query_service.find_rows(query_param)
+        return self._read_coalescer.get(
+            f"rows:{query_param.json()}", lambda: self._review_query_service.find_rows(query_param)
+        )
+
+    def _invalidate_reads(self) -> None:
+        if self._read_coalescer is not None:
+            self._read_coalescer.invalidate()
+
+    def _bump_versions(self, review: Review) -> None:
+        """
+        리뷰가 바뀌면 그 리뷰, 술/유저별 리뷰 목록, 그리고 평점이 바뀐 술 목록의 ETag 가 바뀐다.
+        """
+        if self._resource_versions is None:
+            return
+        self._resource_versions.bump(
+            ResourceVersions.review(str(review.id)),
+            ResourceVersions.reviews_of_drink(str(review.drink_id)),
+            ResourceVersions.reviews_of_user(str(review.user_id)),
+            ResourceVersions.REVIEWS,
+            ResourceVersions.DRINKS,
+        )
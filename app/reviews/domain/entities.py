@@ -3,7 +3,7 @@ from typing import ClassVar
 from pydantic import BaseModel, Field
 
 from reviews.domain.value_objects import ReviewRating
-from shared_kernel.domain.value_objects import DrinkId, ReviewId, UserId
+from shared_kernel.domain.value_objects import VALUE_OBJECT_JSON_ENCODERS, DrinkId, ReviewId, UserId
 
 
 class Review(BaseModel):
@@ -16,3 +16,6 @@ class Review(BaseModel):
     comment: str = Field(default="", min_length=MIN_COMMENT_LEN, max_length=MAX_COMMENT_LEN)
     created_at: float
     updated_at: float
+
+    class Config:
+        json_encoders = VALUE_OBJECT_JSON_ENCODERS
@@ -1,10 +1,12 @@
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
 from reviews.domain.entities import Review
 from reviews.domain.value_objects import OrderType
+from shared_kernel.domain.exceptions import InvalidParamInputError
+from shared_kernel.domain.pagination import Cursor, Page, PageSize
 from shared_kernel.domain.value_objects import ReviewId
 
 
@@ -12,10 +14,37 @@ class QueryParam(BaseModel):
     user_id: Optional[str] = None
     drink_id: Optional[str] = None
     order: Union[str, OrderType] = OrderType.NEWEST
+    limit: int = PageSize.DEFAULT
+    cursor: Optional[str] = None
 
     def to_enum(self) -> "QueryParam":
         self.order = OrderType.from_str(self.order)
-        return QueryParam(user_id=self.user_id, drink_id=self.drink_id, order=self.order)
+        return QueryParam(
+            user_id=self.user_id, drink_id=self.drink_id, order=self.order, limit=self.limit, cursor=self.cursor
+        )
+
+    def filters(self) -> Dict[str, str]:
+        return {attr: value for attr, value in (("user_id", self.user_id), ("drink_id", self.drink_id)) if value}
+
+    @staticmethod
+    def sort_key(review: Review) -> Tuple[float, str]:
+        return review.updated_at, str(review.id)
+
+    def encode_cursor(self, review: Review) -> str:
+        return self.encode_sort_key(self.sort_key(review))
+
+    @staticmethod
+    def encode_sort_key(sort_key: Tuple[float, str]) -> str:
+        return Cursor(values=list(sort_key)).encode()
+
+    def decode_cursor(self) -> Optional[Tuple[float, str]]:
+        if self.cursor is None:
+            return None
+        updated_at, review_id = Cursor.decode(self.cursor, num_of_values=2).values
+        try:
+            return float(updated_at), str(ReviewId.from_str(review_id))
+        except (AttributeError, TypeError, ValueError):
+            raise InvalidParamInputError(f"cursor: {self.cursor}는 올바르지 않은 cursor 입니다.")
 
 
 class ReviewRepository(metaclass=ABCMeta):
@@ -24,7 +53,7 @@ class ReviewRepository(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def find_all(self, query_param: QueryParam) -> List[Review]:
+    def find_all(self, query_param: QueryParam) -> Page[Review]:
         pass
 
     @abstractmethod
@@ -1,8 +1,8 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
-from reviews.application.dtos import CreateReviewOutputDto, FindReviewOutputDto, FindReviewsOutputDto
+from reviews.application.dtos import CreateReviewOutputDto, FindReviewOutputDto
 
 
 class GetReviewJsonResponse(BaseModel):
@@ -28,28 +28,17 @@ class GetReviewJsonResponse(BaseModel):
 
 
 class GetReviewsJsonResponse(BaseModel):
-    review_id: str
-    user_id: str
-    drink_id: str
-    rating: int
-    comment: str
-    created_at: float
-    updated_at: float
-
-    @classmethod
-    def build_by_output_dto(cls, output_dto: FindReviewsOutputDto) -> List["GetReviewsJsonResponse"]:
-        return [
-            GetReviewsJsonResponse(
-                review_id=item.review_id,
-                user_id=item.user_id,
-                drink_id=item.drink_id,
-                rating=item.rating,
-                comment=item.comment,
-                created_at=item.created_at,
-                updated_at=item.updated_at,
-            )
-            for item in output_dto.items
-        ]
+    class Item(BaseModel):
+        review_id: str
+        user_id: str
+        drink_id: str
+        rating: int
+        comment: str
+        created_at: float
+        updated_at: float
+
+    items: List[Item]
+    next_cursor: Optional[str] = None
 
 
 class CreateReviewJsonRequest(BaseModel):
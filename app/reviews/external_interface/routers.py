@@ -1,12 +1,11 @@
-from typing import List, Optional, Union
+from typing import Optional, Union
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Header
 from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from auth.application.dtos import GetTokenDataInputDto
-from auth.application.service import AuthApplicationService
 from container import Container
 from drinks.application.service import DrinkApplicationService
 from reviews.application.dtos import (
@@ -16,7 +15,6 @@ from reviews.application.dtos import (
     FindReviewsInputDto,
     UpdateReviewInputDto,
 )
-from reviews.application.service import ReviewApplicationService
 from reviews.domain.repository import QueryParam
 from reviews.external_interface.json_dtos import (
     CreateReviewJsonRequest,
@@ -26,7 +24,15 @@ from reviews.external_interface.json_dtos import (
     UpdateReviewJsonRequest,
     GetReviewsJsonResponse,
 )
-from shared_kernel.external_interface.json_dtos import FailedJsonResponse
+from shared_kernel.application.async_service import AsyncApplicationService
+from shared_kernel.external_interface.conditional_get import (
+    build_not_modified_response,
+    is_not_modified,
+    set_cache_headers,
+)
+from shared_kernel.external_interface.json_dtos import FailedJsonResponse, RowsJsonResponse
+from shared_kernel.infra_structure.database import pin_request_to_primary
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
 
 router = APIRouter(
     prefix="/reviews",
@@ -36,41 +42,69 @@ router = APIRouter(
 
 @router.get("/{review_id}", status_code=status.HTTP_200_OK)
 @inject
-def get_review(
+async def get_review(
     review_id: str,
-    review_application_service: ReviewApplicationService = Depends(Provide[Container.review_application_service]),
-) -> Union[GetReviewJsonResponse, JSONResponse]:
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    review_application_service: AsyncApplicationService = Depends(Provide[Container.async_review_application_service]),
+    resource_versions: ResourceVersions = Depends(Provide[Container.resource_versions]),
+) -> Union[GetReviewJsonResponse, JSONResponse, Response]:
+    etag, recently_bumped = await resource_versions.lookup(ResourceVersions.review(review_id))
+    if is_not_modified(if_none_match, etag):
+        return build_not_modified_response(etag)
+    if recently_bumped:
+        # 방금 쓰인 리뷰는 replica 가 아직 따라오지 못했을 수 있으므로, 새 ETag 에 맞게 primary 에서 읽는다.
+        pin_request_to_primary()
+
     input_dto = FindReviewInputDto(review_id=review_id)
-    output_dto = review_application_service.find_review(input_dto=input_dto)
+    output_dto = await review_application_service.find_review(input_dto=input_dto)
     if not output_dto.status:
         return FailedJsonResponse.build_by_output_dto(output_dto)
+    set_cache_headers(response, etag)
     return GetReviewJsonResponse.build_by_output_dto(output_dto)
 
 
-@router.get("", status_code=status.HTTP_200_OK, response_model=List[GetReviewsJsonResponse])
+@router.get("", status_code=status.HTTP_200_OK, response_model=GetReviewsJsonResponse)
 @inject
-def get_reviews(
+async def get_reviews(
     query_param: QueryParam = Depends(),
-    review_application_service: ReviewApplicationService = Depends(Provide[Container.review_application_service]),
-) -> Union[List[GetReviewsJsonResponse], JSONResponse]:
+    if_none_match: Optional[str] = Header(None),
+    review_application_service: AsyncApplicationService = Depends(Provide[Container.async_review_application_service]),
+    resource_versions: ResourceVersions = Depends(Provide[Container.resource_versions]),
+) -> Union[JSONResponse, Response]:
+    keys = [ResourceVersions.REVIEWS]
+    if query_param.drink_id or query_param.user_id:
+        keys = []
+        if query_param.drink_id:
+            keys.append(ResourceVersions.reviews_of_drink(query_param.drink_id))
+        if query_param.user_id:
+            keys.append(ResourceVersions.reviews_of_user(query_param.user_id))
+    etag, recently_bumped = await resource_versions.lookup(*keys, variant=query_param.json())
+    if is_not_modified(if_none_match, etag):
+        return build_not_modified_response(etag)
+    if recently_bumped:
+        pin_request_to_primary()
+
     input_dto = FindReviewsInputDto(query_param=query_param.to_enum())
-    output_dto = review_application_service.find_reviews(input_dto=input_dto)
+    output_dto = await review_application_service.find_review_rows(input_dto=input_dto)
     if not output_dto.status:
         return FailedJsonResponse.build_by_output_dto(output_dto)
-    return GetReviewsJsonResponse.build_by_output_dto(output_dto)
+    json_response = RowsJsonResponse.build_by_output_dto(output_dto)
+    set_cache_headers(json_response, etag)
+    return json_response
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=CreateReviewJsonResponse)
 @inject
-def create_review(
+async def create_review(
     request: CreateReviewJsonRequest,
     access_token: str = Header(...),
-    auth_application_service: AuthApplicationService = Depends(Provide[Container.auth_application_service]),
-    review_application_service: ReviewApplicationService = Depends(Provide[Container.review_application_service]),
+    auth_application_service: AsyncApplicationService = Depends(Provide[Container.async_auth_application_service]),
+    review_application_service: AsyncApplicationService = Depends(Provide[Container.async_review_application_service]),
     drink_application_service: DrinkApplicationService = Depends(Provide[Container.drink_application_service]),
 ) -> Union[CreateReviewJsonResponse, JSONResponse]:
     get_token_data_input_dto = GetTokenDataInputDto(access_token=access_token)
-    get_token_data_output_dto = auth_application_service.get_token_data(get_token_data_input_dto)
+    get_token_data_output_dto = await auth_application_service.get_token_data(get_token_data_input_dto)
     if not get_token_data_output_dto.status:
         return FailedJsonResponse.build_by_output_dto(get_token_data_output_dto)
 
@@ -80,7 +114,7 @@ def create_review(
         rating=request.rating,
         comment=request.comment,
     )
-    output_dto = review_application_service.create_review(
+    output_dto = await review_application_service.create_review(
         input_dto=input_dto, drink_application_service=drink_application_service
     )
     if not output_dto.status:
@@ -90,39 +124,39 @@ def create_review(
 
 @router.put("", status_code=status.HTTP_204_NO_CONTENT)
 @inject
-def update_review(
+async def update_review(
     request: UpdateReviewJsonRequest,
     access_token: str = Header(...),
-    auth_application_service: AuthApplicationService = Depends(Provide[Container.auth_application_service]),
-    review_application_service: ReviewApplicationService = Depends(Provide[Container.review_application_service]),
+    auth_application_service: AsyncApplicationService = Depends(Provide[Container.async_auth_application_service]),
+    review_application_service: AsyncApplicationService = Depends(Provide[Container.async_review_application_service]),
     drink_application_service: DrinkApplicationService = Depends(Provide[Container.drink_application_service]),
 ) -> Optional[JSONResponse]:
     get_token_data_input_dto = GetTokenDataInputDto(access_token=access_token)
-    get_token_data_output_dto = auth_application_service.get_token_data(get_token_data_input_dto)
+    get_token_data_output_dto = await auth_application_service.get_token_data(get_token_data_input_dto)
     if not get_token_data_output_dto.status:
         return FailedJsonResponse.build_by_output_dto(get_token_data_output_dto)
 
     input_dto = UpdateReviewInputDto(review_id=request.review_id, rating=request.rating, comment=request.comment)
-    output_dto = review_application_service.update_review(input_dto, drink_application_service)
+    output_dto = await review_application_service.update_review(input_dto, drink_application_service)
     if not output_dto.status:
         return FailedJsonResponse.build_by_output_dto(output_dto)
 
 
 @router.delete("", status_code=status.HTTP_204_NO_CONTENT)
 @inject
-def delete_review(
+async def delete_review(
     request: DeleteReviewJsonRequest,
     access_token: str = Header(...),
-    auth_application_service: AuthApplicationService = Depends(Provide[Container.auth_application_service]),
-    review_application_service: ReviewApplicationService = Depends(Provide[Container.review_application_service]),
+    auth_application_service: AsyncApplicationService = Depends(Provide[Container.async_auth_application_service]),
+    review_application_service: AsyncApplicationService = Depends(Provide[Container.async_review_application_service]),
     drink_application_service: DrinkApplicationService = Depends(Provide[Container.drink_application_service]),
 ) -> Optional[JSONResponse]:
     get_token_data_input_dto = GetTokenDataInputDto(access_token=access_token)
-    get_token_data_output_dto = auth_application_service.get_token_data(get_token_data_input_dto)
+    get_token_data_output_dto = await auth_application_service.get_token_data(get_token_data_input_dto)
     if not get_token_data_output_dto.status:
         return FailedJsonResponse.build_by_output_dto(get_token_data_output_dto)
 
     input_dto = DeleteReviewInputDto(review_id=request.review_id)
-    output_dto = review_application_service.delete_review(input_dto, drink_application_service)
+    output_dto = await review_application_service.delete_review(input_dto, drink_application_service)
     if not output_dto.status:
         return FailedJsonResponse.build_by_output_dto(output_dto)
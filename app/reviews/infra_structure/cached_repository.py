@@ -0,0 +1,58 @@
+from typing import Callable, Optional
+
+from reviews.domain.entities import Review
+from reviews.domain.repository import QueryParam, ReviewRepository
+from shared_kernel.domain.pagination import Page
+from shared_kernel.domain.value_objects import ReviewId
+from shared_kernel.infra_structure.cache_backend import CacheBackend
+from shared_kernel.infra_structure.read_through_cache import ReadThroughCache
+from shared_kernel.infra_structure.unit_of_work import call_after_transaction
+
+
+class CachedReviewRepository(ReviewRepository):
+    """
+    find_by_review_id 결과를 CacheBackend 에 담아 두는 read-through 캐시.
+    ttl_seconds 가 0 이면 찾은 리뷰는 담지 않고, negative_ttl_seconds 동안 없는 id 만 기억해 둔다.
+    쓰기 메서드는 원래 repository 에 위임한 뒤 해당 리뷰를 캐시에서 지운다.
+    """
+
+    def __init__(
+        self,
+        review_repository: ReviewRepository,
+        cache_backend: CacheBackend,
+        ttl_seconds: float = 0,
+        negative_ttl_seconds: float = 0,
+        tombstone_ttl_seconds: float = 5,
+        after_transaction: Callable[[Callable[[], None]], bool] = call_after_transaction,
+    ) -> None:
+        self._review_repository = review_repository
+        self._cache = ReadThroughCache(
+            backend=cache_backend,
+            namespace="review",
+            model=Review,
+            ttl_seconds=ttl_seconds,
+            negative_ttl_seconds=negative_ttl_seconds,
+            tombstone_ttl_seconds=tombstone_ttl_seconds,
+            after_transaction=after_transaction,
+        )
+
+    def find(self, query_param: QueryParam) -> Review:
+        return self._review_repository.find(query_param)
+
+    def find_all(self, query_param: QueryParam) -> Page[Review]:
+        return self._review_repository.find_all(query_param)
+
+    def find_by_review_id(self, review_id: ReviewId) -> Optional[Review]:
+        return self._cache.get(str(review_id), lambda: self._review_repository.find_by_review_id(review_id))
+
+    def add(self, review: Review) -> None:
+        self._review_repository.add(review)
+        self._cache.invalidate(str(review.id))
+
+    def update(self, review: Review) -> None:
+        self._review_repository.update(review)
+        self._cache.invalidate(str(review.id))
+
+    def delete_by_review_id(self, review_id: ReviewId) -> None:
+        self._review_repository.delete_by_review_id(review_id)
+        self._cache.invalidate(str(review_id))
@@ -1,8 +1,10 @@
 from typing import List, Optional
 
 from reviews.domain.entities import Review
-from reviews.domain.repository import ReviewRepository
+from reviews.domain.repository import QueryParam, ReviewRepository
 from reviews.domain.value_objects import OrderType, ReviewRating
+from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceNotFoundError
+from shared_kernel.domain.pagination import Page, PageSize
 from shared_kernel.domain.value_objects import DrinkId, ReviewId, UserId
 
 
@@ -11,8 +13,32 @@ class InMemoryReviewRepository(ReviewRepository):
         self.review_id_to_review = {}
         self.drink_id_user_id_to_review_id = {}
 
-    def find_all(self, order: OrderType = OrderType.LIKE_DESC) -> List[Review]:
-        return list(self.review_id_to_review.values())
+    def find(self, query_param: QueryParam) -> Review:
+        for review in self.review_id_to_review.values():
+            if str(review.user_id) == query_param.user_id and str(review.drink_id) == query_param.drink_id:
+                return review
+        raise ResourceNotFoundError(f"리뷰를 찾지 못했습니다.")
+
+    def find_all(self, query_param: QueryParam) -> Page[Review]:
+        if not query_param.user_id and not query_param.drink_id:
+            raise InvalidParamInputError(
+                f"drink_id: {query_param.drink_id} or user_id:{query_param.user_id}에 해당하는 값이 없습니다."
+            )
+        PageSize.check(query_param.limit)
+        cursor = query_param.decode_cursor()
+
+        reviews = [
+            review
+            for review in self.review_id_to_review.values()
+            if (not query_param.user_id or str(review.user_id) == query_param.user_id)
+            and (not query_param.drink_id or str(review.drink_id) == query_param.drink_id)
+            and (cursor is None or query_param.sort_key(review) < cursor)
+        ]
+        reviews = sorted(reviews, key=query_param.sort_key, reverse=True)
+
+        items = reviews[: query_param.limit]
+        next_cursor = query_param.encode_cursor(items[-1]) if len(reviews) > query_param.limit else None
+        return Page[Review](items=items, next_cursor=next_cursor)
 
     def find_all_by_user_id(self, user_id: UserId, order: OrderType = OrderType.LIKE_DESC) -> List[Review]:
         return [review for review in list(self.review_id_to_review.values()) if review.user_id == user_id]
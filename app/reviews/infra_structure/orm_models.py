@@ -1,6 +1,6 @@
 import time
 
-from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy import Column, Float, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 
 from reviews.domain.entities import Review
@@ -51,3 +51,8 @@ class ReviewOrm(Base):
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
+
+
+# 인덱스는 migrations/v0004_review_keyset_indexes.py 에서 생성된다.
+Index("ix_review_user_id_updated_at_id", ReviewOrm.user_id, ReviewOrm.updated_at.desc(), ReviewOrm.id.desc())
+Index("ix_review_drink_id_updated_at_id", ReviewOrm.drink_id, ReviewOrm.updated_at.desc(), ReviewOrm.id.desc())
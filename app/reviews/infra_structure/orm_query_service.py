@@ -0,0 +1,51 @@
+from contextlib import AbstractContextManager
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from reviews.application.query_service import ReviewQueryService
+from reviews.domain.repository import QueryParam
+from reviews.infra_structure.orm_models import ReviewOrm
+from reviews.infra_structure.orm_repository import build_page_query
+from shared_kernel.domain.pagination import RowPage
+
+_COLUMNS = (
+    ReviewOrm.id,
+    ReviewOrm.user_id,
+    ReviewOrm.drink_id,
+    ReviewOrm.rating,
+    ReviewOrm.comment,
+    ReviewOrm.created_at,
+    ReviewOrm.updated_at,
+)
+
+
+class OrmReviewQueryService(ReviewQueryService):
+    """
+    응답에 필요한 컬럼만 tuple 로 읽어 바로 행을 만든다. ReviewOrm, Review, DTO 를 만들지 않는다.
+    """
+
+    def __init__(self, read_session_factory: Callable[..., AbstractContextManager[Session]]) -> None:
+        self._read_session_factory = read_session_factory
+
+    def find_rows(self, query_param: QueryParam) -> RowPage:
+        with self._read_session_factory() as session:
+            rows = build_page_query(session, query_param, *_COLUMNS).all()
+
+        items = [
+            {
+                "review_id": str(review_id),
+                "user_id": user_id,
+                "drink_id": str(drink_id),
+                "rating": rating,
+                "comment": comment,
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
+            for review_id, user_id, drink_id, rating, comment, created_at, updated_at in rows[: query_param.limit]
+        ]
+
+        next_cursor = None
+        if len(rows) > query_param.limit:
+            next_cursor = query_param.encode_sort_key((items[-1]["updated_at"], items[-1]["review_id"]))
+        return RowPage(items=items, next_cursor=next_cursor)
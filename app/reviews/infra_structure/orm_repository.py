@@ -1,52 +1,69 @@
+import uuid
 from contextlib import AbstractContextManager
-from typing import Callable, List, Optional
+from typing import Callable, Optional
 
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session
 
 from reviews.domain.entities import Review
 from reviews.domain.repository import QueryParam, ReviewRepository
-from reviews.domain.value_objects import OrderType, ReviewRating
+from reviews.domain.value_objects import ReviewRating
 from reviews.infra_structure.orm_models import ReviewOrm
 from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceAlreadyExistError, ResourceNotFoundError
+from shared_kernel.domain.pagination import Page, PageSize
 from shared_kernel.domain.value_objects import DrinkId, ReviewId, UserId
 
 
+def build_page_query(session: Session, query_param: QueryParam, *entities) -> Query:
+    """
+    query_param 의 한 페이지를 읽는 쿼리. 다음 페이지가 있는지 알 수 있도록 limit + 1 개까지 읽는다.
+    entities 로 ReviewOrm 대신 컬럼들을 넘기면 그 컬럼들만 tuple 로 읽는다.
+    """
+    if not query_param.user_id and not query_param.drink_id:
+        raise InvalidParamInputError(
+            f"drink_id: {query_param.drink_id} or user_id:{query_param.user_id}에 해당하는 값이 없습니다."
+        )
+    PageSize.check(query_param.limit)
+    cursor = query_param.decode_cursor()
+
+    # (updated_at, id) 내림차순으로 순서를 고정하고, cursor 이후의 구간만 인덱스에서 읽는다.
+    query = session.query(*entities).filter_by(**query_param.filters())
+    if cursor is not None:
+        query = query.filter(tuple_(ReviewOrm.updated_at, ReviewOrm.id) < tuple_(cursor[0], uuid.UUID(cursor[1])))
+    return query.order_by(desc(ReviewOrm.updated_at), desc(ReviewOrm.id)).limit(query_param.limit + 1)
+
+
 class OrmReviewRepository(ReviewRepository):
-    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[..., AbstractContextManager[Session]],
+        read_session_factory: Optional[Callable[..., AbstractContextManager[Session]]] = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._read_session_factory = read_session_factory or session_factory
 
     def find(self, query_param: QueryParam) -> Review:
         if not query_param.user_id or not query_param.drink_id:
             raise InvalidParamInputError(
                 f"drink_id: {query_param.drink_id} and user_id:{query_param.user_id}에 해당하는 값이 없습니다."
             )
-        _query_param = {attr: value for attr, value in query_param if value and not isinstance(value, OrderType)}
-        with self._session_factory() as session:
+        with self._read_session_factory() as session:
             query = session.query(ReviewOrm)
-            review_orm = query.filter_by(**_query_param).first()
+            review_orm = query.filter_by(**query_param.filters()).first()
             if review_orm is None:
                 raise ResourceNotFoundError(f"리뷰를 찾지 못했습니다.")
             return review_orm.to_review()
 
-    def find_all(self, query_param: QueryParam) -> List[Review]:
-        if not query_param.user_id and not query_param.drink_id:
-            raise InvalidParamInputError(
-                f"drink_id: {query_param.drink_id} or user_id:{query_param.user_id}에 해당하는 값이 없습니다."
-            )
-        _query_param = {attr: value for attr, value in query_param if value and not isinstance(value, OrderType)}
-        with self._session_factory() as session:
-
-            order_type = desc(ReviewOrm.updated_at)
+    def find_all(self, query_param: QueryParam) -> Page[Review]:
+        with self._read_session_factory() as session:
             # if order_type == OrderType.LIKE_DESC:
             #     order_type = desc(ReviewOrm.num_likes)
             # elif order_type == OrderType.LIKE_ASC:
             #     order_type = asc(ReviewOrm.num_likes)
 
-            query = session.query(ReviewOrm)
-            review_orms = query.filter_by(**_query_param).order_by(order_type).all()
-
-            return [
+            review_orms = build_page_query(session, query_param, ReviewOrm).all()
+            reviews = [
                 Review(
                     id=ReviewId(value=review_orm.id),
                     drink_id=DrinkId(value=review_orm.drink_id),
@@ -56,38 +73,42 @@ class OrmReviewRepository(ReviewRepository):
                     created_at=review_orm.created_at,
                     updated_at=review_orm.updated_at,
                 )
-                for review_orm in review_orms
+                for review_orm in review_orms[: query_param.limit]
             ]
 
+        next_cursor = None
+        if len(review_orms) > query_param.limit:
+            next_cursor = query_param.encode_cursor(reviews[-1])
+        return Page[Review](items=reviews, next_cursor=next_cursor)
+
     def find_by_review_id(self, review_id: ReviewId) -> Optional[Review]:
-        with self._session_factory() as session:
-            review_orm = session.query(ReviewOrm).filter(ReviewOrm.id == str(review_id)).first()
+        with self._read_session_factory() as session:
+            review_orm = session.query(ReviewOrm).get(review_id.uuid)
             if review_orm is None:
                 raise ResourceNotFoundError(f"{str(review_id)}의 리뷰를 찾지 못했습니다.")
             return review_orm.to_review()
 
     def add(self, review: Review) -> None:
         with self._session_factory() as session:
-            review_orm = session.query(ReviewOrm).filter(ReviewOrm.id == str(review.id)).first()
-            if review_orm is not None:
+            # 존재 여부를 먼저 SELECT 하지 않고, primary key 충돌로 중복을 판단한다.
+            session.add(ReviewOrm.from_review(review))
+            try:
+                session.flush()
+            except IntegrityError:
                 raise ResourceAlreadyExistError(f"{str(review.id)}는 이미 존재하는 리뷰입니다.")
 
-            review_orm = ReviewOrm.from_review(review)
-            session.add(review_orm)
-            session.commit()
-
     def update(self, review: Review) -> None:
         with self._session_factory() as session:
-            review_orm = session.query(ReviewOrm).filter(ReviewOrm.id == str(review.id)).first()
+            review_orm = session.query(ReviewOrm).get(review.id.uuid)
             if review_orm is None:
                 raise ResourceNotFoundError(f"{str(review.id)}의 리뷰를 찾지 못했습니다.")
             review_orm.fetch_review(review)
-            session.commit()
+            session.flush()
 
     def delete_by_review_id(self, review_id: ReviewId) -> None:
         with self._session_factory() as session:
-            review_orm = session.query(ReviewOrm).filter(ReviewOrm.id == str(review_id)).first()
+            review_orm = session.query(ReviewOrm).get(review_id.uuid)
             if review_orm is None:
                 raise ResourceNotFoundError(f"{str(review_id)}의 리뷰를 찾지 못했습니다.")
             session.delete(review_orm)
-            session.commit()
+            session.flush()
@@ -1,4 +1,5 @@
 import os
+from typing import List
 
 from dotenv import load_dotenv
 from pydantic import BaseSettings
@@ -9,5 +10,99 @@ load_dotenv()
 class Settings(BaseSettings):
     JWT_SECRET_KEY: str = os.environ["JWT_SECRET_KEY"]
     JWT_ALGORITHM: str = os.environ["JWT_ALGORITHM"]
+    # "lru": 서명 검증을 마친 access token 의 payload 를 프로세스 안에 캐시한다. "none": 매번 jwt.decode 한다.
+    AUTH_TOKEN_CACHE: str = "lru"
+    AUTH_TOKEN_CACHE_MAX_SIZE: int = 10000
+    AUTH_TOKEN_CACHE_TTL_SECONDS: float = 300
 
     DB_URL: str = os.environ["DB_URL"]
+    # 배포 시에는 `python -m migrations` 로 스키마를 올리고, 로컬 개발 시에만 켜는 것을 권장
+    DB_AUTO_MIGRATE: bool = False
+    # 예: DB_REPLICA_URLS='["postgresql://...@replica1/coholy", "postgresql://...@replica2/coholy"]'
+    DB_REPLICA_URLS: List[str] = []
+    DB_REPLICA_ROUTING: str = "round_robin"
+    DB_PIN_PRIMARY_AFTER_WRITE: bool = True
+    # 이 워커에서 쓴 리소스는 이 시간 동안 ETag 를 붙이는 조회(GET /drinks, /reviews)도 primary 에서 읽는다. replica 지연보다 길게 둔다.
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+
+    DB_ECHO: bool = False
+    DB_SLOW_QUERY_THRESHOLD_MS: float = 200
+    DB_QUERY_LOG_SAMPLE_RATE: float = 0.0
+
+    # "memory": GET /drinks 를 메모리의 술 랭킹(leaderboard)에서 바로 응답한다. "none": 매번 SQL 로 정렬한다.
+    # "columnar": 술 전체를 numpy 컬럼 배열로 들고 거르고 정렬한다. numpy 를 설치해야 한다.
+    # 다른 워커/호스트에서 일어난 쓰기는 DRINK_LEADERBOARD_REFRESH_SECONDS 마다 전체를 다시 읽어 반영한다.
+    DRINK_LEADERBOARD: str = "memory"
+    DRINK_LEADERBOARD_REFRESH_SECONDS: float = 30
+
+    # "memory": 프로세스 안의 LRU/TTL 캐시. 워커마다 따로 캐시하므로 다른 워커의 쓰기는 TTL 이 지나야 반영된다.
+    # "resp": CACHE_URL 의 Redis 호환 서버를 모든 워커/호스트가 함께 쓴다.
+    CACHE_BACKEND: str = "memory"
+    CACHE_MAX_SIZE: int = 10000
+    CACHE_URL: str = "redis://localhost:6379/0"
+    CACHE_KEY_PREFIX: str = "coholy:"
+    CACHE_POOL_SIZE: int = 10
+    CACHE_SOCKET_TIMEOUT_SECONDS: float = 0.2
+
+    # 없는 술/유저/리뷰 id 를 조회한 결과를 이 시간 동안 CACHE_BACKEND 에 기억해 둔다. 0 이면 기억하지 않는다.
+    CACHE_NEGATIVE_TTL_SECONDS: float = 5
+    # 술/유저/리뷰가 바뀐 뒤 이 시간 동안은 어느 워커도 그 항목을 다시 캐시하지 못한다.
+    # 이 시간보다 짧게 걸린 조회만 캐시에 들어가므로, 다른 워커가 commit 전에 읽은 값이 남지 않는다. 0 이면 끔.
+    CACHE_TOMBSTONE_TTL_SECONDS: float = 5
+
+    # "backend": find_by_drink_id 결과를 CACHE_BACKEND 에 담는다. "none": 캐시를 쓰지 않는다.
+    DRINK_CACHE: str = "backend"
+    DRINK_CACHE_TTL_SECONDS: float = 60
+    # "backend": find_by_user_id 결과를 CACHE_BACKEND 에 담는다. "none": 캐시를 쓰지 않는다.
+    USER_CACHE: str = "backend"
+    USER_CACHE_TTL_SECONDS: float = 60
+    # "backend": find_by_review_id 결과를 CACHE_BACKEND 에 담는다. "none": 캐시를 쓰지 않는다.
+    # 0 이면 찾은 리뷰는 담지 않고 없는 id 만 기억한다.
+    REVIEW_CACHE: str = "backend"
+    REVIEW_CACHE_TTL_SECONDS: float = 0
+
+    # GET /drinks, /reviews 의 ETag 버전은 CACHE_BACKEND 에 담아 워커/호스트가 함께 쓴다.
+    # CACHE_BACKEND=memory 이면 버전이 워커마다 따로이므로, ETag 가 이 시간마다 바뀌어 다른 워커의 쓰기로 낡은 304 를 주는 시간을
+    # 이만큼으로 제한한다. 0 이면 시간으로는 바뀌지 않는다(워커가 하나일 때). resp 에서는 쓰지 않는다.
+    ETAG_VALIDITY_SECONDS: float = 30
+
+    # GET /drinks, /reviews 에서 같은 조회가 동시에 들어오면 한 번만 읽고, 결과를 이 시간 동안 워커 안에 담아 둔다.
+    # 만료가 가까우면 한 요청이 확률적으로 미리 다시 읽는다(READ_COALESCING_BETA 가 클수록 일찍). 0 이면 동시 조회만 합친다.
+    READ_COALESCING_TTL_SECONDS: float = 1
+    READ_COALESCING_MAX_SIZE: int = 1024
+    READ_COALESCING_BETA: float = 1
+    # GET /drinks 에서 담아 둔 결과가 만료된 뒤에도 DRINK_STALE_WHILE_REVALIDATE_SECONDS 동안은 기다리지 않고 예전 값으로
+    # 응답하면서 뒤에서 다시 읽는다. DB 를 읽지 못하면 DRINK_STALE_IF_ERROR_SECONDS 동안 예전 값으로 응답한다.
+    # 예전 값으로 응답할 때는 X-Stale-Seconds 헤더에 그 값을 읽은 뒤 지난 시간을 담는다. 0 이면 쓰지 않는다.
+    DRINK_STALE_WHILE_REVALIDATE_SECONDS: float = 0
+    DRINK_STALE_IF_ERROR_SECONDS: float = 300
+
+    # 워커가 뜰 때 DB 커넥션 풀을 채우고, 술 랭킹과 정렬 조건별 술 목록 WARM_UP_DRINK_PAGES 페이지(그 술들의 단건 캐시 포함),
+    # 그중 리뷰가 많은 술들의 최신 리뷰 목록 WARM_UP_REVIEW_PAGES 페이지를 미리 읽어 둔다.
+    # 끝날 때까지 GET /health/ready 는 503 을 돌려준다.
+    WARM_UP: bool = False
+    WARM_UP_DRINK_PAGES: int = 1
+    WARM_UP_REVIEW_PAGES: int = 1
+
+    # 관리용: user_id, drink_id 없이 GET /wishes 로 전체 위시를 페이지 단위로 조회하는 것을 허용
+    WISH_ALLOW_UNFILTERED_SCAN: bool = False
+
+    # "process_pool": bcrypt 를 별도 프로세스 풀에서 계산한다. "inline": 요청을 처리하는 스레드에서 바로 계산한다.
+    # 대기 중인 작업이 PASSWORD_HASHER_MAX_PENDING 개를 넘으면 503 으로 바로 거절한다.
+    PASSWORD_HASHER: str = "process_pool"
+    PASSWORD_HASHER_WORKERS: int = 2
+    PASSWORD_HASHER_MAX_PENDING: int = 32
+    PASSWORD_HASHER_TIMEOUT_SECONDS: float = 10
+
+    # "dedicated": use case 와 캐시에 없는 access token 검증을 전용 executor 에서 실행한다.
+    #   starlette 기본 threadpool(다른 sync 작업과 함께 쓰는)과 스레드를 나눠 쓰지 않는다.
+    # "shared": 기존 sync 라우터처럼 starlette 기본 threadpool 에서 실행
+    SERVICE_EXECUTOR: str = "dedicated"
+    # DB 풀과 따로 정한다. 풀보다 많은 스레드는 DB 를 쓰는 use case 가 커넥션을 기다리는 동안 캐시에서 끝나는 use case 를 실행한다.
+    SERVICE_EXECUTOR_WORKERS: int = 40
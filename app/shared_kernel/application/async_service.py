@@ -0,0 +1,35 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class AsyncApplicationService:
+    """
+    동기 application service 의 use case 를 executor 에서 실행해 라우터에서 await 할 수 있게 한다.
+    use case 하나가 통째로 한 스레드에서 실행되므로 세션과 트랜잭션은 기존처럼 동작한다.
+    executor 가 None 이면 starlette 가 sync 라우터에 쓰는 기본 threadpool 을 사용한다.
+    """
+
+    def __init__(self, application_service: Any, executor: Optional[Executor] = None) -> None:
+        self._application_service = application_service
+        self._executor = executor
+
+    def __getattr__(self, name: str) -> Callable:
+        use_case = getattr(self._application_service, name)
+        return functools.partial(self._run_in_executor, use_case)
+
+    async def _run_in_executor(self, use_case: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        # run_in_executor 는 contextvar 를 넘겨주지 않으므로 직접 복사한다.
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, functools.partial(context.run, use_case, *args, **kwargs))
+
+
+def build_service_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    use case 전용 executor. DB 풀보다 스레드가 많으면 DB 를 쓰는 use case 는 커넥션을 기다리지만,
+    캐시에서 끝나는 use case 가 그 뒤에 줄 서지 않고 남는 스레드에서 실행된다.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="application-service")
@@ -1,8 +1,10 @@
 import abc
-from typing import ClassVar
+from typing import Any, ClassVar, Dict, List, Optional
 
 from pydantic import BaseModel
 
+from shared_kernel.domain.pagination import RowPage
+
 
 class SuccessOutputDto(BaseModel, abc.ABC):
     @property
@@ -10,6 +12,21 @@ class SuccessOutputDto(BaseModel, abc.ABC):
         return True
 
 
+class RowsOutputDto(SuccessOutputDto):
+    """
+    query service 가 응답 모양으로 만든 행들을 그대로 담는다. 행마다 다시 검증하지 않도록 build 로 만든다.
+    """
+
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+    # DB 를 읽지 못해 예전에 읽은 값으로 응답했다면, 그 값을 읽은 뒤 지난 시간(초)
+    stale_seconds: Optional[float] = None
+
+    @classmethod
+    def build(cls, row_page: RowPage, stale_seconds: Optional[float] = None) -> "RowsOutputDto":
+        return cls.construct(items=row_page.items, next_cursor=row_page.next_cursor, stale_seconds=stale_seconds)
+
+
 class FailedOutputDto(BaseModel):
     RESOURCE_ERROR: ClassVar[str] = "Resource Error"
     RESOURCE_NOT_FOUND_ERROR: ClassVar[str] = "Resource Not Found Error"
@@ -17,6 +34,7 @@ class FailedOutputDto(BaseModel):
     PARAMETERS_ERROR: ClassVar[str] = "Parameters Error"
     SYSTEM_ERROR: ClassVar[str] = "System Error"
     UNAUTHORIZED_ERROR: ClassVar[str] = "Unauthorized Error"
+    SERVICE_UNAVAILABLE_ERROR: ClassVar[str] = "Service Unavailable Error"
 
     type: str
     message: str
@@ -49,6 +67,10 @@ class FailedOutputDto(BaseModel):
     def build_unauthorized_error(cls, message: str = ""):
         return cls(type=cls.UNAUTHORIZED_ERROR, message=message)
 
+    @classmethod
+    def build_service_unavailable_error(cls, message: str = ""):
+        return cls(type=cls.SERVICE_UNAVAILABLE_ERROR, message=message)
+
     @property
     def status(self) -> bool:
         return False
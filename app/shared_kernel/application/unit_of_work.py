@@ -0,0 +1,33 @@
+from abc import ABCMeta, abstractmethod
+from typing import Optional
+
+
+class UnitOfWork(metaclass=ABCMeta):
+    """
+    with 블록 안의 repository 호출을 하나의 트랜잭션으로 묶는다.
+    블록이 정상 종료되면 commit, 예외가 나거나 rollback() 이 호출되었다면 rollback 한다.
+    이미 진행 중인 unit of work 안에서 다시 열면 바깥 트랜잭션에 합류한다.
+    """
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    @abstractmethod
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        pass
+
+
+class NullUnitOfWork(UnitOfWork):
+    """
+    트랜잭션을 묶지 않는 unit of work. 각 repository 호출이 각자 commit 된다.
+    """
+
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        return None
+
+    def rollback(self) -> None:
+        pass
@@ -11,3 +11,8 @@ class ResourceAlreadyExistError(Exception):
 class InvalidParamInputError(Exception):
     def __init__(self, msg: str = "") -> None:
         super().__init__(msg)
+
+
+class ServiceUnavailableError(Exception):
+    def __init__(self, msg: str = "") -> None:
+        super().__init__(msg)
@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+from pydantic.generics import GenericModel
+
+from shared_kernel.domain.exceptions import InvalidParamInputError
+
+T = TypeVar("T")
+
+
+class Cursor(BaseModel):
+    """
+    keyset pagination 의 다음 페이지 위치. 마지막 항목의 정렬 키들을 담고,
+    클라이언트에게는 내용을 알 수 없는 base64 문자열로 전달된다.
+    """
+
+    values: List[Any]
+
+    def encode(self) -> str:
+        raw = json.dumps(self.values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str, num_of_values: int) -> "Cursor":
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidParamInputError(f"cursor: {cursor}는 올바르지 않은 cursor 입니다.")
+
+        if not isinstance(values, list) or len(values) != num_of_values:
+            raise InvalidParamInputError(f"cursor: {cursor}는 올바르지 않은 cursor 입니다.")
+        return cls(values=values)
+
+
+class PageSize:
+    DEFAULT: ClassVar[int] = 20
+    MAX: ClassVar[int] = 100
+
+    @classmethod
+    def check(cls, limit: int) -> None:
+        if not 1 <= limit <= cls.MAX:
+            raise InvalidParamInputError(f"limit: {limit}는 1 이상 {cls.MAX} 이하여야 합니다.")
+
+
+class Page(GenericModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RowPage:
+    """
+    목록 응답의 항목 모양 그대로인 dict 들의 페이지. entity, DTO 를 만들지 않는 조회 경로(query service)가 돌려준다.
+    """
+
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
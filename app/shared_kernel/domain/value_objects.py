@@ -1,43 +1,152 @@
 import uuid
+from typing import Any, Callable, Dict, Iterator, Optional
 
-from pydantic import BaseModel, Field
 
+class ValueObject:
+    """
+    값 하나를 감싸는 불변 value object. repository 가 읽는 행마다 여러 개씩 만들어지므로 pydantic 모델 대신
+    __slots__ 만 가진 가벼운 객체로 두고, 문자열로 바꾼 결과는 처음 한 번만 만들어 둔다.
+    hash 할 수 있고, 같은 타입끼리 값이 같으면 같다.
 
-class UserId(BaseModel):
-    value: str = Field(min_length=1, max_length=30)
+    pydantic 모델의 필드로 쓰면 같은 타입은 그대로, 문자열(또는 예전 형식인 {"value": ...})은 변환해서 받는다.
+    JSON 으로는 문자열로 쓰며, 이 타입을 필드로 가진 모델은 Config.json_encoders 에 VALUE_OBJECT_JSON_ENCODERS 를 둔다.
+    """
 
-    def __str__(self):
-        return self.value
+    __slots__ = ("_value", "_str")
 
+    def __init__(self, value: Any) -> None:
+        object.__setattr__(self, "_value", self._validate_value(value))
+        object.__setattr__(self, "_str", None)
 
-class UserName(BaseModel):
-    value: str = Field(default="", max_length=30)
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    @classmethod
+    def _validate_value(cls, value: Any) -> Any:
+        return value
+
+    def __str__(self) -> str:
+        if self._str is None:
+            object.__setattr__(self, "_str", str(self._value))
+        return self._str
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(value={self._value!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._value == other._value
+
+    def __hash__(self) -> int:
+        return hash(self._value)
 
-    def __str__(self):
-        return self.value
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__}는 바꿀 수 없습니다.")
 
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__}는 바꿀 수 없습니다.")
 
-class DrinkId(BaseModel):
-    value: uuid.UUID
+    def __reduce__(self):
+        return type(self), (self._value,)
+
+    def __copy__(self) -> "ValueObject":
+        return self
+
+    def __deepcopy__(self, memo: Dict) -> "ValueObject":
+        return self
 
     @classmethod
-    def build(cls, drink_name: str, created_at: float) -> "DrinkId":
-        return cls(value=uuid.uuid5(uuid.NAMESPACE_DNS, name=drink_name + str(created_at)))
+    def __get_validators__(cls) -> Iterator[Callable[[Any], "ValueObject"]]:
+        yield cls.validate
 
     @classmethod
-    def from_str(cls, drink_id: str) -> "DrinkId":
-        return cls(value=uuid.UUID(drink_id))
+    def validate(cls, value: Any) -> "ValueObject":
+        if type(value) is cls:
+            return value
+        if isinstance(value, dict) and "value" in value:
+            value = value["value"]
+        return cls(value)
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        field_schema.update(type="string")
+
+
+VALUE_OBJECT_JSON_ENCODERS = {ValueObject: str}
+
+
+class StrValueObject(ValueObject):
+    __slots__ = ()
+
+    MIN_LENGTH: int = 0
+    MAX_LENGTH: Optional[int] = None
+
+    def __init__(self, value: str) -> None:
+        value = self._validate_value(value)
+        object.__setattr__(self, "_value", value)
+        object.__setattr__(self, "_str", value)
+
+    @classmethod
+    def _validate_value(cls, value: Any) -> str:
+        if not isinstance(value, str):
+            raise TypeError(f"{cls.__name__}의 값은 문자열이어야 합니다: {value!r}")
+        if len(value) < cls.MIN_LENGTH or (cls.MAX_LENGTH is not None and len(value) > cls.MAX_LENGTH):
+            raise ValueError(f"{cls.__name__}: {value}의 길이는 {cls.MIN_LENGTH}~{cls.MAX_LENGTH} 이어야 합니다.")
+        return value
+
+
+class UuidValueObject(ValueObject):
+    __slots__ = ()
+
+    @classmethod
+    def _validate_value(cls, value: Any) -> uuid.UUID:
+        if isinstance(value, uuid.UUID):
+            return value
+        if isinstance(value, str):
+            return uuid.UUID(value)
+        raise TypeError(f"{cls.__name__}의 값은 UUID 또는 문자열이어야 합니다: {value!r}")
 
     @property
     def uuid(self) -> uuid.UUID:
-        return self.value
+        return self._value
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        field_schema.update(type="string", format="uuid")
+
+
+class UserId(StrValueObject):
+    __slots__ = ()
+
+    MIN_LENGTH = 1
+    MAX_LENGTH = 30
+
+
+class UserName(StrValueObject):
+    __slots__ = ()
+
+    MAX_LENGTH = 30
+
+    def __init__(self, value: str = "") -> None:
+        super().__init__(value)
+
 
-    def __str__(self):
-        return str(self.value)
+class DrinkId(UuidValueObject):
+    __slots__ = ()
+
+    @classmethod
+    def build(cls, drink_name: str, created_at: float) -> "DrinkId":
+        return cls(value=uuid.uuid5(uuid.NAMESPACE_DNS, name=drink_name + str(created_at)))
+
+    @classmethod
+    def from_str(cls, drink_id: str) -> "DrinkId":
+        return cls(value=uuid.UUID(drink_id))
 
 
-class ReviewId(BaseModel):
-    value: uuid.UUID
+class ReviewId(UuidValueObject):
+    __slots__ = ()
 
     @classmethod
     def build(cls, user_id: str, drink_id: str) -> "ReviewId":
@@ -46,10 +155,3 @@ class ReviewId(BaseModel):
     @classmethod
     def from_str(cls, review_id: str) -> "ReviewId":
         return cls(value=uuid.UUID(review_id))
-
-    @property
-    def uuid(self) -> uuid.UUID:
-        return self.value
-
-    def __str__(self):
-        return str(self.value)
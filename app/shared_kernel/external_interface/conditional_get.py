@@ -0,0 +1,43 @@
+from typing import Dict, Optional
+
+from starlette import status
+from starlette.responses import Response
+
+"""
+ETag 를 이용한 조건부 GET.
+공유 캐시(CDN, 프록시)도 응답을 저장하되, 쓸 때마다 If-None-Match 로 다시 확인하도록 no-cache 를 붙인다.
+"""
+
+CACHE_CONTROL = "public, no-cache"
+STALE_CACHE_CONTROL = "no-store"
+STALE_SECONDS_HEADER = "X-Stale-Seconds"
+
+
+def is_not_modified(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match 는 weak 비교를 하므로 W/ 는 떼고 비교한다.
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return etag in (candidate[2:] if candidate.startswith("W/") else candidate for candidate in candidates)
+
+
+def build_not_modified_response(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    response.headers.update(_cache_headers(etag))
+
+
+def set_stale_headers(response: Response, stale_seconds: float) -> None:
+    """
+    DB 를 읽지 못해 예전 값으로 응답할 때 쓴다. 지금 버전의 ETag 를 붙이면 이후 304 로 예전 값이 굳어지므로 붙이지 않고,
+    공유 캐시에도 저장하지 않게 한다.
+    """
+    response.headers.update({"Cache-Control": STALE_CACHE_CONTROL, STALE_SECONDS_HEADER: f"{stale_seconds:.3f}"})
+
+
+def _cache_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
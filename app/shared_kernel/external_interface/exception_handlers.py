@@ -0,0 +1,20 @@
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from starlette import status
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+
+"""
+FastAPI 기본 예외 처리기(404, 405, 422 등)와 같은 응답을 orjson 으로 쓴다.
+"""
+
+
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=getattr(exc, "headers", None))
+
+
+async def request_validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
+    return ORJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content={"detail": jsonable_encoder(exc.errors())}
+    )
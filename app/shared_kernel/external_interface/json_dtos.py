@@ -1,10 +1,10 @@
 from typing import ClassVar, Dict
 
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from starlette import status
-from starlette.responses import JSONResponse
 
-from shared_kernel.application.dtos import FailedOutputDto
+from shared_kernel.application.dtos import FailedOutputDto, RowsOutputDto
 
 
 class FailedJsonResponse(BaseModel):
@@ -15,17 +15,37 @@ class FailedJsonResponse(BaseModel):
         FailedOutputDto.PARAMETERS_ERROR: status.HTTP_400_BAD_REQUEST,
         FailedOutputDto.UNAUTHORIZED_ERROR: status.HTTP_401_UNAUTHORIZED,
         FailedOutputDto.SYSTEM_ERROR: status.HTTP_500_INTERNAL_SERVER_ERROR,
+        FailedOutputDto.SERVICE_UNAVAILABLE_ERROR: status.HTTP_503_SERVICE_UNAVAILABLE,
     }
+    # 503 응답에 붙여, 클라이언트가 바로 재시도하지 않도록 한다.
+    RETRY_AFTER_SECONDS: ClassVar[int] = 1
 
     _type: str
     _message: str
 
     @classmethod
-    def build_by_output_dto(cls, failed_output_dto: FailedOutputDto) -> JSONResponse:
-        return JSONResponse(
-            status_code=cls.STATUS_CODES[failed_output_dto.type],
+    def build_by_output_dto(cls, failed_output_dto: FailedOutputDto) -> ORJSONResponse:
+        status_code = cls.STATUS_CODES[failed_output_dto.type]
+        headers = None
+        if status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
+            headers = {"Retry-After": str(cls.RETRY_AFTER_SECONDS)}
+        return ORJSONResponse(
+            status_code=status_code,
             content={
                 "error_type": failed_output_dto.type,
                 "message": failed_output_dto.message,
             },
+            headers=headers,
         )
+
+
+class RowsJsonResponse:
+    """
+    RowsOutputDto 의 행들은 이미 응답 모양이므로 response model 을 만들지 않고 바로 JSON 으로 쓴다.
+    Response 를 직접 돌려주면 라우터의 response_model 검증도 건너뛴다(response_model 은 문서로만 쓰인다).
+    그래서 행의 모양이 response_model 과 같은지는 각 목록 라우터의 테스트에서 확인한다.
+    """
+
+    @classmethod
+    def build_by_output_dto(cls, output_dto: RowsOutputDto) -> ORJSONResponse:
+        return ORJSONResponse(content={"items": output_dto.items, "next_cursor": output_dto.next_cursor})
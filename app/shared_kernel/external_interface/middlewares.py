@@ -0,0 +1,35 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shared_kernel.infra_structure.database import begin_request_primary_pin
+from shared_kernel.infra_structure.query_telemetry import begin_request_query_stats
+
+
+class DatabaseRequestMiddleware:
+    """
+    요청마다 실행된 쿼리 수와 시간을 응답 헤더로 내려주고, 쓰기 이후의 읽기를 primary 로 고정할 범위를 정한다.
+    BaseHTTPMiddleware 는 요청마다 task 를 하나 더 만들기 때문에 순수 ASGI middleware 로 구현한다.
+    """
+
+    QUERY_COUNT_HEADER = "X-DB-Query-Count"
+    QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        query_stats = begin_request_query_stats()
+        begin_request_primary_pin()
+
+        async def send_with_query_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[self.QUERY_COUNT_HEADER] = str(query_stats.num_of_queries)
+                headers[self.QUERY_TIME_HEADER] = f"{query_stats.total_ms:.3f}"
+            await send(message)
+
+        await self._app(scope, receive, send_with_query_stats)
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class LruTtlCache:
+    """
+    프로세스 안에서 쓰는 크기 제한 LRU 캐시. 각 항목은 ttl_seconds 가 지나면 만료된다.
+    None 은 "캐시에 없음" 을 뜻하므로 값으로 저장하지 않는다.
+    """
+
+    def __init__(
+        self, max_size: int = 1024, ttl_seconds: float = 60, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError(f"max_size: {max_size}는 1 이상이어야 합니다.")
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+        if_absent: bool = False,
+    ) -> bool:
+        """
+        ttl_seconds 를 주면 이 항목만 기본 TTL 대신 그 시간 뒤에 만료된다.
+        if_absent 이면 아직 만료되지 않은 기존 항목이 있을 때 쓰지 않는다. 썼는지를 돌려준다.
+        """
+        if value is None:
+            raise ValueError("None 은 캐시에 저장할 수 없습니다.")
+        if ttl_seconds is None:
+            ttl_seconds = self._ttl_seconds
+        with self._lock:
+            now = self._clock()
+            expires_at = now + ttl_seconds
+            entry = self._entries.get(key)
+            if if_absent and entry is not None and entry[0] > now:
+                return False
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return True
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            num_of_lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "ttl_seconds": self._ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "hit_rate": round(self._hits / num_of_lookups, 4) if num_of_lookups else 0.0,
+            }
@@ -0,0 +1,173 @@
+import math
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Callable, ClassVar, Dict, List, Optional, Sequence
+
+import redis
+
+from shared_kernel.infra_structure.cache import LruTtlCache
+from shared_kernel.infra_structure.exceptions import CacheBackendError
+
+"""
+여러 워커/호스트가 함께 쓸 수 있는 key-value 캐시.
+값은 bytes 로 주고받으며, 직렬화는 캐시를 쓰는 쪽에서 한다.
+"""
+
+
+class CacheBackend(metaclass=ABCMeta):
+    # 다른 워커/호스트와 같은 값을 보는지. False 면 다른 워커가 쓴 값은 보이지 않는다.
+    shared: ClassVar[bool]
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    def set_if_absent(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> bool:
+        """
+        key 가 없을 때만 쓰고, 썼는지를 돌려준다.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict:
+        pass
+
+
+class InProcessCacheBackend(CacheBackend):
+    """
+    프로세스 안의 LruTtlCache 를 쓰는 CacheBackend. 워커가 하나이거나 로컬 개발할 때 쓴다.
+    """
+
+    shared = False
+
+    def __init__(self, max_size: int = 10000, clock: Callable[[], float] = time.monotonic) -> None:
+        self._cache = LruTtlCache(max_size=max_size, ttl_seconds=math.inf, clock=clock)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        self._cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    def set_if_absent(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> bool:
+        return self._cache.set(key, value, ttl_seconds=ttl_seconds, if_absent=True)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return [self._cache.get(key) for key in keys]
+
+    def stats(self) -> Dict:
+        stats = self._cache.stats()
+        # 항목마다 TTL 을 주므로 기본 TTL(무한대)은 보여주지 않는다.
+        del stats["ttl_seconds"]
+        return {"backend": "memory", **stats}
+
+
+class RespCacheBackend(CacheBackend):
+    """
+    Redis 프로토콜(RESP) 을 쓰는 key-value 서버(Redis, KeyDB, Valkey 등)를 redis-py 로 캐시로 쓴다.
+    url 에 인증 정보, TLS(rediss://), protocol 등을 담을 수 있다.
+    서버에 닿지 못하거나 응답이 늦으면 CacheBackendError 를 던지므로, 쓰는 쪽에서 캐시 없이 진행하면 된다.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        key_prefix: str = "",
+        pool_size: int = 10,
+        socket_timeout_seconds: float = 0.2,
+    ) -> None:
+        # 커넥션이 모두 쓰이는 중이면 새로 열지 않고 socket_timeout_seconds 까지 기다린다.
+        self._connection_pool = redis.BlockingConnectionPool.from_url(
+            url,
+            max_connections=pool_size,
+            timeout=socket_timeout_seconds,
+            socket_timeout=socket_timeout_seconds,
+            socket_connect_timeout=socket_timeout_seconds,
+        )
+        self._client = redis.Redis(connection_pool=self._connection_pool)
+        self._key_prefix = key_prefix
+
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self._execute(self._client.get, self._key(key))
+        self._record_lookups([value])
+        return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        self._execute(self._client.set, self._key(key), value, px=self._to_milliseconds(ttl_seconds))
+
+    def set_if_absent(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> bool:
+        reply = self._execute(self._client.set, self._key(key), value, px=self._to_milliseconds(ttl_seconds), nx=True)
+        return bool(reply)
+
+    def delete(self, key: str) -> None:
+        self._execute(self._client.delete, self._key(key))
+
+    def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        values = self._execute(self._client.mget, [self._key(key) for key in keys])
+        self._record_lookups(values)
+        return values
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            num_of_lookups = self._hits + self._misses
+            return {
+                "backend": "resp",
+                "max_connections": self._connection_pool.max_connections,
+                "hits": self._hits,
+                "misses": self._misses,
+                "errors": self._errors,
+                "hit_rate": round(self._hits / num_of_lookups, 4) if num_of_lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        self._connection_pool.disconnect()
+
+    def _key(self, key: str) -> str:
+        return f"{self._key_prefix}{key}"
+
+    @staticmethod
+    def _to_milliseconds(ttl_seconds: Optional[float]) -> Optional[int]:
+        if ttl_seconds is None:
+            return None
+        return max(int(ttl_seconds * 1000), 1)
+
+    def _execute(self, command: Callable, *args, **kwargs):
+        # redis-py 는 읽다 끊긴 커넥션을 버리고 다음 명령에서 다시 연결한다.
+        try:
+            return command(*args, **kwargs)
+        except redis.RedisError as e:
+            with self._stats_lock:
+                self._errors += 1
+            raise CacheBackendError(f"cache 서버 명령이 실패했습니다: {e}") from e
+
+    def _record_lookups(self, values: List[Optional[bytes]]) -> None:
+        num_of_hits = sum(value is not None for value in values)
+        with self._stats_lock:
+            self._hits += num_of_hits
+            self._misses += len(values) - num_of_hits
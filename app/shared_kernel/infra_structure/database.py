@@ -1,9 +1,20 @@
+import itertools
+import threading
+import time
 from contextlib import contextmanager, AbstractContextManager
-from typing import Callable
+from contextvars import ContextVar
+from typing import Callable, ClassVar, Dict, List, Optional
 
-from sqlalchemy import create_engine, orm
+from sqlalchemy import create_engine, event, exc, orm
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from shared_kernel.infra_structure.metrics import LatencyHistogram
+from shared_kernel.infra_structure.migrator import Migration, Migrator
+from shared_kernel.infra_structure.query_telemetry import QueryTelemetry
+from shared_kernel.infra_structure.unit_of_work import SqlAlchemyUnitOfWork, current_session
 
 """
 ref : https://python-dependency-injector.ets-labs.org/examples/fastapi-sqlalchemy.html
@@ -12,28 +23,247 @@ ref : https://python-dependency-injector.ets-labs.org/examples/fastapi-sqlalchem
 Base = declarative_base()
 
 
+class PoolMetrics:
+    def __init__(self) -> None:
+        self.checkout_latency = LatencyHistogram()
+        self._num_of_timeouts = 0
+        self._lock = threading.Lock()
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._num_of_timeouts += 1
+
+    def snapshot(self) -> Dict:
+        checkout_latency = self.checkout_latency.snapshot()
+        return {
+            "num_of_checkouts": checkout_latency["count"],
+            "num_of_timeouts": self._num_of_timeouts,
+            "total_wait_ms": checkout_latency["sum_ms"],
+            "max_wait_ms": checkout_latency["max_ms"],
+            "checkout_latency_ms": checkout_latency["buckets"],
+        }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    커넥션을 얻기까지 걸린 시간(대기 + pre-ping 포함)과 timeout 횟수를 기록하는 QueuePool.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        return self._timed_checkout(super().connect)
+
+    def unique_connection(self):
+        return self._timed_checkout(super().unique_connection)
+
+    def _timed_checkout(self, checkout: Callable):
+        start = time.perf_counter()
+        try:
+            return checkout()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.checkout_latency.observe(time.perf_counter() - start)
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class PrimaryPin:
+    def __init__(self) -> None:
+        self.pinned = False
+
+
+_request_primary_pin: ContextVar[Optional[PrimaryPin]] = ContextVar("request_primary_pin", default=None)
+
+
+def begin_request_primary_pin() -> PrimaryPin:
+    """
+    현재 요청(context)에서 쓰기가 일어나면 이후의 읽기를 primary 로 고정하기 위한 PrimaryPin 을 만든다.
+    """
+    primary_pin = PrimaryPin()
+    _request_primary_pin.set(primary_pin)
+    return primary_pin
+
+
+def pin_request_to_primary() -> None:
+    """
+    현재 요청(context)의 이후 읽기를 쓰기가 없어도 primary 로 고정한다.
+    """
+    primary_pin = _request_primary_pin.get() or begin_request_primary_pin()
+    primary_pin.pinned = True
+
+
 class Database:
-    def __init__(self, db_url: str) -> None:
-        self._engine = create_engine(db_url, echo=True)
-        self._session_factory = orm.scoped_session(
-            orm.sessionmaker(
-                autocommit=False,
-                autoflush=False,
-                bind=self._engine,
-            ),
+    ROUND_ROBIN: ClassVar[str] = "round_robin"
+    LEAST_BUSY: ClassVar[str] = "least_busy"
+
+    def __init__(
+        self,
+        db_url: str,
+        replica_urls: Optional[List[str]] = None,
+        replica_routing: str = ROUND_ROBIN,
+        pin_primary_after_write: bool = True,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        echo: bool = False,
+        slow_query_threshold_ms: float = 200,
+        query_log_sample_rate: float = 0.0,
+    ) -> None:
+        if replica_routing not in (self.ROUND_ROBIN, self.LEAST_BUSY):
+            raise ValueError(f"{replica_routing}는 지원하지 않는 replica routing 방식입니다.")
+
+        self.query_telemetry = QueryTelemetry(
+            slow_query_threshold_ms=slow_query_threshold_ms,
+            log_sample_rate=query_log_sample_rate,
         )
 
-    def create_database(self) -> None:
-        Base.metadata.create_all(self._engine)
+        def build_engine(url: str) -> Engine:
+            engine = create_engine(
+                url,
+                echo=echo,
+                poolclass=InstrumentedQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+                pool_pre_ping=pool_pre_ping,
+            )
+            self.query_telemetry.instrument(engine)
+            return engine
+
+        def build_session_factory(engine: Engine) -> orm.scoped_session:
+            return orm.scoped_session(
+                orm.sessionmaker(
+                    autocommit=False,
+                    autoflush=False,
+                    bind=engine,
+                ),
+            )
+
+        self._engine = build_engine(db_url)
+        self._session_factory = build_session_factory(self._engine)
+
+        self._replica_engines = [build_engine(replica_url) for replica_url in replica_urls or []]
+        self._replica_session_factories = [build_session_factory(engine) for engine in self._replica_engines]
+        self._replica_routing = replica_routing
+        self._replica_indexes = itertools.cycle(range(len(self._replica_engines)))
+        self._replica_lock = threading.Lock()
+
+        if pin_primary_after_write:
+            event.listen(self._engine, "after_cursor_execute", self._pin_primary_on_write)
+
+    def migrate(self) -> List[Migration]:
+        return Migrator(self._engine).upgrade()
+
+    def pool_status(self) -> Dict:
+        return {
+            **self._engine_pool_status(self._engine),
+            "replicas": [self._engine_pool_status(engine) for engine in self._replica_engines],
+        }
+
+    def warm_up(self) -> int:
+        """
+        primary, replica 의 풀을 pool_size 만큼 미리 채워 첫 요청들이 커넥션을 맺는 비용을 치르지 않게 한다.
+        새로 연 커넥션 수를 돌려준다.
+        """
+        num_of_opened = 0
+        for engine in [self._engine, *self._replica_engines]:
+            pool: InstrumentedQueuePool = engine.pool
+            num_of_idle = pool.checkedin()
+            # 한꺼번에 붙잡아야 풀이 같은 커넥션을 다시 주지 않고 새로 연다.
+            connections = []
+            try:
+                for _ in range(max(pool.size() - pool.checkedout(), 0)):
+                    connection = engine.connect()
+                    connections.append(connection)
+                    connection.execute("SELECT 1")
+            finally:
+                for connection in connections:
+                    connection.close()
+            num_of_opened += max(len(connections) - num_of_idle, 0)
+        return num_of_opened
+
+    def unit_of_work(self) -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(session_factory=self._session_factory)
 
     @contextmanager
     def session(self) -> Callable[..., AbstractContextManager[Session]]:
+        """
+        unit of work 가 진행 중이면 그 세션을 그대로 주고, commit 은 unit of work 에 맡긴다.
+        그렇지 않으면 새 세션을 열어 블록이 정상 종료될 때 commit 한다.
+        """
+        unit_of_work_session = current_session()
+        if unit_of_work_session is not None:
+            yield unit_of_work_session
+            return
+
         session: Session = self._session_factory()
         try:
             yield session
+            session.commit()
         except Exception as e:
             session.rollback()
             print(e)
             raise
         finally:
             session.close()
+
+    @contextmanager
+    def read_session(self) -> Callable[..., AbstractContextManager[Session]]:
+        """
+        조회 전용 세션. replica 가 없거나, unit of work 가 진행 중이거나,
+        현재 요청에서 이미 쓰기가 일어났다면 primary 세션을 준다.
+        """
+        primary_pin = _request_primary_pin.get()
+        if (
+            not self._replica_session_factories
+            or current_session() is not None
+            or (primary_pin is not None and primary_pin.pinned)
+        ):
+            with self.session() as session:
+                yield session
+            return
+
+        session: Session = self._replica_session_factories[self._next_replica_index()]()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _next_replica_index(self) -> int:
+        if self._replica_routing == self.LEAST_BUSY:
+            return min(
+                range(len(self._replica_engines)),
+                key=lambda index: self._replica_engines[index].pool.checkedout(),
+            )
+        with self._replica_lock:
+            return next(self._replica_indexes)
+
+    @staticmethod
+    def _pin_primary_on_write(conn, cursor, statement, parameters, context, executemany) -> None:
+        primary_pin = _request_primary_pin.get()
+        if primary_pin is None or context is None:
+            return
+        if context.isinsert or context.isupdate or context.isdelete:
+            primary_pin.pinned = True
+
+    @staticmethod
+    def _engine_pool_status(engine: Engine) -> Dict:
+        pool: InstrumentedQueuePool = engine.pool
+        return {
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            **pool.metrics.snapshot(),
+        }
@@ -6,3 +6,8 @@ class ResourceNotFoundError(Exception):
 class ResourceAlreadyExistError(Exception):
     def __init__(self, msg: str = "") -> None:
         super().__init__(msg)
+
+
+class CacheBackendError(Exception):
+    def __init__(self, msg: str = "") -> None:
+        super().__init__(msg)
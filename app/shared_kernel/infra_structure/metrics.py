@@ -0,0 +1,48 @@
+import threading
+from typing import Dict, Tuple
+
+
+class LatencyHistogram:
+    DEFAULT_BUCKETS_MS: Tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = DEFAULT_BUCKETS_MS) -> None:
+        self._buckets_ms = tuple(sorted(buckets_ms))
+        self._bucket_counts = [0] * (len(self._buckets_ms) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        elapsed_ms = seconds * 1000
+        index = len(self._buckets_ms)
+        for i, bound in enumerate(self._buckets_ms):
+            if elapsed_ms <= bound:
+                index = i
+                break
+
+        with self._lock:
+            self._bucket_counts[index] += 1
+            self._count += 1
+            self._sum_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            bucket_counts = list(self._bucket_counts)
+            count, sum_ms, max_ms = self._count, self._sum_ms, self._max_ms
+
+        # prometheus 처럼 "le" 기준 누적 값으로 내보낸다.
+        buckets = {}
+        cumulative = 0
+        for bound, bucket_count in zip(self._buckets_ms, bucket_counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = cumulative + bucket_counts[-1]
+
+        return {
+            "count": count,
+            "sum_ms": round(sum_ms, 3),
+            "max_ms": round(max_ms, 3),
+            "buckets": buckets,
+        }
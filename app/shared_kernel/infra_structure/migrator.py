@@ -0,0 +1,84 @@
+import importlib
+import logging
+import pkgutil
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, List
+
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, select
+from sqlalchemy.engine import Connection, Engine
+
+"""
+migrations 패키지 안의 v{번호}_{이름}.py 모듈을 번호 순서대로 한 번씩 적용한다.
+각 모듈은 upgrade(connection) 함수를 가지고, 적용된 버전은 schema_version 테이블에 기록된다.
+"""
+
+logger = logging.getLogger(__name__)
+
+_MIGRATION_MODULE_NAME = re.compile(r"^v(?P<version>\d+)_(?P<name>\w+)$")
+
+_metadata = MetaData()
+schema_version = Table(
+    "schema_version",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", Float, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+class Migrator:
+    def __init__(self, engine: Engine, package: str = "migrations") -> None:
+        self._engine = engine
+        self._package = package
+
+    def migrations(self) -> List[Migration]:
+        package = importlib.import_module(self._package)
+        migrations = []
+        for module_info in pkgutil.iter_modules(package.__path__):
+            matched = _MIGRATION_MODULE_NAME.match(module_info.name)
+            if matched is None:
+                continue
+            module = importlib.import_module(f"{self._package}.{module_info.name}")
+            migrations.append(
+                Migration(version=int(matched["version"]), name=matched["name"], upgrade=getattr(module, "upgrade"))
+            )
+
+        migrations.sort(key=lambda migration: migration.version)
+        versions = [migration.version for migration in migrations]
+        if len(versions) != len(set(versions)):
+            raise ValueError(f"{self._package}에 중복된 migration 버전이 있습니다: {versions}")
+        return migrations
+
+    def current_version(self) -> int:
+        schema_version.create(self._engine, checkfirst=True)
+        with self._engine.connect() as connection:
+            versions = [row.version for row in connection.execute(select([schema_version.c.version]))]
+        return max(versions, default=0)
+
+    def pending(self) -> List[Migration]:
+        current_version = self.current_version()
+        return [migration for migration in self.migrations() if migration.version > current_version]
+
+    def upgrade(self) -> List[Migration]:
+        applied = []
+        for migration in self.pending():
+            # migration 과 버전 기록을 한 트랜잭션으로 묶어, 실패하면 둘 다 반영되지 않도록 한다.
+            with self._engine.begin() as connection:
+                migration.upgrade(connection)
+                connection.execute(
+                    schema_version.insert().values(
+                        version=migration.version, name=migration.name, applied_at=time.time()
+                    )
+                )
+            logger.info("applied migration v%04d_%s", migration.version, migration.name)
+            applied.append(migration)
+        return applied
@@ -0,0 +1,93 @@
+import json
+import logging
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from shared_kernel.infra_structure.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    def __init__(self) -> None:
+        self.num_of_queries = 0
+        self.total_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.num_of_queries += 1
+        self.total_seconds += seconds
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_seconds * 1000
+
+
+_request_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def begin_request_query_stats() -> QueryStats:
+    """
+    현재 요청(context)에서 실행되는 쿼리의 수와 시간을 모을 QueryStats 를 만든다.
+    """
+    query_stats = QueryStats()
+    _request_query_stats.set(query_stats)
+    return query_stats
+
+
+class QueryTelemetry:
+    """
+    engine event 로 모든 쿼리의 실행 시간을 잰다.
+    threshold 보다 느린 쿼리는 항상, 나머지는 sample rate 만큼만 로그로 남긴다.
+    """
+
+    _START_TIMES_KEY = "query_telemetry_start_times"
+
+    def __init__(self, slow_query_threshold_ms: float = 200, log_sample_rate: float = 0.0) -> None:
+        self._slow_query_threshold_ms = slow_query_threshold_ms
+        self._log_sample_rate = log_sample_rate
+        self.latency = LatencyHistogram()
+        self._num_of_slow_queries = 0
+        self._lock = threading.Lock()
+
+    def instrument(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def snapshot(self) -> Dict:
+        return {
+            "num_of_slow_queries": self._num_of_slow_queries,
+            "latency_ms": self.latency.snapshot(),
+        }
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(self._START_TIMES_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info[self._START_TIMES_KEY].pop()
+        self.latency.observe(elapsed)
+
+        query_stats = _request_query_stats.get()
+        if query_stats is not None:
+            query_stats.record(elapsed)
+
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms >= self._slow_query_threshold_ms:
+            with self._lock:
+                self._num_of_slow_queries += 1
+            self._log(logging.WARNING, "slow_query", statement, elapsed_ms)
+        elif self._log_sample_rate > 0 and random.random() < self._log_sample_rate:
+            self._log(logging.INFO, "sampled_query", statement, elapsed_ms)
+
+    @staticmethod
+    def _log(level: int, event_name: str, statement: str, elapsed_ms: float) -> None:
+        # 파라미터에는 비밀번호 해시 등이 들어있을 수 있으므로 남기지 않는다.
+        logger.log(
+            level,
+            json.dumps({"event": event_name, "duration_ms": round(elapsed_ms, 3), "statement": statement}),
+        )
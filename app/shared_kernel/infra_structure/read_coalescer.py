@@ -0,0 +1,241 @@
+import logging
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceNotFoundError
+from shared_kernel.infra_structure.unit_of_work import call_after_commit
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 요청이 잘못된 것이므로 예전 값으로 대신 응답하지 않는다.
+_CLIENT_ERRORS = (InvalidParamInputError, ResourceNotFoundError)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    loaded_at: float
+    compute_seconds: float
+    expires_at: float
+    # 쓰기로 버려진 값. 새 값을 읽을 수 없을 때(stale-if-error)만 쓴다.
+    invalidated: bool = False
+    # 마지막으로 다시 읽다가 실패했다. 다시 읽는 동안 기다리지 않고 이 값으로 응답한다.
+    failing: bool = False
+
+
+def _run_in_thread(refresh: Callable[[], None]) -> None:
+    threading.Thread(target=refresh, name="read-coalescer-refresh", daemon=True).start()
+
+
+class ReadCoalescer:
+    """
+    같은 key 의 조회가 동시에 여러 번 들어오면 하나만 실행하고(single-flight) 나머지는 그 결과를 같이 받는다.
+    결과는 ttl_seconds 동안 프로세스 안에 담아 두며, 만료가 가까워질수록 높은 확률로 한 요청이 미리 다시 읽어
+    (probabilistic early expiration, XFetch) 만료 순간에 요청이 한꺼번에 DB 로 몰리지 않게 한다.
+    ttl_seconds 가 0 이면 결과는 담지 않고 동시에 들어온 조회만 합친다.
+
+    만료된 값은 다음 시간 동안 더 남겨 두고 get_with_staleness 가 낡은 정도와 함께 돌려준다.
+    - stale_while_revalidate_seconds: 만료 뒤 이 시간 안이면 기다리지 않고 예전 값으로 응답하고, 뒤에서 다시 읽는다.
+    - stale_if_error_seconds: 다시 읽다가 실패하면 만료 뒤 이 시간 안의 예전 값으로 응답한다.
+      쓰기로 버려진 값도 이때는 쓰며, 실패한 뒤에는 뒤에서 다시 읽는 동안 예전 값으로 바로 응답한다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 1,
+        max_size: int = 1024,
+        beta: float = 1,
+        stale_while_revalidate_seconds: float = 0,
+        stale_if_error_seconds: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+        random_value: Callable[[], float] = random.random,
+        run_in_background: Callable[[Callable[[], None]], None] = _run_in_thread,
+        after_commit: Callable[[Callable[[], None]], bool] = call_after_commit,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError(f"max_size: {max_size}는 1 이상이어야 합니다.")
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._beta = beta
+        self._stale_while_revalidate_seconds = stale_while_revalidate_seconds
+        self._stale_if_error_seconds = stale_if_error_seconds
+        self._clock = clock
+        self._random_value = random_value
+        self._run_in_background = run_in_background
+        self._after_commit = after_commit
+
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._in_flight: Dict[Hashable, Future] = {}
+        # 조회 도중 무효화가 일어났다면 조회한 값이 이미 낡았을 수 있으므로 담지 않는다.
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._loads = 0
+        self._coalesced = 0
+        self._early_refreshes = 0
+        self._stale_hits = 0
+        self._stale_on_errors = 0
+        self._background_refreshes = 0
+
+    def get(self, key: Hashable, load: Callable[[], T]) -> T:
+        value, _ = self.get_with_staleness(key, load)
+        return value
+
+    def get_with_staleness(self, key: Hashable, load: Callable[[], T]) -> Tuple[T, Optional[float]]:
+        """
+        (값, 예전 값으로 응답했다면 그 값을 읽은 뒤 지난 시간(초)) 을 돌려준다. 새로 읽었거나 만료 전의 값이면 None 이다.
+        """
+        # 직접 조회하는 요청만 generation 을 가진다.
+        generation = None
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None and not entry.invalidated and not entry.failing:
+                if not self._should_refresh(entry, now):
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry.value, None
+                if now < entry.expires_at:
+                    self._early_refreshes += 1
+                elif now < entry.expires_at + self._stale_while_revalidate_seconds:
+                    self._stale_hits += 1
+                    self._refresh_in_background(key, load)
+                    return entry.value, now - entry.loaded_at
+            if entry is not None and entry.failing and self._can_serve_on_error(entry, now):
+                self._stale_on_errors += 1
+                self._refresh_in_background(key, load)
+                return entry.value, now - entry.loaded_at
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._coalesced += 1
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                self._loads += 1
+                generation = self._generation
+
+        try:
+            if generation is None:
+                return future.result(), None
+            return self._load(key, load, future, generation), None
+        except _CLIENT_ERRORS:
+            raise
+        except Exception:
+            stale = self._stale_on_error(key)
+            if stale is None:
+                raise
+            logger.warning("%s 를 다시 읽지 못해 예전 값으로 응답합니다.", key, exc_info=True)
+            return stale
+
+    def invalidate(self) -> None:
+        """
+        담아 둔 결과를 모두 버린다. unit of work 안에서 부르면 commit 된 뒤에 한 번 더 버린다.
+        stale_if_error_seconds 가 있으면 버린 값도 새 값을 읽을 수 없을 때를 위해 남겨 둔다.
+        """
+
+        def apply() -> None:
+            with self._lock:
+                self._generation += 1
+                if self._stale_if_error_seconds > 0:
+                    for key, entry in self._entries.items():
+                        self._entries[key] = replace(entry, invalidated=True)
+                else:
+                    self._entries.clear()
+                # 진행 중인 조회는 쓰기 전의 값을 읽었을 수 있으므로, 이후의 요청은 새로 조회하게 한다.
+                self._in_flight.clear()
+
+        apply()
+        self._after_commit(apply)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "ttl_seconds": self._ttl_seconds,
+                "hits": self._hits,
+                "loads": self._loads,
+                "coalesced": self._coalesced,
+                "early_refreshes": self._early_refreshes,
+                "stale_hits": self._stale_hits,
+                "stale_on_errors": self._stale_on_errors,
+                "background_refreshes": self._background_refreshes,
+            }
+
+    def _load(self, key: Hashable, load: Callable[[], T], future: Future, generation: int) -> T:
+        started_at = self._clock()
+        try:
+            value = load()
+        except BaseException as e:
+            with self._lock:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+            future.set_exception(e)
+            raise
+
+        finished_at = self._clock()
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+            if self._ttl_seconds > 0 and generation == self._generation:
+                self._entries[key] = _Entry(
+                    value=value,
+                    loaded_at=finished_at,
+                    compute_seconds=finished_at - started_at,
+                    expires_at=finished_at + self._ttl_seconds,
+                )
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def _refresh_in_background(self, key: Hashable, load: Callable[[], T]) -> None:
+        # lock 을 잡은 채로 부른다. 이미 다시 읽는 중이면 그 결과를 기다리지 않고 넘어간다.
+        if key in self._in_flight:
+            return
+        future = Future()
+        self._in_flight[key] = future
+        self._loads += 1
+        self._background_refreshes += 1
+        generation = self._generation
+
+        def refresh() -> None:
+            try:
+                self._load(key, load, future, generation)
+            except Exception:
+                logger.warning("%s 를 뒤에서 다시 읽지 못했습니다.", key, exc_info=True)
+
+        self._run_in_background(refresh)
+
+    def _stale_on_error(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is None or not self._can_serve_on_error(entry, now):
+                return None
+            # 미리 다시 읽다가 실패했다면 아직 만료 전이므로 그대로 쓴다.
+            if not entry.invalidated and now < entry.expires_at:
+                return entry.value, None
+            self._entries[key] = replace(entry, failing=True)
+            self._stale_on_errors += 1
+            return entry.value, now - entry.loaded_at
+
+    def _can_serve_on_error(self, entry: _Entry, now: float) -> bool:
+        return now < entry.expires_at + self._stale_if_error_seconds
+
+    def _should_refresh(self, entry: _Entry, now: float) -> bool:
+        # XFetch: 다시 읽는 데 오래 걸리는 값일수록, 만료가 가까울수록 일찍 다시 읽는다.
+        # 1 - random() 은 (0, 1] 이므로 log 는 0 이하다.
+        jitter = -entry.compute_seconds * self._beta * math.log(1 - self._random_value())
+        return now + jitter >= entry.expires_at
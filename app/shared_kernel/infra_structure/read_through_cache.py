@@ -0,0 +1,146 @@
+import logging
+import threading
+from collections import Counter
+from typing import Callable, Generic, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from shared_kernel.domain.exceptions import ResourceNotFoundError
+from shared_kernel.infra_structure.cache_backend import CacheBackend
+from shared_kernel.infra_structure.exceptions import CacheBackendError
+from shared_kernel.infra_structure.unit_of_work import call_after_transaction
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# 없는 key 를 기억해 두는 값. JSON 은 NUL 로 시작하지 않으므로 모델 값과 겹치지 않는다.
+_MISSING = b"\x00missing"
+_NOT_FOUND_PREFIX = b"\x00not_found:"
+# 방금 무효화된 key 에 남기는 값. 이 값이 있는 동안은 어느 워커도 조회한 값을 캐시에 넣지 못한다.
+_TOMBSTONE = b"\x00invalidated"
+
+
+class ReadThroughCache(Generic[T]):
+    """
+    CacheBackend 앞에서 pydantic 모델 하나를 key 별로 읽어 오는 read-through 캐시.
+    쓰기를 한 쪽은 invalidate 를 부르고, unit of work 안에서 쓴 경우에는 트랜잭션이 끝난 뒤 한 번 더 지운다.
+    캐시 서버에 문제가 있으면 원래 저장소에서 바로 읽는다.
+
+    negative_ttl_seconds 가 0 보다 크면 load 가 None 을 돌려주거나 ResourceNotFoundError 를 던진 key 도
+    그 시간 동안 기억해 두고, 같은 방식으로 응답한다. 없는 id 를 계속 묻는 요청이 DB 까지 가지 않게 하기 위함이며,
+    해당 key 를 add 하면 invalidate 로 지워진다. ttl_seconds 가 0 이면 찾은 값은 캐시하지 않는다.
+
+    여러 워커가 하나의 CacheBackend(resp) 를 함께 쓰면, 다른 워커가 commit 전에 읽은 값을 commit 뒤에 쓸 수 있다.
+    그래서 invalidate 는 key 를 지우는 대신 tombstone_ttl_seconds 동안 tombstone 을 남기고(commit 뒤에 한 번 더),
+    조회한 값은 key 가 비어 있을 때만(set_if_absent) 쓴다. tombstone 이 남아 있는 동안 그 key 는 캐시를 거치지 않는다.
+    따라서 tombstone_ttl_seconds 보다 오래 걸린 조회만 낡은 값을 쓸 수 있고, 그 값도 ttl_seconds 가 지나면 사라진다.
+    tombstone_ttl_seconds 가 0 이면 tombstone 없이 지우기만 하며, 워커 사이의 낡은 값은 ttl_seconds 동안 남을 수 있다.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        model: Type[T],
+        ttl_seconds: float = 60,
+        negative_ttl_seconds: float = 0,
+        tombstone_ttl_seconds: float = 5,
+        after_transaction: Callable[[Callable[[], None]], bool] = call_after_transaction,
+    ) -> None:
+        self._backend = backend
+        self._namespace = namespace
+        self._model = model
+        self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._tombstone_ttl_seconds = tombstone_ttl_seconds
+        self._after_transaction = after_transaction
+
+        # 아직 끝나지 않은 트랜잭션에서 바뀐 key 는 commit 전의 값이 캐시에 들어가지 않도록 캐시를 거치지 않는다.
+        self._num_of_pending_writes = Counter()
+        # 조회 도중 무효화가 일어났다면 조회한 값이 이미 낡았을 수 있으므로 캐시에 넣지 않는다.
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, load: Callable[[], Optional[T]]) -> Optional[T]:
+        with self._lock:
+            if self._num_of_pending_writes[key]:
+                return load()
+            generation = self._generation
+
+        cache_key = self._cache_key(key)
+        try:
+            raw = self._backend.get(cache_key)
+        except CacheBackendError:
+            logger.warning("cache 에서 %s 를 읽지 못해 원래 저장소에서 읽습니다.", cache_key, exc_info=True)
+            return load()
+        if raw == _TOMBSTONE:
+            return load()
+        if raw is not None:
+            return self._parse(raw)
+
+        try:
+            value = load()
+        except ResourceNotFoundError as e:
+            if self._negative_ttl_seconds > 0:
+                self._set(key, generation, _NOT_FOUND_PREFIX + str(e).encode(), self._negative_ttl_seconds)
+            raise
+
+        if value is None:
+            if self._negative_ttl_seconds > 0:
+                self._set(key, generation, _MISSING, self._negative_ttl_seconds)
+        elif self._ttl_seconds > 0:
+            self._set(key, generation, value.json().encode(), self._ttl_seconds)
+        return value
+
+    def invalidate(self, key: str) -> None:
+        def end_pending_write() -> None:
+            with self._lock:
+                self._num_of_pending_writes[key] -= 1
+                if not self._num_of_pending_writes[key]:
+                    del self._num_of_pending_writes[key]
+                self._generation += 1
+            self._evict(key)
+
+        with self._lock:
+            self._generation += 1
+            if self._after_transaction(end_pending_write):
+                self._num_of_pending_writes[key] += 1
+        self._evict(key)
+
+    def _parse(self, raw: bytes) -> Optional[T]:
+        if raw == _MISSING:
+            return None
+        if raw.startswith(_NOT_FOUND_PREFIX):
+            raise ResourceNotFoundError(raw[len(_NOT_FOUND_PREFIX) :].decode())
+        return self._model.parse_raw(raw)
+
+    def _set(self, key: str, generation: int, raw: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            if generation != self._generation or self._num_of_pending_writes[key]:
+                return
+        try:
+            # 다른 워커가 남긴 tombstone 이나 더 새로운 값을 덮어쓰지 않는다.
+            self._backend.set_if_absent(self._cache_key(key), raw, ttl_seconds=ttl_seconds)
+        except CacheBackendError:
+            logger.warning("cache 에 %s 를 쓰지 못했습니다.", self._cache_key(key), exc_info=True)
+            return
+
+        # 캐시 서버에 쓰는 동안 무효화가 끼어들었다면 방금 쓴 값을 다시 지운다.
+        with self._lock:
+            invalidated = generation != self._generation or self._num_of_pending_writes[key]
+        if invalidated:
+            self._evict(key)
+
+    def _evict(self, key: str) -> None:
+        try:
+            if self._tombstone_ttl_seconds > 0:
+                self._backend.set(self._cache_key(key), _TOMBSTONE, ttl_seconds=self._tombstone_ttl_seconds)
+            else:
+                self._backend.delete(self._cache_key(key))
+        except CacheBackendError:
+            # 지우지 못한 값은 TTL 이 지나면 사라진다.
+            logger.warning("cache 에서 %s 를 지우지 못했습니다.", self._cache_key(key), exc_info=True)
+
+    def _cache_key(self, key: str) -> str:
+        return f"{self._namespace}:{key}"
@@ -0,0 +1,148 @@
+import hashlib
+import logging
+import time
+import uuid
+import zlib
+from typing import Callable, ClassVar, Optional, Sequence, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from shared_kernel.infra_structure.cache_backend import CacheBackend, InProcessCacheBackend
+from shared_kernel.infra_structure.exceptions import CacheBackendError
+from shared_kernel.infra_structure.unit_of_work import call_after_commit
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceVersions:
+    """
+    조회 API 의 ETag 를 만들기 위한, 리소스별 버전.
+    쓰기 경로가 commit 된 뒤 bump 하고, 라우터는 DB 를 읽기 전에 etag 를 만들어 If-None-Match 와 비교한다.
+
+    버전은 CacheBackend 에 임의의 토큰으로 담으므로, 캐시를 함께 쓰는 워커/호스트는 같은 ETag 를 만들고 서로의 쓰기를 바로 본다.
+    토큰이 만료되거나 지워지면 새 토큰을 만들 뿐 예전 값으로 돌아가지 않으므로, 잘못된 304 가 아니라 불필요한 200 만 생긴다.
+    shared 가 아닌 backend(워커마다 따로인 메모리)는 다른 워커의 쓰기를 알 수 없으므로, validity_seconds 마다 ETag 를 바꿔
+    그 시간 이상 낡은 304 를 주지 않는다.
+
+    버전을 올린 뒤 recent_bump_seconds 동안은 recently_bumped 가 True 를 돌려준다. 라우터는 이때 primary 에서 읽어,
+    새 ETag 에 아직 쓰기를 따라오지 못한 replica 의 응답이 붙지 않게 한다.
+    키는 num_of_slots 개의 슬롯에 나누어 담아 캐시 항목 수를 고정하고, 충돌은 불필요한 200 만 만든다.
+    """
+
+    DRINKS: ClassVar[str] = "drinks"
+    REVIEWS: ClassVar[str] = "reviews"
+
+    def __init__(
+        self,
+        cache_backend: Optional[CacheBackend] = None,
+        validity_seconds: float = 30,
+        recent_bump_seconds: float = 5,
+        version_ttl_seconds: Optional[float] = 3600,
+        num_of_slots: int = 65536,
+        clock: Callable[[], float] = time.time,
+        after_commit: Callable[[Callable[[], None]], bool] = call_after_commit,
+    ) -> None:
+        if num_of_slots <= 0:
+            raise ValueError(f"num_of_slots: {num_of_slots}는 1 이상이어야 합니다.")
+        if cache_backend is None:
+            cache_backend = InProcessCacheBackend(max_size=2 * num_of_slots, clock=clock)
+        self._cache_backend = cache_backend
+        self._validity_seconds = validity_seconds
+        self._recent_bump_seconds = recent_bump_seconds
+        self._version_ttl_seconds = version_ttl_seconds or None
+        self._num_of_slots = num_of_slots
+        self._clock = clock
+        self._after_commit = after_commit
+
+    @staticmethod
+    def review(review_id: str) -> str:
+        return f"review:{review_id}"
+
+    @staticmethod
+    def reviews_of_drink(drink_id: str) -> str:
+        return f"reviews_of_drink:{drink_id}"
+
+    @staticmethod
+    def reviews_of_user(user_id: str) -> str:
+        return f"reviews_of_user:{user_id}"
+
+    def bump(self, *keys: str) -> None:
+        """
+        unit of work 안에서 부르면 commit 된 뒤에 올리고, rollback 되면 올리지 않는다.
+        캐시에 쓰지 못하면 그 리소스의 ETag 는 버전 토큰이 만료될 때까지(version_ttl_seconds) 바뀌지 않을 수 있다.
+        """
+
+        def apply() -> None:
+            for slot in {self._slot(key) for key in keys}:
+                try:
+                    self._cache_backend.set(self._version_key(slot), self._new_token(), self._version_ttl_seconds)
+                    if self._recent_bump_seconds > 0:
+                        self._cache_backend.set(self._bumped_key(slot), b"1", self._recent_bump_seconds)
+                except CacheBackendError:
+                    logger.warning("리소스 버전 슬롯 %s 를 올리지 못했습니다.", slot, exc_info=True)
+
+        if not self._after_commit(apply):
+            apply()
+
+    def recently_bumped(self, *keys: str) -> bool:
+        """
+        keys 중 하나라도 recent_bump_seconds 안에 버전이 올랐는지. 캐시를 읽지 못하면 올랐다고 본다.
+        """
+        return self._lookup(keys)[1]
+
+    def etag(self, *keys: str, variant: str = "") -> str:
+        """
+        keys 의 버전과 variant(같은 리소스의 다른 표현, 예: 쿼리 파라미터)로 strong ETag 를 만든다.
+        """
+        return self._lookup(keys, variant)[0]
+
+    async def lookup(self, *keys: str, variant: str = "") -> Tuple[str, bool]:
+        """
+        etag 와 recently_bumped 를 캐시 한 번의 조회로 함께 돌려준다.
+        shared backend 는 네트워크를 타므로 이벤트 루프를 막지 않게 threadpool 에서 읽는다.
+        """
+        if not self._cache_backend.shared:
+            return self._lookup(keys, variant)
+        return await run_in_threadpool(self._lookup, keys, variant)
+
+    def _lookup(self, keys: Sequence[str], variant: str = "") -> Tuple[str, bool]:
+        slots = [self._slot(key) for key in keys]
+        try:
+            values = self._cache_backend.mget(
+                [self._version_key(slot) for slot in slots] + [self._bumped_key(slot) for slot in slots]
+            )
+            tokens = [token or self._create_version(slot) for slot, token in zip(slots, values)]
+            recently_bumped = any(marker is not None for marker in values[len(slots) :])
+        except CacheBackendError:
+            logger.warning("리소스 버전을 읽지 못해 맞는 If-None-Match 가 없는 ETag 를 씁니다.", exc_info=True)
+            tokens, recently_bumped = [self._new_token()], True
+
+        bucket = 0
+        if not self._cache_backend.shared and self._validity_seconds > 0:
+            bucket = int(self._clock() // self._validity_seconds)
+        versions = b".".join(tokens).decode()
+        digest = hashlib.sha1(f"{versions}|{bucket}|{variant}".encode()).hexdigest()[:16]
+        return f'"{digest}"', recently_bumped
+
+    def _create_version(self, slot: int) -> bytes:
+        token = self._new_token()
+        if self._cache_backend.set_if_absent(self._version_key(slot), token, self._version_ttl_seconds):
+            return token
+        # 그 사이 다른 워커가 만들었거나 bump 했다. 다시 사라졌다면 새 토큰은 어떤 예전 ETag 와도 맞지 않는다.
+        return self._cache_backend.get(self._version_key(slot)) or token
+
+    def _slot(self, key: str) -> int:
+        # hash() 는 프로세스마다 달라지므로, 워커들이 같은 슬롯을 고르도록 고정된 해시를 쓴다.
+        return zlib.crc32(key.encode()) % self._num_of_slots
+
+    @staticmethod
+    def _version_key(slot: int) -> str:
+        return f"resource_version:{slot}"
+
+    @staticmethod
+    def _bumped_key(slot: int) -> str:
+        return f"resource_bumped:{slot}"
+
+    @staticmethod
+    def _new_token() -> bytes:
+        return uuid.uuid4().hex.encode()
@@ -0,0 +1,106 @@
+from contextvars import ContextVar, Token
+from typing import Callable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from shared_kernel.application.unit_of_work import UnitOfWork
+
+
+class _Transaction:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+        self.rollback_only = False
+        # 세션의 identity map 은 약한 참조라서, 조회 후 바로 버려진 객체는 같은 트랜잭션에서 다시 SELECT 된다.
+        # unit of work 동안에는 조회한 객체를 붙잡아 두어 query.get() 이 identity map 에서 처리되도록 한다.
+        self.loaded = []
+        # 트랜잭션이 끝난 뒤(commit, rollback 모두) 호출할 콜백. 캐시 무효화 등에 쓴다.
+        self.after_end_callbacks: List[Callable[[], None]] = []
+        # commit 에 성공했을 때만 호출할 콜백. commit 된 값을 메모리의 다른 구조에 반영할 때 쓴다.
+        self.after_commit_callbacks: List[Callable[[], None]] = []
+
+    def keep_loaded(self, session: Session, instance) -> None:
+        self.loaded.append(instance)
+
+
+_current_transaction: ContextVar[Optional[_Transaction]] = ContextVar("current_transaction", default=None)
+
+
+def current_session() -> Optional[Session]:
+    transaction = _current_transaction.get()
+    return transaction.session if transaction is not None else None
+
+
+def call_after_transaction(callback: Callable[[], None]) -> bool:
+    """
+    진행 중인 unit of work 가 있으면 트랜잭션이 끝난 뒤 callback 을 호출하도록 등록하고 True 를 돌려준다.
+    없으면 아무것도 하지 않고 False 를 돌려준다.
+    """
+    transaction = _current_transaction.get()
+    if transaction is None:
+        return False
+    transaction.after_end_callbacks.append(callback)
+    return True
+
+
+def call_after_commit(callback: Callable[[], None]) -> bool:
+    """
+    진행 중인 unit of work 가 있으면 commit 에 성공한 뒤에만 callback 을 호출하도록 등록하고 True 를 돌려준다.
+    없으면 아무것도 하지 않고 False 를 돌려준다. (이때 쓰기는 이미 commit 된 상태이다.)
+    """
+    transaction = _current_transaction.get()
+    if transaction is None:
+        return False
+    transaction.after_commit_callbacks.append(callback)
+    return True
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """
+    with 블록 동안 하나의 세션(커넥션, 트랜잭션)을 현재 context 에 열어 두고,
+    Database.session() / read_session() 이 그 세션을 그대로 쓰도록 한다.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        self._session_factory = session_factory
+        self._transaction: Optional[_Transaction] = None
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> "SqlAlchemyUnitOfWork":
+        self._transaction = _current_transaction.get()
+        if self._transaction is None:
+            self._transaction = _Transaction(self._session_factory())
+            event.listen(self._transaction.session, "loaded_as_persistent", self._transaction.keep_loaded)
+            self._token = _current_transaction.set(self._transaction)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        if exc_type is not None:
+            self._transaction.rollback_only = True
+
+        # 바깥 unit of work 에 합류한 경우에는 commit / rollback 을 바깥에 맡긴다.
+        if self._token is None:
+            return None
+
+        session = self._transaction.session
+        committed = False
+        try:
+            if self._transaction.rollback_only:
+                session.rollback()
+            else:
+                session.commit()
+                committed = True
+        finally:
+            event.remove(session, "loaded_as_persistent", self._transaction.keep_loaded)
+            session.close()
+            _current_transaction.reset(self._token)
+            self._token = None
+            for callback in self._transaction.after_end_callbacks:
+                callback()
+        if committed:
+            for callback in self._transaction.after_commit_callbacks:
+                callback()
+        return None
+
+    def rollback(self) -> None:
+        self._transaction.rollback_only = True
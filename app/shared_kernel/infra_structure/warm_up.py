@@ -0,0 +1,82 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class WarmUp:
+    """
+    워커가 뜬 직후 커넥션을 열고 캐시를 채우는 작업(step)들을 등록 순서대로 실행한다.
+    start 는 별도 스레드에서 실행하므로 서버는 바로 요청을 받을 수 있고,
+    load balancer 는 is_ready 가 True 가 된 뒤에만 트래픽을 보내면 된다.
+    실패한 step 은 기록만 하고 다음 step 을 계속한다(캐시가 비어 있을 뿐 요청은 처리할 수 있다).
+    등록된 step 이 없으면 처음부터 준비된 상태이다.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._steps: List[Tuple[str, Callable[[], None]]] = []
+        self._step_status: Dict[str, Dict] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._finished = threading.Event()
+        self._finished.set()
+        self._lock = threading.Lock()
+
+    def add_step(self, name: str, step: Callable[[], None]) -> None:
+        with self._lock:
+            if self._thread is not None:
+                raise RuntimeError("warm-up 이 이미 시작되었습니다.")
+            if name in self._step_status:
+                raise ValueError(f"{name}은 이미 등록된 warm-up step 입니다.")
+            self._steps.append((name, step))
+            self._step_status[name] = {"status": self.PENDING, "elapsed_ms": None}
+            self._finished.clear()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None or not self._steps:
+                return
+            self._thread = threading.Thread(target=self.run, name="warm-up", daemon=True)
+        self._thread.start()
+
+    def run(self) -> None:
+        try:
+            for name, step in self._steps:
+                self._set_step_status(name, self.RUNNING)
+                started_at = self._clock()
+                try:
+                    step()
+                except Exception:
+                    logger.exception("warm-up step %s 에 실패했습니다.", name)
+                    self._set_step_status(name, self.FAILED, self._clock() - started_at)
+                else:
+                    self._set_step_status(name, self.DONE, self._clock() - started_at)
+        finally:
+            self._finished.set()
+
+    def is_ready(self) -> bool:
+        return self._finished.is_set()
+
+    def wait(self, timeout_seconds: Optional[float] = None) -> bool:
+        return self._finished.wait(timeout_seconds)
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {
+                "ready": self.is_ready(),
+                "steps": {name: dict(step_status) for name, step_status in self._step_status.items()},
+            }
+
+    def _set_step_status(self, name: str, status: str, elapsed_seconds: Optional[float] = None) -> None:
+        with self._lock:
+            self._step_status[name] = {
+                "status": status,
+                "elapsed_ms": round(elapsed_seconds * 1000, 3) if elapsed_seconds is not None else None,
+            }
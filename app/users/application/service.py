@@ -1,9 +1,7 @@
-from typing import Union
-
-from passlib.context import CryptContext
+from typing import Optional, Union
 
 from shared_kernel.application.dtos import FailedOutputDto
-from shared_kernel.domain.exceptions import ResourceNotFoundError, ResourceAlreadyExistError
+from shared_kernel.domain.exceptions import ResourceNotFoundError, ResourceAlreadyExistError, ServiceUnavailableError
 from shared_kernel.domain.value_objects import UserId, UserName
 from users.application.dtos import (
     CreateUserInputDto,
@@ -18,13 +16,15 @@ from users.application.dtos import (
     DeleteUserOutputDto,
 )
 from users.domain.entities import User
+from users.domain.password_hasher import PasswordHasher
 from users.domain.repository import UserRepository
+from users.infra_structure.password_hasher import BcryptPasswordHasher
 
 
 class UserApplicationService:
-    def __init__(self, user_repository: UserRepository) -> None:
+    def __init__(self, user_repository: UserRepository, password_hasher: Optional[PasswordHasher] = None) -> None:
         self._user_repository = user_repository
-        self._pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self._password_hasher = password_hasher or BcryptPasswordHasher()
 
     def find_user(self, input_dto: FindUserInputDto) -> Union[FindUserOutputDto, FailedOutputDto]:
         try:
@@ -56,6 +56,8 @@ class UserApplicationService:
             )
         except ResourceAlreadyExistError as e:
             return FailedOutputDto.build_resource_conflict_error(message=str(e))
+        except ServiceUnavailableError as e:
+            return FailedOutputDto.build_service_unavailable_error(message=str(e))
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
 
@@ -87,17 +89,19 @@ class UserApplicationService:
     def login(self, input_dto: LoginInputDto) -> Union[LoginOutputDto, FailedOutputDto]:
         try:
             user_id = UserId(value=input_dto.user_id)
-            user = self._user_repository.find_by_user_id(user_id=user_id)
-            if not self._verify_password(input_dto.password, user.password):
+            password = self._user_repository.find_password_by_user_id(user_id=user_id)
+            if not self._verify_password(input_dto.password, password):
                 return FailedOutputDto.build_unauthorized_error(f"잘못된 비밀번호 입니다.")
             return LoginOutputDto()
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
+        except ServiceUnavailableError as e:
+            return FailedOutputDto.build_service_unavailable_error(message=str(e))
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
 
     def _get_password_hash(self, password: str) -> str:
-        return self._pwd_context.hash(password)
+        return self._password_hasher.hash(password)
 
     def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return self._pwd_context.verify(plain_password, hashed_password)
+        return self._password_hasher.verify(plain_password, hashed_password)
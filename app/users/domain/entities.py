@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 
-from shared_kernel.domain.value_objects import UserId, UserName
+from shared_kernel.domain.value_objects import VALUE_OBJECT_JSON_ENCODERS, UserId, UserName
 
 
 class User(BaseModel):
@@ -9,3 +9,6 @@ class User(BaseModel):
     description: str = Field(default="")
     password: str
     image_url: str = Field(default="")
+
+    class Config:
+        json_encoders = VALUE_OBJECT_JSON_ENCODERS
@@ -0,0 +1,11 @@
+from abc import ABCMeta, abstractmethod
+
+
+class PasswordHasher(metaclass=ABCMeta):
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        pass
+
+    @abstractmethod
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        pass
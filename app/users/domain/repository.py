@@ -14,6 +14,10 @@ class UserRepository(metaclass=ABCMeta):
     def find_by_user_id(self, user_id: UserId) -> User:
         pass
 
+    @abstractmethod
+    def find_password_by_user_id(self, user_id: UserId) -> str:
+        pass
+
     @abstractmethod
     def add(self, user: User) -> None:
         pass
@@ -0,0 +1,86 @@
+from typing import Callable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from shared_kernel.domain.value_objects import VALUE_OBJECT_JSON_ENCODERS, UserId, UserName
+from shared_kernel.infra_structure.cache_backend import CacheBackend
+from shared_kernel.infra_structure.read_through_cache import ReadThroughCache
+from shared_kernel.infra_structure.unit_of_work import call_after_transaction
+from users.domain.entities import User
+from users.domain.repository import UserRepository
+
+
+class _CachedUser(BaseModel):
+    """
+    캐시에 담는 User. CacheBackend 가 다른 서버(resp)일 수 있으므로 비밀번호 해시는 담지 않는다.
+    """
+
+    id: UserId
+    name: UserName
+    description: str = Field(default="")
+    image_url: str = Field(default="")
+
+    class Config:
+        json_encoders = VALUE_OBJECT_JSON_ENCODERS
+
+
+class CachedUserRepository(UserRepository):
+    """
+    find_by_user_id 결과를 CacheBackend 에 담아 두는 read-through 캐시.
+    negative_ttl_seconds 동안은 없는 id 도 기억해 둔다.
+    쓰기 메서드는 원래 repository 에 위임한 뒤 해당 유저를 캐시에서 지운다.
+
+    비밀번호 해시는 캐시하지 않으므로 find_by_user_id 가 돌려주는 User 의 password 는 빈 문자열이다.
+    비밀번호가 필요하면 find_password_by_user_id 로 원래 repository 에서 읽는다.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        cache_backend: CacheBackend,
+        ttl_seconds: float = 60,
+        negative_ttl_seconds: float = 0,
+        tombstone_ttl_seconds: float = 5,
+        after_transaction: Callable[[Callable[[], None]], bool] = call_after_transaction,
+    ) -> None:
+        self._user_repository = user_repository
+        self._cache = ReadThroughCache(
+            backend=cache_backend,
+            # 비밀번호 해시를 빼면서, 예전 형식으로 담긴 값을 읽지 않도록 이름을 바꿨다.
+            namespace="user.v2",
+            model=_CachedUser,
+            ttl_seconds=ttl_seconds,
+            negative_ttl_seconds=negative_ttl_seconds,
+            tombstone_ttl_seconds=tombstone_ttl_seconds,
+            after_transaction=after_transaction,
+        )
+
+    def find_all(self) -> List[User]:
+        return self._user_repository.find_all()
+
+    def find_by_user_id(self, user_id: UserId) -> User:
+        cached_user = self._cache.get(str(user_id), lambda: self._load(user_id))
+        if cached_user is None:
+            return None
+        return User(password="", **cached_user.dict())
+
+    def find_password_by_user_id(self, user_id: UserId) -> str:
+        return self._user_repository.find_password_by_user_id(user_id)
+
+    def add(self, user: User) -> None:
+        self._user_repository.add(user)
+        self._cache.invalidate(str(user.id))
+
+    def update(self, user: User) -> None:
+        self._user_repository.update(user)
+        self._cache.invalidate(str(user.id))
+
+    def delete_by_user_id(self, user_id: UserId) -> None:
+        self._user_repository.delete_by_user_id(user_id)
+        self._cache.invalidate(str(user_id))
+
+    def _load(self, user_id: UserId) -> Optional[_CachedUser]:
+        user = self._user_repository.find_by_user_id(user_id)
+        if user is None:
+            return None
+        return _CachedUser(**user.dict(exclude={"password"}))
@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+from shared_kernel.domain.exceptions import ResourceNotFoundError
 from shared_kernel.domain.value_objects import UserId
 from users.domain.entities import User
 from users.domain.repository import UserRepository
@@ -12,6 +13,12 @@ class InMemoryUserRepository(UserRepository):
     def find_by_user_id(self, user_id: UserId) -> Optional[User]:
         return self.user_id_to_user.get(str(user_id), None)
 
+    def find_password_by_user_id(self, user_id: UserId) -> str:
+        user = self.user_id_to_user.get(str(user_id), None)
+        if user is None:
+            raise ResourceNotFoundError(f"{str(user_id)}의 유저를 찾지 못했습니다.")
+        return user.password
+
     def add(self, user: User) -> None:
         self.user_id_to_user[str(user.id)] = user
 
@@ -1,5 +1,5 @@
 from contextlib import AbstractContextManager
-from typing import List, Callable
+from typing import List, Callable, Optional
 
 from sqlalchemy.orm import Session
 
@@ -11,42 +11,54 @@ from users.infra_structure.orm_models import UserOrm
 
 
 class OrmUserRepository(UserRepository):
-    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[..., AbstractContextManager[Session]],
+        read_session_factory: Optional[Callable[..., AbstractContextManager[Session]]] = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._read_session_factory = read_session_factory or session_factory
 
     def find_all(self) -> List[User]:
-        with self._session_factory() as session:
+        with self._read_session_factory() as session:
             user_orms = session.query(UserOrm).all()
             return [user_orm.to_user() for user_orm in user_orms]
 
     def find_by_user_id(self, user_id: UserId) -> User:
-        with self._session_factory() as session:
-            user_orm = session.query(UserOrm).filter(UserOrm.id == str(user_id)).first()
+        with self._read_session_factory() as session:
+            user_orm = session.query(UserOrm).get(str(user_id))
             if user_orm is None:
                 raise ResourceNotFoundError(f"{str(user_id)}의 유저를 찾지 못했습니다.")
             return user_orm.to_user()
 
+    def find_password_by_user_id(self, user_id: UserId) -> str:
+        with self._read_session_factory() as session:
+            password = session.query(UserOrm.password).filter(UserOrm.id == str(user_id)).scalar()
+            if password is None:
+                raise ResourceNotFoundError(f"{str(user_id)}의 유저를 찾지 못했습니다.")
+            return password
+
     def add(self, user: User) -> None:
         with self._session_factory() as session:
-            user_orm = session.query(UserOrm).filter(UserOrm.id == str(user.id)).first()
+            user_orm = session.query(UserOrm).get(str(user.id))
             if user_orm is not None:
                 raise ResourceAlreadyExistError(f"{str(user.id)}는 이미 존재하는 유저입니다.")
             user_orm = UserOrm.from_user(user)
             session.add(user_orm)
-            session.commit()
+            session.flush()
 
     def update(self, user: User) -> None:
         with self._session_factory() as session:
-            user_orm = session.query(UserOrm).filter(UserOrm.id == str(user.id)).first()
+            user_orm = session.query(UserOrm).get(str(user.id))
             if user_orm is None:
                 raise ResourceNotFoundError(f"{str(user.id)}의 유저를 찾지 못했습니다.")
             user_orm.fetch_user(user)
-            session.commit()
+            session.flush()
 
     def delete_by_user_id(self, user_id: UserId) -> None:
         with self._session_factory() as session:
-            user_orm = session.query(UserOrm).filter(UserOrm.id == str(user_id)).first()
+            user_orm = session.query(UserOrm).get(str(user_id))
             if user_orm is None:
                 raise ResourceNotFoundError(f"{str(user_id)}의 유저를 찾지 못했습니다.")
             session.delete(user_orm)
-            session.commit()
+            session.flush()
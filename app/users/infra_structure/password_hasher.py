@@ -0,0 +1,84 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from typing import Optional
+
+from passlib.context import CryptContext
+
+from shared_kernel.domain.exceptions import ServiceUnavailableError
+from users.domain.password_hasher import PasswordHasher
+
+_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash(password: str) -> str:
+    return _pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return _pwd_context.verify(plain_password, hashed_password)
+
+
+class BcryptPasswordHasher(PasswordHasher):
+    """
+    호출한 스레드에서 바로 bcrypt 를 계산한다.
+    """
+
+    def hash(self, password: str) -> str:
+        return _hash(password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return _verify(plain_password, hashed_password)
+
+
+class ProcessPoolPasswordHasher(PasswordHasher):
+    """
+    bcrypt 를 별도 프로세스 풀에서 계산해, 요청을 처리하는 스레드들이 GIL 을 두고 다투지 않게 한다.
+    대기 중인 작업이 max_pending 개를 넘으면 기다리지 않고 ServiceUnavailableError 를 던진다.
+    timeout_seconds 안에 끝나지 않은 작업은 취소하고, 이미 시작했다면 끝날 때까지 max_pending 자리를 차지한다.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 32, timeout_seconds: Optional[float] = 10) -> None:
+        self._max_workers = max_workers
+        self._timeout_seconds = timeout_seconds
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def hash(self, password: str) -> str:
+        return self._submit(_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._submit(_verify, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _submit(self, fn, *args):
+        if not self._pending.acquire(blocking=False):
+            raise ServiceUnavailableError("비밀번호 처리 요청이 많아 잠시 후 다시 시도해주세요.")
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._pending.release()
+            raise
+        # 자리는 작업이 끝나거나 취소될 때 돌려준다. 시간이 지나 응답한 요청의 작업도 끝날 때까지 자리를 차지한다.
+        future.add_done_callback(lambda _: self._pending.release())
+        try:
+            return future.result(timeout=self._timeout_seconds)
+        except TimeoutError:
+            # 아직 시작하지 않은 작업은 취소해, 이미 503 을 받은 요청의 bcrypt 를 계산하지 않는다.
+            future.cancel()
+            raise ServiceUnavailableError("비밀번호 처리가 지연되고 있어 잠시 후 다시 시도해주세요.")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # uvicorn 과 executor 스레드가 떠 있는 프로세스를 fork 하지 않도록 spawn 으로 띄운다.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
@@ -1,5 +1,3 @@
-from typing import List
-
 from pydantic import BaseModel
 
 from shared_kernel.application.dtos import SuccessOutputDto
@@ -10,16 +8,6 @@ class FindWishesInputDto(BaseModel):
     query_param: QueryParam
 
 
-class FindWishesOutputDto(SuccessOutputDto):
-    class Item(BaseModel):
-        id: str
-        user_id: str
-        drink_id: str
-        created_at: float
-
-    items: List[Item]
-
-
 class CreateWishInputDto(BaseModel):
     user_id: str
     drink_id: str
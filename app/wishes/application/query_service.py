@@ -0,0 +1,39 @@
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict
+
+from shared_kernel.domain.pagination import RowPage
+from wishes.domain.entities import Wish
+from wishes.domain.repository import QueryParam, WishRepository
+
+
+def wish_row(wish: Wish) -> Dict[str, Any]:
+    return {
+        "id": str(wish.id),
+        "user_id": str(wish.user_id),
+        "drink_id": str(wish.drink_id),
+        "created_at": wish.created_at,
+    }
+
+
+class WishQueryService(metaclass=ABCMeta):
+    """
+    GET /wishes 의 항목 모양(GetWishesJsonResponse.Item) 그대로 위시 목록을 읽는다.
+    cursor 는 WishRepository.find_all 과 같으므로 두 경로의 페이지를 섞어 써도 된다.
+    """
+
+    @abstractmethod
+    def find_rows(self, query_param: QueryParam) -> RowPage:
+        pass
+
+
+class RepositoryWishQueryService(WishQueryService):
+    """
+    repository 로 읽은 entity 를 행으로 바꾼다. 컬럼만 읽는 query service 가 없을 때 쓴다.
+    """
+
+    def __init__(self, wish_repository: WishRepository) -> None:
+        self._wish_repository = wish_repository
+
+    def find_rows(self, query_param: QueryParam) -> RowPage:
+        page = self._wish_repository.find_all(query_param)
+        return RowPage(items=[wish_row(wish) for wish in page.items], next_cursor=page.next_cursor)
@@ -1,42 +1,47 @@
 import time
-from typing import Union
+from typing import Callable, Optional, Union
 
 from drinks.application.dtos import AddDrinkWishInputDto, DeleteDrinkWishInputDto
 from drinks.application.service import DrinkApplicationService
-from shared_kernel.application.dtos import FailedOutputDto
-from shared_kernel.domain.exceptions import ResourceNotFoundError, ResourceAlreadyExistError
+from shared_kernel.application.dtos import FailedOutputDto, RowsOutputDto
+from shared_kernel.application.unit_of_work import NullUnitOfWork, UnitOfWork
+from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceNotFoundError, ResourceAlreadyExistError
 from shared_kernel.domain.value_objects import UserId, DrinkId
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
 from wishes.application.dto import (
     CreateWishInputDto,
     CreateWishOutputDto,
     DeleteWishInputDto,
     DeleteWishOutputDto,
     FindWishesInputDto,
-    FindWishesOutputDto,
 )
+from wishes.application.query_service import RepositoryWishQueryService, WishQueryService
 from wishes.domain.entities import Wish
 from wishes.domain.repository import WishRepository
 from wishes.domain.value_objects import WishId
 
 
 class WishApplicationService:
-    def __init__(self, wish_repository: WishRepository) -> None:
+    def __init__(
+        self,
+        wish_repository: WishRepository,
+        unit_of_work_factory: Callable[[], UnitOfWork] = NullUnitOfWork,
+        resource_versions: Optional[ResourceVersions] = None,
+        wish_query_service: Optional[WishQueryService] = None,
+    ) -> None:
         self._wish_repository = wish_repository
+        self._wish_query_service = wish_query_service or RepositoryWishQueryService(wish_repository)
+        self._unit_of_work_factory = unit_of_work_factory
+        self._resource_versions = resource_versions
 
-    def find_wishes(self, input_dto: FindWishesInputDto) -> Union[FindWishesOutputDto, FailedOutputDto]:
+    def find_wish_rows(self, input_dto: FindWishesInputDto) -> Union[RowsOutputDto, FailedOutputDto]:
+        """
+        위시 목록을 entity, DTO 없이 GET /wishes 의 항목 모양 그대로 돌려준다.
+        """
         try:
-            wishes = self._wish_repository.find_all(input_dto.query_param)
-            return FindWishesOutputDto(
-                items=[
-                    FindWishesOutputDto.Item(
-                        id=str(wish.id),
-                        user_id=str(wish.user_id),
-                        drink_id=str(wish.drink_id),
-                        created_at=wish.created_at,
-                    )
-                    for wish in wishes
-                ]
-            )
+            return RowsOutputDto.build(self._wish_query_service.find_rows(input_dto.query_param))
+        except InvalidParamInputError as e:
+            return FailedOutputDto.build_parameters_error(message=str(e))
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
 
@@ -46,19 +51,22 @@ class WishApplicationService:
         drink_application_service: DrinkApplicationService,
     ) -> Union[CreateWishOutputDto, FailedOutputDto]:
         try:
-            wish = Wish(
-                id=WishId.build(user_id=str(input_dto.user_id), drink_id=str(input_dto.drink_id)),
-                user_id=UserId(value=input_dto.user_id),
-                drink_id=DrinkId.from_str(input_dto.drink_id),
-                created_at=time.time(),
-            )
-            self._wish_repository.add(wish)
+            with self._unit_of_work_factory() as unit_of_work:
+                wish = Wish(
+                    id=WishId.build(user_id=str(input_dto.user_id), drink_id=str(input_dto.drink_id)),
+                    user_id=UserId(value=input_dto.user_id),
+                    drink_id=DrinkId.from_str(input_dto.drink_id),
+                    created_at=time.time(),
+                )
+                self._wish_repository.add(wish)
 
-            add_drink_wish_input_dto = AddDrinkWishInputDto(drink_id=input_dto.drink_id)
-            add_drink_wish_output_dto = drink_application_service.add_drink_wish(input_dto=add_drink_wish_input_dto)
+                add_drink_wish_input_dto = AddDrinkWishInputDto(drink_id=input_dto.drink_id)
+                add_drink_wish_output_dto = drink_application_service.add_drink_wish(input_dto=add_drink_wish_input_dto)
 
-            if not add_drink_wish_output_dto.status:
-                return add_drink_wish_output_dto
+                if not add_drink_wish_output_dto.status:
+                    unit_of_work.rollback()
+                    return add_drink_wish_output_dto
+                self._bump_drink_versions()
             return CreateWishOutputDto(
                 id=str(wish.id), user_id=str(wish.user_id), drink_id=str(wish.drink_id), created_at=wish.created_at
             )
@@ -73,17 +81,25 @@ class WishApplicationService:
         drink_application_service: DrinkApplicationService,
     ) -> Union[DeleteWishOutputDto, FailedOutputDto]:
         try:
-            wish = self._wish_repository.delete_by_wish_id(WishId.from_str(input_dto.wish_id))
+            with self._unit_of_work_factory() as unit_of_work:
+                wish = self._wish_repository.delete_by_wish_id(WishId.from_str(input_dto.wish_id))
 
-            delete_drink_wish_input_dto = DeleteDrinkWishInputDto(drink_id=str(wish.drink_id))
-            delete_drink_wish_output_dto = drink_application_service.delete_drink_wish(
-                input_dto=delete_drink_wish_input_dto
-            )
+                delete_drink_wish_input_dto = DeleteDrinkWishInputDto(drink_id=str(wish.drink_id))
+                delete_drink_wish_output_dto = drink_application_service.delete_drink_wish(
+                    input_dto=delete_drink_wish_input_dto
+                )
 
-            if not delete_drink_wish_output_dto.status:
-                return delete_drink_wish_output_dto
+                if not delete_drink_wish_output_dto.status:
+                    unit_of_work.rollback()
+                    return delete_drink_wish_output_dto
+                self._bump_drink_versions()
             return DeleteWishOutputDto()
         except ResourceNotFoundError as e:
             return FailedOutputDto.build_resource_not_found_error(message=str(e))
         except Exception as e:
             return FailedOutputDto.build_system_error(message=str(e))
+
+    def _bump_drink_versions(self) -> None:
+        # 위시 수가 바뀌면 술 목록(위시 순 정렬 포함)의 ETag 가 바뀐다.
+        if self._resource_versions is not None:
+            self._resource_versions.bump(ResourceVersions.DRINKS)
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 
-from shared_kernel.domain.value_objects import UserId, DrinkId
+from shared_kernel.domain.value_objects import VALUE_OBJECT_JSON_ENCODERS, UserId, DrinkId
 from wishes.domain.value_objects import WishId
 
 
@@ -9,3 +9,6 @@ class Wish(BaseModel):
     user_id: UserId
     drink_id: DrinkId
     created_at: float
+
+    class Config:
+        json_encoders = VALUE_OBJECT_JSON_ENCODERS
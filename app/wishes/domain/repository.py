@@ -1,8 +1,10 @@
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional
+from typing import Dict, Optional, Tuple
 
 from pydantic import BaseModel
 
+from shared_kernel.domain.exceptions import InvalidParamInputError
+from shared_kernel.domain.pagination import Cursor, Page, PageSize
 from wishes.domain.entities import Wish
 from wishes.domain.value_objects import WishId
 
@@ -11,6 +13,35 @@ class QueryParam(BaseModel):
     wish_id: Optional[str] = None
     user_id: Optional[str] = None
     drink_id: Optional[str] = None
+    limit: int = PageSize.DEFAULT
+    cursor: Optional[str] = None
+
+    def filters(self) -> Dict[str, str]:
+        return {
+            attr: value
+            for attr, value in (("id", self.wish_id), ("user_id", self.user_id), ("drink_id", self.drink_id))
+            if value
+        }
+
+    @staticmethod
+    def sort_key(wish: Wish) -> Tuple[float, str]:
+        return wish.created_at, str(wish.id)
+
+    def encode_cursor(self, wish: Wish) -> str:
+        return self.encode_sort_key(self.sort_key(wish))
+
+    @staticmethod
+    def encode_sort_key(sort_key: Tuple[float, str]) -> str:
+        return Cursor(values=list(sort_key)).encode()
+
+    def decode_cursor(self) -> Optional[Tuple[float, str]]:
+        if self.cursor is None:
+            return None
+        created_at, wish_id = Cursor.decode(self.cursor, num_of_values=2).values
+        try:
+            return float(created_at), str(WishId.from_str(wish_id))
+        except (AttributeError, TypeError, ValueError):
+            raise InvalidParamInputError(f"cursor: {self.cursor}는 올바르지 않은 cursor 입니다.")
 
 
 class WishRepository(metaclass=ABCMeta):
@@ -19,7 +50,7 @@ class WishRepository(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def find_all(self, query_param: QueryParam) -> List[Wish]:
+    def find_all(self, query_param: QueryParam) -> Page[Wish]:
         pass
 
     @abstractmethod
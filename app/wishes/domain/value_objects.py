@@ -1,10 +1,10 @@
 import uuid
 
-from pydantic import BaseModel
+from shared_kernel.domain.value_objects import UuidValueObject
 
 
-class WishId(BaseModel):
-    value: uuid.UUID
+class WishId(UuidValueObject):
+    __slots__ = ()
 
     @classmethod
     def build(cls, user_id: str, drink_id: str) -> "WishId":
@@ -13,10 +13,3 @@ class WishId(BaseModel):
     @classmethod
     def from_str(cls, wish_id: str) -> "WishId":
         return cls(value=uuid.UUID(wish_id))
-
-    @property
-    def uuid(self) -> uuid.UUID:
-        return self.value
-
-    def __str__(self):
-        return str(self.value)
@@ -1,22 +1,19 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
-from wishes.application.dto import CreateWishOutputDto, FindWishesOutputDto
+from wishes.application.dto import CreateWishOutputDto
 
 
 class GetWishesJsonResponse(BaseModel):
-    id: str
-    user_id: str
-    drink_id: str
-    created_at: float
-
-    @classmethod
-    def build_by_output_dto(cls, output_dto: FindWishesOutputDto) -> List["GetWishesJsonResponse"]:
-        return [
-            GetWishesJsonResponse(id=item.id, user_id=item.user_id, drink_id=item.user_id, created_at=item.created_at)
-            for item in output_dto.items
-        ]
+    class Item(BaseModel):
+        id: str
+        user_id: str
+        drink_id: str
+        created_at: float
+
+    items: List[Item]
+    next_cursor: Optional[str] = None
 
 
 class CreateWishJsonResponse(BaseModel):
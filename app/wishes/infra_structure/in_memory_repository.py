@@ -1,35 +1,54 @@
-from typing import List, Optional
-
+from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceNotFoundError
+from shared_kernel.domain.pagination import Page, PageSize
 from wishes.domain.entities import Wish
 from wishes.domain.repository import QueryParam, WishRepository
+from wishes.domain.value_objects import WishId
 
 
 class InMemoryWishRepository(WishRepository):
-    def __init__(self) -> None:
+    def __init__(self, allow_unfiltered_scan: bool = False) -> None:
         self._wishes = []
+        self._allow_unfiltered_scan = allow_unfiltered_scan
 
-    def find(self, query_param: QueryParam) -> Optional[Wish]:
-        for wish in self._wishes:
-            for name, value in query_param:
-                if value is None:
-                    continue
-                if wish.__fields__[name] != value:
-                    break
-            return wish
-
-    def find_all(self, query_param: QueryParam) -> List[Wish]:
-        result = []
+    def find(self, query_param: QueryParam) -> Wish:
         for wish in self._wishes:
-            for name, value in query_param:
-                if value is None:
-                    continue
-                if wish.__fields__[name] != value:
-                    break
-            result.append(wish)
-        return result
+            if self._matches(wish, query_param):
+                return wish
+        raise ResourceNotFoundError(f"해당하는 위시를 찾지 못했습니다.")
+
+    def find_all(self, query_param: QueryParam) -> Page[Wish]:
+        if not query_param.filters() and not self._allow_unfiltered_scan:
+            raise InvalidParamInputError(
+                f"drink_id: {query_param.drink_id} or user_id:{query_param.user_id}에 해당하는 값이 없습니다."
+            )
+        PageSize.check(query_param.limit)
+        cursor = query_param.decode_cursor()
+
+        wishes = [
+            wish
+            for wish in self._wishes
+            if self._matches(wish, query_param) and (cursor is None or query_param.sort_key(wish) < cursor)
+        ]
+        wishes = sorted(wishes, key=query_param.sort_key, reverse=True)
+
+        items = wishes[: query_param.limit]
+        next_cursor = query_param.encode_cursor(items[-1]) if len(wishes) > query_param.limit else None
+        return Page[Wish](items=items, next_cursor=next_cursor)
 
     def add(self, wish: Wish) -> None:
         self._wishes.append(wish)
 
-    def delete_by_wish_id(self, wish: Wish) -> None:
-        self._wishes.remove(wish)
+    def delete_by_wish_id(self, wish_id: WishId) -> Wish:
+        for wish in self._wishes:
+            if wish.id == wish_id:
+                self._wishes.remove(wish)
+                return wish
+        raise ResourceNotFoundError(f"{str(wish_id)}의 위시를 찾지 못했습니다.")
+
+    @staticmethod
+    def _matches(wish: Wish, query_param: QueryParam) -> bool:
+        return (
+            (not query_param.wish_id or str(wish.id) == query_param.wish_id)
+            and (not query_param.user_id or str(wish.user_id) == query_param.user_id)
+            and (not query_param.drink_id or str(wish.drink_id) == query_param.drink_id)
+        )
@@ -1,6 +1,6 @@
 import time
 
-from sqlalchemy import Column, String, Float
+from sqlalchemy import Column, String, Float, Index
 from sqlalchemy.dialects.postgresql import UUID
 
 from shared_kernel.domain.value_objects import UserId, DrinkId
@@ -36,3 +36,9 @@ class WishOrm(Base):
             drink_id=DrinkId(value=self.drink_id),
             created_at=self.created_at,
         )
+
+
+# 인덱스는 migrations/v0002_query_indexes.py, v0005_wish_keyset_indexes.py 에서 생성된다.
+Index("ix_wish_user_id_drink_id", WishOrm.user_id, WishOrm.drink_id)
+Index("ix_wish_user_id_created_at_id", WishOrm.user_id, WishOrm.created_at.desc(), WishOrm.id.desc())
+Index("ix_wish_drink_id_created_at_id", WishOrm.drink_id, WishOrm.created_at.desc(), WishOrm.id.desc())
@@ -0,0 +1,41 @@
+from contextlib import AbstractContextManager
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from shared_kernel.domain.pagination import RowPage
+from wishes.application.query_service import WishQueryService
+from wishes.domain.repository import QueryParam
+from wishes.infra_structure.orm_models import WishOrm
+from wishes.infra_structure.orm_repository import build_page_query
+
+_COLUMNS = (WishOrm.id, WishOrm.user_id, WishOrm.drink_id, WishOrm.created_at)
+
+
+class OrmWishQueryService(WishQueryService):
+    """
+    응답에 필요한 컬럼만 tuple 로 읽어 바로 행을 만든다. WishOrm, Wish, DTO 를 만들지 않는다.
+    """
+
+    def __init__(
+        self,
+        read_session_factory: Callable[..., AbstractContextManager[Session]],
+        allow_unfiltered_scan: bool = False,
+    ) -> None:
+        self._read_session_factory = read_session_factory
+        self._allow_unfiltered_scan = allow_unfiltered_scan
+
+    def find_rows(self, query_param: QueryParam) -> RowPage:
+        with self._read_session_factory() as session:
+            query = build_page_query(session, query_param, *_COLUMNS, allow_unfiltered_scan=self._allow_unfiltered_scan)
+            rows = query.all()
+
+        items = [
+            {"id": str(wish_id), "user_id": user_id, "drink_id": str(drink_id), "created_at": created_at}
+            for wish_id, user_id, drink_id, created_at in rows[: query_param.limit]
+        ]
+
+        next_cursor = None
+        if len(rows) > query_param.limit:
+            next_cursor = query_param.encode_sort_key((items[-1]["created_at"], items[-1]["id"]))
+        return RowPage(items=items, next_cursor=next_cursor)
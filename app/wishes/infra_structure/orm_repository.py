@@ -1,9 +1,13 @@
+import uuid
 from contextlib import AbstractContextManager
-from typing import Callable, List
+from typing import Callable, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session
 
-from shared_kernel.domain.exceptions import ResourceAlreadyExistError, ResourceNotFoundError
+from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceAlreadyExistError, ResourceNotFoundError
+from shared_kernel.domain.pagination import Page, PageSize
 from wishes.domain.entities import Wish
 from wishes.domain.repository import WishRepository, QueryParam
 from wishes.domain.value_objects import WishId
@@ -14,40 +18,72 @@ ref: https://stackoverflow.com/questions/41305129/sqlalchemy-dynamic-filtering
 """
 
 
+def build_page_query(
+    session: Session, query_param: QueryParam, *entities, allow_unfiltered_scan: bool = False
+) -> Query:
+    """
+    query_param 의 한 페이지를 읽는 쿼리. 다음 페이지가 있는지 알 수 있도록 limit + 1 개까지 읽는다.
+    entities 로 WishOrm 대신 컬럼들을 넘기면 그 컬럼들만 tuple 로 읽는다.
+    """
+    filters = query_param.filters()
+    if not filters and not allow_unfiltered_scan:
+        raise InvalidParamInputError(
+            f"drink_id: {query_param.drink_id} or user_id:{query_param.user_id}에 해당하는 값이 없습니다."
+        )
+    PageSize.check(query_param.limit)
+    cursor = query_param.decode_cursor()
+
+    # (created_at, id) 내림차순으로 순서를 고정하고, cursor 이후의 구간만 인덱스에서 읽는다.
+    query = session.query(*entities).filter_by(**filters)
+    if cursor is not None:
+        query = query.filter(tuple_(WishOrm.created_at, WishOrm.id) < tuple_(cursor[0], uuid.UUID(cursor[1])))
+    return query.order_by(desc(WishOrm.created_at), desc(WishOrm.id)).limit(query_param.limit + 1)
+
+
 class OrmWishRepository(WishRepository):
-    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]) -> None:
+    def __init__(
+        self,
+        session_factory: Callable[..., AbstractContextManager[Session]],
+        read_session_factory: Optional[Callable[..., AbstractContextManager[Session]]] = None,
+        allow_unfiltered_scan: bool = False,
+    ) -> None:
         self._session_factory = session_factory
+        self._read_session_factory = read_session_factory or session_factory
+        self._allow_unfiltered_scan = allow_unfiltered_scan
 
     def find(self, query_param: QueryParam) -> Wish:
-        query_param = {attr: value for attr, value in query_param if value}
-        with self._session_factory() as session:
+        with self._read_session_factory() as session:
             query = session.query(WishOrm)
-            wish_orm = query.filter_by(**query_param).first()
+            wish_orm = query.filter_by(**query_param.filters()).first()
             if wish_orm is None:
                 raise ResourceNotFoundError(f"해당하는 위시를 찾지 못했습니다.")
             return wish_orm.to_wish()
 
-    def find_all(self, query_param: QueryParam) -> List[Wish]:
-        query_param = {attr: value for attr, value in query_param if value}
-        with self._session_factory() as session:
-            query = session.query(WishOrm)
-            wish_orms = query.filter_by(**query_param).all()
-            return [wish_orm.to_wish() for wish_orm in wish_orms]
+    def find_all(self, query_param: QueryParam) -> Page[Wish]:
+        with self._read_session_factory() as session:
+            query = build_page_query(session, query_param, WishOrm, allow_unfiltered_scan=self._allow_unfiltered_scan)
+            wish_orms = query.all()
+            wishes = [wish_orm.to_wish() for wish_orm in wish_orms[: query_param.limit]]
+
+        next_cursor = None
+        if len(wish_orms) > query_param.limit:
+            next_cursor = query_param.encode_cursor(wishes[-1])
+        return Page[Wish](items=wishes, next_cursor=next_cursor)
 
     def add(self, wish: Wish) -> None:
         with self._session_factory() as session:
-            wish_orm = session.query(WishOrm).filter(WishOrm.id == wish.id.uuid).first()
-            if wish_orm is not None:
+            # 존재 여부를 먼저 SELECT 하지 않고, primary key 충돌로 중복을 판단한다.
+            session.add(WishOrm.from_wish(wish))
+            try:
+                session.flush()
+            except IntegrityError:
                 raise ResourceAlreadyExistError(f"{str(wish.id)}는 이미 존재하는 위시입니다.")
-            wish_orm = WishOrm.from_wish(wish)
-            session.add(wish_orm)
-            session.commit()
 
     def delete_by_wish_id(self, wish_id: WishId) -> Wish:
         with self._session_factory() as session:
-            wish_orm = session.query(WishOrm).filter(WishOrm.id == wish_id.uuid).first()
+            wish_orm = session.query(WishOrm).get(wish_id.uuid)
             if wish_orm is None:
                 raise ResourceNotFoundError(f"{str(wish_id)}의 위시를 찾지 못했습니다.")
             session.delete(wish_orm)
-            session.commit()
+            session.flush()
             return wish_orm.to_wish()
@@ -0,0 +1,113 @@
+"""
+술 목록(GET /drinks)을 메모리에서 만드는 두 엔진, DrinkLeaderboard(sortedcontainers)와 ColumnarDrinkCatalog(numpy)를
+같은 술들로 채워, 전체를 다시 읽기(replace_all), 페이지 만들기(row_page), 평점 / 위시 반영(upsert)에 드는 시간을 비교한다.
+ColumnarDrinkCatalog 는 numpy 가 있어야 한다.
+
+$ PYTHONPATH=app python benchmarks/drink_catalog.py
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from drinks.domain.entities import Drink
+from drinks.domain.repository import QueryParam
+from drinks.domain.value_objects import DrinkType, FilterType, OrderType
+from drinks.infra_structure.columnar_catalog import ColumnarDrinkCatalog
+from drinks.infra_structure.leaderboard import DrinkLeaderboard
+from shared_kernel.domain.value_objects import DrinkId
+
+_DRINK_TYPES = [drink_type for drink_type in DrinkType if drink_type != DrinkType.ALL]
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def _drinks(num_of_drinks: int, rand: random.Random) -> List[Drink]:
+    drinks = []
+    for i in range(num_of_drinks):
+        num_of_reviews = rand.randint(0, 200)
+        drinks.append(
+            Drink(
+                id=DrinkId.build(drink_name=f"drink{i}", created_at=1234),
+                name=f"drink{i}",
+                image_url=f"https://example.com/drinks/{i}.png",
+                type=rand.choice(_DRINK_TYPES),
+                rating_sum=rand.randint(num_of_reviews, num_of_reviews * 5),
+                num_of_reviews=num_of_reviews,
+                num_of_wish=rand.randint(0, 50),
+            )
+        )
+    return drinks
+
+
+def _latencies(calls: List[Callable[[], None]]) -> Dict:
+    latencies = []
+    for call in calls:
+        started_at = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started_at)
+    return {
+        "p50_us": round(statistics.median(latencies) * 1_000_000, 1),
+        "p99_us": round(_percentile(latencies, 99) * 1_000_000, 1),
+    }
+
+
+def bench(engine, drinks: List[Drink], repeat: int, rand: random.Random) -> Dict[str, Dict]:
+    results = {"replace_all": _latencies([lambda: engine.replace_all(drinks)] * 5)}
+
+    query_params = [
+        QueryParam(
+            type=rand.choice(list(DrinkType)), filter=rand.choice(list(FilterType)), order=rand.choice(list(OrderType))
+        )
+        for _ in range(repeat)
+    ]
+    results["first_page"] = _latencies(
+        [lambda query_param=query_param: engine.row_page(query_param) for query_param in query_params]
+    )
+
+    # 몇 페이지 넘긴 cursor 로 읽는다.
+    cursors = []
+    for query_param in query_params:
+        for _ in range(5):
+            next_cursor = engine.row_page(query_param).next_cursor
+            if next_cursor is None:
+                break
+            query_param = query_param.copy(update={"cursor": next_cursor})
+        cursors.append(query_param)
+    results["cursor_page"] = _latencies(
+        [lambda query_param=query_param: engine.row_page(query_param) for query_param in cursors]
+    )
+
+    changes = []
+    for _ in range(repeat):
+        drink = rand.choice(drinks)
+        if rand.random() < 0.5:
+            changes.append(drink.copy(update={"num_of_wish": drink.num_of_wish + 1}))
+        else:
+            rating = rand.randint(1, 5)
+            changes.append(
+                drink.copy(update={"rating_sum": drink.rating_sum + rating, "num_of_reviews": drink.num_of_reviews + 1})
+            )
+    results["upsert"] = _latencies([lambda drink=drink: engine.upsert(drink) for drink in changes])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--drinks", type=int, default=10000, help="술 수")
+    parser.add_argument("--repeat", type=int, default=2000, help="페이지 읽기 / 반영을 잴 횟수")
+    args = parser.parse_args()
+
+    drinks = _drinks(args.drinks, random.Random(1234))
+    for name, engine in [("leaderboard", DrinkLeaderboard()), ("columnar", ColumnarDrinkCatalog())]:
+        for operation, result in bench(engine, drinks, args.repeat, random.Random(5678)).items():
+            print(name, operation, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+GET /drinks, GET /reviews 한 페이지를 stdlib json(starlette JSONResponse)과 orjson(ORJSONResponse)으로 각각 써서
+응답 시간의 p50/p99 를 비교한다.
+- render: 응답 모양의 행으로 응답 객체를 만들고 JSON 으로 쓰는 데 드는 시간만 잰다.
+- endpoint: create_app() 의 라우터를 TestClient 로 불러 요청 하나에 드는 시간을 잰다.
+  서비스는 정해진 페이지를 돌려주도록 바꾸므로 DB 는 읽지 않지만, 앱 설정(환경 변수)은 필요하다.
+
+$ PYTHONPATH=app python benchmarks/json_responses.py
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, List
+from unittest import mock
+
+from starlette.responses import JSONResponse
+from starlette.testclient import TestClient
+
+from drinks.application.service import DrinkApplicationService
+from reviews.application.service import ReviewApplicationService
+from shared_kernel.application.dtos import RowsOutputDto
+from shared_kernel.domain.pagination import RowPage
+from shared_kernel.external_interface import json_dtos
+from shared_kernel.external_interface.json_dtos import RowsJsonResponse
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def _drink_rows(num_of_rows: int) -> List[Dict]:
+    return [
+        {
+            "drink_id": str(uuid.uuid4()),
+            "name": f"참이슬 {i}",
+            "image_url": f"https://example.com/drinks/{i}.png",
+            "type": ["soju", "beer", "wine"][i % 3],
+            "avg_rating": i % 50 / 10,
+            "num_of_reviews": i % 100,
+            "num_of_wish": i % 7,
+        }
+        for i in range(num_of_rows)
+    ]
+
+
+def _review_rows(num_of_rows: int) -> List[Dict]:
+    now = time.time()
+    drink_id = str(uuid.uuid4())
+    return [
+        {
+            "review_id": str(uuid.uuid4()),
+            "user_id": f"user{i}",
+            "drink_id": drink_id,
+            "rating": i % 5 + 1,
+            "comment": "맛있어요, 다음에도 또 마실게요",
+            "created_at": now - i,
+            "updated_at": now - i,
+        }
+        for i in range(num_of_rows)
+    ]
+
+
+def _latencies(call: Callable[[], None], repeat: int) -> Dict:
+    call()
+    latencies = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started_at)
+    return {
+        "p50_us": round(statistics.median(latencies) * 1_000_000, 1),
+        "p99_us": round(_percentile(latencies, 99) * 1_000_000, 1),
+    }
+
+
+def _compare(call: Callable[[], None], repeat: int) -> Dict[str, Dict]:
+    # 예전처럼 RowsJsonResponse 가 starlette JSONResponse(stdlib json)로 쓰게 하고 한 번, 그대로 한 번 잰다.
+    with mock.patch.object(json_dtos, "ORJSONResponse", JSONResponse):
+        stdlib = _latencies(call, repeat)
+    return {"json": stdlib, "orjson": _latencies(call, repeat)}
+
+
+def bench_render(output_dtos: Dict[str, RowsOutputDto], repeat: int) -> Dict[str, Dict]:
+    results = {}
+    for name, output_dto in output_dtos.items():
+
+        def render(output_dto=output_dto) -> None:
+            RowsJsonResponse.build_by_output_dto(output_dto)
+
+        for encoder, result in _compare(render, repeat).items():
+            results[f"{name} {encoder}"] = result
+    return results
+
+
+def bench_endpoints(output_dtos: Dict[str, RowsOutputDto], repeat: int) -> Dict[str, Dict]:
+    from main import create_app
+
+    app = create_app()
+    client = TestClient(app)
+    drink_application_service = mock.Mock(spec=DrinkApplicationService)
+    drink_application_service.find_drink_rows.return_value = output_dtos["drinks"]
+    review_application_service = mock.Mock(spec=ReviewApplicationService)
+    review_application_service.find_review_rows.return_value = output_dtos["reviews"]
+
+    results = {}
+    with app.container.drink_application_service.override(
+        drink_application_service
+    ), app.container.review_application_service.override(review_application_service):
+        for name, url in [("drinks", "/drinks?limit=100"), ("reviews", "/reviews?limit=100")]:
+
+            def request(url=url) -> None:
+                assert client.get(url).status_code == 200
+
+            for encoder, result in _compare(request, repeat).items():
+                results[f"{name} {encoder}"] = result
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100, help="한 페이지의 행 수 (최대 100)")
+    parser.add_argument("--repeat", type=int, default=2000, help="경로마다 잴 횟수")
+    parser.add_argument("--skip-endpoints", action="store_true", help="앱을 띄우지 않고 render 만 잰다")
+    args = parser.parse_args()
+
+    output_dtos = {
+        "drinks": RowsOutputDto.build(RowPage(items=_drink_rows(args.rows), next_cursor="cursor")),
+        "reviews": RowsOutputDto.build(RowPage(items=_review_rows(args.rows), next_cursor="cursor")),
+    }
+    for path, result in bench_render(output_dtos, args.repeat).items():
+        print("render", path, result)
+    if not args.skip_endpoints:
+        for path, result in bench_endpoints(output_dtos, args.repeat).items():
+            print("endpoint", path, result)
+
+
+if __name__ == "__main__":
+    main()
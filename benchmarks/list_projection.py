@@ -0,0 +1,145 @@
+"""
+GET /reviews, GET /drinks 의 한 페이지를 예전 경로(entity -> DTO -> JSON 응답 모델 -> response_model 검증)와
+query service 경로(응답 모양의 행 -> JSONResponse)로 각각 만들어, 페이지 하나와 행 하나에 드는 시간을 비교한다.
+리뷰는 --db-url 의 DB 에 임시 리뷰를 넣어 읽고 끝나면 지운다. 술은 메모리의 술 랭킹(leaderboard)에서 읽는다.
+
+$ PYTHONPATH=app python benchmarks/list_projection.py --db-url postgresql://...
+"""
+
+import argparse
+import os
+import timeit
+import uuid
+from typing import Callable, Dict
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from drinks.application.dtos import FindDrinksInputDto
+from drinks.application.service import DrinkApplicationService
+from drinks.domain.entities import Drink
+from drinks.domain.repository import QueryParam as DrinkQueryParam
+from drinks.domain.value_objects import DrinkType
+from drinks.external_interface.json_dtos import GetDrinksJsonResponse
+from drinks.infra_structure.in_memory_repository import InMemoryDrinkRepository
+from drinks.infra_structure.leaderboard import DrinkLeaderboard
+from drinks.infra_structure.leaderboard_repository import LeaderboardDrinkRepository
+from reviews.application.dtos import FindReviewsInputDto
+from reviews.application.service import ReviewApplicationService
+from reviews.domain.entities import Review
+from reviews.domain.repository import QueryParam as ReviewQueryParam
+from reviews.domain.value_objects import ReviewRating
+from reviews.external_interface.json_dtos import GetReviewsJsonResponse
+from reviews.infra_structure.orm_models import ReviewOrm
+from reviews.infra_structure.orm_query_service import OrmReviewQueryService
+from reviews.infra_structure.orm_repository import OrmReviewRepository
+from shared_kernel.domain.value_objects import DrinkId, ReviewId, UserId
+from shared_kernel.external_interface.json_dtos import RowsJsonResponse
+from shared_kernel.infra_structure.database import Database
+
+
+def _legacy_response(json_response_type, output_dto) -> JSONResponse:
+    # 라우터가 응답 모델을 돌려주면 FastAPI 가 response_model 로 다시 검증하고 jsonable_encoder 로 바꾼 뒤 JSON 으로 쓴다.
+    response = json_response_type.build_by_output_dto(output_dto)
+    return JSONResponse(content=jsonable_encoder(json_response_type(**response.dict())))
+
+
+def run(build_page: Callable[[], JSONResponse], num_of_rows: int, repeat: int) -> Dict:
+    build_page()
+    best = min(timeit.repeat(build_page, number=1, repeat=repeat))
+    return {"page_ms": round(best * 1000, 3), "per_row_us": round(best / num_of_rows * 1_000_000, 2)}
+
+
+def bench_reviews(db_url: str, num_of_rows: int, repeat: int) -> Dict[str, Dict]:
+    database = Database(db_url=db_url)
+    database.migrate()
+    drink_id = str(uuid.uuid4())
+    with database.session() as session:
+        session.add_all(
+            [
+                ReviewOrm.from_review(
+                    Review(
+                        id=ReviewId.build(user_id=f"user{i}", drink_id=drink_id),
+                        drink_id=DrinkId.from_str(drink_id),
+                        user_id=UserId(value=f"user{i}"),
+                        rating=ReviewRating(value=i % 5 + 1),
+                        comment="tastes good",
+                        created_at=i,
+                        updated_at=i,
+                    )
+                )
+                for i in range(num_of_rows + 1)
+            ]
+        )
+
+    try:
+        review_repository = OrmReviewRepository(session_factory=database.session)
+        review_application_service = ReviewApplicationService(
+            review_repository=review_repository,
+            review_query_service=OrmReviewQueryService(read_session_factory=database.session),
+        )
+        input_dto = FindReviewsInputDto(query_param=ReviewQueryParam(drink_id=drink_id, limit=num_of_rows).to_enum())
+
+        def legacy() -> JSONResponse:
+            return _legacy_response(GetReviewsJsonResponse, review_application_service.find_reviews(input_dto))
+
+        def projection() -> JSONResponse:
+            return RowsJsonResponse.build_by_output_dto(review_application_service.find_review_rows(input_dto))
+
+        return {"legacy": run(legacy, num_of_rows, repeat), "projection": run(projection, num_of_rows, repeat)}
+    finally:
+        with database.session() as session:
+            session.query(ReviewOrm).filter(ReviewOrm.drink_id == drink_id).delete()
+
+
+def bench_drinks(num_of_rows: int, repeat: int) -> Dict[str, Dict]:
+    in_memory_drink_repository = InMemoryDrinkRepository()
+    for i in range(num_of_rows * 10):
+        in_memory_drink_repository.add(
+            Drink(
+                id=DrinkId.build(drink_name=f"drink{i}", created_at=1234),
+                name=f"drink{i}",
+                image_url=f"https://example.com/drink{i}.png",
+                type=[DrinkType.SOJU, DrinkType.BEER, DrinkType.WINE][i % 3],
+                rating_sum=i % 5 * (i % 100),
+                num_of_reviews=i % 100,
+                num_of_wish=i % 7,
+            )
+        )
+    leaderboard_drink_repository = LeaderboardDrinkRepository(
+        drink_repository=in_memory_drink_repository, leaderboard=DrinkLeaderboard(), refresh_interval_seconds=3600
+    )
+    drink_application_service = DrinkApplicationService(
+        drink_repository=leaderboard_drink_repository, drink_query_service=leaderboard_drink_repository
+    )
+    input_dto = FindDrinksInputDto(query_param=DrinkQueryParam(limit=num_of_rows).to_enum())
+
+    def legacy() -> JSONResponse:
+        return _legacy_response(GetDrinksJsonResponse, drink_application_service.find_drinks(input_dto))
+
+    def projection() -> JSONResponse:
+        return RowsJsonResponse.build_by_output_dto(drink_application_service.find_drink_rows(input_dto))
+
+    return {"legacy": run(legacy, num_of_rows, repeat), "projection": run(projection, num_of_rows, repeat)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--db-url", default=os.environ.get("DB_URL"), help="리뷰를 넣고 읽을 DB (기본: 환경 변수 DB_URL)"
+    )
+    parser.add_argument("--rows", type=int, default=100, help="한 페이지의 행 수 (최대 100)")
+    parser.add_argument("--repeat", type=int, default=200, help="반복 횟수(가장 빠른 값을 쓴다)")
+    args = parser.parse_args()
+
+    if args.db_url:
+        for path, result in bench_reviews(args.db_url, args.rows, args.repeat).items():
+            print("reviews", path, result)
+    else:
+        print("reviews: --db-url 이 없어 건너뜁니다.")
+    for path, result in bench_drinks(args.rows, args.repeat).items():
+        print("drinks", path, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+bcrypt 를 요청 스레드에서 바로 계산할 때(inline)와 프로세스 풀에서 계산할 때(process_pool)를 비교한다.
+
+- 비밀번호 처리량 / 지연: executor 스레드 수만큼 동시에 hash 를 요청한다.
+- 다른 라우트의 지연: 그동안 다른 스레드에서 가벼운 CPU 작업(응답 직렬화 정도)을 반복하며 걸린 시간을 잰다.
+
+$ PYTHONPATH=app python benchmarks/password_hasher.py
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from users.infra_structure.password_hasher import BcryptPasswordHasher, ProcessPoolPasswordHasher
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def _light_route() -> None:
+    json.dumps([{"drink_id": str(i), "avg_rating": i / 3, "num_of_reviews": i} for i in range(50)])
+
+
+def run(password_hasher, num_of_threads: int, num_of_hashes: int) -> Dict:
+    password_hasher.hash("warm up")
+
+    stop = threading.Event()
+    light_route_latencies = []
+
+    def measure_light_route() -> None:
+        while not stop.is_set():
+            start = time.perf_counter()
+            _light_route()
+            light_route_latencies.append(time.perf_counter() - start)
+            time.sleep(0.001)
+
+    def hash_once(_) -> float:
+        start = time.perf_counter()
+        password_hasher.hash("password")
+        return time.perf_counter() - start
+
+    light_route_thread = threading.Thread(target=measure_light_route)
+    light_route_thread.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_of_threads) as executor:
+        hash_latencies = list(executor.map(hash_once, range(num_of_hashes)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    light_route_thread.join()
+
+    return {
+        "hashes_per_sec": round(num_of_hashes / elapsed, 2),
+        "hash_p50_ms": round(statistics.median(hash_latencies) * 1000, 1),
+        "hash_p99_ms": round(_percentile(hash_latencies, 99) * 1000, 1),
+        "light_route_p50_ms": round(statistics.median(light_route_latencies) * 1000, 3),
+        "light_route_p99_ms": round(_percentile(light_route_latencies, 99) * 1000, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=8, help="동시에 비밀번호를 처리하는 요청 스레드 수")
+    parser.add_argument("--hashes", type=int, default=32, help="전체 hash 횟수")
+    parser.add_argument("--workers", type=int, default=2, help="process_pool 의 프로세스 수")
+    args = parser.parse_args()
+
+    print("inline", run(BcryptPasswordHasher(), args.threads, args.hashes))
+    process_pool_password_hasher = ProcessPoolPasswordHasher(max_workers=args.workers, max_pending=args.hashes)
+    try:
+        print("process_pool", run(process_pool_password_hasher, args.threads, args.hashes))
+    finally:
+        process_pool_password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+전용 executor 의 스레드 수와 access token 확인 방식(executor / 캐시에 있으면 바로)에 따른 지연을 비교한다.
+
+- 동시 요청 --clients 개가 인증이 필요한 라우트를 반복해서 부른다. 요청마다 access token 을 확인한 뒤 use case 하나를 실행한다.
+- --db-ratio 만큼은 DB 를 쓰는 use case 로, DB 풀(--db-pool 개)의 커넥션을 잡고 --db-ms 동안 쿼리를 기다린다.
+- 나머지는 캐시에서 끝나는 use case 로, 응답 직렬화 정도의 가벼운 CPU 작업만 한다.
+
+$ PYTHONPATH=app python benchmarks/service_executor.py
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import threading
+import time
+from typing import Dict, List
+
+from jose import jwt
+
+from auth.application.async_service import AsyncAuthApplicationService
+from auth.application.dtos import GetTokenDataInputDto
+from auth.application.service import AuthApplicationService
+from auth.infra_structure.token_cache import VerifiedTokenCache
+from shared_kernel.application.async_service import AsyncApplicationService, build_service_executor
+
+JWT_SECRET_KEY = "benchmark"
+JWT_ALGORITHM = "HS256"
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+class SimulatedApplicationService:
+    def __init__(self, db_pool_size: int, db_seconds: float) -> None:
+        self._db_pool = threading.BoundedSemaphore(db_pool_size)
+        self._db_seconds = db_seconds
+
+    def find_from_db(self) -> None:
+        with self._db_pool:
+            time.sleep(self._db_seconds)
+
+    def find_from_cache(self) -> None:
+        json.dumps([{"drink_id": str(i), "avg_rating": i / 3, "num_of_reviews": i} for i in range(50)])
+
+
+async def _run(args: argparse.Namespace, workers: int, inline_auth: bool) -> Dict:
+    executor = build_service_executor(max_workers=workers)
+    auth_application_service = AuthApplicationService(
+        user_application_service=None,
+        jwt_secret_key=JWT_SECRET_KEY,
+        jwt_algorithm=JWT_ALGORITHM,
+        token_cache=VerifiedTokenCache(),
+    )
+    async_auth_application_service = (AsyncAuthApplicationService if inline_auth else AsyncApplicationService)(
+        auth_application_service, executor=executor
+    )
+    async_application_service = AsyncApplicationService(
+        SimulatedApplicationService(args.db_pool, args.db_ms / 1000), executor=executor
+    )
+    input_dtos = [
+        GetTokenDataInputDto(access_token=jwt.encode({"user_id": f"user-{i}"}, JWT_SECRET_KEY, JWT_ALGORITHM))
+        for i in range(args.clients)
+    ]
+    latencies = {"db": [], "cache": []}
+    deadline = time.perf_counter() + args.seconds
+
+    async def client(input_dto: GetTokenDataInputDto) -> None:
+        rng = random.Random(input_dto.access_token)
+        while time.perf_counter() < deadline:
+            route = "db" if rng.random() < args.db_ratio else "cache"
+            start = time.perf_counter()
+            await async_auth_application_service.get_token_data(input_dto)
+            if route == "db":
+                await async_application_service.find_from_db()
+            else:
+                await async_application_service.find_from_cache()
+            latencies[route].append(time.perf_counter() - start)
+
+    await asyncio.gather(*(client(input_dto) for input_dto in input_dtos))
+    executor.shutdown()
+
+    result = {"requests_per_sec": round(sum(map(len, latencies.values())) / args.seconds, 1)}
+    for route, values in latencies.items():
+        result[f"{route}_p50_ms"] = round(statistics.median(values) * 1000, 2)
+        result[f"{route}_p99_ms"] = round(_percentile(values, 99) * 1000, 2)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=64, help="동시 요청 수")
+    parser.add_argument("--seconds", type=float, default=5, help="설정마다 부하를 줄 시간(초)")
+    parser.add_argument("--db-ratio", type=float, default=0.5, help="DB 를 쓰는 요청의 비율")
+    parser.add_argument("--db-pool", type=int, default=15, help="DB 풀이 한 번에 내줄 수 있는 커넥션 수")
+    parser.add_argument("--db-ms", type=float, default=5, help="DB 를 쓰는 use case 의 쿼리 시간(ms)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[15, 40], help="비교할 executor 스레드 수")
+    args = parser.parse_args()
+
+    for workers in args.workers:
+        for inline_auth in (False, True):
+            result = asyncio.run(_run(args, workers, inline_auth))
+            print(f"workers={workers} auth={'inline_if_cached' if inline_auth else 'executor'}", result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+find_all 이 읽은 행마다 하는 일(id 를 감싸 entity 를 만들고, DTO 로 바꾸며 id 를 문자열로 바꾸기)을
+예전의 pydantic 모델 id 와 지금의 __slots__ id 로 각각 반복해, 행 하나에 드는 시간을 비교한다. DB 는 거치지 않는다.
+
+$ PYTHONPATH=app python benchmarks/value_objects.py
+"""
+
+import argparse
+import time
+import timeit
+import uuid
+from typing import Callable, Dict, List, Tuple
+
+from pydantic import BaseModel, Field
+
+from reviews.application.dtos import FindReviewsOutputDto
+from reviews.domain.entities import Review
+from reviews.domain.value_objects import ReviewRating
+from shared_kernel.domain.value_objects import DrinkId, ReviewId, UserId
+
+
+class LegacyUserId(BaseModel):
+    value: str = Field(min_length=1, max_length=30)
+
+    def __str__(self):
+        return self.value
+
+
+class LegacyDrinkId(BaseModel):
+    value: uuid.UUID
+
+    def __str__(self):
+        return str(self.value)
+
+
+class LegacyReviewId(BaseModel):
+    value: uuid.UUID
+
+    def __str__(self):
+        return str(self.value)
+
+
+class LegacyReview(BaseModel):
+    id: LegacyReviewId
+    drink_id: LegacyDrinkId
+    user_id: LegacyUserId
+    rating: ReviewRating
+    comment: str = ""
+    created_at: float
+    updated_at: float
+
+
+Row = Tuple[uuid.UUID, uuid.UUID, str, int, str, float, float]
+
+
+def _rows(num_of_rows: int) -> List[Row]:
+    now = time.time()
+    return [
+        (uuid.uuid4(), uuid.uuid4(), f"user{i % 100}", i % 5 + 1, "맛있어요", now - i, now - i)
+        for i in range(num_of_rows)
+    ]
+
+
+def _find_all(review_type, review_id_type, drink_id_type, user_id_type) -> Callable[[List[Row]], None]:
+    def find_all(rows: List[Row]) -> None:
+        # orm_repository.find_all: 행 -> entity
+        reviews = [
+            review_type(
+                id=review_id_type(value=review_id),
+                drink_id=drink_id_type(value=drink_id),
+                user_id=user_id_type(value=user_id),
+                rating=ReviewRating(value=rating),
+                comment=comment,
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+            for review_id, drink_id, user_id, rating, comment, created_at, updated_at in rows
+        ]
+        # application service: entity -> DTO, 마지막 행은 cursor 로도 쓴다.
+        FindReviewsOutputDto(
+            items=[
+                FindReviewsOutputDto.Item(
+                    review_id=str(review.id),
+                    drink_id=str(review.drink_id),
+                    user_id=str(review.user_id),
+                    rating=int(review.rating),
+                    comment=review.comment,
+                    created_at=review.created_at,
+                    updated_at=review.updated_at,
+                )
+                for review in reviews
+            ],
+            next_cursor=str(reviews[-1].id),
+        )
+
+    return find_all
+
+
+def run(find_all: Callable[[List[Row]], None], rows: List[Row], repeat: int) -> Dict:
+    find_all(rows)
+    best = min(timeit.repeat(lambda: find_all(rows), number=1, repeat=repeat))
+    return {"page_ms": round(best * 1000, 3), "per_row_us": round(best / len(rows) * 1_000_000, 2)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100, help="한 페이지의 행 수")
+    parser.add_argument("--repeat", type=int, default=200, help="반복 횟수(가장 빠른 값을 쓴다)")
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    legacy = run(_find_all(LegacyReview, LegacyReviewId, LegacyDrinkId, LegacyUserId), rows, args.repeat)
+    current = run(_find_all(Review, ReviewId, DrinkId, UserId), rows, args.repeat)
+    print("pydantic ids", legacy)
+    print("slots ids", current)
+    print("saved per row (us)", round(legacy["per_row_us"] - current["per_row_us"], 2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from auth.application.async_service import AsyncAuthApplicationService
+from auth.application.dtos import GetTokenDataInputDto, GetTokenDataOutputDto
+from auth.application.service import AuthApplicationService
+
+
+def test_get_token_data_runs_inline_if_cached():
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="application-service")
+    auth_application_service = mock.Mock(spec=AuthApplicationService)
+    auth_application_service.find_cached_token_data.return_value = None
+    auth_application_service.get_token_data.side_effect = lambda input_dto: GetTokenDataOutputDto(
+        user_id=threading.current_thread().name
+    )
+    async_auth_application_service = AsyncAuthApplicationService(auth_application_service, executor=executor)
+    input_dto = GetTokenDataInputDto(access_token="access token")
+
+    # 캐시에 없으면 executor 에서 검증한다.
+    actual = asyncio.run(async_auth_application_service.get_token_data(input_dto))
+    assert actual.user_id.startswith("application-service")
+
+    # 캐시에 있으면 executor 를 거치지 않는다.
+    auth_application_service.find_cached_token_data.return_value = GetTokenDataOutputDto(user_id="heumsi")
+    actual = asyncio.run(async_auth_application_service.get_token_data(input_dto))
+    assert actual == GetTokenDataOutputDto(user_id="heumsi")
+    assert auth_application_service.get_token_data.call_count == 1
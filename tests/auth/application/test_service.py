@@ -1,3 +1,4 @@
+import time
 from unittest import mock
 
 import pytest
@@ -10,6 +11,7 @@ from auth.application.dtos import (
     GetTokenDataOutputDto,
 )
 from auth.application.service import AuthApplicationService
+from auth.infra_structure.token_cache import VerifiedTokenCache
 from shared_kernel.application.dtos import FailedOutputDto
 from users.application.dtos import LoginOutputDto
 from users.application.service import UserApplicationService
@@ -105,3 +107,88 @@ def test_get_token_data_success(jwt_secret_key, jwt_algorithm):
     actual = auth_application_service.get_token_data(input_dto)
     expected = GetTokenDataOutputDto(user_id="heumsi")
     assert actual == expected
+
+
+def test_get_token_data_cached(jwt_secret_key, jwt_algorithm):
+    token_cache = VerifiedTokenCache()
+    auth_application_service = AuthApplicationService(
+        user_application_service=mock.Mock(spec=UserApplicationService),
+        jwt_secret_key=jwt_secret_key,
+        jwt_algorithm=jwt_algorithm,
+        token_cache=token_cache,
+    )
+    input_dto = GetTokenDataInputDto(access_token=jwt.encode({"user_id": "heumsi"}, jwt_secret_key, jwt_algorithm))
+
+    with mock.patch("auth.application.service.jwt.decode", wraps=jwt.decode) as decode:
+        assert auth_application_service.get_token_data(input_dto) == GetTokenDataOutputDto(user_id="heumsi")
+        assert auth_application_service.get_token_data(input_dto) == GetTokenDataOutputDto(user_id="heumsi")
+    assert decode.call_count == 1
+    assert token_cache.stats()["hits"] == 1
+
+    # 서명이 틀린 토큰은 캐시되지 않는다.
+    input_dto = GetTokenDataInputDto(access_token=jwt.encode({"user_id": "heumsi"}, "other key", jwt_algorithm))
+    for _ in range(2):
+        actual = auth_application_service.get_token_data(input_dto)
+        assert actual == FailedOutputDto.build_unauthorized_error(message="올바른 access-token이 아닙니다.")
+    assert token_cache.stats()["size"] == 1
+
+
+def test_get_token_data_expired(jwt_secret_key, jwt_algorithm):
+    auth_application_service = AuthApplicationService(
+        user_application_service=mock.Mock(spec=UserApplicationService),
+        jwt_secret_key=jwt_secret_key,
+        jwt_algorithm=jwt_algorithm,
+        token_cache=VerifiedTokenCache(),
+    )
+    access_token = jwt.encode({"user_id": "heumsi", "exp": time.time() - 1}, jwt_secret_key, jwt_algorithm)
+
+    actual = auth_application_service.get_token_data(GetTokenDataInputDto(access_token=access_token))
+    expected = FailedOutputDto.build_unauthorized_error(message="올바른 access-token이 아닙니다.")
+    assert actual == expected
+
+
+def test_get_token_data_revoked(jwt_secret_key, jwt_algorithm):
+    revoked_token_digests = set()
+    auth_application_service = AuthApplicationService(
+        user_application_service=mock.Mock(spec=UserApplicationService),
+        jwt_secret_key=jwt_secret_key,
+        jwt_algorithm=jwt_algorithm,
+        token_cache=VerifiedTokenCache(),
+        is_token_revoked=lambda token_digest, token_payload: token_digest in revoked_token_digests,
+    )
+    access_token = jwt.encode({"user_id": "heumsi"}, jwt_secret_key, jwt_algorithm)
+    input_dto = GetTokenDataInputDto(access_token=access_token)
+    assert auth_application_service.get_token_data(input_dto) == GetTokenDataOutputDto(user_id="heumsi")
+
+    revoked_token_digests.add(VerifiedTokenCache.digest(access_token))
+    actual = auth_application_service.get_token_data(input_dto)
+    expected = FailedOutputDto.build_unauthorized_error(message="올바른 access-token이 아닙니다.")
+    assert actual == expected
+
+
+def test_find_cached_token_data(jwt_secret_key, jwt_algorithm):
+    auth_application_service = AuthApplicationService(
+        user_application_service=mock.Mock(spec=UserApplicationService),
+        jwt_secret_key=jwt_secret_key,
+        jwt_algorithm=jwt_algorithm,
+        token_cache=VerifiedTokenCache(),
+    )
+    input_dto = GetTokenDataInputDto(access_token=jwt.encode({"user_id": "heumsi"}, jwt_secret_key, jwt_algorithm))
+    assert auth_application_service.find_cached_token_data(input_dto) is None
+
+    auth_application_service.get_token_data(input_dto)
+    assert auth_application_service.find_cached_token_data(input_dto) == GetTokenDataOutputDto(user_id="heumsi")
+
+
+def test_find_cached_token_data_with_revocation_check(jwt_secret_key, jwt_algorithm):
+    auth_application_service = AuthApplicationService(
+        user_application_service=mock.Mock(spec=UserApplicationService),
+        jwt_secret_key=jwt_secret_key,
+        jwt_algorithm=jwt_algorithm,
+        token_cache=VerifiedTokenCache(),
+        is_token_revoked=lambda token_digest, token_payload: False,
+    )
+    input_dto = GetTokenDataInputDto(access_token=jwt.encode({"user_id": "heumsi"}, jwt_secret_key, jwt_algorithm))
+    auth_application_service.get_token_data(input_dto)
+    # 폐기 여부는 I/O 를 할 수 있으므로 캐시에 있어도 get_token_data 로 확인하게 한다.
+    assert auth_application_service.find_cached_token_data(input_dto) is None
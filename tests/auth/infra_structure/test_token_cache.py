@@ -0,0 +1,42 @@
+from auth.domain.value_objects import TokenPayload
+from auth.infra_structure.token_cache import VerifiedTokenCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_expires_at_ttl_or_exp():
+    clock, wall_clock = FakeClock(), FakeClock(now=1000)
+    token_cache = VerifiedTokenCache(ttl_seconds=60, clock=clock, wall_clock=wall_clock)
+    token_payload = TokenPayload(user_id="heumsi")
+
+    token_cache.put("no exp", token_payload)
+    token_cache.put("exp before ttl", token_payload, expires_at=1010)
+    token_cache.put("already expired", token_payload, expires_at=1000)
+    assert token_cache.get("no exp") == token_payload
+    assert token_cache.get("exp before ttl") == token_payload
+    assert token_cache.get("already expired") is None
+
+    clock.now = 10
+    assert token_cache.get("exp before ttl") is None
+    assert token_cache.get("no exp") == token_payload
+
+    clock.now = 60
+    assert token_cache.get("no exp") is None
+
+
+def test_revoke():
+    token_cache = VerifiedTokenCache()
+    token_digest = VerifiedTokenCache.digest("access token")
+    assert token_digest != "access token"
+    assert len(token_digest) == 64
+
+    token_cache.put(token_digest, TokenPayload(user_id="heumsi"))
+    token_cache.revoke(token_digest)
+    assert token_cache.get(token_digest) is None
+    assert token_cache.stats()["misses"] == 1
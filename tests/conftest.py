@@ -11,7 +11,7 @@ from shared_kernel.infra_structure.database import Database
 @pytest.fixture(scope="session")
 def database():
     database = Database(db_url=os.environ["TEST_DB_URL"])
-    database.create_database()
+    database.migrate()
     return database
 
 
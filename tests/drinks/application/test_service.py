@@ -1,3 +1,4 @@
+import time
 from unittest import mock
 
 import pytest
@@ -21,14 +22,18 @@ from drinks.application.dtos import (
     AddDrinkWishOutputDto,
     DeleteDrinkWishOutputDto,
     DeleteDrinkWishInputDto,
+    FindDrinksInputDto,
 )
+from drinks.application.query_service import DrinkQueryService
 from drinks.application.service import DrinkApplicationService
 from drinks.domain.entities import Drink
-from drinks.domain.repository import DrinkRepository
-from drinks.domain.value_objects import DrinkRating, DrinkType
-from shared_kernel.application.dtos import FailedOutputDto
-from shared_kernel.domain.exceptions import ResourceNotFoundError, ResourceAlreadyExistError
+from drinks.domain.repository import DrinkRepository, QueryParam
+from drinks.domain.value_objects import DrinkType
+from shared_kernel.application.dtos import FailedOutputDto, RowsOutputDto
+from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceNotFoundError, ResourceAlreadyExistError
+from shared_kernel.domain.pagination import Page, RowPage
 from shared_kernel.domain.value_objects import DrinkId
+from shared_kernel.infra_structure.read_coalescer import ReadCoalescer
 
 
 @pytest.fixture(scope="function")
@@ -67,7 +72,7 @@ def test_find_drink_success(
         drink_name=drink_name,
         drink_image_url=drink_image_url,
         drink_type=drink_type.value,
-        avg_rating=float(DrinkRating()),
+        avg_rating=0.0,
         num_of_reviews=0,
         num_of_wish=0,
     )
@@ -152,7 +157,7 @@ def test_update_drink_success(
         drink_name="Tequila",
         drink_image_url="tequila image url",
         drink_type=DrinkType.LIQUOR.value,
-        avg_rating=float(DrinkRating(value=3.65)),
+        rating_sum=37,
         num_of_reviews=10,
         num_of_wish=20,
     )
@@ -178,7 +183,7 @@ def test_update_drink_fail(
         drink_name="Tequila",
         drink_image_url="tequila image url",
         drink_type=DrinkType.LIQUOR.value,
-        avg_rating=float(DrinkRating(value=3.65)),
+        rating_sum=37,
         num_of_reviews=10,
         num_of_wish=20,
     )
@@ -232,10 +237,9 @@ def test_add_drink_review_success(
     drink_image_url,
     drink_type,
 ):
-    drink_repository_mock.find_by_drink_id.return_value = Drink(
+    drink_repository_mock.add_rating.return_value = Drink(
         id=drink_id, name=drink_name, image_url=drink_image_url, type=drink_type
     )
-    drink_repository_mock.update.return_value = None
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
     input_dto = AddDrinkReviewInputDto(drink_id=str(drink_id), drink_rating=5)
@@ -243,6 +247,8 @@ def test_add_drink_review_success(
     actual = drink_application_service.add_drink_review(input_dto)
     expected = AddDrinkReviewOutputDto()
     assert actual == expected
+    drink_repository_mock.add_rating.assert_called_once_with(drink_id, rating=5)
+    drink_repository_mock.update.assert_not_called()
 
 
 @pytest.mark.parametrize("drink_id, drink_name, drink_image_url, drink_type", drink_data)
@@ -253,26 +259,15 @@ def test_add_drink_review_fail(
     drink_image_url,
     drink_type,
 ):
-    drink_repository_mock.find_by_drink_id.side_effect = ResourceNotFoundError()
-    drink_repository_mock.update.return_value = None
+    drink_repository_mock.add_rating.side_effect = ResourceNotFoundError(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
     input_dto = AddDrinkReviewInputDto(drink_id=str(drink_id), drink_rating=5)
 
     actual = drink_application_service.add_drink_review(input_dto)
-    expected = FailedOutputDto(type="Resource Not Found Error", message="")
-    assert actual == expected
-
-    drink_repository_mock.find_by_drink_id.return_value = Drink(
-        id=drink_id, name=drink_name, image_url=drink_image_url, type=drink_type
+    expected = FailedOutputDto(
+        type="Resource Not Found Error", message="a9a94653-eede-5172-bd44-55653d0dc908의 술을 찾을 수 없습니다."
     )
-    drink_repository_mock.update.return_value = ResourceNotFoundError()
-    drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
-
-    input_dto = AddDrinkReviewInputDto(drink_id=str(drink_id), drink_rating=5)
-
-    actual = drink_application_service.add_drink_review(input_dto)
-    expected = FailedOutputDto(type="Resource Not Found Error", message="")
     assert actual == expected
 
 
@@ -284,10 +279,9 @@ def test_update_drink_review_success(
     drink_image_url,
     drink_type,
 ):
-    drink_repository_mock.find_by_drink_id.return_value = Drink(
+    drink_repository_mock.update_rating.return_value = Drink(
         id=drink_id, name=drink_name, image_url=drink_image_url, type=drink_type
     )
-    drink_repository_mock.update.return_value = None
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
     input_dto = UpdateDrinkReviewInputDto(drink_id=str(drink_id), old_drink_rating=5, new_drink_rating=4)
@@ -295,6 +289,8 @@ def test_update_drink_review_success(
     actual = drink_application_service.update_drink_review(input_dto)
     expected = UpdateDrinkReviewOutputDto()
     assert actual == expected
+    drink_repository_mock.update_rating.assert_called_once_with(drink_id, old_rating=5, new_rating=4)
+    drink_repository_mock.update.assert_not_called()
 
 
 @pytest.mark.parametrize("drink_id, drink_name, drink_image_url, drink_type", drink_data)
@@ -305,8 +301,7 @@ def test_update_drink_review_fail(
     drink_image_url,
     drink_type,
 ):
-    drink_repository_mock.find_by_drink_id.return_value = None
-    drink_repository_mock.update.return_value = None
+    drink_repository_mock.update_rating.side_effect = ResourceNotFoundError(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
     input_dto = UpdateDrinkReviewInputDto(drink_id=str(drink_id), old_drink_rating=5, new_drink_rating=4)
@@ -326,10 +321,9 @@ def test_delete_drink_review_success(
     drink_image_url,
     drink_type,
 ):
-    drink_repository_mock.find_by_drink_id.return_value = Drink(
+    drink_repository_mock.delete_rating.return_value = Drink(
         id=drink_id, name=drink_name, image_url=drink_image_url, type=drink_type
     )
-    drink_repository_mock.update.return_value = None
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
     input_dto = DeleteDrinkReviewInputDto(drink_id=str(drink_id), drink_rating=5)
@@ -337,6 +331,8 @@ def test_delete_drink_review_success(
     actual = drink_application_service.delete_drink_review(input_dto)
     expected = DeleteDrinkReviewOutputDto()
     assert actual == expected
+    drink_repository_mock.delete_rating.assert_called_once_with(drink_id, rating=5)
+    drink_repository_mock.update.assert_not_called()
 
 
 @pytest.mark.parametrize("drink_id, drink_name, drink_image_url, drink_type", drink_data)
@@ -347,24 +343,15 @@ def test_delete_drink_review_fail(
     drink_image_url,
     drink_type,
 ):
-    drink_repository_mock.find_by_drink_id.side_effect = ResourceNotFoundError()
-    drink_repository_mock.update.return_value = None
+    drink_repository_mock.delete_rating.side_effect = ResourceNotFoundError(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
     input_dto = DeleteDrinkReviewInputDto(drink_id=str(drink_id), drink_rating=5)
 
     actual = drink_application_service.delete_drink_review(input_dto)
-    expected = FailedOutputDto(type="Resource Not Found Error", message="")
-    assert actual == expected
-
-    drink_repository_mock.find_by_drink_id.return_value = None
-    drink_repository_mock.update.side_effect = ResourceNotFoundError()
-    drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
-
-    input_dto = DeleteDrinkReviewInputDto(drink_id=str(drink_id), drink_rating=5)
-
-    actual = drink_application_service.delete_drink_review(input_dto)
-    expected = FailedOutputDto(type="Resource Not Found Error", message="")
+    expected = FailedOutputDto(
+        type="Resource Not Found Error", message="a9a94653-eede-5172-bd44-55653d0dc908의 술을 찾을 수 없습니다."
+    )
     assert actual == expected
 
 
@@ -376,16 +363,18 @@ def test_add_drink_wish_success(
     drink_image_url,
     drink_type,
 ):
-    drink_repository_mock.find_by_drink_id.return_value = Drink(
+    drink_repository_mock.add_wish.return_value = Drink(
         id=drink_id, name=drink_name, image_url=drink_image_url, type=drink_type
     )
-    drink_repository_mock.update.return_value = None
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
     input_dto = AddDrinkWishInputDto(drink_id=str(drink_id))
+
     actual = drink_application_service.add_drink_wish(input_dto)
     expected = AddDrinkWishOutputDto()
     assert actual == expected
+    drink_repository_mock.add_wish.assert_called_once_with(drink_id)
+    drink_repository_mock.update.assert_not_called()
 
 
 @pytest.mark.parametrize("drink_id, drink_name, drink_image_url, drink_type", drink_data)
@@ -396,22 +385,15 @@ def test_add_drink_wish_fail(
     drink_image_url,
     drink_type,
 ):
-    drink_repository_mock.find_by_drink_id.side_effect = ResourceNotFoundError()
-    drink_repository_mock.update.return_value = None
+    drink_repository_mock.add_wish.side_effect = ResourceNotFoundError(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
     input_dto = AddDrinkWishInputDto(drink_id=str(drink_id))
-    actual = drink_application_service.add_drink_wish(input_dto)
-    expected = FailedOutputDto(type="Resource Not Found Error", message="")
-    assert actual == expected
-
-    drink_repository_mock.find_by_drink_id.return_value = None
-    drink_repository_mock.update.side_effect = ResourceNotFoundError()
-    drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
-    input_dto = AddDrinkWishInputDto(drink_id=str(drink_id))
     actual = drink_application_service.add_drink_wish(input_dto)
-    expected = FailedOutputDto(type="Resource Not Found Error", message="")
+    expected = FailedOutputDto(
+        type="Resource Not Found Error", message="a9a94653-eede-5172-bd44-55653d0dc908의 술을 찾을 수 없습니다."
+    )
     assert actual == expected
 
 
@@ -423,16 +405,18 @@ def test_delete_drink_wish_success(
     drink_image_url,
     drink_type,
 ):
-    drink_repository_mock.find_by_drink_id.return_value = Drink(
+    drink_repository_mock.delete_wish.return_value = Drink(
         id=drink_id, name=drink_name, image_url=drink_image_url, type=drink_type
     )
-    drink_repository_mock.update.return_value = None
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
     input_dto = DeleteDrinkWishInputDto(drink_id=str(drink_id))
+
     actual = drink_application_service.delete_drink_wish(input_dto)
     expected = DeleteDrinkWishOutputDto()
     assert actual == expected
+    drink_repository_mock.delete_wish.assert_called_once_with(drink_id)
+    drink_repository_mock.update.assert_not_called()
 
 
 @pytest.mark.parametrize("drink_id, drink_name, drink_image_url, drink_type", drink_data)
@@ -443,20 +427,108 @@ def test_delete_drink_wish_fail(
     drink_image_url,
     drink_type,
 ):
-    drink_repository_mock.find_by_drink_id.side_effect = ResourceNotFoundError()
-    drink_repository_mock.update.return_value = None
+    drink_repository_mock.delete_wish.side_effect = ResourceNotFoundError(f"{str(drink_id)}의 술을 찾을 수 없습니다.")
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
     input_dto = DeleteDrinkWishInputDto(drink_id=str(drink_id))
+
     actual = drink_application_service.delete_drink_wish(input_dto)
-    expected = FailedOutputDto(type="Resource Not Found Error", message="")
+    expected = FailedOutputDto(
+        type="Resource Not Found Error", message="a9a94653-eede-5172-bd44-55653d0dc908의 술을 찾을 수 없습니다."
+    )
     assert actual == expected
 
-    drink_repository_mock.find_by_drink_id.return_value = None
-    drink_repository_mock.update.side_effect = ResourceNotFoundError()
+
+def test_find_drink_rows_coalesces_until_write(drink_repository_mock):
+    drink_repository_mock.find_all.return_value = Page[Drink](items=[])
+    drink_application_service = DrinkApplicationService(
+        drink_repository=drink_repository_mock,
+        read_coalescer=ReadCoalescer(ttl_seconds=10, after_commit=lambda _: False),
+    )
+    input_dto = FindDrinksInputDto(query_param=QueryParam(type="beer", filter="rating").to_enum())
+
+    for _ in range(3):
+        assert drink_application_service.find_drink_rows(input_dto).status is True
+    assert drink_repository_mock.find_all.call_count == 1
+
+    # 리뷰로 평점이 바뀌면 담아 둔 목록을 버린다.
+    drink_application_service.add_drink_review(
+        AddDrinkReviewInputDto(drink_id=str(DrinkId.build(drink_name="Cass", created_at=1234)), drink_rating=4)
+    )
+    drink_application_service.find_drink_rows(input_dto)
+    assert drink_repository_mock.find_all.call_count == 2
+
+
+def test_find_drink_rows(drink_repository_mock):
+    drink_query_service_mock = mock.Mock(spec=DrinkQueryService)
+    drink_query_service_mock.find_rows.side_effect = [
+        RowPage(items=[{"drink_id": "drink_id_uuid"}], next_cursor="cursor"),
+        InvalidParamInputError("invalid cursor"),
+    ]
+    drink_application_service = DrinkApplicationService(
+        drink_repository=drink_repository_mock,
+        read_coalescer=ReadCoalescer(ttl_seconds=10, after_commit=lambda _: False),
+        drink_query_service=drink_query_service_mock,
+    )
+    input_dto = FindDrinksInputDto(query_param=QueryParam().to_enum())
+
+    for _ in range(2):
+        actual = drink_application_service.find_drink_rows(input_dto)
+        assert actual == RowsOutputDto(items=[{"drink_id": "drink_id_uuid"}], next_cursor="cursor")
+    assert drink_query_service_mock.find_rows.call_count == 1
+    drink_repository_mock.find_all.assert_not_called()
+
+    actual = drink_application_service.find_drink_rows(FindDrinksInputDto(query_param=QueryParam(cursor="invalid")))
+    assert actual == FailedOutputDto(type="Parameters Error", message="invalid cursor")
+
+
+@pytest.mark.parametrize("drink_id, drink_name, drink_image_url, drink_type", drink_data)
+def test_warm_up(drink_repository_mock, drink_id, drink_name, drink_image_url, drink_type):
+    drink = Drink(id=drink_id, name=drink_name, image_url=drink_image_url, type=drink_type)
+    drink_repository_mock.find_all.side_effect = [
+        Page[Drink](items=[drink], next_cursor="next"),
+        Page[Drink](items=[drink]),
+        Page[Drink](items=[]),
+        Page[Drink](items=[drink], next_cursor="next"),
+        Page[Drink](items=[]),
+    ]
     drink_application_service = DrinkApplicationService(drink_repository=drink_repository_mock)
 
-    input_dto = DeleteDrinkWishInputDto(drink_id=str(drink_id))
-    actual = drink_application_service.delete_drink_wish(input_dto)
-    expected = FailedOutputDto(type="Resource Not Found Error", message="")
-    assert actual == expected
+    actual = drink_application_service.warm_up(num_of_pages=2)
+
+    assert actual == [str(drink_id), str(drink_id)]
+    query_params = [call.args[0] for call in drink_repository_mock.find_all.call_args_list]
+    assert [(query_param.filter.value, query_param.cursor) for query_param in query_params] == [
+        ("review", None),
+        ("review", "next"),
+        ("rating", None),
+        ("wish", None),
+        ("wish", "next"),
+    ]
+    assert drink_repository_mock.find_by_drink_id.call_args_list == [mock.call(drink_id)] * 3
+
+
+@pytest.mark.parametrize("drink_id, drink_name, drink_image_url, drink_type", drink_data)
+def test_find_drink_serves_stale_on_error(drink_repository_mock, drink_id, drink_name, drink_image_url, drink_type):
+    drink = Drink(id=drink_id, name=drink_name, image_url=drink_image_url, type=drink_type)
+    drink_repository_mock.find_by_drink_id.side_effect = [drink, ConnectionError("db down")]
+    drink_repository_mock.find_all.side_effect = [Page[Drink](items=[drink]), ConnectionError("db down")]
+    drink_application_service = DrinkApplicationService(
+        drink_repository=drink_repository_mock,
+        read_coalescer=ReadCoalescer(ttl_seconds=0.01, stale_if_error_seconds=60, after_commit=lambda _: False),
+    )
+    find_drink_input_dto = FindDrinkInputDto(drink_id=str(drink_id))
+    find_drinks_input_dto = FindDrinksInputDto(query_param=QueryParam().to_enum())
+    assert drink_application_service.find_drink(find_drink_input_dto).stale_seconds is None
+    assert drink_application_service.find_drink_rows(find_drinks_input_dto).stale_seconds is None
+
+    time.sleep(0.02)
+    actual = drink_application_service.find_drink(find_drink_input_dto)
+    assert actual.status is True
+    assert actual.drink_name == drink_name
+    assert actual.stale_seconds >= 0.01
+
+    actual = drink_application_service.find_drink_rows(find_drinks_input_dto)
+    assert actual.status is True
+    assert [item["drink_id"] for item in actual.items] == [str(drink_id)]
+    assert actual.stale_seconds >= 0.01
@@ -1,7 +1,7 @@
 import pytest
 
 from drinks.domain.entities import Drink
-from drinks.domain.value_objects import DrinkType, DrinkRating
+from drinks.domain.value_objects import DrinkType
 from shared_kernel.domain.value_objects import DrinkId
 
 
@@ -12,7 +12,7 @@ def drink_no_review():
         name="soju1",
         image_url="soju_image1",
         type=DrinkType.from_str("soju"),
-        avg_rating=DrinkRating(),
+        rating_sum=0,
         num_of_reviews=0,
         num_of_wish=0,
     )
@@ -25,7 +25,7 @@ def drink_one_review():
         name="soju2",
         image_url="soju_image2",
         type=DrinkType.from_str("soju"),
-        avg_rating=DrinkRating(value=5),
+        rating_sum=5,
         num_of_reviews=1,
         num_of_wish=1,
     )
@@ -38,7 +38,7 @@ def drink_two_reviews():
         name="soju3",
         image_url="soju_image3",
         type=DrinkType.from_str("soju"),
-        avg_rating=DrinkRating(value=4.5),
+        rating_sum=9,
         num_of_reviews=2,
         num_of_wish=2,
     )
@@ -46,38 +46,65 @@ def drink_two_reviews():
 
 def test_drink_add_rating(drink_no_review, drink_one_review, drink_two_reviews):
     drink_no_review.add_rating(input_rating=5)
-    assert drink_no_review.avg_rating == DrinkRating(value=5)
+    assert drink_no_review.avg_rating == 5
     assert drink_no_review.num_of_reviews == 1
 
 
 def test_drink_update_rating(drink_no_review, drink_one_review, drink_two_reviews):
     drink_no_review.update_rating(old_rating=5, new_rating=4)
-    assert drink_no_review.avg_rating == DrinkRating(value=0)
+    assert drink_no_review.avg_rating == 0
     assert drink_no_review.num_of_reviews == 0
 
     drink_one_review.update_rating(old_rating=5, new_rating=4)
-    assert drink_one_review.avg_rating == DrinkRating(value=4)
+    assert drink_one_review.avg_rating == 4
     assert drink_one_review.num_of_reviews == 1
 
     drink_two_reviews.update_rating(old_rating=4, new_rating=5)
-    assert drink_two_reviews.avg_rating == DrinkRating(value=5)
+    assert drink_two_reviews.avg_rating == 5
+    assert drink_two_reviews.rating_sum == 10
     assert drink_two_reviews.num_of_reviews == 2
 
 
 def test_drink_delete_rating(drink_no_review, drink_one_review, drink_two_reviews):
     drink_no_review.delete_rating(input_rating=5)
-    assert drink_no_review.avg_rating == DrinkRating(value=0)
+    assert drink_no_review.avg_rating == 0
     assert drink_no_review.num_of_reviews == 0
 
     drink_one_review.delete_rating(input_rating=5)
-    assert drink_one_review.avg_rating == DrinkRating(value=0)
+    assert drink_one_review.avg_rating == 0
     assert drink_one_review.num_of_reviews == 0
 
     drink_two_reviews.delete_rating(input_rating=5)
-    assert drink_two_reviews.avg_rating == DrinkRating(value=4)
+    assert drink_two_reviews.avg_rating == 4
     assert drink_two_reviews.num_of_reviews == 1
 
 
+def test_drink_rating_does_not_drift(drink_no_review):
+    ratings = [i % 5 + 1 for i in range(1000)]
+    for rating in ratings:
+        drink_no_review.add_rating(input_rating=rating)
+    for old_rating, new_rating in zip(ratings, reversed(ratings)):
+        drink_no_review.update_rating(old_rating=old_rating, new_rating=new_rating)
+    for rating in ratings[:-3]:
+        drink_no_review.delete_rating(input_rating=rating)
+
+    assert drink_no_review.num_of_reviews == 3
+    assert drink_no_review.rating_sum == sum(ratings[-3:])
+    assert drink_no_review.avg_rating == sum(ratings[-3:]) / 3
+
+
+def test_drink_rating_sum_over_max():
+    with pytest.raises(ValueError):
+        Drink(
+            id=DrinkId.build(drink_name="soju4", created_at=1234),
+            name="soju4",
+            image_url="soju_image4",
+            type=DrinkType.SOJU,
+            rating_sum=11,
+            num_of_reviews=2,
+        )
+
+
 def test_drink_add_wish(drink_no_review, drink_one_review, drink_two_reviews):
     drink_no_review.add_wish()
     assert drink_no_review.num_of_wish == 1
@@ -1,10 +1,15 @@
 import uuid
 from unittest import mock
 
-from drinks.application.dtos import FindDrinksOutputDto, CreateDrinkOutputDto
+from drinks.application.dtos import CreateDrinkOutputDto
+from drinks.application.query_service import drink_row
 from drinks.application.service import DrinkApplicationService
-from shared_kernel.application.dtos import FailedOutputDto
+from drinks.domain.entities import Drink
+from drinks.domain.value_objects import DrinkType
+from shared_kernel.application.dtos import FailedOutputDto, RowsOutputDto
+from shared_kernel.domain.pagination import RowPage
 from shared_kernel.domain.value_objects import DrinkId
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
 
 
 def test_post_drinks(client, app):
@@ -44,32 +49,8 @@ def test_post_drinks(client, app):
 
 def test_get_drinks(client, app):
     application_service_mock = mock.Mock(spec=DrinkApplicationService)
-    application_service_mock.find_drinks.return_value = FindDrinksOutputDto(
+    application_service_mock.find_drink_rows.return_value = RowsOutputDto(
         items=[
-            FindDrinksOutputDto.Item(
-                drink_id="drink_id_uuid",
-                drink_name="drink_name",
-                drink_image_url="drink_image_url",
-                drink_type="drink_type",
-                avg_rating=4.5,
-                num_of_reviews=2,
-                num_of_wish=2,
-            ),
-            FindDrinksOutputDto.Item(
-                drink_id="drink_id_uuid2",
-                drink_name="drink_name2",
-                drink_image_url="drink_image_url2",
-                drink_type="drink_type2",
-                avg_rating=3.5,
-                num_of_reviews=4,
-                num_of_wish=4,
-            ),
-        ]
-    )
-    with app.container.drink_application_service.override(application_service_mock):
-        response = client.get("/drinks?type=wine&filter=review&order=descending")
-        assert response.status_code == 200
-        assert response.json() == [
             {
                 "drink_id": "drink_id_uuid",
                 "name": "drink_name",
@@ -88,4 +69,123 @@ def test_get_drinks(client, app):
                 "num_of_reviews": 4,
                 "num_of_wish": 4,
             },
-        ]
+        ],
+        next_cursor="cursor",
+    )
+    with app.container.drink_application_service.override(application_service_mock):
+        response = client.get("/drinks?type=wine&filter=review&order=descending&limit=2")
+        assert response.status_code == 200
+        assert response.json() == {
+            "items": [
+                {
+                    "drink_id": "drink_id_uuid",
+                    "name": "drink_name",
+                    "image_url": "drink_image_url",
+                    "type": "drink_type",
+                    "avg_rating": 4.5,
+                    "num_of_reviews": 2,
+                    "num_of_wish": 2,
+                },
+                {
+                    "drink_id": "drink_id_uuid2",
+                    "name": "drink_name2",
+                    "image_url": "drink_image_url2",
+                    "type": "drink_type2",
+                    "avg_rating": 3.5,
+                    "num_of_reviews": 4,
+                    "num_of_wish": 4,
+                },
+            ],
+            "next_cursor": "cursor",
+        }
+
+
+def test_get_drinks_invalid_page(client, app):
+    application_service_mock = mock.Mock(spec=DrinkApplicationService)
+    application_service_mock.find_drink_rows.return_value = FailedOutputDto.build_parameters_error(message="invalid")
+    with app.container.drink_application_service.override(application_service_mock):
+        response = client.get("/drinks?limit=1000")
+        assert response.status_code == 400
+        assert application_service_mock.find_drink_rows.call_args.kwargs["input_dto"].query_param.limit == 1000
+
+
+def test_get_drinks_not_modified(client, app):
+    application_service_mock = mock.Mock(spec=DrinkApplicationService)
+    application_service_mock.find_drink_rows.return_value = RowsOutputDto(items=[], next_cursor=None)
+    resource_versions = ResourceVersions()
+    with app.container.drink_application_service.override(
+        application_service_mock
+    ), app.container.resource_versions.override(resource_versions):
+        response = client.get("/drinks?limit=2")
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "public, no-cache"
+        etag = response.headers["ETag"]
+
+        # 바뀐 것이 없으면 서비스를 부르지 않고 304 로 응답한다.
+        response = client.get("/drinks?limit=2", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert application_service_mock.find_drink_rows.call_count == 1
+
+        # 다른 쿼리는 다른 표현이다.
+        response = client.get("/drinks?limit=3", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+        resource_versions.bump(ResourceVersions.DRINKS)
+        response = client.get("/drinks?limit=2", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+
+def test_get_drinks_stale(client, app):
+    application_service_mock = mock.Mock(spec=DrinkApplicationService)
+    application_service_mock.find_drink_rows.return_value = RowsOutputDto(items=[], stale_seconds=12.5)
+    with app.container.drink_application_service.override(application_service_mock):
+        response = client.get("/drinks")
+
+    assert response.status_code == 200
+    assert response.headers["X-Stale-Seconds"] == "12.500"
+    assert response.headers["Cache-Control"] == "no-store"
+    assert "ETag" not in response.headers
+
+
+def test_get_drinks_reads_primary_after_bump(client, app):
+    application_service_mock = mock.Mock(spec=DrinkApplicationService)
+    application_service_mock.find_drink_rows.return_value = RowsOutputDto(items=[], next_cursor=None)
+    clock = mock.Mock(return_value=100.0)
+    resource_versions = ResourceVersions(recent_bump_seconds=5, clock=clock)
+    with app.container.drink_application_service.override(
+        application_service_mock
+    ), app.container.resource_versions.override(resource_versions), mock.patch(
+        "drinks.external_interface.routers.pin_request_to_primary"
+    ) as pin_request_to_primary:
+        client.get("/drinks")
+        assert pin_request_to_primary.call_count == 0
+
+        # 버전을 올린 직후에는 replica 가 아직 따라오지 못했을 수 있으므로 primary 에서 읽는다.
+        resource_versions.bump(ResourceVersions.DRINKS)
+        client.get("/drinks")
+        assert pin_request_to_primary.call_count == 1
+
+        clock.return_value = 105.1
+        client.get("/drinks")
+        assert pin_request_to_primary.call_count == 1
+
+
+def test_get_drinks_rows_match_response_model(client, app):
+    # 목록은 query service 의 행을 검증 없이 그대로 쓰므로, 행의 모양이 선언한 response_model 과 같은지 확인한다.
+    drink = Drink(
+        id=DrinkId.build(drink_name="Cass", created_at=1234), name="Cass", image_url="url", type=DrinkType.BEER
+    )
+    application_service_mock = mock.Mock(spec=DrinkApplicationService)
+    application_service_mock.find_drink_rows.return_value = RowsOutputDto.build(
+        RowPage(items=[drink_row(drink)], next_cursor="cursor")
+    )
+    with app.container.drink_application_service.override(application_service_mock):
+        response = client.get("/drinks")
+
+    (route,) = [route for route in app.routes if route.path == "/drinks" and "GET" in route.methods]
+    body = response.json()
+    assert body.keys() == route.response_model.__fields__.keys()
+    assert body["items"][0].keys() == route.response_model.__fields__["items"].type_.__fields__.keys()
+    assert route.response_model.parse_obj(body).dict() == body
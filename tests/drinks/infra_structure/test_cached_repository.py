@@ -0,0 +1,148 @@
+from unittest import mock
+
+import pytest
+
+from drinks.domain.entities import Drink
+from drinks.domain.value_objects import DrinkType
+from drinks.infra_structure.cached_repository import CachedDrinkRepository
+from drinks.infra_structure.in_memory_repository import InMemoryDrinkRepository
+from shared_kernel.domain.value_objects import DrinkId
+from shared_kernel.infra_structure.cache_backend import InProcessCacheBackend
+
+DRINK_ID = DrinkId.from_str("335ca1a4-5175-5e41-8bac-40ffd840834c")
+
+
+class FakeTransaction:
+    def __init__(self) -> None:
+        self.active = False
+        self.callbacks = []
+
+    def __call__(self, callback) -> bool:
+        if not self.active:
+            return False
+        self.callbacks.append(callback)
+        return True
+
+    def end(self) -> None:
+        self.active = False
+        for callback in self.callbacks:
+            callback()
+        self.callbacks = []
+
+
+@pytest.fixture(scope="function")
+def in_memory_drink_repository():
+    repository = InMemoryDrinkRepository()
+    repository.add(Drink(id=DRINK_ID, name="참이슬", image_url="url", type=DrinkType.SOJU))
+    return mock.Mock(wraps=repository)
+
+
+@pytest.fixture(scope="function")
+def transaction():
+    return FakeTransaction()
+
+
+@pytest.fixture(scope="function")
+def cached_drink_repository(in_memory_drink_repository, transaction):
+    return CachedDrinkRepository(
+        drink_repository=in_memory_drink_repository,
+        cache_backend=InProcessCacheBackend(),
+        after_transaction=transaction,
+    )
+
+
+def test_find_by_drink_id_read_through(cached_drink_repository, in_memory_drink_repository):
+    first = cached_drink_repository.find_by_drink_id(DRINK_ID)
+    second = cached_drink_repository.find_by_drink_id(DRINK_ID)
+    assert first == second
+    assert in_memory_drink_repository.find_by_drink_id.call_count == 1
+
+    # 캐시된 엔티티를 호출한 쪽에서 바꿔도 캐시에는 영향이 없다.
+    second.add_wish()
+    assert cached_drink_repository.find_by_drink_id(DRINK_ID).num_of_wish == 0
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda repository: repository.update(
+            Drink(id=DRINK_ID, name="처음처럼", image_url="url", type=DrinkType.SOJU, num_of_wish=1)
+        ),
+        lambda repository: repository.add_rating(DRINK_ID, 4),
+        lambda repository: repository.update_rating(DRINK_ID, old_rating=0, new_rating=4),
+        lambda repository: repository.delete_rating(DRINK_ID, 0),
+        lambda repository: repository.add_wish(DRINK_ID),
+        lambda repository: repository.delete_wish(DRINK_ID),
+        lambda repository: repository.delete_by_drink_id(DRINK_ID),
+    ],
+)
+def test_write_invalidates(cached_drink_repository, in_memory_drink_repository, write):
+    cached_drink_repository.find_by_drink_id(DRINK_ID)
+    write(cached_drink_repository)
+    cached_drink_repository.find_by_drink_id(DRINK_ID)
+    assert in_memory_drink_repository.find_by_drink_id.call_count == 2
+
+
+def test_write_in_transaction_bypasses_cache_until_end(in_memory_drink_repository, transaction):
+    # tombstone 없이, 트랜잭션이 끝나자마자 다시 캐시하는지 본다.
+    cached_drink_repository = CachedDrinkRepository(
+        drink_repository=in_memory_drink_repository,
+        cache_backend=InProcessCacheBackend(),
+        tombstone_ttl_seconds=0,
+        after_transaction=transaction,
+    )
+    transaction.active = True
+    cached_drink_repository.add_wish(DRINK_ID)
+
+    # commit 전의 값은 캐시에 넣지 않는다.
+    assert cached_drink_repository.find_by_drink_id(DRINK_ID).num_of_wish == 1
+    assert cached_drink_repository.find_by_drink_id(DRINK_ID).num_of_wish == 1
+    assert in_memory_drink_repository.find_by_drink_id.call_count == 2
+
+    transaction.end()
+    cached_drink_repository.find_by_drink_id(DRINK_ID)
+    cached_drink_repository.find_by_drink_id(DRINK_ID)
+    assert in_memory_drink_repository.find_by_drink_id.call_count == 3
+
+
+def test_stale_read_is_not_cached(transaction):
+    in_memory_drink_repository = InMemoryDrinkRepository()
+    in_memory_drink_repository.add(Drink(id=DRINK_ID, name="참이슬", image_url="url", type=DrinkType.SOJU))
+    cached_drink_repository = CachedDrinkRepository(
+        drink_repository=in_memory_drink_repository,
+        cache_backend=InProcessCacheBackend(),
+        after_transaction=transaction,
+    )
+
+    def find_then_concurrent_write(drink_id):
+        drink = in_memory_drink_repository.drink_id_to_drink[str(drink_id)].copy()
+        cached_drink_repository.add_wish(drink_id)
+        return drink
+
+    # 조회와 캐시 저장 사이에 다른 요청의 쓰기가 끼어들면, 조회한 값은 캐시에 넣지 않는다.
+    with mock.patch.object(in_memory_drink_repository, "find_by_drink_id", side_effect=find_then_concurrent_write):
+        assert cached_drink_repository.find_by_drink_id(DRINK_ID).num_of_wish == 0
+    assert cached_drink_repository.find_by_drink_id(DRINK_ID).num_of_wish == 1
+
+
+def test_workers_share_cache_backend():
+    in_memory_drink_repository = InMemoryDrinkRepository()
+    in_memory_drink_repository.add(Drink(id=DRINK_ID, name="참이슬", image_url="url", type=DrinkType.SOJU))
+    cache_backend = InProcessCacheBackend()
+    worker_1, worker_2 = (
+        CachedDrinkRepository(
+            drink_repository=in_memory_drink_repository,
+            cache_backend=cache_backend,
+            after_transaction=lambda _: False,
+        )
+        for _ in range(2)
+    )
+
+    worker_1.find_by_drink_id(DRINK_ID)
+    with mock.patch.object(in_memory_drink_repository, "find_by_drink_id") as find_by_drink_id:
+        assert worker_2.find_by_drink_id(DRINK_ID).name == "참이슬"
+        find_by_drink_id.assert_not_called()
+
+    # 한 워커의 쓰기가 캐시에서 지운 값은 다른 워커도 다시 읽는다.
+    worker_1.add_wish(DRINK_ID)
+    assert worker_2.find_by_drink_id(DRINK_ID).num_of_wish == 1
@@ -0,0 +1,142 @@
+import itertools
+import random
+
+import pytest
+
+from drinks.domain.entities import Drink
+from drinks.domain.repository import QueryParam
+from drinks.domain.value_objects import DrinkType, FilterType, OrderType
+from drinks.infra_structure.leaderboard import DrinkLeaderboard
+from shared_kernel.domain.exceptions import InvalidParamInputError
+from shared_kernel.domain.value_objects import DrinkId
+
+pytest.importorskip("numpy")
+
+from drinks.infra_structure.columnar_catalog import ColumnarDrinkCatalog  # noqa: E402
+
+drinks = [
+    Drink(
+        id=DrinkId.build(drink_name=f"drink{i}", created_at=1234),
+        name=f"drink{i}",
+        image_url="",
+        type=[DrinkType.SOJU, DrinkType.BEER, DrinkType.WINE][i % 3],
+        rating_sum=i % 5 * (i % 4),
+        num_of_reviews=i % 4,
+        num_of_wish=i % 2,
+    )
+    for i in range(12)
+]
+
+query_params = [
+    QueryParam(type=drink_type, filter=filter_type, order=order_type, limit=5)
+    for drink_type, filter_type, order_type in itertools.product(
+        [DrinkType.ALL, DrinkType.SOJU, DrinkType.BEER, DrinkType.SAKE], FilterType, OrderType
+    )
+]
+
+
+@pytest.fixture(scope="function")
+def catalog():
+    catalog = ColumnarDrinkCatalog()
+    catalog.replace_all(drinks)
+    return catalog
+
+
+@pytest.fixture(scope="function")
+def leaderboard():
+    leaderboard = DrinkLeaderboard()
+    leaderboard.replace_all(drinks)
+    return leaderboard
+
+
+def _read_all_pages(find_page, query_param):
+    pages = []
+    while True:
+        page = find_page(query_param)
+        pages.append(page)
+        if page.next_cursor is None:
+            return pages
+        query_param = query_param.copy(update={"cursor": page.next_cursor})
+
+
+def _assert_same_as_leaderboard(catalog, leaderboard):
+    for query_param in query_params:
+        assert _read_all_pages(catalog.page, query_param) == _read_all_pages(leaderboard.page, query_param)
+        assert _read_all_pages(catalog.row_page, query_param) == _read_all_pages(leaderboard.row_page, query_param)
+    assert len(catalog) == len(leaderboard)
+
+
+def test_page_same_as_leaderboard(catalog, leaderboard):
+    _assert_same_as_leaderboard(catalog, leaderboard)
+
+
+def test_empty():
+    catalog = ColumnarDrinkCatalog()
+    page = catalog.page(QueryParam(type=DrinkType.ALL, filter=FilterType.RATING, order=OrderType.DESC))
+    assert page.items == []
+    assert page.next_cursor is None
+    assert len(catalog) == 0
+
+
+def test_upsert_and_remove(catalog, leaderboard):
+    query_param = QueryParam(type=DrinkType.SOJU, filter=FilterType.WISH, order=OrderType.DESC, limit=1)
+
+    changed = drinks[0].copy(update={"num_of_wish": 10})
+    catalog.upsert(changed)
+    assert catalog.page(query_param).items == [changed]
+    assert catalog.page(query_param.copy(update={"type": DrinkType.ALL})).items == [changed]
+
+    # 술 종류가 바뀌면 이전 종류로 거를 때 빠진다.
+    catalog.upsert(changed.copy(update={"type": DrinkType.BEER}))
+    assert catalog.page(query_param).items != [changed]
+
+    # 이미 내준 행은 그대로 두고 새 행으로 바꾼다.
+    row = catalog.row_page(query_param.copy(update={"type": DrinkType.ALL})).items[0]
+    catalog.upsert(changed.copy(update={"num_of_wish": 11}))
+    assert row["num_of_wish"] == 10
+    assert catalog.row_page(query_param.copy(update={"type": DrinkType.ALL})).items[0]["num_of_wish"] == 11
+
+    catalog.remove(changed.id)
+    catalog.remove(changed.id)
+    assert len(catalog) == len(drinks) - 1
+    assert changed.id not in [drink.id for drink in catalog.page(query_param.copy(update={"limit": 100})).items]
+
+    # 빠진 술의 slot 을 다시 쓴다.
+    catalog.upsert(changed)
+    leaderboard.upsert(changed)
+    _assert_same_as_leaderboard(catalog, leaderboard)
+
+
+def test_patch_same_as_leaderboard(catalog, leaderboard):
+    rand = random.Random(1234)
+    # INITIAL_CAPACITY 를 넘도록 추가해 배열이 늘어나는 경우도 확인한다.
+    drink_ids = [drink.id for drink in drinks] + [
+        DrinkId.build(drink_name=f"new{i}", created_at=1234) for i in range(ColumnarDrinkCatalog.INITIAL_CAPACITY)
+    ]
+    for i in range(500):
+        drink_id = rand.choice(drink_ids)
+        if rand.random() < 0.1:
+            catalog.remove(drink_id)
+            leaderboard.remove(drink_id)
+            continue
+        num_of_reviews = rand.randint(0, 5)
+        drink = Drink(
+            id=drink_id,
+            name=f"drink{i}",
+            image_url="",
+            type=rand.choice([DrinkType.SOJU, DrinkType.BEER, DrinkType.WINE]),
+            rating_sum=rand.randint(num_of_reviews, num_of_reviews * 5),
+            num_of_reviews=num_of_reviews,
+            num_of_wish=rand.randint(0, 3),
+        )
+        catalog.upsert(drink)
+        leaderboard.upsert(drink)
+
+    _assert_same_as_leaderboard(catalog, leaderboard)
+
+
+def test_page_invalid(catalog):
+    with pytest.raises(InvalidParamInputError):
+        catalog.page(QueryParam(type=DrinkType.ALL, filter=FilterType.WISH, order=OrderType.DESC, limit=101))
+    with pytest.raises(InvalidParamInputError):
+        catalog.row_page(QueryParam(type=DrinkType.ALL, filter=FilterType.WISH, order=OrderType.DESC, cursor="invalid"))
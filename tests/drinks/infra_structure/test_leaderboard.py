@@ -0,0 +1,113 @@
+import itertools
+
+import pytest
+
+from drinks.application.query_service import drink_row
+from drinks.domain.entities import Drink
+from drinks.domain.repository import QueryParam
+from drinks.domain.value_objects import DrinkType, FilterType, OrderType
+from drinks.infra_structure.in_memory_repository import InMemoryDrinkRepository
+from drinks.infra_structure.leaderboard import DrinkLeaderboard
+from shared_kernel.domain.exceptions import InvalidParamInputError
+from shared_kernel.domain.value_objects import DrinkId
+
+drinks = [
+    Drink(
+        id=DrinkId.build(drink_name=f"drink{i}", created_at=1234),
+        name=f"drink{i}",
+        image_url="",
+        type=[DrinkType.SOJU, DrinkType.BEER, DrinkType.WINE][i % 3],
+        rating_sum=i % 5 * (i % 4),
+        num_of_reviews=i % 4,
+        num_of_wish=i % 2,
+    )
+    for i in range(12)
+]
+
+
+@pytest.fixture(scope="function")
+def leaderboard():
+    leaderboard = DrinkLeaderboard()
+    leaderboard.replace_all(drinks)
+    return leaderboard
+
+
+@pytest.fixture(scope="function")
+def in_memory_drink_repository():
+    repository = InMemoryDrinkRepository()
+    for drink in drinks:
+        repository.add(drink.copy())
+    return repository
+
+
+def _read_all_pages(find_page, query_param):
+    items, pages = [], 0
+    while True:
+        page = find_page(query_param)
+        items.extend(page.items)
+        pages += 1
+        if page.next_cursor is None:
+            return items, pages
+        query_param = query_param.copy(update={"cursor": page.next_cursor})
+
+
+@pytest.mark.parametrize(
+    "drink_type, filter_type, order_type",
+    list(itertools.product([DrinkType.ALL, DrinkType.SOJU, DrinkType.SAKE], FilterType, OrderType)),
+)
+def test_page_same_as_repository(leaderboard, in_memory_drink_repository, drink_type, filter_type, order_type):
+    query_param = QueryParam(type=drink_type, filter=filter_type, order=order_type, limit=5)
+
+    actual, num_of_pages = _read_all_pages(leaderboard.page, query_param)
+    expected, _ = _read_all_pages(in_memory_drink_repository.find_all, query_param)
+    assert actual == expected
+    assert num_of_pages == max(1, -(-len(expected) // 5))
+
+
+@pytest.mark.parametrize(
+    "drink_type, filter_type, order_type",
+    list(itertools.product([DrinkType.ALL, DrinkType.SOJU], FilterType, OrderType)),
+)
+def test_row_page_same_as_page(leaderboard, drink_type, filter_type, order_type):
+    query_param = QueryParam(type=drink_type, filter=filter_type, order=order_type, limit=5)
+    while True:
+        actual = leaderboard.row_page(query_param)
+        expected = leaderboard.page(query_param)
+        assert actual.items == [drink_row(drink) for drink in expected.items]
+        assert actual.next_cursor == expected.next_cursor
+        if actual.next_cursor is None:
+            break
+        query_param = query_param.copy(update={"cursor": actual.next_cursor})
+
+
+def test_upsert_and_remove(leaderboard):
+    query_param = QueryParam(type=DrinkType.SOJU, filter=FilterType.WISH, order=OrderType.DESC, limit=1)
+    first = leaderboard.page(query_param).items[0]
+    assert first.num_of_wish == 1
+
+    changed = drinks[0].copy(update={"num_of_wish": 10})
+    leaderboard.upsert(changed)
+    assert leaderboard.page(query_param).items == [changed]
+    assert leaderboard.page(query_param.copy(update={"type": DrinkType.ALL})).items == [changed]
+    assert len(leaderboard) == len(drinks)
+
+    # 술 종류가 바뀌면 이전 종류의 랭킹에서 빠진다.
+    leaderboard.upsert(changed.copy(update={"type": DrinkType.BEER}))
+    assert leaderboard.page(query_param).items != [changed]
+
+    # 이미 내준 행은 그대로 두고 새 행으로 바꾼다.
+    row = leaderboard.row_page(query_param.copy(update={"type": DrinkType.ALL})).items[0]
+    leaderboard.upsert(changed.copy(update={"num_of_wish": 11}))
+    assert row["num_of_wish"] == 10
+    assert leaderboard.row_page(query_param.copy(update={"type": DrinkType.ALL})).items[0]["num_of_wish"] == 11
+
+    leaderboard.remove(changed.id)
+    assert len(leaderboard) == len(drinks) - 1
+    assert changed.id not in [drink.id for drink in leaderboard.page(query_param.copy(update={"limit": 100})).items]
+
+
+def test_page_invalid(leaderboard):
+    with pytest.raises(InvalidParamInputError):
+        leaderboard.page(QueryParam(type=DrinkType.ALL, filter=FilterType.WISH, order=OrderType.DESC, limit=101))
+    with pytest.raises(InvalidParamInputError):
+        leaderboard.page(QueryParam(type=DrinkType.ALL, filter=FilterType.WISH, order=OrderType.DESC, cursor="invalid"))
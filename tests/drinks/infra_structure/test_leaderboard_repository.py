@@ -0,0 +1,179 @@
+from unittest import mock
+
+import pytest
+
+from drinks.domain.entities import Drink
+from drinks.domain.repository import QueryParam
+from drinks.domain.value_objects import DrinkType, FilterType, OrderType
+from drinks.infra_structure.columnar_catalog import ColumnarDrinkCatalog
+from drinks.infra_structure.in_memory_repository import InMemoryDrinkRepository
+from drinks.infra_structure.leaderboard import DrinkLeaderboard
+from drinks.infra_structure.leaderboard_repository import LeaderboardDrinkRepository
+from shared_kernel.domain.value_objects import DrinkId
+
+SOJU_ID = DrinkId.build(drink_name="soju", created_at=1234)
+BEER_ID = DrinkId.build(drink_name="beer", created_at=1234)
+QUERY_PARAM = QueryParam(type=DrinkType.ALL, filter=FilterType.WISH, order=OrderType.DESC)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeTransaction:
+    def __init__(self) -> None:
+        self.active = False
+        self.callbacks = []
+
+    def __call__(self, callback) -> bool:
+        if not self.active:
+            return False
+        self.callbacks.append(callback)
+        return True
+
+    def commit(self) -> None:
+        self.active = False
+        for callback in self.callbacks:
+            callback()
+        self.callbacks = []
+
+    def rollback(self) -> None:
+        self.active = False
+        self.callbacks = []
+
+
+@pytest.fixture(scope="function")
+def drink_repository():
+    repository = InMemoryDrinkRepository()
+    repository.add(Drink(id=SOJU_ID, name="soju", image_url="", type=DrinkType.SOJU, num_of_wish=1))
+    repository.add(Drink(id=BEER_ID, name="beer", image_url="", type=DrinkType.BEER, num_of_wish=2))
+    return repository
+
+
+@pytest.fixture(scope="function")
+def in_memory_drink_repository(drink_repository):
+    return mock.Mock(wraps=drink_repository)
+
+
+@pytest.fixture(scope="function")
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(scope="function")
+def transaction():
+    return FakeTransaction()
+
+
+@pytest.fixture(scope="function", params=["memory", "columnar"])
+def leaderboard(request):
+    if request.param == "columnar":
+        pytest.importorskip("numpy")
+        return ColumnarDrinkCatalog()
+    return DrinkLeaderboard()
+
+
+@pytest.fixture(scope="function")
+def leaderboard_drink_repository(in_memory_drink_repository, leaderboard, clock, transaction):
+    return LeaderboardDrinkRepository(
+        drink_repository=in_memory_drink_repository,
+        leaderboard=leaderboard,
+        refresh_interval_seconds=30,
+        clock=clock,
+        after_commit=transaction,
+    )
+
+
+def _drink_ids(page):
+    return [drink.id for drink in page.items]
+
+
+def test_find_all_without_sql(leaderboard_drink_repository, in_memory_drink_repository, clock):
+    assert _drink_ids(leaderboard_drink_repository.find_all(QUERY_PARAM)) == [BEER_ID, SOJU_ID]
+    assert _drink_ids(leaderboard_drink_repository.find_all(QUERY_PARAM)) == [BEER_ID, SOJU_ID]
+    assert in_memory_drink_repository.find_catalog.call_count == 1
+    assert in_memory_drink_repository.find_all.call_count == 0
+
+    clock.now = 30
+    leaderboard_drink_repository.find_all(QUERY_PARAM)
+    assert in_memory_drink_repository.find_catalog.call_count == 2
+
+
+def test_write_applied_on_commit(leaderboard_drink_repository, transaction):
+    leaderboard_drink_repository.find_all(QUERY_PARAM)
+
+    transaction.active = True
+    leaderboard_drink_repository.add_wish(SOJU_ID)
+    leaderboard_drink_repository.add_wish(SOJU_ID)
+    assert _drink_ids(leaderboard_drink_repository.find_all(QUERY_PARAM)) == [BEER_ID, SOJU_ID]
+    transaction.commit()
+    assert _drink_ids(leaderboard_drink_repository.find_all(QUERY_PARAM)) == [SOJU_ID, BEER_ID]
+
+    transaction.active = True
+    leaderboard_drink_repository.delete_by_drink_id(SOJU_ID)
+    transaction.rollback()
+    assert _drink_ids(leaderboard_drink_repository.find_all(QUERY_PARAM)) == [SOJU_ID, BEER_ID]
+
+    # unit of work 밖의 쓰기는 이미 commit 된 것이므로 바로 반영한다.
+    leaderboard_drink_repository.delete_by_drink_id(BEER_ID)
+    assert _drink_ids(leaderboard_drink_repository.find_all(QUERY_PARAM)) == [SOJU_ID]
+
+
+def test_commit_callbacks_out_of_order_keep_latest(
+    leaderboard_drink_repository, in_memory_drink_repository, drink_repository, transaction
+):
+    leaderboard_drink_repository.find_all(QUERY_PARAM)
+    # DB 처럼 쓰기마다 그 시점의 행을 돌려준다.
+    in_memory_drink_repository.add_wish.side_effect = lambda drink_id: drink_repository.add_wish(drink_id).copy()
+
+    # 두 트랜잭션이 차례로 commit 했지만 콜백은 반대 순서로 불려도, 나중에 commit 된 값이 남는다.
+    transaction.active = True
+    leaderboard_drink_repository.add_wish(SOJU_ID)
+    leaderboard_drink_repository.add_wish(SOJU_ID)
+    transaction.callbacks.reverse()
+    transaction.commit()
+
+    (soju,) = [drink for drink in leaderboard_drink_repository.find_all(QUERY_PARAM).items if drink.id == SOJU_ID]
+    assert soju.num_of_wish == 3
+
+
+def test_deleted_drink_is_removed_even_if_upsert_runs_last(leaderboard_drink_repository, transaction):
+    leaderboard_drink_repository.find_all(QUERY_PARAM)
+
+    transaction.active = True
+    leaderboard_drink_repository.add_wish(BEER_ID)
+    leaderboard_drink_repository.delete_by_drink_id(BEER_ID)
+    transaction.callbacks.reverse()
+    transaction.commit()
+
+    assert _drink_ids(leaderboard_drink_repository.find_all(QUERY_PARAM)) == [SOJU_ID]
+
+
+def test_write_during_refresh_is_kept(leaderboard_drink_repository, in_memory_drink_repository, drink_repository):
+    def find_catalog_then_concurrent_write():
+        drinks = [drink.copy() for drink in drink_repository.find_catalog()]
+        leaderboard_drink_repository.add_wish(SOJU_ID)
+        leaderboard_drink_repository.add_wish(SOJU_ID)
+        return drinks
+
+    # 전체를 읽은 뒤 leaderboard 를 덮어쓰기 전에 반영된 쓰기가 사라지지 않는다.
+    in_memory_drink_repository.find_catalog.side_effect = find_catalog_then_concurrent_write
+    assert _drink_ids(leaderboard_drink_repository.find_all(QUERY_PARAM)) == [SOJU_ID, BEER_ID]
+
+
+def test_refresh_failure_serves_previous_ranking(leaderboard_drink_repository, in_memory_drink_repository, clock):
+    leaderboard_drink_repository.find_all(QUERY_PARAM)
+
+    clock.now = 30
+    in_memory_drink_repository.find_catalog.side_effect = RuntimeError("db is down")
+    assert _drink_ids(leaderboard_drink_repository.find_all(QUERY_PARAM)) == [BEER_ID, SOJU_ID]
+
+
+def test_first_refresh_failure_raises(leaderboard_drink_repository, in_memory_drink_repository):
+    in_memory_drink_repository.find_catalog.side_effect = RuntimeError("db is down")
+    with pytest.raises(RuntimeError):
+        leaderboard_drink_repository.find_all(QUERY_PARAM)
@@ -0,0 +1,63 @@
+import itertools
+
+import pytest
+
+from drinks.application.query_service import drink_row
+from drinks.domain.entities import Drink
+from drinks.domain.repository import QueryParam
+from drinks.domain.value_objects import DrinkType, FilterType, OrderType
+from drinks.infra_structure.orm_models import DrinkOrm
+from drinks.infra_structure.orm_query_service import OrmDrinkQueryService
+from drinks.infra_structure.orm_repository import OrmDrinkRepository
+from shared_kernel.domain.exceptions import InvalidParamInputError
+from shared_kernel.domain.value_objects import DrinkId
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup(database):
+    with database.session() as session:
+        session.query(DrinkOrm).delete()
+        session.add_all(
+            [
+                DrinkOrm.from_drink(
+                    Drink(
+                        id=DrinkId.build(drink_name=f"drink{i}", created_at=1234),
+                        name=f"drink{i}",
+                        image_url=f"drink_image{i}",
+                        type=[DrinkType.SOJU, DrinkType.BEER, DrinkType.WINE][i % 3],
+                        rating_sum=i % 5 * (i % 4),
+                        num_of_reviews=i % 4,
+                        num_of_wish=i % 2,
+                    )
+                )
+                for i in range(7)
+            ]
+        )
+        session.commit()
+
+
+@pytest.mark.parametrize(
+    "drink_type, filter_type, order_type",
+    list(itertools.product([DrinkType.ALL, DrinkType.SOJU], FilterType, OrderType)),
+)
+def test_find_rows_same_as_repository(database, drink_type, filter_type, order_type):
+    orm_drink_query_service = OrmDrinkQueryService(read_session_factory=database.session)
+    orm_drink_repository = OrmDrinkRepository(session_factory=database.session)
+    query_param = QueryParam(type=drink_type, filter=filter_type, order=order_type, limit=2)
+
+    while True:
+        actual = orm_drink_query_service.find_rows(query_param)
+        expected = orm_drink_repository.find_all(query_param)
+        assert actual.items == [drink_row(drink) for drink in expected.items]
+        assert actual.next_cursor == expected.next_cursor
+        if actual.next_cursor is None:
+            break
+        query_param = query_param.copy(update={"cursor": actual.next_cursor})
+
+
+def test_find_rows_invalid(database):
+    orm_drink_query_service = OrmDrinkQueryService(read_session_factory=database.session)
+    with pytest.raises(InvalidParamInputError):
+        orm_drink_query_service.find_rows(QueryParam(limit=101).to_enum())
+    with pytest.raises(InvalidParamInputError):
+        orm_drink_query_service.find_rows(QueryParam(cursor="invalid").to_enum())
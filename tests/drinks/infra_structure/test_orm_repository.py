@@ -1,11 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from drinks.domain.entities import Drink
 from drinks.domain.repository import QueryParam
-from drinks.domain.value_objects import DrinkType, DrinkRating, OrderType, FilterType
+from drinks.domain.value_objects import DrinkType, OrderType, FilterType
 from drinks.infra_structure.orm_models import DrinkOrm
 from drinks.infra_structure.orm_repository import OrmDrinkRepository
-from shared_kernel.domain.exceptions import ResourceNotFoundError, ResourceAlreadyExistError
+from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceNotFoundError, ResourceAlreadyExistError
+from shared_kernel.domain.pagination import Cursor
 from shared_kernel.domain.value_objects import DrinkId
 
 
@@ -21,7 +24,7 @@ def setup(database):
                         name="soju1",
                         image_url="soju_image1",
                         type=DrinkType.SOJU,
-                        avg_rating=DrinkRating(),
+                        rating_sum=0,
                         num_of_reviews=0,
                         num_of_wish=0,
                     )
@@ -32,7 +35,7 @@ def setup(database):
                         name="soju2",
                         image_url="soju_image2",
                         type=DrinkType.SOJU,
-                        avg_rating=DrinkRating(value=5),
+                        rating_sum=5,
                         num_of_reviews=1,
                         num_of_wish=1,
                     )
@@ -43,7 +46,7 @@ def setup(database):
                         name="beer",
                         image_url="beer_image",
                         type=DrinkType.BEER,
-                        avg_rating=DrinkRating(value=4.5),
+                        rating_sum=9,
                         num_of_reviews=2,
                         num_of_wish=2,
                     )
@@ -68,7 +71,7 @@ def test_find_by_review_id(orm_drink_repository):
             name="soju1",
             image_url="soju_image1",
             type=DrinkType.SOJU,
-            avg_rating=DrinkRating(),
+            rating_sum=0,
             num_of_reviews=0,
             num_of_wish=0,
         )
@@ -80,13 +83,18 @@ def test_find_by_review_id(orm_drink_repository):
         name="soju1",
         image_url="soju_image1",
         type=DrinkType.from_str("soju"),
-        avg_rating=DrinkRating(),
+        rating_sum=0,
         num_of_reviews=0,
         num_of_wish=0,
     )
     assert actual == expected
 
 
+def test_find_catalog(orm_drink_repository):
+    actual = sorted(drink.name for drink in orm_drink_repository.find_catalog())
+    assert {"beer", "soju1", "soju2"} <= set(actual)
+
+
 def test_find_all(orm_drink_repository):
     actual = orm_drink_repository.find_all(
         query_param=QueryParam(
@@ -101,7 +109,7 @@ def test_find_all(orm_drink_repository):
             name="soju2",
             image_url="soju_image2",
             type=DrinkType.from_str("soju"),
-            avg_rating=DrinkRating(value=5),
+            rating_sum=5,
             num_of_reviews=1,
             num_of_wish=1,
         ),
@@ -110,12 +118,65 @@ def test_find_all(orm_drink_repository):
             name="soju1",
             image_url="soju_image1",
             type=DrinkType.from_str("soju"),
-            avg_rating=DrinkRating(),
+            rating_sum=0,
             num_of_reviews=0,
             num_of_wish=0,
         ),
     ]
-    assert actual == expected
+    assert actual.items == expected
+    assert actual.next_cursor is None
+
+
+def test_find_all_pages(orm_drink_repository):
+    query_param = QueryParam(
+        type=DrinkType.ALL,
+        filter=FilterType.from_str("review"),
+        order=OrderType.from_str("ascending"),
+        limit=2,
+    )
+    first_page = orm_drink_repository.find_all(query_param=query_param)
+    assert [drink.name for drink in first_page.items] == ["soju1", "soju2"]
+    assert first_page.next_cursor is not None
+
+    second_page = orm_drink_repository.find_all(query_param=query_param.copy(update={"cursor": first_page.next_cursor}))
+    assert [drink.name for drink in second_page.items] == ["beer"]
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "query_param",
+    [
+        QueryParam(type=DrinkType.ALL, filter=FilterType.REVIEW, order=OrderType.DESC, limit=0),
+        QueryParam(type=DrinkType.ALL, filter=FilterType.REVIEW, order=OrderType.DESC, limit=101),
+        QueryParam(type=DrinkType.ALL, filter=FilterType.REVIEW, order=OrderType.DESC, cursor="not-a-cursor"),
+        QueryParam(
+            type=DrinkType.ALL,
+            filter=FilterType.REVIEW,
+            order=OrderType.DESC,
+            cursor=Cursor(values=["wish", "descending", 1, "35a05a4b-d9ba-5122-af75-7c0022b8bbd8"]).encode(),
+        ),
+        *[
+            QueryParam(
+                type=DrinkType.ALL,
+                filter=filter_type,
+                order=OrderType.DESC,
+                cursor=Cursor(
+                    values=[filter_type.value, "descending", sort_value, "35a05a4b-d9ba-5122-af75-7c0022b8bbd8"]
+                ).encode(),
+            )
+            for filter_type, sort_value in [
+                (FilterType.REVIEW, 3.7),
+                (FilterType.REVIEW, "3"),
+                (FilterType.WISH, True),
+                (FilterType.RATING, "4.5"),
+                (FilterType.RATING, None),
+            ]
+        ],
+    ],
+)
+def test_find_all_invalid_page(orm_drink_repository, query_param):
+    with pytest.raises(InvalidParamInputError):
+        orm_drink_repository.find_all(query_param=query_param)
 
 
 def test_add(orm_drink_repository):
@@ -124,7 +185,7 @@ def test_add(orm_drink_repository):
         name="wine",
         image_url="wine_image",
         type=DrinkType.from_str("wine"),
-        avg_rating=DrinkRating(value=3),
+        rating_sum=3,
         num_of_reviews=1,
         num_of_wish=1,
     )
@@ -136,7 +197,7 @@ def test_add(orm_drink_repository):
         name="wine",
         image_url="wine_image",
         type=DrinkType.from_str("wine"),
-        avg_rating=DrinkRating(value=3),
+        rating_sum=3,
         num_of_reviews=1,
         num_of_wish=1,
     )
@@ -155,7 +216,7 @@ def test_update(orm_drink_repository):
         name=old_drink.name,
         image_url=old_drink.image_url,
         type=old_drink.type,
-        avg_rating=DrinkRating(value=4.5),
+        rating_sum=9,
         num_of_reviews=2,
         num_of_wish=1,
     )
@@ -173,3 +234,63 @@ def test_delete(orm_drink_repository):
 
     with pytest.raises(ResourceNotFoundError):
         orm_drink_repository.delete_by_drink_id(drink_id=DrinkId.build(drink_name="soju1", created_at=1234))
+
+
+def test_update_counters(orm_drink_repository):
+    drink_id = DrinkId.build(drink_name="makgeolli", created_at=1234)
+    orm_drink_repository.add(Drink(id=drink_id, name="makgeolli", image_url="", type=DrinkType.ETC))
+
+    actual = orm_drink_repository.add_rating(drink_id, rating=4)
+    assert (actual.num_of_reviews, actual.avg_rating) == (1, 4)
+
+    actual = orm_drink_repository.add_rating(drink_id, rating=5)
+    assert (actual.num_of_reviews, actual.avg_rating) == (2, 4.5)
+
+    actual = orm_drink_repository.update_rating(drink_id, old_rating=4, new_rating=2)
+    assert (actual.num_of_reviews, actual.avg_rating) == (2, 3.5)
+
+    actual = orm_drink_repository.delete_rating(drink_id, rating=5)
+    assert (actual.num_of_reviews, actual.avg_rating) == (1, 2)
+
+    actual = orm_drink_repository.delete_rating(drink_id, rating=2)
+    assert (actual.num_of_reviews, actual.avg_rating) == (0, 0)
+
+    actual = orm_drink_repository.delete_rating(drink_id, rating=2)
+    assert (actual.num_of_reviews, actual.avg_rating) == (0, 0)
+
+    assert orm_drink_repository.add_wish(drink_id).num_of_wish == 1
+    assert orm_drink_repository.delete_wish(drink_id).num_of_wish == 0
+    assert orm_drink_repository.delete_wish(drink_id).num_of_wish == 0
+
+    assert orm_drink_repository.find_by_drink_id(drink_id) == actual.copy(update={"num_of_wish": 0})
+
+    with pytest.raises(ResourceNotFoundError):
+        orm_drink_repository.add_wish(DrinkId.from_str("35a05a4b-d9ba-5122-af75-7c0022b8bbd8"))
+
+
+def test_avg_rating_generated(database, orm_drink_repository):
+    drink_id = DrinkId.build(drink_name="whisky", created_at=1234)
+    orm_drink_repository.add(Drink(id=drink_id, name="whisky", image_url="", type=DrinkType.LIQUOR))
+    for rating in [5, 4, 4]:
+        orm_drink_repository.add_rating(drink_id, rating=rating)
+
+    with database.session() as session:
+        drink_orm = session.query(DrinkOrm).get(drink_id.uuid)
+        assert (drink_orm.rating_sum, drink_orm.num_of_reviews) == (13, 3)
+        # DB 가 계산한 평균은 Drink 가 계산한 평균과 같아, 둘 중 어느 쪽으로 만든 cursor 든 같은 위치를 가리킨다.
+        assert drink_orm.avg_rating == drink_orm.to_drink().avg_rating == 13 / 3
+
+
+def test_update_counters_concurrently(orm_drink_repository):
+    drink_id = DrinkId.build(drink_name="cocktail", created_at=1234)
+    orm_drink_repository.add(Drink(id=drink_id, name="cocktail", image_url="", type=DrinkType.ETC))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: orm_drink_repository.add_wish(drink_id), range(20)))
+        list(executor.map(lambda _: orm_drink_repository.add_rating(drink_id, rating=3), range(20)))
+
+    actual = orm_drink_repository.find_by_drink_id(drink_id)
+    assert actual.num_of_wish == 20
+    assert actual.num_of_reviews == 20
+    assert actual.rating_sum == 60
+    assert actual.avg_rating == 3
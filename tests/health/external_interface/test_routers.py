@@ -1,4 +1,38 @@
+from shared_kernel.infra_structure.warm_up import WarmUp
+
+
 def test_health_check(client):
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"msg": "I'm healthy!"}
+
+
+def test_get_metrics(client):
+    response = client.get("/health/metrics")
+    assert response.status_code == 200
+    assert set(response.json()["db_pool"]) >= {"pool_size", "checked_out", "overflow", "checkout_latency_ms"}
+    assert set(response.json()["cache"]) >= {"backend", "hits", "misses", "hit_rate"}
+    assert set(response.json()["token_cache"]) >= {"hits", "misses", "hit_rate"}
+    assert set(response.json()["read_coalescing"]["drinks"]) >= {"hits", "loads", "coalesced", "early_refreshes"}
+
+
+def test_query_stats_headers(client):
+    response = client.get("/health")
+    assert response.headers["X-DB-Query-Count"] == "0"
+    assert response.headers["X-DB-Query-Time-Ms"] == "0.000"
+
+
+def test_readiness_check(app, client):
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+
+    warm_up = WarmUp()
+    warm_up.add_step("drinks", lambda: None)
+    with app.container.warm_up.override(warm_up):
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json() == {"ready": False, "steps": {"drinks": {"status": "pending", "elapsed_ms": None}}}
+
+        warm_up.run()
+        assert client.get("/health/ready").status_code == 200
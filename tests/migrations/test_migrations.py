@@ -0,0 +1,183 @@
+import json
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from drinks.infra_structure.orm_models import DrinkOrm
+from reviews.infra_structure.orm_models import ReviewOrm
+from shared_kernel.infra_structure.database import Base
+from shared_kernel.infra_structure.migrator import Migrator
+from wishes.infra_structure.orm_models import WishOrm
+
+
+def test_up_to_date(database):
+    assert database.migrate() == []
+
+
+def test_model_indexes_created(database):
+    with database.session() as session:
+        actual = {row.indexname for row in session.execute("SELECT indexname FROM pg_indexes")}
+    expected = {index.name for table in Base.metadata.tables.values() for index in table.indexes}
+    assert expected
+    assert expected <= actual
+
+
+PLAN_SCHEMA = "query_plan_test"
+# 실제 조회와 비슷한 분포로 넣는 행. 처음 스키마(v0001)의 컬럼만 쓰므로 이후 migration 이 컬럼을 바꿔도 그대로 쓸 수 있다.
+SEED_STATEMENTS = [
+    "SELECT setseed(0.5)",
+    """
+    INSERT INTO drink (id, name, image_url, type, avg_rating, num_of_reviews, num_of_wish)
+    SELECT md5('drink' || i)::uuid, 'drink' || i, '', (ARRAY['beer', 'wine', 'liquor', 'sake', 'soju', 'etc'])[1 + mod(i, 6)],
+           round((random() * 5)::numeric, 2)::float, floor(random() * 200), floor(random() * 100)
+    FROM generate_series(1, 20000) AS i
+    """,
+    """
+    INSERT INTO review (id, user_id, drink_id, rating, comment, created_at, updated_at)
+    SELECT md5('review' || i)::uuid, 'user' || mod(i, 5000), md5('drink' || (1 + floor(random() * 20000)))::uuid,
+           1 + floor(random() * 5), '', 1613113664.9 - i, 1613113664.9 - i
+    FROM generate_series(1, 100000) AS i
+    """,
+    """
+    INSERT INTO wish (id, user_id, drink_id, created_at)
+    SELECT md5('wish' || i)::uuid, 'user' || mod(i, 5000), md5('drink' || (1 + floor(random() * 20000)))::uuid,
+           1613113664.9 - i
+    FROM generate_series(1, 50000) AS i
+    """,
+]
+
+
+@pytest.fixture(scope="module")
+def seeded_engine():
+    """
+    행을 넣고 ANALYZE 한 별도 schema 에 모든 migration 을 적용한 engine.
+    planner 가 실제와 비슷한 통계로 인덱스를 고르므로, 다른 테스트가 남긴 행이나 통계에 영향을 받지 않는다.
+    """
+    engine = create_engine(os.environ["TEST_DB_URL"], connect_args={"options": f"-csearch_path={PLAN_SCHEMA}"})
+    with engine.begin() as connection:
+        connection.execute(f"DROP SCHEMA IF EXISTS {PLAN_SCHEMA} CASCADE")
+        connection.execute(f"CREATE SCHEMA {PLAN_SCHEMA}")
+        initial_schema, *migrations = Migrator(engine).migrations()
+        initial_schema.upgrade(connection)
+        for statement in SEED_STATEMENTS:
+            connection.execute(statement)
+        for migration in migrations:
+            migration.upgrade(connection)
+        connection.execute("ANALYZE drink, review, wish")
+    yield engine
+    with engine.begin() as connection:
+        connection.execute(f"DROP SCHEMA {PLAN_SCHEMA} CASCADE")
+    engine.dispose()
+
+
+def _plan_index_names(engine, statement: str, params: dict) -> set:
+    with engine.connect() as connection:
+        plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {statement}"), params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    index_names, nodes = set(), [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node:
+            index_names.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return index_names
+
+
+@pytest.mark.parametrize(
+    "statement, params, index_name",
+    [
+        (
+            "SELECT * FROM review WHERE user_id = :user_id ORDER BY updated_at DESC, id DESC LIMIT 21",
+            {"user_id": "user"},
+            "ix_review_user_id_updated_at_id",
+        ),
+        (
+            "SELECT * FROM review WHERE drink_id = :drink_id AND (updated_at, id) < (:updated_at, :id) "
+            "ORDER BY updated_at DESC, id DESC LIMIT 21",
+            {
+                "drink_id": "6e1bff4f-6c25-4a4b-9b8e-3f5a5d2d3b9a",
+                "updated_at": 1613113664.9,
+                "id": "6e1bff4f-6c25-4a4b-9b8e-3f5a5d2d3b9a",
+            },
+            "ix_review_drink_id_updated_at_id",
+        ),
+        (
+            "SELECT * FROM wish WHERE user_id = :user_id ORDER BY created_at DESC, id DESC LIMIT 21",
+            {"user_id": "user"},
+            "ix_wish_user_id_created_at_id",
+        ),
+        (
+            "SELECT * FROM wish WHERE drink_id = :drink_id AND (created_at, id) < (:created_at, :id) "
+            "ORDER BY created_at DESC, id DESC LIMIT 21",
+            {
+                "drink_id": "6e1bff4f-6c25-4a4b-9b8e-3f5a5d2d3b9a",
+                "created_at": 1613113664.9,
+                "id": "6e1bff4f-6c25-4a4b-9b8e-3f5a5d2d3b9a",
+            },
+            "ix_wish_drink_id_created_at_id",
+        ),
+        (
+            "SELECT * FROM drink WHERE type = :type ORDER BY num_of_reviews DESC, id DESC LIMIT 21",
+            {"type": "soju"},
+            "ix_drink_type_num_of_reviews_id",
+        ),
+        (
+            "SELECT * FROM drink WHERE type = :type AND (avg_rating, id) < (:avg_rating, :id) "
+            "ORDER BY avg_rating DESC, id DESC LIMIT 21",
+            {"type": "soju", "avg_rating": 4.5, "id": "6e1bff4f-6c25-4a4b-9b8e-3f5a5d2d3b9a"},
+            "ix_drink_type_avg_rating_id",
+        ),
+        (
+            "SELECT * FROM drink WHERE type = :type AND (num_of_wish, id) > (:num_of_wish, :id) "
+            "ORDER BY num_of_wish ASC, id ASC LIMIT 21",
+            {"type": "soju", "num_of_wish": 3, "id": "6e1bff4f-6c25-4a4b-9b8e-3f5a5d2d3b9a"},
+            "ix_drink_type_num_of_wish_id",
+        ),
+        ("SELECT * FROM drink ORDER BY num_of_reviews DESC, id DESC LIMIT 21", {}, "ix_drink_num_of_reviews_id"),
+        (
+            "SELECT * FROM drink WHERE (avg_rating, id) < (:avg_rating, :id) ORDER BY avg_rating DESC, id DESC LIMIT 21",
+            {"avg_rating": 4.5, "id": "6e1bff4f-6c25-4a4b-9b8e-3f5a5d2d3b9a"},
+            "ix_drink_avg_rating_id",
+        ),
+        ("SELECT * FROM drink ORDER BY num_of_wish DESC, id DESC LIMIT 21", {}, "ix_drink_num_of_wish_id"),
+    ],
+)
+def test_query_uses_index(seeded_engine, statement, params, index_name):
+    assert _plan_index_names(seeded_engine, statement, params) == {index_name}
+
+
+def test_drink_rating_sum_backfilled(database):
+    from migrations import v0001_initial_schema, v0003_drink_keyset_indexes, v0006_drink_rating_sum
+
+    with database.session() as session:
+        connection = session.connection()
+        try:
+            # 비어 있는 schema 에 v0006 이전의 drink 테이블을 만들어 적용해 보고, 끝나면 되돌린다.
+            connection.execute("CREATE SCHEMA migration_test")
+            connection.execute("SET LOCAL search_path TO migration_test")
+            v0001_initial_schema.upgrade(connection)
+            v0003_drink_keyset_indexes.upgrade(connection)
+            for name, avg_rating, num_of_reviews in [("none", 0, 0), ("drifted", 13 / 3 - 1e-12, 3), ("half", 4.5, 2)]:
+                connection.execute(
+                    "INSERT INTO drink (id, name, image_url, type, avg_rating, num_of_reviews, num_of_wish) "
+                    "VALUES (gen_random_uuid(), %s, '', 'soju', %s, %s, 0)",
+                    (name, avg_rating, num_of_reviews),
+                )
+
+            v0006_drink_rating_sum.upgrade(connection)
+
+            rows = connection.execute(
+                "SELECT name, rating_sum, num_of_reviews, avg_rating FROM drink ORDER BY name"
+            ).fetchall()
+            index_names = {
+                row.indexname
+                for row in connection.execute("SELECT indexname FROM pg_indexes WHERE schemaname = 'migration_test'")
+            }
+        finally:
+            session.rollback()
+
+    assert [tuple(row) for row in rows] == [("drifted", 13, 3, 13 / 3), ("half", 9, 2, 4.5), ("none", 0, 0, 0)]
+    assert {"ix_drink_type_avg_rating_id", "ix_drink_avg_rating_id"} <= index_names
@@ -12,7 +12,6 @@ from reviews.application.dtos import (
     FindReviewInputDto,
     FindReviewOutputDto,
     FindReviewsInputDto,
-    FindReviewsOutputDto,
     UpdateReviewInputDto,
     UpdateReviewOutputDto,
 )
@@ -20,9 +19,13 @@ from reviews.application.service import ReviewApplicationService
 from reviews.domain.entities import Review
 from reviews.domain.repository import QueryParam, ReviewRepository
 from reviews.domain.value_objects import ReviewRating
-from shared_kernel.application.dtos import FailedOutputDto
+from shared_kernel.application.dtos import FailedOutputDto, RowsOutputDto
+from shared_kernel.application.unit_of_work import UnitOfWork
+from shared_kernel.domain.pagination import Page
 from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceAlreadyExistError, ResourceNotFoundError
 from shared_kernel.domain.value_objects import DrinkId, ReviewId, UserId
+from shared_kernel.infra_structure.read_coalescer import ReadCoalescer
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
 
 review_data = [
     (
@@ -100,7 +103,7 @@ def test_find_review_fail(
 
 
 @pytest.mark.parametrize("review_id, drink_id, user_id, rating, created_at", review_data)
-def test_find_reviews_success(
+def test_find_review_rows_success(
     review_repository_mock,
     review_id,
     drink_id,
@@ -112,57 +115,62 @@ def test_find_reviews_success(
     user_id_2 = "meme"
     review_id_2 = ReviewId.build(user_id=user_id_2, drink_id=drink_id_2)
 
-    review_repository_mock.find_all.return_value = [
-        Review(
-            id=review_id,
-            drink_id=drink_id,
-            user_id=UserId(value=user_id),
-            rating=ReviewRating(value=rating),
-            comment="hello",
-            created_at=created_at,
-            updated_at=created_at,
-        ),
-        Review(
-            id=review_id_2,
-            drink_id=DrinkId.from_str(drink_id_2),
-            user_id=UserId(value=user_id_2),
-            rating=ReviewRating(value=rating),
-            comment="olleh",
-            created_at=created_at,
-            updated_at=created_at,
-        ),
-    ]
-    review_application_service = ReviewApplicationService(review_repository=review_repository_mock)
-
-    input_dto = FindReviewsInputDto(query_param=QueryParam())
-    actual = review_application_service.find_reviews(input_dto)
-    expected = FindReviewsOutputDto(
+    review_repository_mock.find_all.return_value = Page[Review](
         items=[
-            FindReviewsOutputDto.Item(
-                review_id=str(review_id),
-                drink_id=str(drink_id),
-                user_id=str(user_id),
-                rating=int(rating),
+            Review(
+                id=review_id,
+                drink_id=drink_id,
+                user_id=UserId(value=user_id),
+                rating=ReviewRating(value=rating),
                 comment="hello",
                 created_at=created_at,
                 updated_at=created_at,
             ),
-            FindReviewsOutputDto.Item(
-                review_id=str(review_id_2),
-                drink_id=str(drink_id_2),
-                user_id=str(user_id_2),
-                rating=int(rating),
+            Review(
+                id=review_id_2,
+                drink_id=DrinkId.from_str(drink_id_2),
+                user_id=UserId(value=user_id_2),
+                rating=ReviewRating(value=rating),
                 comment="olleh",
                 created_at=created_at,
                 updated_at=created_at,
             ),
-        ]
+        ],
+        next_cursor="cursor",
+    )
+    review_application_service = ReviewApplicationService(review_repository=review_repository_mock)
+
+    # query service 를 주지 않으면 repository 로 읽은 리뷰를 GET /reviews 의 항목 모양의 행으로 바꾼다.
+    input_dto = FindReviewsInputDto(query_param=QueryParam())
+    actual = review_application_service.find_review_rows(input_dto)
+    expected = RowsOutputDto(
+        items=[
+            {
+                "review_id": str(review_id),
+                "drink_id": str(drink_id),
+                "user_id": str(user_id),
+                "rating": int(rating),
+                "comment": "hello",
+                "created_at": created_at,
+                "updated_at": created_at,
+            },
+            {
+                "review_id": str(review_id_2),
+                "drink_id": str(drink_id_2),
+                "user_id": str(user_id_2),
+                "rating": int(rating),
+                "comment": "olleh",
+                "created_at": created_at,
+                "updated_at": created_at,
+            },
+        ],
+        next_cursor="cursor",
     )
     assert actual == expected
 
 
 @pytest.mark.parametrize("review_id, drink_id, user_id, rating, created_at", review_data)
-def test_find_reviews_fail(
+def test_find_review_rows_fail(
     review_repository_mock,
     review_id,
     drink_id,
@@ -174,7 +182,7 @@ def test_find_reviews_fail(
     review_application_service = ReviewApplicationService(review_repository=review_repository_mock)
 
     input_dto = FindReviewsInputDto(query_param=QueryParam())
-    actual = review_application_service.find_reviews(input_dto)
+    actual = review_application_service.find_review_rows(input_dto)
     expected = FailedOutputDto(type="Parameters Error", message="")
 
     assert actual == expected
@@ -244,6 +252,72 @@ def test_create_review_fail(
     assert actual == expected
 
 
+@pytest.mark.parametrize("review_id, drink_id, user_id, rating, created_at", review_data)
+def test_create_review_rollback(
+    review_repository_mock,
+    drink_application_service_mock,
+    review_id,
+    drink_id,
+    user_id,
+    rating,
+    created_at,
+):
+    unit_of_work_mock = mock.MagicMock(spec=UnitOfWork)
+    unit_of_work_mock.__enter__.return_value = unit_of_work_mock
+    review_application_service = ReviewApplicationService(
+        review_repository=review_repository_mock, unit_of_work_factory=lambda: unit_of_work_mock
+    )
+
+    drink_application_service_mock.add_drink_review.return_value = FailedOutputDto.build_resource_not_found_error()
+
+    input_dto = CreateReviewInputDto(
+        drink_id=str(drink_id),
+        user_id=str(UserId(value=user_id)),
+        rating=int(ReviewRating(value=rating)),
+        comment="",
+    )
+
+    actual = review_application_service.create_review(input_dto, drink_application_service_mock)
+    assert actual == FailedOutputDto.build_resource_not_found_error()
+    review_repository_mock.add.assert_called_once()
+    unit_of_work_mock.rollback.assert_called_once()
+
+
+@pytest.mark.parametrize("review_id, drink_id, user_id, rating, created_at", review_data)
+def test_create_review_bumps_resource_versions(
+    review_repository_mock,
+    drink_application_service_mock,
+    review_id,
+    drink_id,
+    user_id,
+    rating,
+    created_at,
+):
+    resource_versions = ResourceVersions()
+    review_application_service = ReviewApplicationService(
+        review_repository=review_repository_mock, resource_versions=resource_versions
+    )
+    keys = [
+        ResourceVersions.review(str(review_id)),
+        ResourceVersions.reviews_of_drink(str(drink_id)),
+        ResourceVersions.reviews_of_user(user_id),
+        ResourceVersions.REVIEWS,
+        ResourceVersions.DRINKS,
+    ]
+    etags = [resource_versions.etag(key) for key in keys]
+    input_dto = CreateReviewInputDto(drink_id=str(drink_id), user_id=user_id, rating=rating, comment="")
+
+    # rollback 되면 버전이 그대로다.
+    drink_application_service_mock.add_drink_review.return_value = FailedOutputDto.build_resource_not_found_error()
+    review_application_service.create_review(input_dto, drink_application_service_mock)
+    assert [resource_versions.etag(key) for key in keys] == etags
+
+    drink_application_service_mock.add_drink_review.return_value = AddDrinkReviewOutputDto()
+    review_application_service.create_review(input_dto, drink_application_service_mock)
+    for key, etag in zip(keys, etags):
+        assert resource_versions.etag(key) != etag
+
+
 @pytest.mark.parametrize("review_id, drink_id, user_id, rating, created_at", review_data)
 def test_update_review_success(
     review_repository_mock,
@@ -372,3 +446,55 @@ def test_delete_review_fail(
     actual = review_application_service.delete_review(input_dto, drink_application_service_mock)
     expected = FailedOutputDto(type="Resource Not Found Error", message="")
     assert actual == expected
+
+
+@pytest.mark.parametrize("review_id, drink_id, user_id, rating, created_at", review_data)
+def test_find_review_rows_coalesces_until_write(
+    review_repository_mock,
+    drink_application_service_mock,
+    review_id,
+    drink_id,
+    user_id,
+    rating,
+    created_at,
+):
+    review_repository_mock.find_all.return_value = Page[Review](items=[])
+    review_application_service = ReviewApplicationService(
+        review_repository=review_repository_mock,
+        read_coalescer=ReadCoalescer(ttl_seconds=10, after_commit=lambda _: False),
+    )
+    input_dto = FindReviewsInputDto(query_param=QueryParam(drink_id=str(drink_id)))
+
+    for _ in range(3):
+        assert review_application_service.find_review_rows(input_dto).status is True
+    assert review_repository_mock.find_all.call_count == 1
+
+    # 다른 조건의 조회는 따로 읽는다.
+    review_application_service.find_review_rows(FindReviewsInputDto(query_param=QueryParam(user_id=user_id)))
+    assert review_repository_mock.find_all.call_count == 2
+
+    drink_application_service_mock.add_drink_review.return_value = AddDrinkReviewOutputDto()
+    review_application_service.create_review(
+        CreateReviewInputDto(drink_id=str(drink_id), user_id=user_id, rating=rating, comment=""),
+        drink_application_service_mock,
+    )
+    review_application_service.find_review_rows(input_dto)
+    assert review_repository_mock.find_all.call_count == 3
+
+
+def test_warm_up(review_repository_mock):
+    review_repository_mock.find_all.side_effect = [
+        Page[Review](items=[], next_cursor="next"),
+        Page[Review](items=[]),
+        Page[Review](items=[]),
+    ]
+    review_application_service = ReviewApplicationService(review_repository=review_repository_mock)
+
+    review_application_service.warm_up(drink_ids=["drink-1", "drink-2"], num_of_pages=3)
+
+    query_params = [call.kwargs["query_param"] for call in review_repository_mock.find_all.call_args_list]
+    assert [(query_param.drink_id, query_param.cursor) for query_param in query_params] == [
+        ("drink-1", None),
+        ("drink-1", "next"),
+        ("drink-2", None),
+    ]
@@ -1,10 +1,16 @@
 from unittest import mock
 
 from auth.application.service import AuthApplicationService
-from reviews.application.dtos import CreateReviewOutputDto, FindReviewOutputDto, FindReviewsOutputDto
+from reviews.application.dtos import CreateReviewOutputDto, FindReviewOutputDto
+from reviews.application.query_service import review_row
 from reviews.application.service import ReviewApplicationService
+from reviews.domain.entities import Review
+from reviews.domain.value_objects import ReviewRating
 from reviews.external_interface.json_dtos import CreateReviewJsonRequest, UpdateReviewJsonRequest
-from shared_kernel.application.dtos import FailedOutputDto
+from shared_kernel.application.dtos import FailedOutputDto, RowsOutputDto
+from shared_kernel.domain.pagination import RowPage
+from shared_kernel.domain.value_objects import DrinkId, ReviewId, UserId
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
 
 
 def test_get_review(client, app):
@@ -46,7 +52,7 @@ def test_get_review(client, app):
 
 def test_get_reviews(client, app):
     application_service_mock = mock.Mock(spec=ReviewApplicationService)
-    application_service_mock.find_reviews.return_value = FailedOutputDto.build_parameters_error()
+    application_service_mock.find_review_rows.return_value = FailedOutputDto.build_parameters_error()
 
     # valid request but no resource
     with app.container.review_application_service.override(application_service_mock):
@@ -58,32 +64,34 @@ def test_get_reviews(client, app):
     }
 
     # valid request
-    application_service_mock.find_reviews.return_value = FindReviewsOutputDto(
+    application_service_mock.find_review_rows.return_value = RowsOutputDto(
         items=[
-            FindReviewsOutputDto.Item(
-                review_id="review_id_uuid",
-                drink_id="drink_id_uuid",
-                user_id="user_id_uuid",
-                rating=4,
-                comment="tastes good",
-                created_at=737373737.6,
-                updated_at=737373737.6,
-            ),
-            FindReviewsOutputDto.Item(
-                review_id="review_id_uuid2",
-                drink_id="drink_id_uuid2",
-                user_id="user_id_uuid2",
-                rating=3,
-                comment="tastes good2",
-                created_at=123.123,
-                updated_at=123.123,
-            ),
-        ]
+            {
+                "review_id": "review_id_uuid",
+                "user_id": "user_id_uuid",
+                "drink_id": "drink_id_uuid",
+                "rating": 4,
+                "comment": "tastes good",
+                "created_at": 737373737.6,
+                "updated_at": 737373737.6,
+            },
+            {
+                "review_id": "review_id_uuid2",
+                "user_id": "user_id_uuid2",
+                "drink_id": "drink_id_uuid2",
+                "rating": 3,
+                "comment": "tastes good2",
+                "created_at": 123.123,
+                "updated_at": 123.123,
+            },
+        ],
+        next_cursor="cursor",
     )
     with app.container.review_application_service.override(application_service_mock):
-        response = client.get("/reviews?drink_id=drink_id_uuid&order=newest")
+        response = client.get("/reviews?drink_id=drink_id_uuid&order=newest&limit=2")
     assert response.status_code == 200
-    assert response.json() == [
+    assert response.json()["next_cursor"] == "cursor"
+    assert response.json()["items"] == [
         {
             "review_id": "review_id_uuid",
             "drink_id": "drink_id_uuid",
@@ -105,9 +113,65 @@ def test_get_reviews(client, app):
     ]
 
 
+def test_get_review_not_modified(client, app):
+    application_service_mock = mock.Mock(spec=ReviewApplicationService)
+    application_service_mock.find_review.return_value = FailedOutputDto.build_resource_not_found_error()
+    resource_versions = ResourceVersions()
+    with app.container.review_application_service.override(
+        application_service_mock
+    ), app.container.resource_versions.override(resource_versions):
+        # 실패 응답에는 ETag 를 붙이지 않는다.
+        response = client.get("/reviews/review_id_uuid")
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
+
+        application_service_mock.find_review.return_value = FindReviewOutputDto(
+            review_id="review_id_uuid",
+            drink_id="drink_id_uuid",
+            user_id="user_id_uuid",
+            rating=4,
+            comment="tastes good",
+            created_at=737373737.6,
+            updated_at=737373737.6,
+        )
+        response = client.get("/reviews/review_id_uuid")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = client.get("/reviews/review_id_uuid", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert application_service_mock.find_review.call_count == 2
+
+        resource_versions.bump(ResourceVersions.review("review_id_uuid"))
+        response = client.get("/reviews/review_id_uuid", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+
+def test_get_reviews_not_modified(client, app):
+    application_service_mock = mock.Mock(spec=ReviewApplicationService)
+    application_service_mock.find_review_rows.return_value = RowsOutputDto(items=[], next_cursor=None)
+    resource_versions = ResourceVersions()
+    with app.container.review_application_service.override(
+        application_service_mock
+    ), app.container.resource_versions.override(resource_versions):
+        response = client.get("/reviews?drink_id=drink_id_uuid")
+        etag = response.headers["ETag"]
+
+        # 다른 술의 리뷰가 바뀌어도 304 로 응답한다.
+        resource_versions.bump(ResourceVersions.reviews_of_drink("other_drink_id_uuid"))
+        response = client.get("/reviews?drink_id=drink_id_uuid", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        resource_versions.bump(ResourceVersions.reviews_of_drink("drink_id_uuid"))
+        response = client.get("/reviews?drink_id=drink_id_uuid", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert application_service_mock.find_review_rows.call_count == 2
+
+
 def test_create_review(client, app):
     application_service_mock = mock.Mock(ReviewApplicationService)
     auth_service_mock = mock.Mock(AuthApplicationService)
+    auth_service_mock.find_cached_token_data.return_value = None
 
     # unauthorized token
     auth_service_mock.get_token_data.return_value = FailedOutputDto.build_unauthorized_error()
@@ -195,6 +259,7 @@ def test_create_review(client, app):
 def test_update_review(client, app):
     application_service_mock = mock.Mock(ReviewApplicationService)
     auth_service_mock = mock.Mock(AuthApplicationService)
+    auth_service_mock.find_cached_token_data.return_value = None
 
     # unauthorized token
     auth_service_mock.get_token_data.return_value = FailedOutputDto.build_unauthorized_error()
@@ -277,3 +342,29 @@ def test_update_review(client, app):
         "created_at": 123.123,
         "updated_at": 123.123,
     }
+
+
+def test_get_reviews_rows_match_response_model(client, app):
+    # 목록은 query service 의 행을 검증 없이 그대로 쓰므로, 행의 모양이 선언한 response_model 과 같은지 확인한다.
+    drink_id = DrinkId.build(drink_name="Cass", created_at=1234)
+    review = Review(
+        id=ReviewId.build(user_id="heumsi", drink_id=str(drink_id)),
+        drink_id=drink_id,
+        user_id=UserId(value="heumsi"),
+        rating=ReviewRating(value=4),
+        comment="tastes good",
+        created_at=737373737.6,
+        updated_at=737373737.6,
+    )
+    application_service_mock = mock.Mock(spec=ReviewApplicationService)
+    application_service_mock.find_review_rows.return_value = RowsOutputDto.build(
+        RowPage(items=[review_row(review)], next_cursor="cursor")
+    )
+    with app.container.review_application_service.override(application_service_mock):
+        response = client.get("/reviews")
+
+    (route,) = [route for route in app.routes if route.path == "/reviews" and "GET" in route.methods]
+    body = response.json()
+    assert body.keys() == route.response_model.__fields__.keys()
+    assert body["items"][0].keys() == route.response_model.__fields__["items"].type_.__fields__.keys()
+    assert route.response_model.parse_obj(body).dict() == body
@@ -0,0 +1,53 @@
+from unittest import mock
+
+import pytest
+
+from reviews.domain.entities import Review
+from reviews.domain.value_objects import ReviewRating
+from reviews.infra_structure.cached_repository import CachedReviewRepository
+from reviews.infra_structure.in_memory_repository import InMemoryReviewRepository
+from shared_kernel.domain.value_objects import DrinkId, ReviewId, UserId
+from shared_kernel.infra_structure.cache_backend import InProcessCacheBackend
+
+DRINK_ID = "335ca1a4-5175-5e41-8bac-40ffd840834c"
+REVIEW = Review(
+    id=ReviewId.build(user_id="heumsi", drink_id=DRINK_ID),
+    drink_id=DrinkId.from_str(DRINK_ID),
+    user_id=UserId(value="heumsi"),
+    rating=ReviewRating(value=4),
+    comment="good",
+    created_at=1613113664.9,
+    updated_at=1613113664.9,
+)
+
+
+@pytest.fixture(scope="function")
+def in_memory_review_repository():
+    return mock.Mock(wraps=InMemoryReviewRepository())
+
+
+@pytest.fixture(scope="function")
+def cached_review_repository(in_memory_review_repository):
+    return CachedReviewRepository(
+        review_repository=in_memory_review_repository,
+        cache_backend=InProcessCacheBackend(),
+        negative_ttl_seconds=5,
+        after_transaction=lambda _: False,
+    )
+
+
+def test_missing_review_id_is_remembered(cached_review_repository, in_memory_review_repository):
+    for _ in range(3):
+        assert cached_review_repository.find_by_review_id(REVIEW.id) is None
+    assert in_memory_review_repository.find_by_review_id.call_count == 1
+
+    # add 가 성공하면 기억해 둔 결과를 지우고 바로 찾을 수 있다.
+    cached_review_repository.add(REVIEW)
+    assert cached_review_repository.find_by_review_id(REVIEW.id) == REVIEW
+
+
+def test_found_review_is_not_cached_by_default(cached_review_repository, in_memory_review_repository):
+    cached_review_repository.add(REVIEW)
+    cached_review_repository.find_by_review_id(REVIEW.id)
+    cached_review_repository.find_by_review_id(REVIEW.id)
+    assert in_memory_review_repository.find_by_review_id.call_count == 2
@@ -0,0 +1,66 @@
+import pytest
+
+from reviews.application.query_service import review_row
+from reviews.domain.entities import Review
+from reviews.domain.repository import QueryParam
+from reviews.domain.value_objects import ReviewRating
+from reviews.infra_structure.orm_models import ReviewOrm
+from reviews.infra_structure.orm_query_service import OrmReviewQueryService
+from reviews.infra_structure.orm_repository import OrmReviewRepository
+from shared_kernel.domain.exceptions import InvalidParamInputError
+from shared_kernel.domain.value_objects import DrinkId, ReviewId, UserId
+
+drink_id = "07a9627a-c930-4292-afd0-b6a2d55de3b2"
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup(database):
+    with database.session() as session:
+        session.query(ReviewOrm).delete()
+        session.add_all(
+            [
+                ReviewOrm.from_review(
+                    Review(
+                        id=ReviewId.build(user_id=f"user{i}", drink_id=drink_id),
+                        user_id=UserId(value=f"user{i}"),
+                        drink_id=DrinkId.from_str(drink_id),
+                        rating=ReviewRating(value=i % 5 + 1),
+                        comment=f"comment{i}",
+                        created_at=1613807667,
+                        # 같은 updated_at 이 섞여 있어도 id 로 순서가 정해진다.
+                        updated_at=i // 2,
+                    )
+                )
+                for i in range(5)
+            ]
+        )
+        session.commit()
+
+
+@pytest.fixture(scope="function")
+def orm_review_query_service(database):
+    return OrmReviewQueryService(read_session_factory=database.session)
+
+
+def test_find_rows_same_as_repository(database, orm_review_query_service):
+    orm_review_repository = OrmReviewRepository(session_factory=database.session)
+    query_param = QueryParam(drink_id=drink_id, limit=2).to_enum()
+
+    num_of_pages = 0
+    while True:
+        actual = orm_review_query_service.find_rows(query_param)
+        expected = orm_review_repository.find_all(query_param)
+        assert actual.items == [review_row(review) for review in expected.items]
+        assert actual.next_cursor == expected.next_cursor
+        num_of_pages += 1
+        if actual.next_cursor is None:
+            break
+        query_param = query_param.copy(update={"cursor": actual.next_cursor})
+    assert num_of_pages == 3
+
+
+def test_find_rows_invalid(orm_review_query_service):
+    with pytest.raises(InvalidParamInputError):
+        orm_review_query_service.find_rows(QueryParam())
+    with pytest.raises(InvalidParamInputError):
+        orm_review_query_service.find_rows(QueryParam(drink_id=drink_id, cursor="invalid"))
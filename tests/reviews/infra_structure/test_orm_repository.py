@@ -102,7 +102,8 @@ def test_find_all(orm_review_repository):
             updated_at=1,
         ),
     ]
-    assert actual == expected
+    assert actual.items == expected
+    assert actual.next_cursor is None
 
     actual = orm_review_repository.find_all(QueryParam(user_id="jun"))
     expected = [
@@ -125,7 +126,22 @@ def test_find_all(orm_review_repository):
             updated_at=2,
         ),
     ]
-    assert actual == expected
+    assert actual.items == expected
+
+
+def test_find_all_pages(orm_review_repository):
+    query_param = QueryParam(user_id="jun", limit=1)
+    first_page = orm_review_repository.find_all(query_param)
+    assert [review.comment for review in first_page.items] == ["first jun"]
+
+    second_page = orm_review_repository.find_all(query_param.copy(update={"cursor": first_page.next_cursor}))
+    assert [review.comment for review in second_page.items] == ["second jun"]
+    assert second_page.next_cursor is None
+
+    with pytest.raises(InvalidParamInputError):
+        orm_review_repository.find_all(QueryParam(user_id="jun", limit=101))
+    with pytest.raises(InvalidParamInputError):
+        orm_review_repository.find_all(QueryParam(user_id="jun", cursor="invalid"))
 
 
 def test_find_by_review_id(orm_review_repository):
@@ -0,0 +1,35 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+from shared_kernel.application.async_service import AsyncApplicationService, build_service_executor
+
+request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+class EchoApplicationService:
+    def echo(self, message: str, suffix: str = "") -> dict:
+        return {
+            "message": message + suffix,
+            "thread_name": threading.current_thread().name,
+            "request_id": request_id.get(),
+        }
+
+
+def test_async_application_service():
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="application-service")
+    async_application_service = AsyncApplicationService(EchoApplicationService(), executor=executor)
+
+    async def call():
+        request_id.set("request-1")
+        return await async_application_service.echo("hello", suffix="!")
+
+    actual = asyncio.run(call())
+    assert actual["message"] == "hello!"
+    assert actual["thread_name"].startswith("application-service")
+    assert actual["request_id"] == "request-1"
+
+
+def test_build_service_executor():
+    assert build_service_executor(max_workers=40)._max_workers == 40
@@ -0,0 +1,76 @@
+import copy
+import pickle
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from drinks.domain.entities import Drink
+from drinks.domain.value_objects import DrinkType
+from shared_kernel.domain.value_objects import DrinkId, ReviewId, UserId, UserName
+from users.domain.entities import User
+from wishes.domain.value_objects import WishId
+
+
+def test_uuid_id():
+    drink_id = DrinkId.build(drink_name="Cass", created_at=1234)
+
+    assert DrinkId.from_str(str(drink_id)) == drink_id
+    assert DrinkId(value=str(drink_id)) == drink_id
+    assert drink_id.uuid == uuid.uuid5(uuid.NAMESPACE_DNS, name="Cass1234")
+    assert drink_id.value == drink_id.uuid
+    # 문자열은 한 번만 만든다.
+    assert str(drink_id) is str(drink_id)
+    assert repr(drink_id) == f"DrinkId(value={drink_id.uuid!r})"
+
+    with pytest.raises(ValueError):
+        DrinkId.from_str("not a uuid")
+
+
+def test_hash_and_equality():
+    drink_id = DrinkId.build(drink_name="Cass", created_at=1234)
+
+    assert {drink_id, DrinkId(value=drink_id.uuid)} == {drink_id}
+    assert {UserId(value="heumsi"): 1}[UserId(value="heumsi")] == 1
+    # 값이 같아도 타입이 다르면 다른 id 다.
+    assert ReviewId(value=drink_id.uuid) != drink_id
+    assert WishId(value=drink_id.uuid) != ReviewId(value=drink_id.uuid)
+    assert drink_id != str(drink_id)
+
+
+def test_immutable():
+    user_id = UserId(value="heumsi")
+    with pytest.raises(AttributeError):
+        user_id.value = "joon"
+    with pytest.raises(AttributeError):
+        user_id.extra = 1
+
+    drink_id = DrinkId.build(drink_name="Cass", created_at=1234)
+    assert copy.deepcopy(drink_id) is drink_id
+    assert pickle.loads(pickle.dumps(drink_id)) == drink_id
+
+
+def test_str_id_length():
+    assert str(UserName()) == ""
+    with pytest.raises(ValueError):
+        UserId(value="")
+    with pytest.raises(ValueError):
+        UserId(value="a" * 31)
+    with pytest.raises(TypeError):
+        UserId(value=1)
+
+
+def test_pydantic_field():
+    drink_id = DrinkId.build(drink_name="Cass", created_at=1234)
+    drink = Drink(id=drink_id, name="Cass", image_url="", type=DrinkType.BEER)
+    assert drink.id is drink_id
+
+    # JSON 에는 문자열로 쓰고, 다시 읽을 때 id 로 바꾼다.
+    raw = drink.json()
+    assert f'"id": "{drink_id}"' in raw
+    assert Drink.parse_raw(raw) == drink
+    # 예전 형식({"value": ...})으로 캐시된 값도 읽는다.
+    assert Drink.parse_raw(raw.replace(f'"{drink_id}"', f'{{"value": "{drink_id}"}}')) == drink
+
+    with pytest.raises(ValidationError):
+        User(id=UserId(value="heumsi"), name="a" * 31, password="hashed")
@@ -0,0 +1,27 @@
+import pytest
+
+from shared_kernel.external_interface.conditional_get import build_not_modified_response, is_not_modified
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+        ("abc", False),
+    ],
+)
+def test_is_not_modified(if_none_match, expected):
+    assert is_not_modified(if_none_match, '"abc"') is expected
+
+
+def test_build_not_modified_response():
+    response = build_not_modified_response('"abc"')
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == '"abc"'
+    assert response.headers["Cache-Control"] == "public, no-cache"
@@ -0,0 +1,29 @@
+from unittest import mock
+
+from fastapi.responses import ORJSONResponse
+
+
+def test_not_found_is_rendered_by_orjson(client):
+    with mock.patch.object(ORJSONResponse, "render", autospec=True, side_effect=ORJSONResponse.render) as render:
+        response = client.get("/not-exists")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Not Found"}
+    render.assert_called_once()
+
+
+def test_validation_error_is_rendered_by_orjson(client):
+    with mock.patch.object(ORJSONResponse, "render", autospec=True, side_effect=ORJSONResponse.render) as render:
+        response = client.get("/drinks", params={"limit": "many"})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "limit"]
+    render.assert_called_once()
+
+
+def test_router_return_value_is_rendered_by_orjson(client):
+    with mock.patch.object(ORJSONResponse, "render", autospec=True, side_effect=ORJSONResponse.render) as render:
+        response = client.get("/health")
+
+    assert response.status_code == 200
+    render.assert_called_once()
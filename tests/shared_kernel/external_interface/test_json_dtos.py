@@ -0,0 +1,27 @@
+import orjson
+from fastapi.responses import ORJSONResponse
+
+from shared_kernel.application.dtos import FailedOutputDto, RowsOutputDto
+from shared_kernel.domain.pagination import RowPage
+from shared_kernel.external_interface.json_dtos import FailedJsonResponse, RowsJsonResponse
+
+
+def test_failed_json_response():
+    response = FailedJsonResponse.build_by_output_dto(FailedOutputDto.build_resource_not_found_error("없는 술"))
+    assert isinstance(response, ORJSONResponse)
+    assert response.status_code == 404
+    assert orjson.loads(response.body) == {"error_type": "Resource Not Found Error", "message": "없는 술"}
+
+    response = FailedJsonResponse.build_by_output_dto(FailedOutputDto.build_service_unavailable_error())
+    assert isinstance(response, ORJSONResponse)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_rows_json_response():
+    rows = [{"drink_id": "1", "name": "소주", "avg_rating": 4.5}, {"drink_id": "2", "name": "beer", "avg_rating": 0.0}]
+    response = RowsJsonResponse.build_by_output_dto(RowsOutputDto.build(RowPage(items=rows, next_cursor="abc")))
+    assert isinstance(response, ORJSONResponse)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert orjson.loads(response.body) == {"items": rows, "next_cursor": "abc"}
@@ -0,0 +1,105 @@
+import socketserver
+import threading
+import time
+
+import pytest
+
+
+class FakeRespServer(socketserver.ThreadingTCPServer):
+    """
+    RespCacheBackend 테스트용으로 localhost 에 띄우는 Redis 프로토콜 서버.
+    GET, SET(PX, NX), DEL, MGET, SELECT, AUTH, PING 만 지원한다. 그 밖의 명령은 오류로 응답한다.
+    truncate_next_reply 를 켜면 다음 응답을 절반만 보내고 커넥션을 끊는다.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _FakeRespHandler)
+        self.data = {}
+        self.expires_at = {}
+        self.commands = []
+        self.truncate_next_reply = False
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address
+        return f"redis://{host}:{port}/0"
+
+    def execute(self, command):
+        name, args = command[0].upper().decode(), command[1:]
+        with self.lock:
+            self.commands.append(name)
+            for key in [key for key, expires_at in self.expires_at.items() if expires_at <= time.monotonic()]:
+                self.data.pop(key, None)
+                del self.expires_at[key]
+
+            if name == "PING":
+                return ("+", b"PONG")
+            if name in ("SELECT", "AUTH"):
+                return ("+", b"OK")
+            if name == "GET":
+                return self.data.get(args[0])
+            if name == "MGET":
+                return [self.data.get(key) for key in args]
+            if name == "SET":
+                options = [arg.upper() for arg in args[2:]]
+                if b"NX" in options and args[0] in self.data:
+                    return None
+                self.data[args[0]] = args[1]
+                self.expires_at.pop(args[0], None)
+                if b"PX" in options:
+                    self.expires_at[args[0]] = time.monotonic() + int(args[2 + options.index(b"PX") + 1]) / 1000
+                return ("+", b"OK")
+            if name == "DEL":
+                self.expires_at.pop(args[0], None)
+                return 1 if self.data.pop(args[0], None) is not None else 0
+            return ("-", b"ERR unknown command " + name.encode())
+
+
+class _FakeRespHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        while True:
+            command = self._read_command()
+            if command is None:
+                return
+            reply = self._encode(self.server.execute(command))
+            if self.server.truncate_next_reply:
+                self.server.truncate_next_reply = False
+                self.wfile.write(reply[: len(reply) // 2])
+                return
+            self.wfile.write(reply)
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        command = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            command.append(self.rfile.read(length + 2)[:-2])
+        return command
+
+    def _encode(self, reply) -> bytes:
+        if reply is None:
+            return b"$-1\r\n"
+        if isinstance(reply, int):
+            return b":%d\r\n" % reply
+        if isinstance(reply, list):
+            return b"*%d\r\n" % len(reply) + b"".join(self._encode(item) for item in reply)
+        if isinstance(reply, tuple):
+            prefix, message = reply
+            return prefix.encode() + message + b"\r\n"
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+
+
+@pytest.fixture(scope="function")
+def resp_server():
+    server = FakeRespServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,90 @@
+import pytest
+
+from shared_kernel.infra_structure.cache import LruTtlCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_eviction():
+    cache = LruTtlCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    # 가장 오래 쓰이지 않은 b 가 밀려난다.
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiration():
+    clock = FakeClock()
+    cache = LruTtlCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+    actual = cache.stats()
+    expected = {
+        "size": 0,
+        "max_size": 2,
+        "ttl_seconds": 10,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 1,
+        "hit_rate": 0.5,
+    }
+    assert actual == expected
+
+
+def test_ttl_per_entry():
+    clock = FakeClock()
+    cache = LruTtlCache(ttl_seconds=10, clock=clock)
+    cache.set("a", 1, ttl_seconds=1)
+    cache.set("b", 2)
+
+    clock.now = 1
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_set_if_absent():
+    clock = FakeClock()
+    cache = LruTtlCache(ttl_seconds=10, clock=clock)
+    assert cache.set("a", 1, if_absent=True)
+    assert not cache.set("a", 2, if_absent=True)
+    assert cache.get("a") == 1
+
+    # 만료된 항목은 없는 것으로 본다.
+    clock.now = 10
+    assert cache.set("a", 3, if_absent=True)
+    assert cache.get("a") == 3
+
+
+def test_delete_and_clear():
+    cache = LruTtlCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.delete("a")
+    cache.delete("not exist")
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.get("b") is None
+
+    with pytest.raises(ValueError):
+        cache.set("a", None)
+    with pytest.raises(ValueError):
+        LruTtlCache(max_size=0)
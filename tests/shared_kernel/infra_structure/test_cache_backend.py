@@ -0,0 +1,118 @@
+import socket
+
+import pytest
+
+from shared_kernel.infra_structure.cache_backend import InProcessCacheBackend, RespCacheBackend
+from shared_kernel.infra_structure.exceptions import CacheBackendError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(scope="function", params=["memory", "resp"])
+def cache_backend(request):
+    if request.param == "memory":
+        yield InProcessCacheBackend(max_size=100)
+        return
+    resp_server = request.getfixturevalue("resp_server")
+    cache_backend = RespCacheBackend(url=resp_server.url, key_prefix="test:")
+    yield cache_backend
+    cache_backend.close()
+
+
+def test_get_set_delete(cache_backend):
+    assert cache_backend.get("a") is None
+    cache_backend.set("a", b"1")
+    cache_backend.set("b", b"\r\n-binary")
+    assert cache_backend.get("a") == b"1"
+    assert cache_backend.get("b") == b"\r\n-binary"
+
+    cache_backend.delete("a")
+    assert cache_backend.get("a") is None
+    assert cache_backend.stats()["hits"] == 2
+
+
+def test_set_if_absent(cache_backend):
+    assert cache_backend.set_if_absent("a", b"1", ttl_seconds=10)
+    assert not cache_backend.set_if_absent("a", b"2")
+    assert cache_backend.get("a") == b"1"
+
+    cache_backend.delete("a")
+    assert cache_backend.set_if_absent("a", b"3")
+    assert cache_backend.get("a") == b"3"
+
+
+def test_mget(cache_backend):
+    cache_backend.set("a", b"1")
+    cache_backend.set("c", b"3")
+    assert cache_backend.mget(["a", "b", "c"]) == [b"1", None, b"3"]
+    assert cache_backend.mget([]) == []
+
+
+def test_in_process_ttl():
+    clock = FakeClock()
+    cache_backend = InProcessCacheBackend(clock=clock)
+    cache_backend.set("a", b"1", ttl_seconds=10)
+    cache_backend.set("b", b"2")
+
+    clock.now = 10
+    assert cache_backend.get("a") is None
+    assert cache_backend.get("b") == b"2"
+
+
+def test_resp_ttl_and_key_prefix(resp_server):
+    cache_backend = RespCacheBackend(url=resp_server.url, key_prefix="test:")
+    cache_backend.set("a", b"1", ttl_seconds=10)
+    cache_backend.set_if_absent("b", b"2", ttl_seconds=0.0001)
+    cache_backend.set("c", b"3")
+
+    assert set(resp_server.data) == {b"test:a", b"test:b", b"test:c"}
+    assert set(resp_server.expires_at) == {b"test:a", b"test:b"}
+
+
+def test_resp_reuses_connections(resp_server):
+    cache_backend = RespCacheBackend(url=resp_server.url.replace("/0", "/2"), pool_size=1)
+    for _ in range(3):
+        cache_backend.get("a")
+    # 커넥션을 한 번만 열었으므로 SELECT 도 한 번만 보낸다.
+    assert [command for command in resp_server.commands if command != "CLIENT"] == ["SELECT", "GET", "GET", "GET"]
+
+
+def test_resp_auth_from_url(resp_server):
+    host, port = resp_server.server_address
+    cache_backend = RespCacheBackend(url=f"redis://:secret@{host}:{port}/1")
+    cache_backend.set("a", b"1")
+    assert [command for command in resp_server.commands if command != "CLIENT"] == ["AUTH", "SELECT", "SET"]
+
+
+def test_resp_reconnects_after_partial_reply(resp_server):
+    cache_backend = RespCacheBackend(url=resp_server.url, pool_size=1)
+    cache_backend.set("a", b"a-long-enough-value")
+
+    # 응답을 읽다 끊긴 커넥션은 버리므로, 다음 명령이 앞 응답의 나머지를 읽지 않는다.
+    resp_server.truncate_next_reply = True
+    with pytest.raises(CacheBackendError):
+        cache_backend.get("a")
+    assert cache_backend.get("a") == b"a-long-enough-value"
+    assert cache_backend.mget(["a", "b"]) == [b"a-long-enough-value", None]
+
+
+def test_resp_unavailable():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        host, port = sock.getsockname()
+    cache_backend = RespCacheBackend(url=f"redis://{host}:{port}/0")
+
+    with pytest.raises(CacheBackendError):
+        cache_backend.get("a")
+    assert cache_backend.stats()["errors"] == 1
+
+
+def test_invalid_url():
+    with pytest.raises(ValueError):
+        RespCacheBackend(url="http://localhost:6379")
@@ -0,0 +1,136 @@
+import os
+
+import pytest
+from sqlalchemy import column, exc, insert, table, text
+
+from shared_kernel.infra_structure.database import Database, begin_request_primary_pin, pin_request_to_primary
+
+
+@pytest.fixture(scope="function")
+def small_pool_database():
+    return Database(db_url=os.environ["TEST_DB_URL"], pool_size=1, max_overflow=0, pool_timeout=0.1)
+
+
+def test_pool_status(small_pool_database):
+    with small_pool_database.session() as session:
+        session.execute("SELECT 1")
+        actual = small_pool_database.pool_status()
+        assert actual["pool_size"] == 1
+        assert actual["checked_out"] == 1
+        assert actual["overflow"] == 0
+
+    actual = small_pool_database.pool_status()
+    assert actual["checked_out"] == 0
+    assert actual["checked_in"] == 1
+    assert actual["num_of_checkouts"] == 1
+    assert actual["num_of_timeouts"] == 0
+    assert actual["checkout_latency_ms"]["+Inf"] == 1
+
+
+def test_pool_status_timeout(small_pool_database):
+    connection = small_pool_database._engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        small_pool_database._engine.connect()
+    connection.close()
+
+    actual = small_pool_database.pool_status()
+    assert actual["num_of_checkouts"] == 2
+    assert actual["num_of_timeouts"] == 1
+    assert actual["max_wait_ms"] >= 100
+
+
+@pytest.fixture(scope="function")
+def sqlite_urls(tmp_path):
+    # replica 역할을 하는 서로 다른 SQLite 파일
+    return [f"sqlite:///{tmp_path / name}.db" for name in ("primary", "replica1", "replica2")]
+
+
+def _database_name(session) -> str:
+    return session.get_bind().url.database.rsplit("/", 1)[-1]
+
+
+def test_read_session_without_replicas(sqlite_urls):
+    database = Database(db_url=sqlite_urls[0])
+    with database.read_session() as session:
+        assert _database_name(session) == "primary.db"
+
+
+def test_read_session_round_robin(sqlite_urls):
+    database = Database(db_url=sqlite_urls[0], replica_urls=sqlite_urls[1:])
+
+    actual = []
+    for _ in range(4):
+        with database.read_session() as session:
+            actual.append(_database_name(session))
+    assert actual == ["replica1.db", "replica2.db", "replica1.db", "replica2.db"]
+
+    with database.session() as session:
+        assert _database_name(session) == "primary.db"
+
+
+def test_read_session_least_busy(sqlite_urls):
+    database = Database(db_url=sqlite_urls[0], replica_urls=sqlite_urls[1:], replica_routing=Database.LEAST_BUSY)
+
+    with database.read_session() as busy_session:
+        busy_session.execute("SELECT 1")
+        assert _database_name(busy_session) == "replica1.db"
+
+        with database.read_session() as session:
+            assert _database_name(session) == "replica2.db"
+
+
+def test_read_session_pinned_to_primary_after_write(sqlite_urls):
+    database = Database(db_url=sqlite_urls[0], replica_urls=sqlite_urls[1:])
+    begin_request_primary_pin()
+
+    with database.session() as session:
+        session.execute("CREATE TABLE item (id INTEGER PRIMARY KEY)")
+        session.execute(text("SELECT 1"))
+    with database.read_session() as session:
+        assert _database_name(session) == "replica1.db"
+
+    with database.session() as session:
+        session.execute(insert(table("item", column("id"))).values(id=1))
+        session.commit()
+    with database.read_session() as session:
+        assert _database_name(session) == "primary.db"
+
+    begin_request_primary_pin()
+    with database.read_session() as session:
+        assert _database_name(session) == "replica2.db"
+
+
+def test_read_session_pinned_to_primary_by_request(sqlite_urls):
+    database = Database(db_url=sqlite_urls[0], replica_urls=sqlite_urls[1:])
+    begin_request_primary_pin()
+
+    pin_request_to_primary()
+    with database.read_session() as session:
+        assert _database_name(session) == "primary.db"
+
+    begin_request_primary_pin()
+    with database.read_session() as session:
+        assert _database_name(session) == "replica1.db"
+
+
+def test_read_session_not_pinned(sqlite_urls):
+    database = Database(db_url=sqlite_urls[0], replica_urls=sqlite_urls[1:], pin_primary_after_write=False)
+    begin_request_primary_pin()
+
+    with database.session() as session:
+        session.execute("CREATE TABLE item (id INTEGER PRIMARY KEY)")
+        session.execute(insert(table("item", column("id"))).values(id=1))
+        session.commit()
+    with database.read_session() as session:
+        assert _database_name(session) == "replica1.db"
+
+
+def test_warm_up_fills_pool():
+    database = Database(db_url=os.environ["TEST_DB_URL"], pool_size=3, max_overflow=0)
+    assert database.warm_up() == 3
+    assert database.pool_status()["checked_in"] == 3
+    assert database.pool_status()["checked_out"] == 0
+
+    # 이미 채워진 풀은 다시 열지 않는다.
+    assert database.warm_up() == 0
+    assert database.pool_status()["checked_in"] == 3
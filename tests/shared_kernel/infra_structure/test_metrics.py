@@ -0,0 +1,18 @@
+from shared_kernel.infra_structure.metrics import LatencyHistogram
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(buckets_ms=(1, 10, 100))
+    histogram.observe(0.0005)
+    histogram.observe(0.005)
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+
+    actual = histogram.snapshot()
+    expected = {
+        "count": 4,
+        "sum_ms": 555.5,
+        "max_ms": 500.0,
+        "buckets": {"1": 1, "10": 2, "100": 3, "+Inf": 4},
+    }
+    assert actual == expected
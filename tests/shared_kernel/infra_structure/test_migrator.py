@@ -0,0 +1,76 @@
+import sys
+import textwrap
+
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from shared_kernel.infra_structure.migrator import Migrator
+
+
+@pytest.fixture(scope="function")
+def migrations_package(tmp_path, monkeypatch):
+    package = tmp_path / "sample_migrations"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "v0001_create_item.py").write_text(textwrap.dedent("""
+            def upgrade(connection):
+                connection.execute("CREATE TABLE item (id INTEGER PRIMARY KEY)")
+            """))
+    (package / "v0002_add_name.py").write_text(textwrap.dedent("""
+            def upgrade(connection):
+                connection.execute("ALTER TABLE item ADD COLUMN name VARCHAR(30)")
+            """))
+    (package / "helpers.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in [name for name in sys.modules if name.startswith("sample_migrations")]:
+        del sys.modules[name]
+
+
+@pytest.fixture(scope="function")
+def engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'migrator.db'}")
+
+
+def test_upgrade(migrations_package, engine):
+    migrator = Migrator(engine, package="sample_migrations")
+    assert migrator.current_version() == 0
+    assert [migration.version for migration in migrator.pending()] == [1, 2]
+
+    actual = migrator.upgrade()
+    assert [(migration.version, migration.name) for migration in actual] == [(1, "create_item"), (2, "add_name")]
+    assert migrator.current_version() == 2
+    assert [column["name"] for column in inspect(engine).get_columns("item")] == ["id", "name"]
+
+    assert migrator.upgrade() == []
+
+
+def test_upgrade_only_pending(migrations_package, engine):
+    migrator = Migrator(engine, package="sample_migrations")
+    migrator.upgrade()
+
+    (migrations_package / "v0003_add_price.py").write_text(textwrap.dedent("""
+            def upgrade(connection):
+                connection.execute("ALTER TABLE item ADD COLUMN price INTEGER")
+            """))
+    actual = migrator.upgrade()
+    assert [migration.version for migration in actual] == [3]
+    assert migrator.current_version() == 3
+
+
+def test_upgrade_failed(migrations_package, engine):
+    (migrations_package / "v0003_broken.py").write_text(textwrap.dedent("""
+            def upgrade(connection):
+                connection.execute("ALTER TABLE unknown ADD COLUMN price INTEGER")
+            """))
+    migrator = Migrator(engine, package="sample_migrations")
+    with pytest.raises(Exception):
+        migrator.upgrade()
+    assert migrator.current_version() == 2
+    assert [migration.version for migration in migrator.pending()] == [3]
+
+
+def test_duplicated_version(migrations_package, engine):
+    (migrations_package / "v0002_duplicated.py").write_text("def upgrade(connection):\n    pass\n")
+    with pytest.raises(ValueError):
+        Migrator(engine, package="sample_migrations").migrations()
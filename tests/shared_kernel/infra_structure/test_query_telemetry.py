@@ -0,0 +1,55 @@
+import json
+import logging
+import os
+
+import pytest
+from sqlalchemy import create_engine
+
+from shared_kernel.infra_structure.query_telemetry import QueryTelemetry, begin_request_query_stats
+
+
+@pytest.fixture(scope="function")
+def engine():
+    return create_engine(os.environ["TEST_DB_URL"])
+
+
+def test_request_query_stats(engine):
+    query_telemetry = QueryTelemetry()
+    query_telemetry.instrument(engine)
+
+    query_stats = begin_request_query_stats()
+    engine.execute("SELECT 1")
+    engine.execute("SELECT 2")
+
+    assert query_stats.num_of_queries == 2
+    assert query_stats.total_ms > 0
+    assert query_telemetry.snapshot()["latency_ms"]["count"] == 2
+
+
+def test_slow_query_log(engine, caplog):
+    query_telemetry = QueryTelemetry(slow_query_threshold_ms=0)
+    query_telemetry.instrument(engine)
+
+    with caplog.at_level(logging.INFO, logger="shared_kernel.infra_structure.query_telemetry"):
+        engine.execute("SELECT 1")
+
+    actual = json.loads(caplog.records[-1].message)
+    assert actual["event"] == "slow_query"
+    assert actual["statement"] == "SELECT 1"
+    assert query_telemetry.snapshot()["num_of_slow_queries"] == 1
+
+
+def test_sampled_query_log(engine, caplog):
+    query_telemetry = QueryTelemetry(slow_query_threshold_ms=10000, log_sample_rate=0)
+    query_telemetry.instrument(engine)
+
+    with caplog.at_level(logging.INFO, logger="shared_kernel.infra_structure.query_telemetry"):
+        engine.execute("SELECT 1")
+    assert caplog.records == []
+
+    query_telemetry = QueryTelemetry(slow_query_threshold_ms=10000, log_sample_rate=1)
+    query_telemetry.instrument(engine)
+
+    with caplog.at_level(logging.INFO, logger="shared_kernel.infra_structure.query_telemetry"):
+        engine.execute("SELECT 1")
+    assert json.loads(caplog.records[-1].message)["event"] == "sampled_query"
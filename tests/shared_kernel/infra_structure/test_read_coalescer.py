@@ -0,0 +1,234 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from shared_kernel.domain.exceptions import ResourceNotFoundError
+from shared_kernel.infra_structure.read_coalescer import ReadCoalescer
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_concurrent_reads_share_one_load():
+    read_coalescer = ReadCoalescer(ttl_seconds=0, after_commit=lambda _: False)
+    started, release = threading.Event(), threading.Event()
+    num_of_loads = 0
+
+    def load():
+        nonlocal num_of_loads
+        num_of_loads += 1
+        started.set()
+        release.wait(timeout=5)
+        return ["beer"]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(read_coalescer.get, "beer", load)
+        started.wait(timeout=5)
+        followers = [executor.submit(read_coalescer.get, "beer", load) for _ in range(7)]
+        while read_coalescer.stats()["coalesced"] < 7:
+            time.sleep(0.001)
+        release.set()
+        results = [leader.result(timeout=5)] + [follower.result(timeout=5) for follower in followers]
+
+    assert results == [["beer"]] * 8
+    assert num_of_loads == 1
+    assert read_coalescer.stats()["loads"] == 1
+
+
+def test_error_is_shared_and_not_cached():
+    read_coalescer = ReadCoalescer(ttl_seconds=10, after_commit=lambda _: False)
+
+    def load():
+        raise ValueError("db down")
+
+    with pytest.raises(ValueError):
+        read_coalescer.get("beer", load)
+    assert read_coalescer.get("beer", lambda: "ok") == "ok"
+
+
+def test_result_is_kept_until_ttl():
+    clock = FakeClock()
+    # random 이 0 이면 미리 다시 읽지 않는다.
+    read_coalescer = ReadCoalescer(ttl_seconds=1, clock=clock, random_value=lambda: 0.0, after_commit=lambda _: False)
+    assert read_coalescer.get("beer", lambda: 1) == 1
+
+    clock.now = 0.9
+    assert read_coalescer.get("beer", lambda: 2) == 1
+    clock.now = 1
+    assert read_coalescer.get("beer", lambda: 3) == 3
+    assert read_coalescer.stats()["hits"] == 1
+
+
+def test_early_refresh():
+    clock = FakeClock()
+    random_value = 0.0
+
+    def load():
+        # 다시 읽는 데 0.1 초가 걸린다.
+        clock.now += 0.1
+        return clock.now
+
+    read_coalescer = ReadCoalescer(
+        ttl_seconds=1, clock=clock, random_value=lambda: random_value, after_commit=lambda _: False
+    )
+    first = read_coalescer.get("beer", load)
+
+    # 만료 0.5 초 전: -0.1 * log(1 - 0.99) = 0.46 이므로 아직 미리 읽지 않는다.
+    clock.now = first + 0.5
+    random_value = 0.99
+    assert read_coalescer.get("beer", load) == first
+
+    # 만료 0.2 초 전에는 같은 확률값으로 미리 다시 읽는다.
+    clock.now = first + 0.8
+    assert read_coalescer.get("beer", load) != first
+    assert read_coalescer.stats()["early_refreshes"] == 1
+
+
+def test_invalidate():
+    callbacks = []
+    read_coalescer = ReadCoalescer(ttl_seconds=10, after_commit=lambda callback: callbacks.append(callback) or True)
+    read_coalescer.get("beer", lambda: 1)
+
+    read_coalescer.invalidate()
+    assert read_coalescer.get("beer", lambda: 2) == 2
+
+    # commit 되기 전에 다시 담긴 값도 commit 뒤에 버린다.
+    callbacks.pop()()
+    assert read_coalescer.get("beer", lambda: 3) == 3
+
+
+def test_load_racing_with_invalidate_is_not_kept():
+    read_coalescer = ReadCoalescer(ttl_seconds=10, after_commit=lambda _: False)
+
+    def load_then_concurrent_write():
+        read_coalescer.invalidate()
+        return 1
+
+    assert read_coalescer.get("beer", load_then_concurrent_write) == 1
+    assert read_coalescer.get("beer", lambda: 2) == 2
+
+
+class ManualBackground:
+    def __init__(self) -> None:
+        self.refreshes = []
+
+    def __call__(self, refresh) -> None:
+        self.refreshes.append(refresh)
+
+    def run_all(self) -> None:
+        while self.refreshes:
+            self.refreshes.pop(0)()
+
+
+def test_stale_while_revalidate():
+    clock, background = FakeClock(), ManualBackground()
+    read_coalescer = ReadCoalescer(
+        ttl_seconds=1,
+        stale_while_revalidate_seconds=5,
+        clock=clock,
+        random_value=lambda: 0.0,
+        run_in_background=background,
+        after_commit=lambda _: False,
+    )
+    assert read_coalescer.get_with_staleness("beer", lambda: 1) == (1, None)
+
+    # 만료 뒤에는 기다리지 않고 예전 값으로 응답하며, 다시 읽기는 한 번만 시작한다.
+    clock.now = 3
+    assert read_coalescer.get_with_staleness("beer", lambda: 2) == (1, 3)
+    assert read_coalescer.get_with_staleness("beer", lambda: 2) == (1, 3)
+    assert len(background.refreshes) == 1
+
+    background.run_all()
+    assert read_coalescer.get_with_staleness("beer", lambda: 3) == (2, None)
+    assert read_coalescer.stats()["stale_hits"] == 2
+    assert read_coalescer.stats()["background_refreshes"] == 1
+
+    # 창이 지나면 다시 기다려서 읽는다.
+    clock.now = 10
+    assert read_coalescer.get_with_staleness("beer", lambda: 4) == (4, None)
+
+
+def test_stale_while_revalidate_is_not_used_after_write():
+    clock, background = FakeClock(), ManualBackground()
+    read_coalescer = ReadCoalescer(
+        ttl_seconds=1,
+        stale_while_revalidate_seconds=5,
+        stale_if_error_seconds=5,
+        clock=clock,
+        run_in_background=background,
+        after_commit=lambda _: False,
+    )
+    read_coalescer.get("beer", lambda: 1)
+
+    clock.now = 2
+    read_coalescer.invalidate()
+    assert read_coalescer.get_with_staleness("beer", lambda: 2) == (2, None)
+    assert background.refreshes == []
+
+
+def test_stale_if_error():
+    clock, background = FakeClock(), ManualBackground()
+    read_coalescer = ReadCoalescer(
+        ttl_seconds=1,
+        stale_if_error_seconds=10,
+        clock=clock,
+        random_value=lambda: 0.0,
+        run_in_background=background,
+        after_commit=lambda _: False,
+    )
+    read_coalescer.get("beer", lambda: 1)
+
+    def load():
+        raise ConnectionError("db down")
+
+    clock.now = 2
+    assert read_coalescer.get_with_staleness("beer", load) == (1, 2)
+    # 실패한 뒤에는 DB 를 기다리지 않고 예전 값으로 응답하면서 뒤에서 다시 읽는다.
+    clock.now = 3
+    assert read_coalescer.get_with_staleness("beer", load) == (1, 3)
+    assert len(background.refreshes) == 1
+    background.run_all()
+    assert read_coalescer.stats()["stale_on_errors"] == 2
+
+    background.refreshes.clear()
+    read_coalescer.get_with_staleness("beer", lambda: 2)
+    background.run_all()
+    assert read_coalescer.get_with_staleness("beer", lambda: 3) == (2, None)
+
+    # 창이 지난 값으로는 응답하지 않는다.
+    clock.now = 20
+    with pytest.raises(ConnectionError):
+        read_coalescer.get_with_staleness("beer", load)
+
+
+def test_stale_if_error_uses_invalidated_value():
+    clock = FakeClock()
+    read_coalescer = ReadCoalescer(ttl_seconds=10, stale_if_error_seconds=10, clock=clock, after_commit=lambda _: False)
+    read_coalescer.get("beer", lambda: 1)
+    read_coalescer.invalidate()
+
+    def load():
+        raise ConnectionError("db down")
+
+    clock.now = 1
+    assert read_coalescer.get_with_staleness("beer", load) == (1, 1)
+
+
+def test_stale_if_error_does_not_hide_client_errors():
+    clock = FakeClock()
+    read_coalescer = ReadCoalescer(ttl_seconds=1, stale_if_error_seconds=10, clock=clock, after_commit=lambda _: False)
+    read_coalescer.get("beer", lambda: 1)
+
+    def load():
+        raise ResourceNotFoundError("beer")
+
+    clock.now = 2
+    with pytest.raises(ResourceNotFoundError):
+        read_coalescer.get_with_staleness("beer", load)
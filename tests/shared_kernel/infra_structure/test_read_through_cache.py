@@ -0,0 +1,186 @@
+from unittest import mock
+
+import pytest
+from pydantic import BaseModel
+
+from shared_kernel.domain.exceptions import ResourceNotFoundError
+from shared_kernel.infra_structure.cache_backend import CacheBackend, InProcessCacheBackend
+from shared_kernel.infra_structure.exceptions import CacheBackendError
+from shared_kernel.infra_structure.read_through_cache import ReadThroughCache
+
+
+class Item(BaseModel):
+    name: str
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_reads_through():
+    clock = FakeClock()
+    cache_backend = InProcessCacheBackend(clock=clock)
+    cache = ReadThroughCache(backend=cache_backend, namespace="item", model=Item, after_transaction=lambda _: False)
+    load = mock.Mock(return_value=Item(name="a"))
+
+    assert cache.get("1", load) == Item(name="a")
+    assert cache.get("1", load) == Item(name="a")
+    assert load.call_count == 1
+    assert cache_backend.get("item:1") == b'{"name": "a"}'
+
+    # 무효화된 뒤 tombstone_ttl_seconds 동안은 캐시하지 않고 매번 읽는다.
+    cache.invalidate("1")
+    load.return_value = Item(name="b")
+    assert cache.get("1", load) == Item(name="b")
+    assert cache.get("1", load) == Item(name="b")
+    assert load.call_count == 3
+
+    clock.now = 5
+    assert cache.get("1", load) == Item(name="b")
+    assert cache.get("1", load) == Item(name="b")
+    assert load.call_count == 4
+
+
+def test_invalidate_without_tombstone_deletes_value():
+    cache_backend = InProcessCacheBackend()
+    cache = ReadThroughCache(
+        backend=cache_backend, namespace="item", model=Item, tombstone_ttl_seconds=0, after_transaction=lambda _: False
+    )
+    cache.get("1", lambda: Item(name="a"))
+    cache.invalidate("1")
+    assert cache_backend.get("item:1") is None
+
+
+def test_none_is_not_cached():
+    cache = ReadThroughCache(
+        backend=InProcessCacheBackend(), namespace="item", model=Item, after_transaction=lambda _: False
+    )
+    load = mock.Mock(return_value=None)
+    assert cache.get("1", load) is None
+    assert cache.get("1", load) is None
+    assert load.call_count == 2
+
+
+def test_backend_error_falls_back_to_load():
+    cache_backend = mock.Mock(spec=CacheBackend)
+    cache_backend.get.side_effect = CacheBackendError()
+    cache_backend.set.side_effect = CacheBackendError()
+    cache = ReadThroughCache(backend=cache_backend, namespace="item", model=Item, after_transaction=lambda _: False)
+
+    assert cache.get("1", lambda: Item(name="a")) == Item(name="a")
+    cache.invalidate("1")
+
+
+def test_invalidation_during_set_deletes_value():
+    cache_backend = InProcessCacheBackend()
+    cache = ReadThroughCache(
+        backend=cache_backend, namespace="item", model=Item, tombstone_ttl_seconds=0, after_transaction=lambda _: False
+    )
+    set_if_absent = cache_backend.set_if_absent
+
+    def set_then_concurrent_invalidate(*args, **kwargs):
+        set_if_absent(*args, **kwargs)
+        cache.invalidate("1")
+
+    # 캐시 서버에 쓰는 동안 다른 요청의 무효화가 끼어들면, 방금 쓴 값을 지운다.
+    with mock.patch.object(cache_backend, "set_if_absent", side_effect=set_then_concurrent_invalidate):
+        cache.get("1", lambda: Item(name="a"))
+    assert cache_backend.get("item:1") is None
+
+
+def test_stale_value_from_other_worker_is_not_cached():
+    clock = FakeClock()
+    cache_backend = InProcessCacheBackend(clock=clock)
+    after_commit = []
+    # 같은 CacheBackend 를 쓰는 두 워커. reader 는 writer 의 무효화를 프로세스 안에서 알 수 없다.
+    reader = ReadThroughCache(backend=cache_backend, namespace="item", model=Item, after_transaction=lambda _: False)
+    writer = ReadThroughCache(
+        backend=cache_backend, namespace="item", model=Item, after_transaction=after_commit.append
+    )
+
+    def load_then_concurrent_write():
+        writer.invalidate("1")
+        after_commit.pop()()
+        return Item(name="old")
+
+    # commit 전에 읽은 값은, writer 가 commit 뒤에 남긴 tombstone 때문에 캐시에 들어가지 않는다.
+    assert reader.get("1", load_then_concurrent_write) == Item(name="old")
+    assert reader.get("1", lambda: Item(name="new")) == Item(name="new")
+
+
+def test_stale_value_written_before_commit_is_replaced():
+    clock = FakeClock()
+    cache_backend = InProcessCacheBackend(clock=clock)
+    after_commit = []
+    reader = ReadThroughCache(backend=cache_backend, namespace="item", model=Item, after_transaction=lambda _: False)
+    writer = ReadThroughCache(
+        backend=cache_backend, namespace="item", model=Item, after_transaction=after_commit.append
+    )
+
+    # writer 의 트랜잭션이 tombstone_ttl_seconds 보다 길어, reader 가 commit 전의 값을 캐시에 넣었다.
+    writer.invalidate("1")
+    clock.now = 5
+    assert reader.get("1", lambda: Item(name="old")) == Item(name="old")
+    assert reader.get("1", lambda: Item(name="new")) == Item(name="old")
+
+    # commit 뒤의 tombstone 이 그 값을 덮어쓴다.
+    after_commit.pop()()
+    assert reader.get("1", lambda: Item(name="new")) == Item(name="new")
+
+
+def test_negative_caching():
+    clock = FakeClock()
+    cache = ReadThroughCache(
+        backend=InProcessCacheBackend(clock=clock),
+        namespace="item",
+        model=Item,
+        negative_ttl_seconds=5,
+        after_transaction=lambda _: False,
+    )
+    load = mock.Mock(return_value=None)
+    assert cache.get("1", load) is None
+    assert cache.get("1", load) is None
+    assert load.call_count == 1
+
+    # negative_ttl_seconds 가 지나면 다시 읽는다.
+    clock.now = 5
+    assert cache.get("1", load) is None
+    assert load.call_count == 2
+
+    # add 등으로 무효화되면 바로 다시 읽는다.
+    cache.invalidate("1")
+    load.return_value = Item(name="a")
+    assert cache.get("1", load) == Item(name="a")
+
+
+def test_negative_caching_of_not_found_error():
+    cache = ReadThroughCache(
+        backend=InProcessCacheBackend(),
+        namespace="item",
+        model=Item,
+        negative_ttl_seconds=5,
+        after_transaction=lambda _: False,
+    )
+    load = mock.Mock(side_effect=ResourceNotFoundError("1의 항목을 찾지 못했습니다."))
+    for _ in range(2):
+        with pytest.raises(ResourceNotFoundError, match="1의 항목을 찾지 못했습니다."):
+            cache.get("1", load)
+    assert load.call_count == 1
+
+
+def test_found_values_are_not_cached_without_ttl():
+    cache_backend = InProcessCacheBackend()
+    cache = ReadThroughCache(
+        backend=cache_backend,
+        namespace="item",
+        model=Item,
+        ttl_seconds=0,
+        negative_ttl_seconds=5,
+        after_transaction=lambda _: False,
+    )
+    cache.get("1", lambda: Item(name="a"))
+    assert cache_backend.get("item:1") is None
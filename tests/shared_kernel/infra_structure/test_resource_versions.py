@@ -0,0 +1,143 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from shared_kernel.infra_structure.cache_backend import CacheBackend, InProcessCacheBackend, RespCacheBackend
+from shared_kernel.infra_structure.exceptions import CacheBackendError
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bump_changes_etag():
+    resource_versions = ResourceVersions()
+    etag = resource_versions.etag(ResourceVersions.DRINKS)
+    assert resource_versions.etag(ResourceVersions.DRINKS) == etag
+    assert etag.startswith('"') and etag.endswith('"')
+
+    resource_versions.bump(ResourceVersions.DRINKS)
+    assert resource_versions.etag(ResourceVersions.DRINKS) != etag
+
+
+def test_etag_per_key_and_variant():
+    resource_versions = ResourceVersions()
+    review_etag = resource_versions.etag(ResourceVersions.review("r1"))
+    drinks_etag = resource_versions.etag(ResourceVersions.DRINKS, variant="page=1")
+    assert resource_versions.etag(ResourceVersions.DRINKS, variant="page=2") != drinks_etag
+
+    # 다른 리소스가 바뀌어도 ETag 는 그대로다.
+    resource_versions.bump(ResourceVersions.review("r2"))
+    assert resource_versions.etag(ResourceVersions.review("r1")) == review_etag
+    assert resource_versions.etag(ResourceVersions.DRINKS, variant="page=1") == drinks_etag
+
+
+def test_etag_differs_between_in_process_backends():
+    # 워커마다 따로인 메모리 backend 는 서로의 쓰기를 모르므로, 다른 워커가 만든 ETag 와 맞지 않아야 한다.
+    assert ResourceVersions().etag(ResourceVersions.DRINKS) != ResourceVersions().etag(ResourceVersions.DRINKS)
+
+
+def test_shared_backend_etag_is_same_across_workers(resp_server):
+    clock = FakeClock()
+    workers = [
+        ResourceVersions(cache_backend=RespCacheBackend(url=resp_server.url), validity_seconds=30, clock=clock)
+        for _ in range(2)
+    ]
+    etag = workers[0].etag(ResourceVersions.DRINKS, variant="page=1")
+    assert workers[1].etag(ResourceVersions.DRINKS, variant="page=1") == etag
+
+    # shared backend 는 다른 워커의 쓰기를 바로 보므로 ETag 를 시간으로 바꾸지 않는다.
+    clock.now = 3600
+    assert workers[1].etag(ResourceVersions.DRINKS, variant="page=1") == etag
+
+    workers[0].bump(ResourceVersions.DRINKS)
+    assert workers[1].etag(ResourceVersions.DRINKS, variant="page=1") != etag
+    assert workers[1].recently_bumped(ResourceVersions.DRINKS)
+    assert workers[0].etag(ResourceVersions.DRINKS, variant="page=1") == workers[1].etag(
+        ResourceVersions.DRINKS, variant="page=1"
+    )
+
+
+def test_lost_version_does_not_repeat_etag():
+    cache_backend = InProcessCacheBackend()
+    resource_versions = ResourceVersions(cache_backend=cache_backend)
+    etag = resource_versions.etag(ResourceVersions.DRINKS)
+
+    # 버전이 만료/축출되어도 예전 ETag 로 돌아가 잘못된 304 를 주지 않는다.
+    cache_backend.delete(f"resource_version:{resource_versions._slot(ResourceVersions.DRINKS)}")
+    new_etag = resource_versions.etag(ResourceVersions.DRINKS)
+    assert new_etag != etag
+    assert resource_versions.etag(ResourceVersions.DRINKS) == new_etag
+
+
+def test_etag_without_cache_never_matches():
+    cache_backend = mock.Mock(spec=CacheBackend, shared=True)
+    cache_backend.mget.side_effect = CacheBackendError("down")
+    cache_backend.set.side_effect = CacheBackendError("down")
+    resource_versions = ResourceVersions(cache_backend=cache_backend)
+
+    assert resource_versions.etag(ResourceVersions.DRINKS) != resource_versions.etag(ResourceVersions.DRINKS)
+    # 최근에 쓰였는지 모르므로 primary 에서 읽게 한다.
+    assert resource_versions.recently_bumped(ResourceVersions.DRINKS)
+    resource_versions.bump(ResourceVersions.DRINKS)
+
+
+def test_lookup(resp_server):
+    resource_versions = ResourceVersions(cache_backend=RespCacheBackend(url=resp_server.url))
+    etag, recently_bumped = asyncio.run(resource_versions.lookup(ResourceVersions.DRINKS, variant="page=1"))
+    assert etag == resource_versions.etag(ResourceVersions.DRINKS, variant="page=1")
+    assert not recently_bumped
+
+    resource_versions.bump(ResourceVersions.DRINKS)
+    etag, recently_bumped = asyncio.run(resource_versions.lookup(ResourceVersions.DRINKS, variant="page=1"))
+    assert etag == resource_versions.etag(ResourceVersions.DRINKS, variant="page=1")
+    assert recently_bumped
+
+
+def test_etag_changes_after_validity_seconds():
+    clock = FakeClock()
+    resource_versions = ResourceVersions(validity_seconds=30, clock=clock)
+    etag = resource_versions.etag(ResourceVersions.DRINKS)
+
+    clock.now = 29.9
+    assert resource_versions.etag(ResourceVersions.DRINKS) == etag
+    clock.now = 30
+    assert resource_versions.etag(ResourceVersions.DRINKS) != etag
+
+
+def test_bump_waits_for_commit():
+    callbacks = []
+    resource_versions = ResourceVersions(after_commit=lambda callback: callbacks.append(callback) or True)
+    etag = resource_versions.etag(ResourceVersions.DRINKS)
+
+    resource_versions.bump(ResourceVersions.DRINKS)
+    assert resource_versions.etag(ResourceVersions.DRINKS) == etag
+
+    callbacks.pop()()
+    assert resource_versions.etag(ResourceVersions.DRINKS) != etag
+
+
+def test_invalid_num_of_slots():
+    with pytest.raises(ValueError):
+        ResourceVersions(num_of_slots=0)
+
+
+def test_recently_bumped():
+    clock = FakeClock()
+    resource_versions = ResourceVersions(recent_bump_seconds=5, clock=clock)
+    assert not resource_versions.recently_bumped(ResourceVersions.DRINKS)
+
+    clock.now = 100
+    resource_versions.bump(ResourceVersions.DRINKS)
+    assert resource_versions.recently_bumped(ResourceVersions.DRINKS)
+    assert resource_versions.recently_bumped(ResourceVersions.review("r1"), ResourceVersions.DRINKS)
+    assert not resource_versions.recently_bumped(ResourceVersions.review("r1"))
+
+    clock.now = 105
+    assert not resource_versions.recently_bumped(ResourceVersions.DRINKS)
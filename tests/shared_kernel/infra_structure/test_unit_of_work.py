@@ -0,0 +1,154 @@
+import pytest
+
+from drinks.application.service import DrinkApplicationService
+from drinks.domain.entities import Drink
+from drinks.domain.value_objects import DrinkType
+from drinks.infra_structure.cached_repository import CachedDrinkRepository
+from drinks.infra_structure.orm_models import DrinkOrm
+from drinks.infra_structure.orm_repository import OrmDrinkRepository
+from reviews.application.dtos import CreateReviewInputDto, CreateReviewOutputDto
+from reviews.application.service import ReviewApplicationService
+from reviews.infra_structure.orm_models import ReviewOrm
+from reviews.infra_structure.orm_repository import OrmReviewRepository
+from shared_kernel.application.dtos import FailedOutputDto
+from shared_kernel.domain.value_objects import DrinkId, ReviewId
+from shared_kernel.infra_structure.cache_backend import InProcessCacheBackend
+from shared_kernel.infra_structure.query_telemetry import begin_request_query_stats
+from shared_kernel.infra_structure.unit_of_work import call_after_commit, call_after_transaction
+
+drink_id = DrinkId.build(drink_name="unit_of_work_drink", created_at=1234)
+missing_drink_id = DrinkId.build(drink_name="unit_of_work_missing_drink", created_at=1234)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup(database):
+    with database.session() as session:
+        session.query(ReviewOrm).filter(ReviewOrm.user_id == "uow_user").delete()
+        session.query(DrinkOrm).filter(DrinkOrm.id == drink_id.uuid).delete()
+        session.add(DrinkOrm.from_drink(Drink(id=drink_id, name="uow", image_url="", type=DrinkType.SOJU)))
+    yield
+    with database.session() as session:
+        session.query(ReviewOrm).filter(ReviewOrm.user_id == "uow_user").delete()
+        session.query(DrinkOrm).filter(DrinkOrm.id == drink_id.uuid).delete()
+
+
+@pytest.fixture(scope="function")
+def drink_application_service(database):
+    return DrinkApplicationService(
+        drink_repository=OrmDrinkRepository(session_factory=database.session),
+        unit_of_work_factory=database.unit_of_work,
+    )
+
+
+@pytest.fixture(scope="function")
+def review_application_service(database):
+    return ReviewApplicationService(
+        review_repository=OrmReviewRepository(session_factory=database.session),
+        unit_of_work_factory=database.unit_of_work,
+    )
+
+
+def test_create_review_in_one_transaction(database, review_application_service, drink_application_service):
+    num_of_checkouts = database.pool_status()["num_of_checkouts"]
+    query_stats = begin_request_query_stats()
+
+    actual = review_application_service.create_review(
+        CreateReviewInputDto(user_id="uow_user", drink_id=str(drink_id), rating=4, comment=""),
+        drink_application_service,
+    )
+
+    assert isinstance(actual, CreateReviewOutputDto)
+    assert database.pool_status()["num_of_checkouts"] - num_of_checkouts == 1
+    # review INSERT, drink UPDATE ... RETURNING
+    assert query_stats.num_of_queries == 2
+
+    with database.session() as session:
+        assert session.query(ReviewOrm).get(ReviewId.build(user_id="uow_user", drink_id=str(drink_id)).uuid)
+        drink_orm = session.query(DrinkOrm).get(drink_id.uuid)
+        assert drink_orm.num_of_reviews == 1
+        assert drink_orm.avg_rating == 4
+
+
+def test_create_review_rollback(database, review_application_service, drink_application_service):
+    actual = review_application_service.create_review(
+        CreateReviewInputDto(user_id="uow_user", drink_id=str(missing_drink_id), rating=4, comment=""),
+        drink_application_service,
+    )
+
+    assert isinstance(actual, FailedOutputDto)
+    with database.session() as session:
+        assert session.query(ReviewOrm).filter(ReviewOrm.user_id == "uow_user").count() == 0
+
+
+def test_nested_unit_of_work(database):
+    with database.unit_of_work():
+        with database.session() as outer_session:
+            with database.unit_of_work() as unit_of_work:
+                with database.read_session() as inner_session:
+                    assert inner_session is outer_session
+                    inner_session.query(DrinkOrm).get(drink_id.uuid).num_of_wish = 10
+                    inner_session.flush()
+                unit_of_work.rollback()
+
+    with database.session() as session:
+        assert session.query(DrinkOrm).get(drink_id.uuid).num_of_wish == 0
+
+
+def test_unit_of_work_rollback_on_error(database):
+    with pytest.raises(ValueError):
+        with database.unit_of_work():
+            with database.session() as session:
+                session.query(DrinkOrm).get(drink_id.uuid).num_of_wish = 10
+                session.flush()
+            raise ValueError()
+
+    with database.session() as session:
+        assert session.query(DrinkOrm).get(drink_id.uuid).num_of_wish == 0
+
+
+def test_call_after_transaction(database):
+    called = []
+    assert call_after_transaction(lambda: called.append("no transaction")) is False
+
+    with database.unit_of_work():
+        with database.unit_of_work():
+            assert call_after_transaction(lambda: called.append("inner"))
+        assert called == []
+    assert called == ["inner"]
+
+    with pytest.raises(ValueError):
+        with database.unit_of_work():
+            call_after_transaction(lambda: called.append("rollback"))
+            raise ValueError()
+    assert called == ["inner", "rollback"]
+
+
+def test_call_after_commit(database):
+    called = []
+    assert call_after_commit(lambda: called.append("no transaction")) is False
+
+    with database.unit_of_work():
+        assert call_after_commit(lambda: called.append("commit"))
+    assert called == ["commit"]
+
+    with database.unit_of_work() as unit_of_work:
+        call_after_commit(lambda: called.append("rollback"))
+        unit_of_work.rollback()
+    assert called == ["commit"]
+
+
+def test_cached_drink_repository_rollback(database):
+    cached_drink_repository = CachedDrinkRepository(
+        drink_repository=OrmDrinkRepository(session_factory=database.session), cache_backend=InProcessCacheBackend()
+    )
+    assert cached_drink_repository.find_by_drink_id(drink_id).num_of_wish == 0
+
+    with database.unit_of_work() as unit_of_work:
+        cached_drink_repository.add_wish(drink_id)
+        assert cached_drink_repository.find_by_drink_id(drink_id).num_of_wish == 1
+        unit_of_work.rollback()
+    assert cached_drink_repository.find_by_drink_id(drink_id).num_of_wish == 0
+
+    with database.unit_of_work():
+        cached_drink_repository.add_wish(drink_id)
+    assert cached_drink_repository.find_by_drink_id(drink_id).num_of_wish == 1
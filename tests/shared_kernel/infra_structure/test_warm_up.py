@@ -0,0 +1,53 @@
+import threading
+
+from shared_kernel.infra_structure.warm_up import WarmUp
+
+
+def test_ready_without_steps():
+    warm_up = WarmUp()
+    warm_up.start()
+    assert warm_up.is_ready()
+    assert warm_up.status() == {"ready": True, "steps": {}}
+
+
+def test_not_ready_until_steps_finish():
+    called = []
+    release = threading.Event()
+
+    def slow_step():
+        release.wait(5)
+        called.append("slow")
+
+    warm_up = WarmUp()
+    warm_up.add_step("slow", slow_step)
+    warm_up.add_step("fast", lambda: called.append("fast"))
+    assert not warm_up.is_ready()
+
+    warm_up.start()
+    assert not warm_up.wait(0.05)
+    assert warm_up.status()["ready"] is False
+    assert warm_up.status()["steps"]["fast"]["status"] == WarmUp.PENDING
+
+    release.set()
+    assert warm_up.wait(5)
+    assert called == ["slow", "fast"]
+    assert {name: step["status"] for name, step in warm_up.status()["steps"].items()} == {
+        "slow": WarmUp.DONE,
+        "fast": WarmUp.DONE,
+    }
+
+
+def test_failed_step_does_not_block_readiness():
+    def fail():
+        raise ConnectionError("db is down")
+
+    called = []
+    warm_up = WarmUp()
+    warm_up.add_step("fail", fail)
+    warm_up.add_step("next", lambda: called.append("next"))
+    warm_up.run()
+
+    assert warm_up.is_ready()
+    assert called == ["next"]
+    assert warm_up.status()["steps"]["fail"]["status"] == WarmUp.FAILED
+    assert warm_up.status()["steps"]["fail"]["elapsed_ms"] is not None
@@ -3,7 +3,7 @@ from unittest import mock
 import pytest
 
 from shared_kernel.application.dtos import FailedOutputDto
-from shared_kernel.domain.exceptions import ResourceNotFoundError, ResourceAlreadyExistError
+from shared_kernel.domain.exceptions import ResourceNotFoundError, ResourceAlreadyExistError, ServiceUnavailableError
 from shared_kernel.domain.value_objects import UserId, UserName
 from users.application.dtos import (
     CreateUserInputDto,
@@ -19,6 +19,7 @@ from users.application.dtos import (
 )
 from users.application.service import UserApplicationService
 from users.domain.entities import User
+from users.domain.password_hasher import PasswordHasher
 from users.domain.repository import UserRepository
 
 user_data = [("heumsi", "heumsi", "1234")]
@@ -121,10 +122,8 @@ def test_delete_user_fail(user_repository_mock, user_id, user_name, password):
 
 @pytest.mark.parametrize("user_id, user_name, password", user_data)
 def test_login_success(user_repository_mock, user_id, user_name, password):
-    user_repository_mock.find_by_user_id.return_value = User(
-        id=UserId(value=user_id),
-        name=UserName(value=user_name),
-        password="$2b$12$.fqrWFYdw.HLyHFfApiAx.NpOoTD6NcxJNWq5PWf7fu2cG5nheutG",
+    user_repository_mock.find_password_by_user_id.return_value = (
+        "$2b$12$.fqrWFYdw.HLyHFfApiAx.NpOoTD6NcxJNWq5PWf7fu2cG5nheutG"
     )
     user_application_service = UserApplicationService(user_repository=user_repository_mock)
 
@@ -136,22 +135,24 @@ def test_login_success(user_repository_mock, user_id, user_name, password):
 
 def test_login_fail_with_wrong_id(user_repository_mock):
     wrong_user_id = "joon"
-    user_repository_mock.find_by_user_id.side_effect = ResourceNotFoundError(f"{wrong_user_id}의 유저를 찾지 못했습니다.")
+    user_repository_mock.find_password_by_user_id.side_effect = ResourceNotFoundError(
+        f"{wrong_user_id}의 유저를 찾지 못했습니다."
+    )
     user_application_service = UserApplicationService(user_repository=user_repository_mock)
 
     input_dto = LoginInputDto(user_id=wrong_user_id, password="dump password")
     actual = user_application_service.login(input_dto)
-    expected = FailedOutputDto.build_resource_not_found_error(message=f"{str(input_dto.user_id)}의 유저를 찾지 못했습니다.")
+    expected = FailedOutputDto.build_resource_not_found_error(
+        message=f"{str(input_dto.user_id)}의 유저를 찾지 못했습니다."
+    )
     assert actual == expected
 
 
 @pytest.mark.parametrize("user_id, user_name, password", user_data)
 def test_login_fail_with_wrong_password(user_repository_mock, user_id, user_name, password):
     wrong_password = "wrong password"
-    user_repository_mock.find_by_user_id.return_value = User(
-        id=UserId(value=user_id),
-        name=UserName(value=user_name),
-        password="$2b$12$.fqrWFYdw.HLyHFfApiAx.NpOoTD6NcxJNWq5PWf7fu2cG5nheutG",
+    user_repository_mock.find_password_by_user_id.return_value = (
+        "$2b$12$.fqrWFYdw.HLyHFfApiAx.NpOoTD6NcxJNWq5PWf7fu2cG5nheutG"
     )
     user_application_service = UserApplicationService(user_repository=user_repository_mock)
 
@@ -159,3 +160,32 @@ def test_login_fail_with_wrong_password(user_repository_mock, user_id, user_name
     actual = user_application_service.login(input_dto)
     expected = FailedOutputDto.build_unauthorized_error(message=f"잘못된 비밀번호 입니다.")
     assert actual == expected
+
+
+@pytest.mark.parametrize("user_id, user_name, password", user_data)
+def test_create_user_service_unavailable(user_repository_mock, user_id, user_name, password):
+    password_hasher_mock = mock.Mock(spec=PasswordHasher)
+    password_hasher_mock.hash.side_effect = ServiceUnavailableError()
+    user_application_service = UserApplicationService(
+        user_repository=user_repository_mock, password_hasher=password_hasher_mock
+    )
+
+    input_dto = CreateUserInputDto(user_id=user_id, user_name=user_name, password=password)
+    actual = user_application_service.create_user(input_dto)
+    expected = FailedOutputDto(type="Service Unavailable Error", message="")
+    assert actual == expected
+    user_repository_mock.add.assert_not_called()
+
+
+@pytest.mark.parametrize("user_id, user_name, password", user_data)
+def test_login_service_unavailable(user_repository_mock, user_id, user_name, password):
+    user_repository_mock.find_password_by_user_id.return_value = "hashed"
+    password_hasher_mock = mock.Mock(spec=PasswordHasher)
+    password_hasher_mock.verify.side_effect = ServiceUnavailableError()
+    user_application_service = UserApplicationService(
+        user_repository=user_repository_mock, password_hasher=password_hasher_mock
+    )
+
+    actual = user_application_service.login(LoginInputDto(user_id=user_id, password=password))
+    expected = FailedOutputDto(type="Service Unavailable Error", message="")
+    assert actual == expected
@@ -1,7 +1,9 @@
+import threading
 from unittest import mock
 
 import pytest
 
+from auth.application.dtos import GetTokenDataOutputDto
 from shared_kernel.application.dtos import FailedOutputDto
 from users.application.dtos import FindUserOutputDto, CreateUserOutputDto, UpdateUserOutputDto, DeleteUserOutputDto
 from users.application.service import UserApplicationService
@@ -14,7 +16,9 @@ def user_application_service_mock():
 
 @pytest.fixture(scope="function")
 def auth_application_service_mock():
-    return mock.Mock()
+    m = mock.Mock()
+    m.find_cached_token_data.return_value = None
+    return m
 
 
 def test_get_users_success(user_application_service_mock, client, app):
@@ -61,6 +65,16 @@ def test_post_users_fail(user_application_service_mock, client, app):
     assert response.json() == {"error_type": "Resource Conflict Error", "message": "heumsi는 이미 존재하는 유저입니다."}
 
 
+def test_post_users_service_unavailable(user_application_service_mock, client, app):
+    user_application_service_mock.create_user.return_value = FailedOutputDto.build_service_unavailable_error(
+        message="비밀번호 처리 요청이 많아 잠시 후 다시 시도해주세요."
+    )
+    with app.container.user_application_service.override(user_application_service_mock):
+        response = client.post("/users", json={"user_id": "heumsi", "user_name": "heumsi", "password": "1234"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
 def test_put_users_fail_with_not_exist_user(user_application_service_mock, client, app):
     user_application_service_mock.update_user.return_value = FailedOutputDto(
         type="Resource Not Found Error", message="heumsi의 유저를 찾지 못했습니다."
@@ -122,3 +136,28 @@ def test_delete_users_fail(user_application_service_mock, client, app):
         "error_type": "Resource Not Found Error",
         "message": "heumsi의 유저를 찾지 못했습니다.",
     }
+
+
+def test_put_users_decodes_token_on_service_executor(
+    auth_application_service_mock, user_application_service_mock, client, app
+):
+    thread_names = []
+
+    def get_token_data(input_dto):
+        thread_names.append(threading.current_thread().name)
+        return GetTokenDataOutputDto(user_id="heumsi")
+
+    auth_application_service_mock.get_token_data.side_effect = get_token_data
+    user_application_service_mock.update_user.return_value = UpdateUserOutputDto()
+
+    with app.container.auth_application_service.override(auth_application_service_mock):
+        with app.container.user_application_service.override(user_application_service_mock):
+            response = client.put(
+                "/users",
+                headers={"access-token": "access token value"},
+                json={"user_name": "heumsi", "description": "Hi, I'm heumsi", "password": "1234"},
+            )
+    assert response.status_code == 204
+    # 이벤트 루프가 아니라 use case 와 같은 전용 executor 에서 검증한다.
+    assert thread_names[0].startswith("application-service")
+    assert user_application_service_mock.update_user.call_args[0][0].user_id == "heumsi"
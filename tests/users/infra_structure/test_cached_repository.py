@@ -0,0 +1,87 @@
+from unittest import mock
+
+import pytest
+
+from shared_kernel.domain.exceptions import ResourceNotFoundError
+from shared_kernel.domain.value_objects import UserId, UserName
+from shared_kernel.infra_structure.cache_backend import InProcessCacheBackend
+from users.domain.entities import User
+from users.domain.repository import UserRepository
+from users.infra_structure.cached_repository import CachedUserRepository
+from users.infra_structure.in_memory_repository import InMemoryUserRepository
+
+USER = User(id=UserId(value="heumsi"), name=UserName(value="heumsi"), password="hashed")
+
+
+@pytest.fixture(scope="function")
+def in_memory_user_repository():
+    repository = InMemoryUserRepository()
+    repository.add(USER)
+    return mock.Mock(wraps=repository)
+
+
+@pytest.fixture(scope="function")
+def cached_user_repository(in_memory_user_repository):
+    return CachedUserRepository(
+        user_repository=in_memory_user_repository,
+        cache_backend=InProcessCacheBackend(),
+        after_transaction=lambda _: False,
+    )
+
+
+def test_find_by_user_id_read_through(cached_user_repository, in_memory_user_repository):
+    # 비밀번호 해시는 캐시하지 않는다.
+    expected = USER.copy(update={"password": ""})
+    assert cached_user_repository.find_by_user_id(USER.id) == expected
+    assert cached_user_repository.find_by_user_id(USER.id) == expected
+    assert in_memory_user_repository.find_by_user_id.call_count == 1
+
+
+def test_password_is_not_cached(in_memory_user_repository):
+    cache_backend = InProcessCacheBackend()
+    cached_user_repository = CachedUserRepository(
+        user_repository=in_memory_user_repository, cache_backend=cache_backend, after_transaction=lambda _: False
+    )
+    cached_user_repository.find_by_user_id(USER.id)
+    assert b"hashed" not in cache_backend.get("user.v2:heumsi")
+
+    # 비밀번호는 매번 원래 repository 에서 읽는다.
+    for _ in range(2):
+        assert cached_user_repository.find_password_by_user_id(USER.id) == "hashed"
+    assert in_memory_user_repository.find_password_by_user_id.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda repository: repository.update(USER.copy(update={"description": "hello"})),
+        lambda repository: repository.delete_by_user_id(USER.id),
+    ],
+)
+def test_write_invalidates(cached_user_repository, in_memory_user_repository, write):
+    cached_user_repository.find_by_user_id(USER.id)
+    write(cached_user_repository)
+    cached_user_repository.find_by_user_id(USER.id)
+    assert in_memory_user_repository.find_by_user_id.call_count == 2
+
+
+def test_missing_user_id_is_remembered():
+    user_repository_mock = mock.Mock(spec=UserRepository)
+    user_repository_mock.find_by_user_id.side_effect = ResourceNotFoundError("joon의 유저를 찾지 못했습니다.")
+    cached_user_repository = CachedUserRepository(
+        user_repository=user_repository_mock,
+        cache_backend=InProcessCacheBackend(),
+        negative_ttl_seconds=5,
+        after_transaction=lambda _: False,
+    )
+    for _ in range(3):
+        with pytest.raises(ResourceNotFoundError, match="joon의 유저를 찾지 못했습니다."):
+            cached_user_repository.find_by_user_id(UserId(value="joon"))
+    assert user_repository_mock.find_by_user_id.call_count == 1
+
+    # 가입(add)이 성공하면 기억해 둔 결과를 지운다.
+    joon = User(id=UserId(value="joon"), name=UserName(value="joon"), password="hashed")
+    cached_user_repository.add(joon)
+    user_repository_mock.find_by_user_id.side_effect = None
+    user_repository_mock.find_by_user_id.return_value = joon
+    assert cached_user_repository.find_by_user_id(UserId(value="joon")) == joon.copy(update={"password": ""})
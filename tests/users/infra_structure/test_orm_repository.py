@@ -89,6 +89,13 @@ def test_find_by_user_id(orm_user_repository):
         orm_user_repository.find_by_user_id(user_id=UserId(value="not exist user"))
 
 
+def test_find_password_by_user_id(orm_user_repository):
+    assert orm_user_repository.find_password_by_user_id(user_id=UserId(value="heumsi")) == "1234"
+
+    with pytest.raises(ResourceNotFoundError):
+        orm_user_repository.find_password_by_user_id(user_id=UserId(value="not exist user"))
+
+
 def test_add(orm_user_repository):
     orm_user_repository.add(user=User(id=UserId(value="siheum"), name=UserName(value="siheum"), password="1234"))
     actual = orm_user_repository.find_by_user_id(user_id=UserId(value="siheum"))
@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from shared_kernel.domain.exceptions import ServiceUnavailableError
+from users.infra_structure.password_hasher import BcryptPasswordHasher, ProcessPoolPasswordHasher
+
+
+@pytest.fixture(scope="module")
+def process_pool_password_hasher():
+    password_hasher = ProcessPoolPasswordHasher(max_workers=1, max_pending=4)
+    yield password_hasher
+    password_hasher.shutdown()
+
+
+def test_process_pool_password_hasher(process_pool_password_hasher):
+    hashed_password = process_pool_password_hasher.hash("1234")
+    assert hashed_password != "1234"
+    assert process_pool_password_hasher.verify("1234", hashed_password)
+    assert not process_pool_password_hasher.verify("4321", hashed_password)
+
+    # 같은 알고리즘이므로 inline 으로 만든 해시와 서로 검증된다.
+    assert BcryptPasswordHasher().verify("1234", hashed_password)
+    assert process_pool_password_hasher.verify("1234", BcryptPasswordHasher().hash("1234"))
+
+
+def test_process_pool_password_hasher_rejects_when_full():
+    password_hasher = ProcessPoolPasswordHasher(max_workers=1, max_pending=1)
+    password_hasher._pending.acquire()
+    try:
+        with pytest.raises(ServiceUnavailableError):
+            password_hasher.hash("1234")
+    finally:
+        password_hasher._pending.release()
+        password_hasher.shutdown()
+
+
+def test_process_pool_password_hasher_timed_out_work_keeps_its_slot():
+    password_hasher = ProcessPoolPasswordHasher(max_workers=1, max_pending=2, timeout_seconds=0.05)
+    try:
+        # 풀이 느린 작업으로 가득 차 시간이 지나면, 그 작업들이 끝날 때까지 다음 요청은 받지 않는다.
+        for _ in range(2):
+            with pytest.raises(ServiceUnavailableError, match="지연"):
+                password_hasher._submit(time.sleep, 1)
+        with pytest.raises(ServiceUnavailableError, match="많아"):
+            password_hasher._submit(time.sleep, 0)
+
+        deadline = time.monotonic() + 10
+        while not password_hasher._pending.acquire(blocking=False):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        password_hasher._pending.release()
+    finally:
+        password_hasher.shutdown()
@@ -2,14 +2,16 @@ from unittest import mock
 
 import pytest
 
-from shared_kernel.application.dtos import SuccessOutputDto
+from shared_kernel.application.dtos import FailedOutputDto, SuccessOutputDto
+from shared_kernel.domain.exceptions import InvalidParamInputError
+from shared_kernel.domain.pagination import Page
 from shared_kernel.domain.value_objects import UserId, DrinkId
+from shared_kernel.infra_structure.resource_versions import ResourceVersions
 from wishes.application.dto import (
     CreateWishInputDto,
     CreateWishOutputDto,
     DeleteWishInputDto,
     FindWishesInputDto,
-    FindWishesOutputDto,
 )
 from wishes.application.service import WishApplicationService
 from wishes.domain.entities import Wish
@@ -20,20 +22,23 @@ from wishes.domain.value_objects import WishId
 @pytest.fixture(scope="function")
 def wish_application_service():
     wish_repository_mock = mock.Mock(spec=WishRepository)
-    wish_repository_mock.find_all.return_value = [
-        Wish(
-            id=WishId.build(user_id="heumsi", drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c"),
-            user_id=UserId(value="heumsi"),
-            drink_id=DrinkId.from_str("335ca1a4-5175-5e41-8bac-40ffd840834c"),
-            created_at=1613113664.931505,
-        ),
-        Wish(
-            id=WishId.build(user_id="joon", drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c"),
-            user_id=UserId(value="joon"),
-            drink_id=DrinkId.from_str("335ca1a4-5175-5e41-8bac-40ffd840834c"),
-            created_at=1613113664.931505,
-        ),
-    ]
+    wish_repository_mock.find_all.return_value = Page[Wish](
+        items=[
+            Wish(
+                id=WishId.build(user_id="heumsi", drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c"),
+                user_id=UserId(value="heumsi"),
+                drink_id=DrinkId.from_str("335ca1a4-5175-5e41-8bac-40ffd840834c"),
+                created_at=1613113664.931505,
+            ),
+            Wish(
+                id=WishId.build(user_id="joon", drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c"),
+                user_id=UserId(value="joon"),
+                drink_id=DrinkId.from_str("335ca1a4-5175-5e41-8bac-40ffd840834c"),
+                created_at=1613113664.931505,
+            ),
+        ],
+        next_cursor="cursor",
+    )
 
     return WishApplicationService(wish_repository=wish_repository_mock)
 
@@ -43,24 +48,36 @@ def drink_application_service():
     return mock.Mock()
 
 
-def test_find_create_wish_success(wish_application_service):
+def test_find_wish_rows(wish_application_service):
     input_dto = FindWishesInputDto(query_param=QueryParam(drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c"))
-    output_dto = wish_application_service.find_wishes(input_dto)
+    output_dto = wish_application_service.find_wish_rows(input_dto)
     assert output_dto.status is True
     assert output_dto.items == [
-        FindWishesOutputDto.Item(
-            id=str(WishId.build(user_id="heumsi", drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c")),
-            user_id="heumsi",
-            drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c",
-            created_at=1613113664.931505,
-        ),
-        FindWishesOutputDto.Item(
-            id=str(WishId.build(user_id="joon", drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c")),
-            user_id="joon",
-            drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c",
-            created_at=1613113664.931505,
-        ),
+        {
+            "id": str(WishId.build(user_id="heumsi", drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c")),
+            "user_id": "heumsi",
+            "drink_id": "335ca1a4-5175-5e41-8bac-40ffd840834c",
+            "created_at": 1613113664.931505,
+        },
+        {
+            "id": str(WishId.build(user_id="joon", drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c")),
+            "user_id": "joon",
+            "drink_id": "335ca1a4-5175-5e41-8bac-40ffd840834c",
+            "created_at": 1613113664.931505,
+        },
     ]
+    assert output_dto.next_cursor == "cursor"
+
+
+def test_find_wish_rows_fail():
+    wish_repository_mock = mock.Mock(spec=WishRepository)
+    wish_repository_mock.find_all.side_effect = InvalidParamInputError()
+    wish_application_service = WishApplicationService(wish_repository=wish_repository_mock)
+
+    input_dto = FindWishesInputDto(query_param=QueryParam())
+    actual = wish_application_service.find_wish_rows(input_dto)
+    expected = FailedOutputDto(type="Parameters Error", message="")
+    assert actual == expected
 
 
 def test_create_wish_success(
@@ -92,3 +109,20 @@ def test_delete_wish_success(
     )
     output_dto = wish_application_service.delete_wish(input_dto, drink_application_service)
     assert output_dto.status is True
+
+
+def test_create_wish_bumps_drink_versions(drink_application_service):
+    resource_versions = ResourceVersions()
+    wish_application_service = WishApplicationService(
+        wish_repository=mock.Mock(spec=WishRepository), resource_versions=resource_versions
+    )
+    etag = resource_versions.etag(ResourceVersions.DRINKS)
+    input_dto = CreateWishInputDto(user_id="heumsi", drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c")
+
+    drink_application_service.add_drink_wish.return_value = FailedOutputDto.build_resource_not_found_error()
+    wish_application_service.create_wish(input_dto, drink_application_service)
+    assert resource_versions.etag(ResourceVersions.DRINKS) == etag
+
+    drink_application_service.add_drink_wish.return_value = mock.Mock(spec=SuccessOutputDto)
+    wish_application_service.create_wish(input_dto, drink_application_service)
+    assert resource_versions.etag(ResourceVersions.DRINKS) != etag
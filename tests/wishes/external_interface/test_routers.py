@@ -4,8 +4,14 @@ import pytest
 
 from auth.application.dtos import GetTokenDataOutputDto
 from auth.application.service import AuthApplicationService
-from wishes.application.dto import FindWishesOutputDto, CreateWishOutputDto, DeleteWishOutputDto
+from shared_kernel.application.dtos import RowsOutputDto
+from shared_kernel.domain.pagination import RowPage
+from shared_kernel.domain.value_objects import DrinkId, UserId
+from wishes.application.dto import CreateWishOutputDto, DeleteWishOutputDto
+from wishes.application.query_service import wish_row
 from wishes.application.service import WishApplicationService
+from wishes.domain.entities import Wish
+from wishes.domain.value_objects import WishId
 
 
 @pytest.fixture(scope="function")
@@ -16,30 +22,34 @@ def wish_application_service_mock():
 @pytest.fixture(scope="function")
 def auth_application_service_mock():
     m = mock.Mock(spec=AuthApplicationService)
+    m.find_cached_token_data.return_value = None
     m.get_token_data.return_value = GetTokenDataOutputDto(user_id="heumsi")
     return m
 
 
 def test_get_wishes_success(wish_application_service_mock, client, app):
-    wish_application_service_mock.find_wishes.return_value = FindWishesOutputDto(
-        items=[FindWishesOutputDto.Item(id="wish_id", user_id="heumsi", drink_id="drink_id", created_at=1613884133)]
+    wish_application_service_mock.find_wish_rows.return_value = RowsOutputDto(
+        items=[{"id": "wish_id", "user_id": "heumsi", "drink_id": "drink_id", "created_at": 1613884133.0}],
+        next_cursor="cursor",
     )
 
     # get by user_id
     with app.container.wish_application_service.override(wish_application_service_mock):
         response = client.get("/wishes?user_id=heumsi")
     assert response.status_code == 200
-    assert response.json() == [
-        {"id": "wish_id", "user_id": "heumsi", "drink_id": "heumsi", "created_at": 1613884133.0},
-    ]
+    assert response.json() == {
+        "items": [{"id": "wish_id", "user_id": "heumsi", "drink_id": "drink_id", "created_at": 1613884133.0}],
+        "next_cursor": "cursor",
+    }
 
     # get by drink_id
     with app.container.wish_application_service.override(wish_application_service_mock):
         response = client.get("/wishes?drink_id=drink_id")
     assert response.status_code == 200
-    assert response.json() == [
-        {"id": "wish_id", "user_id": "heumsi", "drink_id": "heumsi", "created_at": 1613884133.0},
-    ]
+    assert response.json() == {
+        "items": [{"id": "wish_id", "user_id": "heumsi", "drink_id": "drink_id", "created_at": 1613884133.0}],
+        "next_cursor": "cursor",
+    }
 
 
 def test_create_wish_success(auth_application_service_mock, wish_application_service_mock, client, app):
@@ -61,3 +71,25 @@ def test_delete_wish_success(auth_application_service_mock, wish_application_ser
         with app.container.wish_application_service.override(wish_application_service_mock):
             response = client.delete("/wishes/drink_id", headers={"access-token": "dump_value"})
     assert response.status_code == 204
+
+
+def test_get_wishes_rows_match_response_model(wish_application_service_mock, client, app):
+    # 목록은 query service 의 행을 검증 없이 그대로 쓰므로, 행의 모양이 선언한 response_model 과 같은지 확인한다.
+    drink_id = DrinkId.build(drink_name="Cass", created_at=1234)
+    wish = Wish(
+        id=WishId.build(user_id="heumsi", drink_id=str(drink_id)),
+        user_id=UserId(value="heumsi"),
+        drink_id=drink_id,
+        created_at=1613884133.0,
+    )
+    wish_application_service_mock.find_wish_rows.return_value = RowsOutputDto.build(
+        RowPage(items=[wish_row(wish)], next_cursor="cursor")
+    )
+    with app.container.wish_application_service.override(wish_application_service_mock):
+        response = client.get("/wishes?user_id=heumsi")
+
+    (route,) = [route for route in app.routes if route.path == "/wishes/" and "GET" in route.methods]
+    body = response.json()
+    assert body.keys() == route.response_model.__fields__.keys()
+    assert body["items"][0].keys() == route.response_model.__fields__["items"].type_.__fields__.keys()
+    assert route.response_model.parse_obj(body).dict() == body
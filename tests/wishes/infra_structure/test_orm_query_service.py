@@ -0,0 +1,59 @@
+import pytest
+
+from shared_kernel.domain.exceptions import InvalidParamInputError
+from shared_kernel.domain.value_objects import DrinkId, UserId
+from wishes.application.query_service import wish_row
+from wishes.domain.entities import Wish
+from wishes.domain.repository import QueryParam
+from wishes.domain.value_objects import WishId
+from wishes.infra_structure.orm_models import WishOrm
+from wishes.infra_structure.orm_query_service import OrmWishQueryService
+from wishes.infra_structure.orm_repository import OrmWishRepository
+
+drink_id = "335ca1a4-5175-5e41-8bac-40ffd840834c"
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup(database):
+    with database.session() as session:
+        session.query(WishOrm).delete()
+        session.add_all(
+            [
+                WishOrm.from_wish(
+                    Wish(
+                        id=WishId.build(user_id=f"user{i}", drink_id=drink_id),
+                        user_id=UserId(value=f"user{i}"),
+                        drink_id=DrinkId.from_str(drink_id),
+                        created_at=1613807667 + i // 2,
+                    )
+                )
+                for i in range(5)
+            ]
+        )
+        session.commit()
+
+
+def test_find_rows_same_as_repository(database):
+    orm_wish_query_service = OrmWishQueryService(read_session_factory=database.session)
+    orm_wish_repository = OrmWishRepository(session_factory=database.session)
+    query_param = QueryParam(drink_id=drink_id, limit=2)
+
+    num_of_pages = 0
+    while True:
+        actual = orm_wish_query_service.find_rows(query_param)
+        expected = orm_wish_repository.find_all(query_param)
+        assert actual.items == [wish_row(wish) for wish in expected.items]
+        assert actual.next_cursor == expected.next_cursor
+        num_of_pages += 1
+        if actual.next_cursor is None:
+            break
+        query_param = query_param.copy(update={"cursor": actual.next_cursor})
+    assert num_of_pages == 3
+
+
+def test_find_rows_unfiltered(database):
+    with pytest.raises(InvalidParamInputError):
+        OrmWishQueryService(read_session_factory=database.session).find_rows(QueryParam())
+
+    orm_wish_query_service = OrmWishQueryService(read_session_factory=database.session, allow_unfiltered_scan=True)
+    assert len(orm_wish_query_service.find_rows(QueryParam()).items) == 5
@@ -1,6 +1,6 @@
 import pytest
 
-from shared_kernel.domain.exceptions import ResourceAlreadyExistError, ResourceNotFoundError
+from shared_kernel.domain.exceptions import InvalidParamInputError, ResourceAlreadyExistError, ResourceNotFoundError
 from shared_kernel.domain.value_objects import UserId, DrinkId
 from wishes.domain.entities import Wish
 from wishes.domain.repository import QueryParam
@@ -77,7 +77,33 @@ def test_find_all(orm_wish_repository):
             created_at=1613807667.0,
         ),
     ]
-    assert actual == expected
+    assert actual.items == expected
+    assert actual.next_cursor is None
+
+
+def test_find_all_pages(orm_wish_repository):
+    query_param = QueryParam(drink_id="335ca1a4-5175-5e41-8bac-40ffd840834c", limit=1)
+    first_page = orm_wish_repository.find_all(query_param)
+    assert [str(wish.user_id) for wish in first_page.items] == ["heumsi"]
+
+    second_page = orm_wish_repository.find_all(query_param.copy(update={"cursor": first_page.next_cursor}))
+    assert [str(wish.user_id) for wish in second_page.items] == ["joon"]
+    assert second_page.next_cursor is None
+
+    with pytest.raises(InvalidParamInputError):
+        orm_wish_repository.find_all(QueryParam(user_id="heumsi", limit=0))
+    with pytest.raises(InvalidParamInputError):
+        orm_wish_repository.find_all(QueryParam(user_id="heumsi", cursor="invalid"))
+
+
+def test_find_all_unfiltered(database, orm_wish_repository):
+    with pytest.raises(InvalidParamInputError):
+        orm_wish_repository.find_all(QueryParam())
+
+    admin_wish_repository = OrmWishRepository(session_factory=database.session, allow_unfiltered_scan=True)
+    actual = admin_wish_repository.find_all(QueryParam(limit=1))
+    assert len(actual.items) == 1
+    assert actual.next_cursor is not None
 
 
 def test_add(orm_wish_repository):